@@ -90,8 +90,12 @@ The library provides several protocols that can be used for type hints and inter
 Available Observable Types:
 - ObservableSingleValue: Wrapper around any single value with validation
 - ObservableList: Reactive list with full list interface compatibility
+- ObservableSortedList: Sorted list with bisect-based edits and range (window) hooks
+- ObservableRingBuffer: Fixed-capacity buffer of the latest items with O(1) push and window statistics
 - ObservableSet: Reactive set with full set interface compatibility
 - ObservableDict: Reactive dictionary with full dict interface compatibility
+- ObservableTable: Records by row id with incrementally maintained hash and sorted indexes
+- ObservableArray: NumPy array with region edits and statistics hooks (requires numpy)
 - ObservableTuple: Reactive tuple with individual element binding support
 - ObservableSelectionOption: Combined options set and selected value management
 - ObservableMultiSelectionOption: Combined available options set and multiple selected values management
@@ -157,24 +161,45 @@ Advanced Usage:
 from ._xobjects.x_any_value import ObservableSingleValue
 
 from ._xobjects.list_like.x_list import ObservableList, ObservableListProtocol
+from ._xobjects.list_like.x_sorted_list import ObservableSortedList
+from ._xobjects.list_like.list_change import ListChange, ListChangePublisher, apply_list_changes
+from ._xobjects.list_like.utils import list_changes
+from ._xobjects.list_like.list_view import ListView
 
 from ._xobjects.set_like.x_set import ObservableSet, ObservableSetProtocol
+from ._xobjects.set_like.set_change import SetChange
+from ._xobjects.set_like.utils import set_changes
 from ._xobjects.set_like.x_selection_set import ObservableSelectionSet
 from ._xobjects.set_like.x_optional_selection_set import ObservableOptionalSelectionSet
 from ._xobjects.set_like.x_multi_selection_set import ObservableMultiSelectionSet
 from ._xobjects.set_like.protocols import ObservableOptionalSelectionOptionProtocol, ObservableSelectionOptionsProtocol, ObservableMultiSelectionOptionsProtocol
 
 from ._xobjects.function_like.function_values import FunctionValues
+from ._xobjects.function_like.function_memo import FunctionMemo, MemoInfo
+from ._xobjects.function_like.batch_kernel import BatchKernel
+from ._xobjects.function_like.expression import Expression
 from ._xobjects.function_like.x_function import ObservableFunction as ObservableSync
 from ._xobjects.function_like.x_one_way_function import ObservableOneWayFunction
+from ._xobjects.function_like.x_async_one_way_function import ObservableAsyncOneWayFunction
 
 from ._xobjects.dict_like.x_selection_dict import ObservableSelectionDict
 from ._xobjects.dict_like.x_optional_selection_dict import ObservableOptionalSelectionDict
 from ._xobjects.dict_like.x_selection_dict_with_default import ObservableDefaultSelectionDict
 from ._xobjects.dict_like.x_optional_selection_dict_with_default import ObservableOptionalDefaultSelectionDict
 from ._xobjects.dict_like.x_dict import ObservableDict
+from ._xobjects.dict_like.map_change import MapChange
+from ._xobjects.dict_like.utils import map_changes
 from ._xobjects.dict_like.protocols import ObservableDictProtocol, ObservableSelectionDictProtocol, ObservableOptionalSelectionDictProtocol, ObservableDefaultSelectionDictProtocol, ObservableOptionalDefaultSelectionDictProtocol
 
+from ._xobjects.table_like.x_table import ObservableTable
+from ._xobjects.table_like.table_index import HashIndex, SortedIndex
+
+from ._xobjects.list_like.x_ring_buffer import ObservableRingBuffer
+from ._xobjects.list_like.ring_buffer import RingBufferSnapshot, RingBufferAppend, RingBufferAppendPublisher, WindowStatistics
+
+from ._xobjects.array_like.x_array import ObservableArray
+from ._xobjects.array_like.array_change import ArrayChange
+
 from ._xobjects.complex.xobject_rooted_paths import ObservableRootedPaths
 from ._xobjects.complex.xobject_block_none import ObservableBlockNone
 from ._xobjects.complex.xobject_subscriber import ObservableSubscriber
@@ -188,6 +213,7 @@ from ._publisher_subscriber.publisher import Publisher
 
 from ._nexus_system.update_function_values import UpdateFunctionValues
 from ._nexus_system.system_analysis import write_report
+from ._nexus_system.snapshot import Snapshot
 
 from ._carries_hooks.x_object_serializable_mixin import XObjectSerializableMixin
 
@@ -196,8 +222,12 @@ from ._carries_hooks.x_object_serializable_mixin import XObjectSerializableMixin
 
 XValue = ObservableSingleValue
 XList = ObservableList
+XSortedList = ObservableSortedList
+XRingBuffer = ObservableRingBuffer
 XSet = ObservableSet
 XDict = ObservableDict
+XTable = ObservableTable
+XArray = ObservableArray
 
 XSelectionDict = ObservableSelectionDict
 XOptionalSelectionDict = ObservableOptionalSelectionDict
@@ -210,6 +240,7 @@ XMultiSelectionSet = ObservableMultiSelectionSet
 
 XFunction = ObservableSync
 XOneWayFunction = ObservableOneWayFunction
+XAsyncOneWayFunction = ObservableAsyncOneWayFunction
 
 XRootedPaths = ObservableRootedPaths
 XBlockNone = ObservableBlockNone
@@ -233,8 +264,12 @@ __all__ = [
     # Modern clean aliases (RECOMMENDED - use these for new code!)
     'XValue',
     'XList',
+    'XSortedList',
+    'XRingBuffer',
     'XSet',
     'XDict',
+    'XTable',
+    'XArray',
     'XSelectionDict',
     'XOptionalSelectionDict',
     'XDefaultSelectionDict',
@@ -244,6 +279,7 @@ __all__ = [
     'XMultiSelectionSet',
     'XFunction',
     'XOneWayFunction',
+    'XAsyncOneWayFunction',
     'XRootedPaths',
     'XBlockNone',
     'XSubscriber',
@@ -258,14 +294,19 @@ __all__ = [
     
     # Legacy names (DEPRECATED - kept for backwards compatibility)
     'ObservableList',
+    'ObservableSortedList',
+    'ObservableRingBuffer',
     'ObservableSet',
     'ObservableDict',
+    'ObservableTable',
+    'ObservableArray',
     'ObservableSingleValue',
     'ObservableSelectionSet',
     'ObservableOptionalSelectionSet',
     'ObservableMultiSelectionSet',
     'ObservableSync',
     'ObservableOneWayFunction',
+    'ObservableAsyncOneWayFunction',
     'ObservableSelectionDict',
     'ObservableOptionalSelectionDict',
     'ObservableDefaultSelectionDict',
@@ -294,6 +335,30 @@ __all__ = [
     # Function utilities
     'FunctionValues',
     'UpdateFunctionValues',
+    'FunctionMemo',
+    'MemoInfo',
+    'BatchKernel',
+    'Expression',
+
+    # List views and change records
+    'ListView',
+    'ListChange',
+    'ListChangePublisher',
+    'list_changes',
+    'apply_list_changes',
+    'SetChange',
+    'set_changes',
+    'MapChange',
+    'map_changes',
+    'ArrayChange',
+    'RingBufferSnapshot',
+    'RingBufferAppend',
+    'RingBufferAppendPublisher',
+    'WindowStatistics',
+
+    # Table indexes
+    'HashIndex',
+    'SortedIndex',
 
     # Publisher/Subscriber
     'PublisherProtocol',
@@ -303,6 +368,7 @@ __all__ = [
     # Utilities
     'XObjectSerializableMixin',
     'write_report',
+    'Snapshot',
 ]
 
 # Package metadata
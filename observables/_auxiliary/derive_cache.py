@@ -0,0 +1,64 @@
+"""
+DeriveCache - Values derived from immutable values, reusing the value derived for a previous one
+
+Secondary hook callbacks derive their value from the primary values on every
+submission. If the primary value is an immutable value created by an edit of
+an earlier one (e.g. a PersistentMap), the derived value can be updated from
+the value derived for the earlier one instead of being derived from scratch.
+"""
+
+from typing import Generic, Optional, TypeVar
+
+S = TypeVar("S")
+D = TypeVar("D")
+
+_CACHE_SIZE: int = 2
+"""Number of derived values to remember. Two cover a submission that was rejected after its values had been derived."""
+
+
+class DeriveCache(Generic[S, D]):
+    """
+    Base class for deriving values from source values, reusing the values derived for the last sources.
+
+    `_derive` returns, in this order:
+        1. the cached value, for the same source object as before,
+        2. the value updated by `_derive_from_edit`, for a source edited from a cached one,
+        3. the value of `_derive_from_scratch`, for any other source.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self) -> None:
+        self._cache: list[tuple[S, D]] = []
+
+    def _derive(self, source: S) -> D:
+        # Step 1: The same source as before
+        for cached_source, cached_value in self._cache:
+            if cached_source is source:
+                return cached_value
+
+        # Step 2: An edit of a cached source
+        derived: Optional[D] = None
+        for cached_source, cached_value in self._cache:
+            derived = self._derive_from_edit(cached_source, cached_value, source)
+            if derived is not None:
+                break
+
+        # Step 3: Any other source
+        if derived is None:
+            derived = self._derive_from_scratch(source)
+
+        self._cache.insert(0, (source, derived))
+        del self._cache[_CACHE_SIZE:]
+        return derived
+
+    def _latest_value(self) -> Optional[D]:
+        """Get the value derived last (None if nothing was derived yet)."""
+        return self._cache[0][1] if self._cache else None
+
+    def _derive_from_edit(self, previous_source: S, previous_value: D, source: S) -> Optional[D]:
+        """Update `previous_value` to `source`, or return None if `source` is not an edit of `previous_source`."""
+        return None
+
+    def _derive_from_scratch(self, source: S) -> D:
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import Any, TypeVar, Optional, final, Mapping, Generic, Callable, Literal
+from typing import Any, Awaitable, TypeVar, Optional, final, Mapping, Generic, Callable, Literal, TYPE_CHECKING
 from logging import Logger
 from abc import ABC, abstractmethod
 from threading import RLock
@@ -19,6 +19,9 @@ from .._hooks.mixin_protocols.hook_with_connection_protocol import HookWithConne
 
 import weakref
 
+if TYPE_CHECKING:
+    from .._xobjects.function_like.function_memo import FunctionMemo
+
 HK = TypeVar("HK")
 HV = TypeVar("HV")
 O = TypeVar("O", bound="CarriesSomeHooksBase[Any, Any, Any]")
@@ -101,9 +104,20 @@ class CarriesSomeHooksBase(CarriesSomeHooksProtocol[HK, HV], HasNexusManagerProt
         add_values_to_be_updated_callback: Optional[Callable[[O, UpdateFunctionValues[HK, HV]], Mapping[HK, HV]]] = None,
         logger: Optional[Logger] = None,
         nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER, 
+        validation_memo: Optional["FunctionMemo[HK, HV, tuple[bool, str]]"] = None,
+        validate_complete_values_in_isolation_async_callback: Optional[Callable[[O, Mapping[HK, HV]], Awaitable[tuple[bool, str]]]] = None,
         ) -> None:
         """
         Initialize the CarriesSomeHooksBase.
+
+        Args:
+            validation_memo: Optional FunctionMemo caching the validation results per set of
+                values. Only for pure validation (the result depends on the values only): values
+                validated moments ago, e.g. by repeated validate_value calls, are answered from
+                the cache without calling the validation callback.
+            validate_complete_values_in_isolation_async_callback: Optional coroutine function
+                validating the complete values, awaited by asynchronous submissions only
+                (NexusManager.submit_values_async) before the values are submitted.
         """
 
         # Store weak references to callbacks to avoid circular references
@@ -113,6 +127,8 @@ class CarriesSomeHooksBase(CarriesSomeHooksProtocol[HK, HV], HasNexusManagerProt
         self._add_values_to_be_updated_callback = add_values_to_be_updated_callback
         self._logger: Optional[Logger] = logger
         self._nexus_manager: NexusManager = nexus_manager
+        self._validation_memo: Optional["FunctionMemo[HK, HV, tuple[bool, str]]"] = validation_memo
+        self._validate_complete_values_in_isolation_async_callback = validate_complete_values_in_isolation_async_callback
 
         self._lock = RLock()
 
@@ -169,10 +185,34 @@ class CarriesSomeHooksBase(CarriesSomeHooksProtocol[HK, HV], HasNexusManagerProt
             if self._self_ref() is None:
                 raise ValueError("Owner has been garbage collected")
             self_ref: O = self._self_ref() # type: ignore
+            if self._validation_memo is not None:
+                callback = self._validate_complete_values_in_isolation_callback
+                return self._validation_memo.call(lambda values: callback(self_ref, values), values)
             return self._validate_complete_values_in_isolation_callback(self_ref, values)
         else:
             return True, "No validation in isolation callback provided"
 
+    @final
+    def _validate_complete_values_in_isolation_async(self, values: dict[HK, HV]) -> Optional[Awaitable[tuple[bool, str]]]:
+        """
+        Start the asynchronous validation of the values as part of the owner.
+
+        Values are provided for all hooks according to get_hook_keys().
+
+        Returns:
+            An awaitable of (success: bool, message: str), or None without asynchronous validation.
+
+        Raises:
+            ValueError: If the owner has been garbage collected
+        """
+
+        if self._validate_complete_values_in_isolation_async_callback is None:
+            return None
+        if self._self_ref() is None:
+            raise ValueError("Owner has been garbage collected")
+        self_ref: O = self._self_ref() # type: ignore
+        return self._validate_complete_values_in_isolation_async_callback(self_ref, values)
+
     @final
     def _get_value_of_hook(self, key: HK) -> HV:
         """
@@ -435,6 +475,83 @@ class CarriesSomeHooksBase(CarriesSomeHooksProtocol[HK, HV], HasNexusManagerProt
         )
         return success, msg
 
+    def _update_value(self, key: HK, update_function: Callable[[HV], HV], *, logger: Optional[Logger] = None) -> tuple[bool, str]:
+        """
+        Read-modify-write a value without holding the lock across the read.
+
+        The new value is computed from the current value and submitted with the version of the
+        nexus that was read (compare-and-set). If another submission changed the value meanwhile,
+        the update is computed again from the new value, so concurrent updates are not lost.
+
+        Args:
+            key: The key of the hook to update the value of
+            update_function: Function computing the new value from the current value. It may be
+                called more than once; returning the current value itself submits nothing.
+            logger: Optional logger for debugging
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+
+        hook = self._get_hook_by_key(key)
+        while True:
+            nexus: Nexus[Any] = hook._get_nexus() # type: ignore
+            # The version is read before the value, see Nexus.version
+            version: int = nexus.version
+            current_value: HV = nexus.stored_value
+            new_value: HV = update_function(current_value)
+            if new_value is current_value:
+                return True, "Value is unchanged"
+            success, msg = self._nexus_manager.submit_values({nexus: new_value}, logger=logger, expected_versions={nexus: version})
+            if success or (nexus.version == version and hook._get_nexus() is nexus):
+                return success, msg
+
+    async def _submit_values_async(self, values: Mapping[HK, HV], *, mode: Literal["Normal submission", "Check values"] = "Normal submission", logger: Optional[Logger] = None) -> tuple[bool, str]:
+        """
+        Submit values to the observable from a coroutine, without blocking the event loop.
+
+        See NexusManager.submit_values_async.
+
+        Args:
+            values: Mapping of hook keys to their new values
+            mode: "Check values" only validates the values
+            logger: Optional logger for debugging
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+
+        nexus_and_values: dict[Nexus[Any], Any] = self._get_nexus_and_values(values)
+        return await self._nexus_manager.submit_values_async(nexus_and_values, mode=mode, logger=logger)
+
+    async def _update_value_async(self, key: HK, update_function: Callable[[HV], HV], *, logger: Optional[Logger] = None) -> tuple[bool, str]:
+        """
+        Read-modify-write a value from a coroutine, see `_update_value`.
+
+        The new value is computed again from the current value whenever another submission
+        changed the value while this one waited for the lock or for asynchronous validations.
+
+        Args:
+            key: The key of the hook to update the value of
+            update_function: Function computing the new value from the current value
+            logger: Optional logger for debugging
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+
+        hook = self._get_hook_by_key(key)
+        while True:
+            nexus: Nexus[Any] = hook._get_nexus() # type: ignore
+            version: int = nexus.version
+            current_value: HV = nexus.stored_value
+            new_value: HV = update_function(current_value)
+            if new_value is current_value:
+                return True, "Value is unchanged"
+            success, msg = await self._nexus_manager.submit_values_async({nexus: new_value}, logger=logger, expected_versions={nexus: version})
+            if success or (nexus.version == version and hook._get_nexus() is nexus):
+                return success, msg
+
     def _get_nexus_and_values(self, values: Mapping[HK, HV]) -> dict[Nexus[Any], Any]:
         """
         Get a dictionary of nexuses and values.
@@ -509,4 +626,49 @@ class CarriesSomeHooksBase(CarriesSomeHooksProtocol[HK, HV], HasNexusManagerProt
         Returns:
             The key for the hook or nexus
         """
-        ...
\ No newline at end of file
+        ...
+
+    def _get_derived_hook_keys(self) -> set[HK]:
+        """
+        Get the keys of the hooks whose values are computed from the other hooks of this owner.
+
+        ** This method is not thread-safe and should only be called internally.
+
+        Used by the NexusManager to complete submissions in topological order: owners joined
+        to a derived hook are completed after this owner, and values added for derived hooks
+        do not require completing this owner again. Override in derived observables, the
+        default declares no derived hooks.
+
+        Returns:
+            The set of keys of the derived hooks
+        """
+        return set()
+
+    def _has_unlisted_hooks(self) -> bool:
+        """
+        Whether this owner has hooks that are not listed by `_get_hook_keys()`.
+
+        ** This method is not thread-safe and should only be called internally.
+
+        The nexus manager finds the hooks of such owners through the submitted nexuses, not
+        through their hook keys. The default is no such hooks.
+
+        Returns:
+            True if some hooks are not listed by `_get_hook_keys()`
+        """
+        return False
+
+    def _get_batch_group(self) -> Optional[Any]:
+        """
+        Get the object completing this owner together with other owners of the same group.
+
+        ** This method is not thread-safe and should only be called internally.
+
+        Owners of the same group (e.g. functions sharing a BatchKernel) that are due for completion
+        with the same propagation rank are completed with one call of the group's
+        `_add_values_to_be_updated_in_batch(owners, update_values)`. The default is no group.
+
+        Returns:
+            The batch group, or None
+        """
+        return None
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, TypeVar, Optional, Mapping, Protocol, Literal
+from typing import TYPE_CHECKING, Any, TypeVar, Optional, Mapping, Protocol, Literal
 from logging import Logger
 
 from .._nexus_system.has_nexus_manager_protocol import HasNexusManagerProtocol
@@ -41,6 +41,24 @@ class CarriesSomeHooksProtocol(HasNexusManagerProtocol, Protocol[HK, HV]):
         """
         ...
 
+    def _get_derived_hook_keys(self) -> set[HK]:
+        """
+        Get the keys of the hooks whose values are computed from the other hooks of this owner.
+        """
+        ...
+
+    def _has_unlisted_hooks(self) -> bool:
+        """
+        Whether this owner has hooks that are not listed by `_get_hook_keys()` (e.g. hooks created on demand).
+        """
+        ...
+
+    def _get_batch_group(self) -> Optional[Any]:
+        """
+        Get the object completing this owner together with other owners of the same group.
+        """
+        ...
+
     def _get_value_by_key(self, key: HK) -> HV:
         """
         Get a value as a copy by its key.
@@ -1,11 +1,13 @@
-from typing import Callable, Generic, Mapping, Optional, TypeVar, Any, Literal
+from typing import Callable, Generic, Mapping, Optional, TypeVar, Any, Literal, Iterable
 from logging import Logger
+import weakref
 
 from .._auxiliary.listening_base import ListeningBase
 from .._hooks.hook_protocols.owned_hook_protocol import OwnedHookProtocol
 from .._hooks.hook_protocols.owned_read_only_hook_protocol import OwnedReadOnlyHookProtocol
 from .._hooks.hook_protocols.owned_full_hook_protocol import OwnedFullHookProtocol
 from .._hooks.owned_hook import OwnedHook
+from .._hooks.lazy_owned_hook import LazyOwnedHook
 from .._hooks.mixin_protocols.hook_with_owner_protocol import HookWithOwnerProtocol
 from .._hooks.mixin_protocols.hook_with_getter_protocol import HookWithGetterProtocol
 from .._hooks.hook_aliases import Hook, ReadOnlyHook
@@ -25,6 +27,9 @@ PHV = TypeVar("PHV", covariant=True)
 SHV = TypeVar("SHV", covariant=True)
 O = TypeVar("O", bound="ComplexObservableBase[Any, Any, Any, Any, Any]")
 
+_DYNAMIC_HOOK_RELEASE_SIZE: int = 64
+"""Number of dynamic hooks from which on creating another one first releases the unobserved ones."""
+
 class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV, O], XObjectSerializableMixin[PHK|SHK, PHV|SHV], Generic[PHK, SHK, PHV, SHV, O]):
     """
     Base class for all observable objects in the hook-based architecture.
@@ -160,7 +165,9 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             add_values_to_be_updated_callback: Optional[Callable[[O, UpdateFunctionValues[PHK, PHV]], Mapping[PHK, PHV]]] = None,
             invalidate_callback: Optional[Callable[[], None]] = None,
             logger: Optional[Logger] = None,
-            nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER):
+            nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER,
+            secondary_hook_dependencies: Mapping[SHK, Iterable[PHK]] = {},
+            lazy_secondary_hook_keys: Iterable[SHK] = ()):
         """
         Initialize the BaseObservable with hook-based architecture.
 
@@ -302,6 +309,31 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             NexusManager instance for coordinating value updates.
             Defaults to DEFAULT_NEXUS_MANAGER. Controls how values are synchronized
             and equality is checked across the hook system.
+
+        secondary_hook_dependencies : Mapping[SHK, Iterable[PHK]], optional
+            Primary hook keys that a secondary hook callback reads. A secondary hook with
+            declared dependencies is only recomputed if one of its dependencies changes in
+            a submission; secondary hooks without an entry are recomputed on every submission.
+
+            Examples
+            --------
+            >>> secondary_hook_dependencies = {
+            ...     'length': ['items'],
+            ...     'average': ['numbers'],
+            ... }
+
+        lazy_secondary_hook_keys : Iterable[SHK], optional
+            Secondary hooks that are only computed when somebody looks at them. While such a
+            hook is not observed (not joined with other hooks, no listeners and no subscribers),
+            submissions neither compute nor submit its value; the value is computed on the next
+            read of the hook, or before it is joined or gets a listener or subscriber. Observed lazy hooks are updated like any other secondary hook.
+
+            Notes
+            -----
+            - Useful for expensive derived values that are rarely read
+            - A read recomputes the value only if the primary values it depends on are
+              different objects than at the last computation
+            - `previous_value` of an unobserved lazy hook is not maintained
             
         Notes
         -----
@@ -314,6 +346,7 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
         
         Error Handling:
         - Raises ValueError if primary and secondary hook keys overlap
+        - Raises ValueError if secondary hook dependencies or lazy keys name unknown hooks
         - Raises ValueError if verification_method returns False
         - Raises ValueError if add_values_to_be_updated_callback returns invalid keys
         - Logs errors from invalidate_callback but doesn't raise them
@@ -327,6 +360,13 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
         self._secondary_values: dict[SHK, SHV] = {}
         """Just to ensure that the secondary values cannot be modified from outside. They can be different, but only within the nexus manager's equality check. These values are never used for anything else."""
 
+        # Dynamic hooks (see _get_or_create_dynamic_hook), by hook key and by id of the hook
+        self._dynamic_hooks: dict[Any, OwnedHook[Any]] = {}
+        self._released_dynamic_hooks: dict[Any, weakref.ref[OwnedHook[Any]]] = {}
+        self._dynamic_hook_keys: dict[int, Any] = {}
+        self._derived_dynamic_hook_values: dict[Any, Any] = {}
+        self._dynamic_hook_release_size: int = _DYNAMIC_HOOK_RELEASE_SIZE
+
         # Eager Caching
         self._primary_hook_keys = set(initial_hook_values.keys())
         self._secondary_hook_keys = set(secondary_hook_callbacks.keys())
@@ -335,6 +375,14 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
         if self._primary_hook_keys & self._secondary_hook_keys:
             raise ValueError("Primary hook keys and secondary hook keys must be disjoint")
 
+        self._secondary_hook_dependencies: dict[SHK, frozenset[PHK]] = {key: frozenset(dependencies) for key, dependencies in secondary_hook_dependencies.items()}
+        self._lazy_secondary_hook_keys: frozenset[SHK] = frozenset(lazy_secondary_hook_keys)
+        if not self._secondary_hook_dependencies.keys() <= self._secondary_hook_keys or not self._lazy_secondary_hook_keys <= self._secondary_hook_keys:
+            raise ValueError("Secondary hook dependencies and lazy secondary hook keys must refer to secondary hook keys")
+        for dependencies in self._secondary_hook_dependencies.values():
+            if not dependencies <= self._primary_hook_keys:
+                raise ValueError("Secondary hook dependencies must be primary hook keys")
+
         # Initialize the BaseListening
         ListeningBase.__init__(self, logger)
 
@@ -352,6 +400,11 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
 
         def internal_validation_in_isolation_callback(self_ref: O, values: Mapping[PHK|SHK, PHV|SHV]) -> tuple[bool, str]:
             if verification_method is None:
+                for key, value in values.items():
+                    if key not in self_ref._primary_hooks and key not in self_ref._secondary_hooks:
+                        success, msg = self_ref._validate_dynamic_hook_value(key, value)
+                        if not success:
+                            return False, msg
                 return True, "No verification method provided. Default is True"
             else:
                 primary_values_dict: dict[PHK, PHV] = dict(self_ref.primary_values)
@@ -363,16 +416,29 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
                         if not self_ref._get_nexus_manager().is_equal(self_ref._secondary_values[key], value):
                             return False, f"Internal secondary value for key {key} ( {self_ref._secondary_values[key]} ) is not equal to the submitted value {value}"
                     else:
-                        raise ValueError(f"Key {key} not found in component_hooks or secondary_hooks")
+                        success, msg = self_ref._validate_dynamic_hook_value(key, value)
+                        if not success:
+                            return False, msg
                 success, msg = verification_method(primary_values_dict)
                 return success, msg
 
         def internal_add_values_to_be_updated_callback(self_ref: O, update_values: UpdateFunctionValues[PHK|SHK, PHV|SHV]) -> Mapping[PHK|SHK, PHV|SHV]:
+            # Step 0: Take over the values submitted to dynamic hooks into the primary values
+            submitted: Mapping[PHK|SHK, PHV|SHV] = update_values.submitted
+            taken_over_values: Mapping[PHK, PHV] = {}
+            dynamic_hook_values: dict[Any, Any] = {
+                key: value for key, value in submitted.items() if key not in self_ref._primary_hook_keys and key not in self_ref._secondary_hook_keys
+            }
+            if dynamic_hook_values:
+                taken_over_values = self_ref._primary_values_of_dynamic_hooks(dynamic_hook_values, update_values)
+                submitted = {key: value for key, value in submitted.items() if key not in dynamic_hook_values}
+                submitted.update(taken_over_values) # type: ignore
+
             # Step 1: Complete the primary values
             primary_values: dict[PHK, PHV] = {}
             for key, hook in self_ref._primary_hooks.items():
-                if key in update_values.submitted:
-                    primary_values[key] = update_values.submitted[key] # type: ignore
+                if key in submitted:
+                    primary_values[key] = submitted[key] # type: ignore
                 else:
                     primary_values[key] = hook.value
 
@@ -384,7 +450,7 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
                     if key in self_ref._primary_hook_keys:
                         current_values_only_primary[key] = value # type: ignore
                 submitted_values_only_primary: Mapping[PHK, PHV] = {}
-                for key, value in update_values.submitted.items():
+                for key, value in submitted.items():
                     if key in self_ref._primary_hook_keys:
                         submitted_values_only_primary[key] = value # type: ignore
 
@@ -395,14 +461,31 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
                         raise ValueError(f"Additional values keys must only contain primary hook keys")
 
                 primary_values.update(additional_values) # type: ignore
+            for key, value in taken_over_values.items():
+                additional_values.setdefault(key, value) # type: ignore
 
             # Step 3: Generate the secondary values
-            for key in self_ref._secondary_hooks.keys():
+            # A callback returning the very object its hook already holds reports "unchanged", so the hook is left out of the submission
+            # Secondary hooks whose declared dependencies did not change are skipped, unobserved lazy ones are computed when read
+            changed_keys: set[PHK] = {key for key, hook in self_ref._primary_hooks.items() if primary_values[key] is not hook.value}
+            for key, secondary_hook in self_ref._secondary_hooks.items():
+                dependencies = self_ref._secondary_hook_dependencies.get(key)
+                if dependencies is not None and dependencies.isdisjoint(changed_keys):
+                    continue
+                if isinstance(secondary_hook, LazyOwnedHook) and not secondary_hook.is_observed():
+                    continue
                 value = self_ref._secondary_hook_callbacks[key](primary_values)
                 self_ref._secondary_values[key] = value
-                additional_values[key] = value
+                if value is not secondary_hook.value:
+                    additional_values[key] = value
+
+            # Step 4: Derive the values of the dynamic hooks affected by the change
+            self_ref._derived_dynamic_hook_values = {}
+            if changed_keys and (self_ref._dynamic_hooks or self_ref._released_dynamic_hooks):
+                self_ref._derived_dynamic_hook_values = dict(self_ref._derive_dynamic_hook_values(update_values.current, primary_values)) # type: ignore
+                additional_values.update(self_ref._derived_dynamic_hook_values)
 
-            # Step 4: Return the additional values
+            # Step 5: Return the additional values
             return additional_values
         
         CarriesSomeHooksBase.__init__( # type: ignore
@@ -434,6 +517,17 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
         self._secondary_hook_callbacks: dict[SHK, Callable[[Mapping[PHK, PHV]], SHV]] = {}
         for key, _callback in secondary_hook_callbacks.items():
             self._secondary_hook_callbacks[key] = _callback
+            if key in self._lazy_secondary_hook_keys:
+                # Computed on first read
+                self._secondary_values[key] = None # type: ignore
+                self._secondary_hooks[key] = LazyOwnedHook[SHV](
+                    self,
+                    None, # type: ignore
+                    lambda key=key: self._compute_lazy_secondary_value(key),
+                    lambda key=key: self._get_lazy_secondary_source_values(key),
+                    logger,
+                    nexus_manager)
+                continue
             value = _callback(initial_primary_hook_values)
             self._secondary_values[key] = value
             secondary_hook = OwnedHook[SHV](self, value, logger, nexus_manager)
@@ -441,6 +535,134 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
 
         #-------------------------------- Initialize finished --------------------------------
 
+    def _get_lazy_secondary_source_values(self, key: SHK) -> tuple[Any, ...]:
+        """
+        Get the primary values a lazy secondary hook depends on (all primary values if it declares no dependencies).
+        """
+        dependencies = self._secondary_hook_dependencies.get(key)
+        if dependencies is None:
+            return tuple(hook.value for hook in self._primary_hooks.values())
+        return tuple(hook.value for primary_key, hook in self._primary_hooks.items() if primary_key in dependencies)
+
+    def _compute_lazy_secondary_value(self, key: SHK) -> SHV:
+        """
+        Compute the value of a lazy secondary hook from the current primary values.
+        """
+        primary_values: dict[PHK, PHV] = {primary_key: hook.value for primary_key, hook in self._primary_hooks.items()}
+        value = self._secondary_hook_callbacks[key](primary_values)
+        self._secondary_values[key] = value
+        return value
+
+    #########################################################################
+    # Dynamic hooks
+    #########################################################################
+
+    def _get_or_create_dynamic_hook(self, hook_key: Any, initial_value: Callable[[], Any]) -> OwnedHook[Any]:
+        """
+        Get the dynamic hook for `hook_key`, creating it with the value of `initial_value()` on first access.
+
+        Dynamic hooks are created on demand for a part of the primary values (e.g. a single key of
+        a dictionary). They are not part of `_get_hook_keys()`, so that their number does not slow
+        down submissions: if the primary values change, `_derive_dynamic_hook_values` gives the new
+        values of the affected ones only, and values submitted to them are taken over into the
+        primary values by `_primary_values_of_dynamic_hooks`.
+
+        The owner keeps a dynamic hook while it is joined or has listeners or subscribers. Others
+        are released once many hooks were created: they are kept (and updated) only as long as
+        they are referenced elsewhere, and are registered again when they are requested again.
+        """
+        with self._lock:
+            hook = self._dynamic_hooks.get(hook_key)
+            if hook is not None:
+                return hook
+            hook_ref = self._released_dynamic_hooks.pop(hook_key, None)
+            if hook_ref is not None:
+                hook = hook_ref()
+                if hook is not None:
+                    self._dynamic_hooks[hook_key] = hook
+                    return hook
+                self._dynamic_hook_dropped(hook_key)
+            if len(self._dynamic_hooks) + len(self._released_dynamic_hooks) >= self._dynamic_hook_release_size:
+                self._release_dynamic_hooks()
+            hook = OwnedHook[Any](self, initial_value(), self._logger, self._nexus_manager) # type: ignore
+            self._dynamic_hooks[hook_key] = hook
+            self._dynamic_hook_keys[id(hook)] = hook_key
+            self._dynamic_hook_created(hook_key)
+            return hook
+
+    def _get_dynamic_hook(self, hook_key: Any) -> Optional[OwnedHook[Any]]:
+        """Get the dynamic hook for `hook_key`, or None if there is none (anymore)."""
+        hook = self._dynamic_hooks.get(hook_key)
+        if hook is None:
+            hook_ref = self._released_dynamic_hooks.get(hook_key)
+            if hook_ref is not None:
+                hook = hook_ref()
+        return hook
+
+    def _get_dynamic_hooks(self) -> dict[Any, OwnedHook[Any]]:
+        """Get all dynamic hooks by hook key, including the released ones that are still referenced elsewhere."""
+        hooks: dict[Any, OwnedHook[Any]] = dict(self._dynamic_hooks)
+        for hook_key, hook_ref in self._released_dynamic_hooks.items():
+            hook = hook_ref()
+            if hook is not None:
+                hooks[hook_key] = hook
+        return hooks
+
+    def _release_dynamic_hooks(self) -> None:
+        """
+        Keep the unobserved dynamic hooks by weak reference only, and drop the released ones that are gone.
+        """
+        for hook_key, hook_ref in list(self._released_dynamic_hooks.items()):
+            released_hook = hook_ref()
+            if released_hook is None:
+                del self._released_dynamic_hooks[hook_key]
+                self._dynamic_hook_dropped(hook_key)
+            elif released_hook.is_observed():
+                del self._released_dynamic_hooks[hook_key]
+                self._dynamic_hooks[hook_key] = released_hook
+        for hook_key, hook in list(self._dynamic_hooks.items()):
+            if not hook.is_observed():
+                del self._dynamic_hooks[hook_key]
+                self._released_dynamic_hooks[hook_key] = weakref.ref(hook)
+        self._dynamic_hook_keys = {id(hook): hook_key for hook_key, hook in self._get_dynamic_hooks().items()}
+        self._dynamic_hook_release_size = max(_DYNAMIC_HOOK_RELEASE_SIZE, 2 * (len(self._dynamic_hooks) + len(self._released_dynamic_hooks)))
+
+    def _dynamic_hook_created(self, hook_key: Any) -> None:
+        """Called after a dynamic hook was created. Override to index it."""
+        pass
+
+    def _dynamic_hook_dropped(self, hook_key: Any) -> None:
+        """Called after a released dynamic hook was dropped. Override to remove it from an index."""
+        pass
+
+    def _primary_values_of_dynamic_hooks(self, values: Mapping[Any, Any], update_values: UpdateFunctionValues[PHK|SHK, PHV|SHV]) -> Mapping[PHK, PHV]:
+        """
+        Get the primary values that take over the `values` submitted to dynamic hooks.
+
+        By default, dynamic hooks are read-only: their submitted values are only validated.
+        """
+        return {}
+
+    def _derive_dynamic_hook_values(self, current: Mapping[PHK|SHK, PHV|SHV], final: Mapping[PHK, PHV]) -> Mapping[Any, Any]:
+        """
+        Get the new values of the dynamic hooks whose value changes with the primary values from `current` to `final`.
+
+        Called after the secondary values were derived. Dynamic hooks that are left out keep their value.
+        """
+        return {}
+
+    def _validate_dynamic_hook_value(self, hook_key: Any, value: Any) -> tuple[bool, str]:
+        """
+        Check that a value submitted to a dynamic hook is the one derived for it (or its current value, if it was not derived).
+        """
+        hook = self._get_dynamic_hook(hook_key)
+        if hook is None:
+            raise ValueError(f"Key {hook_key} not found in component_hooks or secondary_hooks")
+        expected = self._derived_dynamic_hook_values[hook_key] if hook_key in self._derived_dynamic_hook_values else hook.value
+        if not self._get_nexus_manager().is_equal(expected, value):
+            return False, f"Value {value} of the hook for {hook_key} does not match {expected}"
+        return True, "Dynamic hook value matches"
+
     #########################################################################
     # CarriesSomeHooksBase methods implementation
     #########################################################################
@@ -474,8 +696,10 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             return self._primary_hooks[key] # type: ignore
         elif key in self._secondary_hooks:
             return self._secondary_hooks[key] # type: ignore
-        else:
-            raise ValueError(f"Key {key} not found in component_hooks or secondary_hooks")
+        dynamic_hook = self._get_dynamic_hook(key)
+        if dynamic_hook is not None:
+            return dynamic_hook # type: ignore
+        raise ValueError(f"Key {key} not found in component_hooks or secondary_hooks")
 
     def _get_hook_keys(self) -> set[PHK|SHK]:
         """
@@ -493,11 +717,30 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
         """
         return set(self._primary_hooks.keys()) | set(self._secondary_hooks.keys())
 
+    def _has_unlisted_hooks(self) -> bool:
+        """
+        Whether there are dynamic hooks (they are not part of `_get_hook_keys()`).
+        """
+        return bool(self._dynamic_hooks) or bool(self._released_dynamic_hooks)
+
+    def _get_derived_hook_keys(self) -> set[SHK]:
+        """
+        Get the secondary hook keys, their values are computed from the primary values.
+        """
+        return set(self._secondary_hooks.keys())
+
     def _get_value_by_key(self, key: PHK|SHK) -> PHV|SHV:
         """
         Get a value by its key.
+
+        The nexus system reads the values of all hooks of an owner during a submission. For lazy
+        secondary hooks this returns the stored value without computing it; public reads go
+        through the hook (see `value_by_key`).
         """
-        return self._get_hook_by_key(key).value
+        hook = self._get_hook_by_key(key)
+        if isinstance(hook, LazyOwnedHook):
+            return hook._get_nexus().stored_value # type: ignore
+        return hook.value
 
     def _get_key_by_hook_or_nexus(self, hook_or_nexus: OwnedHookProtocol[PHV|SHV]|Nexus[PHV|SHV]) -> PHK|SHK:
         """
@@ -530,6 +773,9 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             for key, hook in self._secondary_hooks.items():
                 if hook._get_nexus() == hook_or_nexus: # type: ignore
                     return key
+            for key, hook in self._get_dynamic_hooks().items():
+                if hook._get_nexus() is hook_or_nexus: # type: ignore
+                    return key
             raise ValueError(f"Hook {hook_or_nexus} not found in component_hooks or secondary_hooks")
         elif isinstance(hook_or_nexus, HookWithOwnerProtocol): #type: ignore
             for key, hook in self._primary_hooks.items():
@@ -538,10 +784,21 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             for key, hook in self._secondary_hooks.items():
                 if hook == hook_or_nexus:
                     return key
+            # Dynamic hooks are found through the reverse index
+            if id(hook_or_nexus) in self._dynamic_hook_keys:
+                key = self._dynamic_hook_keys[id(hook_or_nexus)]
+                if self._get_dynamic_hook(key) is hook_or_nexus:
+                    return key
             raise ValueError(f"Hook {hook_or_nexus} not found in component_hooks or secondary_hooks")
         else:
             raise ValueError(f"Hook {hook_or_nexus} not found in component_hooks or secondary_hooks")
 
+    def _isolate(self, key: Optional[PHK|SHK] = None) -> None:
+        super()._isolate(key)
+        if key is None:
+            for dynamic_hook in self._get_dynamic_hooks().values():
+                dynamic_hook._isolate() # type: ignore
+
     #########################################################
     # ObservableSerializable implementation
     #########################################################
@@ -631,7 +888,7 @@ class ComplexObservableBase(ListeningBase, CarriesSomeHooksBase[PHK|SHK, PHV|SHV
             ValueError: If the key is not found in component_hooks or secondary_hooks
         """
         with self._lock:
-            return self._get_value_by_key(key)
+            return self._get_hook_by_key(key).value
 
     def hook_by_key(self, key: PHK|SHK) -> OwnedFullHookProtocol[PHV|SHV]:
         """
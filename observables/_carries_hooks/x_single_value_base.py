@@ -1,4 +1,4 @@
-from typing import Callable, Generic, Literal, Mapping, Optional, TypeVar
+from typing import Awaitable, Callable, Generic, Literal, Mapping, Optional, TypeVar, TYPE_CHECKING
 from logging import Logger
 from threading import RLock
 
@@ -15,6 +15,9 @@ from .carries_single_hook_protocol import CarriesSingleHookProtocol
 from .._carries_hooks.x_object_serializable_mixin import XObjectSerializableMixin
 from .._carries_hooks.carries_some_hooks_base import CarriesSomeHooksBase
 
+if TYPE_CHECKING:
+    from .._xobjects.function_like.function_memo import FunctionMemo
+
 T = TypeVar("T")
 
 class XValueBase(ListeningBase, CarriesSomeHooksBase[Literal["value"], T, "XValueBase[T]"], CarriesSingleHookProtocol[T], XObjectSerializableMixin[Literal["value"], T], Generic[T]):
@@ -42,7 +45,9 @@ class XValueBase(ListeningBase, CarriesSomeHooksBase[Literal["value"], T, "XValu
             verification_method: Optional[Callable[[T], tuple[bool, str]]] = None,
             invalidate_callback: Optional[Callable[[], None]] = None,
             logger: Optional[Logger] = None,
-            nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER):
+            nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER,
+            validation_memo: Optional["FunctionMemo[Literal['value'], T, tuple[bool, str]]"] = None,
+            async_verification_method: Optional[Callable[[T], Awaitable[tuple[bool, str]]]] = None):
         """
         Initialize the XValueBase.
         
@@ -52,6 +57,8 @@ class XValueBase(ListeningBase, CarriesSomeHooksBase[Literal["value"], T, "XValu
             invalidate_callback: Optional callback for post-change actions
             logger: Optional logger for debugging
             nexus_manager: NexusManager for coordinating updates
+            validation_memo: Optional FunctionMemo caching the results of a pure verification method
+            async_verification_method: Optional coroutine function validating values of asynchronous submissions
         """
 
         #-------------------------------- Initialization start --------------------------------
@@ -109,11 +116,23 @@ class XValueBase(ListeningBase, CarriesSomeHooksBase[Literal["value"], T, "XValu
             
             return True, "Value is valid"
 
+        async def validate_complete_values_in_isolation_async_callback(
+            self_ref: "XValueBase[T]",
+            values: Mapping[Literal["value"], T]
+        ) -> tuple[bool, str]:
+            """Validate the complete values using the asynchronous verification method."""
+            try:
+                return await async_verification_method(values["value"]) # type: ignore
+            except Exception as e:
+                return False, f"Validation error: {e}"
+
         CarriesSomeHooksBase.__init__( # type: ignore
             self,
             validate_complete_values_in_isolation_callback=validate_complete_values_in_isolation_callback,
+            validate_complete_values_in_isolation_async_callback=validate_complete_values_in_isolation_async_callback if async_verification_method is not None else None,
             logger=logger,
-            nexus_manager=nexus_manager
+            nexus_manager=nexus_manager,
+            validation_memo=validation_memo
         )
 
         # If initialized with a Hook, join to it
@@ -232,8 +251,9 @@ class XValueBase(ListeningBase, CarriesSomeHooksBase[Literal["value"], T, "XValu
         Returns:
             Tuple of (success, message)
         """
-        # First check custom verification method if provided
-        if self._verification_method is not None:
+        # First check custom verification method if provided (with a validation memo, the
+        # NexusManager answers from the cache instead)
+        if self._verification_method is not None and self._validation_memo is None:
             try:
                 success, msg = self._verification_method(value)
                 if not success:
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Optional, Callable
+from typing import Generic, Literal, TypeVar, Optional, Callable, TYPE_CHECKING
 from logging import Logger
 
 from .._auxiliary.listening_base import ListeningBase
@@ -9,11 +9,17 @@ from .hook_bases.full_hook_base import FullHookBase
 from .mixin_protocols.hook_with_isolated_validation_protocol import HookWithIsolatedValidationProtocol
 from .mixin_protocols.hook_with_reaction_protocol import HookWithReactionProtocol
 
+if TYPE_CHECKING:
+    from .._xobjects.function_like.function_memo import FunctionMemo
+
 T = TypeVar("T")
 
 class FloatingHook(FullHookBase[T], HookWithIsolatedValidationProtocol[T], HookWithReactionProtocol, ListeningBase, Generic[T]):
     """
     A floating hook that can be used to store a value that is not owned by any observable.
+
+    With a validation_memo (a FunctionMemo), the results of a pure isolated validation callback
+    are cached per value.
     """
 
     def __init__(
@@ -22,11 +28,13 @@ class FloatingHook(FullHookBase[T], HookWithIsolatedValidationProtocol[T], HookW
         reaction_callback: Optional[Callable[[], tuple[bool, str]]] = None,
         isolated_validation_callback: Optional[Callable[[T], tuple[bool, str]]] = None,
         logger: Optional[Logger] = None,
-        nexus_manager: "NexusManager" = DEFAULT_NEXUS_MANAGER
+        nexus_manager: "NexusManager" = DEFAULT_NEXUS_MANAGER,
+        validation_memo: Optional["FunctionMemo[Literal['value'], T, tuple[bool, str]]"] = None
         ) -> None:
         
         self._reaction_callback = reaction_callback
         self._isolated_validation_callback = isolated_validation_callback
+        self._validation_memo = validation_memo
 
         ListeningBase.__init__(self, logger)
         FullHookBase.__init__( # type: ignore
@@ -44,6 +52,9 @@ class FloatingHook(FullHookBase[T], HookWithIsolatedValidationProtocol[T], HookW
     def validate_value_in_isolation(self, value: T) -> tuple[bool, str]:
         """Validate the value in isolation."""
         if self._isolated_validation_callback is not None:
+            if self._validation_memo is not None:
+                callback = self._isolated_validation_callback
+                return self._validation_memo.call(lambda values: callback(values["value"]), {"value": value})
             return self._isolated_validation_callback(value)
         else:
             return True, "No isolated validation callback provided"
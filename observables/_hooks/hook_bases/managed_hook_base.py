@@ -350,6 +350,9 @@ class ManagedHookBase(ManagedHookProtocol[T], Publisher, ListeningBase, Generic[
                 log(self, "disconnect", self._logger, True, "Hook was the last in the nexus, so it is already 'disconnected'")
                 return
             
+            # The owners sharing the nexus may change their propagation order
+            self._nexus_manager._hook_isolating(self) # type: ignore
+
             # Create a new isolated nexus for this hook
             new_hook_nexus = Nexus(self.value, hooks={self}, nexus_manager=self._nexus_manager, logger=self._logger)
             
@@ -0,0 +1,90 @@
+from typing import Callable, Generic, Optional, TypeVar, Any, TYPE_CHECKING
+from logging import Logger
+
+from .._nexus_system.nexus_manager import NexusManager
+from .._nexus_system.default_nexus_manager import DEFAULT_NEXUS_MANAGER
+from .._carries_hooks.carries_some_hooks_protocol import CarriesSomeHooksProtocol
+
+from .owned_hook import OwnedHook
+
+if TYPE_CHECKING:
+    from .._publisher_subscriber.subscriber import Subscriber
+
+T = TypeVar("T")
+
+class LazyOwnedHook(OwnedHook[T], Generic[T]):
+    """
+    An owned hook whose value is only computed when somebody looks at it.
+
+    Used for lazy secondary hooks: while the hook is not observed (not joined with other
+    hooks, no listeners and no subscribers), the owner does not compute or submit its value.
+    Instead, the hook remembers the values its value was computed from (`source_callback`)
+    and recomputes it with `compute_callback` when it is read and these values have changed,
+    and before it is joined or gets a listener or subscriber. Once observed, the owner keeps
+    the value up to date like for any other hook.
+    """
+
+    def __init__(
+            self,
+            owner: CarriesSomeHooksProtocol[Any, Any],
+            initial_value: T,
+            compute_callback: Callable[[], T],
+            source_callback: Callable[[], tuple[Any, ...]],
+            logger: Optional[Logger] = None,
+            nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER
+            ) -> None:
+
+        super().__init__(owner, initial_value, logger, nexus_manager)
+        self._compute_callback = compute_callback
+        self._source_callback = source_callback
+        self._source_values: Optional[tuple[Any, ...]] = None
+
+    def is_outdated(self) -> bool:
+        """Whether the values the stored value was computed from have changed since."""
+        source_values = self._source_values
+        if source_values is None:
+            return True
+        current_values = self._source_callback()
+        return len(current_values) != len(source_values) or any(current is not source for current, source in zip(current_values, source_values))
+
+    def _refresh(self) -> None:
+        """Recompute an outdated value of an unobserved hook and store it in its (unshared) nexus."""
+        if self.is_observed() or not self.is_outdated():
+            return
+        # Submissions change the source values and join the nexus under the manager lock,
+        # so the value is computed and stored under it as well (checked again once held).
+        with self._nexus_manager._lock:
+            if self.is_observed() or not self.is_outdated():
+                return
+            source_values: tuple[Any, ...] = self._source_callback()
+            # Nobody else shares the nexus and nobody listens, so the value is stored without a submission.
+            # The value is stored before the source values, see _peek_value.
+            self._hook_nexus._stored_value = self._compute_callback() # type: ignore
+            self._source_values = source_values
+
+    def _peek_value(self) -> T:
+        """
+        Get the current value without storing anything: an outdated value is computed but not stored.
+
+        Used by lock-free readers (see NexusManager.snapshot), which must not write to the hook
+        while other threads refresh it. Reading the source values before the stored value (the
+        reverse of _refresh) never pairs current source values with an outdated value.
+        """
+        if self.is_observed() or not self.is_outdated():
+            return self._hook_nexus._stored_value # type: ignore
+        return self._compute_callback()
+
+    def _get_value(self) -> T:
+        self._refresh()
+        return super()._get_value()
+
+    def add_listener(self, *callbacks: Callable[[], None]) -> None:
+        # The manager lock is taken before the hook lock, like in a submission.
+        with self._nexus_manager._lock, self._lock:
+            self._refresh()
+            super().add_listener(*callbacks)
+
+    def add_subscriber(self, subscriber: "Subscriber|Callable[[], None]") -> None:
+        with self._nexus_manager._lock, self._lock:
+            self._refresh()
+            super().add_subscriber(subscriber)
@@ -17,3 +17,22 @@ class HookWithOwnerProtocol(Protocol[T]): # type: ignore
         """
         ...
 
+
+
+_hook_types_with_owner: set[type] = set()
+
+def is_hook_with_owner(hook: Any) -> bool:
+    """
+    Check isinstance(hook, HookWithOwnerProtocol), cached for hook classes defining `owner`.
+
+    Runtime protocol checks inspect all protocol attributes on every call, which dominates the
+    completion of submissions touching thousands of hooks.
+    """
+    hook_type: type = type(hook)
+    if hook_type in _hook_types_with_owner:
+        return True
+    if not isinstance(hook, HookWithOwnerProtocol):
+        return False
+    if hasattr(hook_type, "owner"):
+        _hook_types_with_owner.add(hook_type)
+    return True
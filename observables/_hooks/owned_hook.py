@@ -65,6 +65,12 @@ class OwnedHook(FullHookBase[T], OwnedFullHookProtocol[T], ListeningBase, Generi
         success, _ = self.owner._validate_value(hook_key, value) # type: ignore
         return success
 
+    def is_observed(self) -> bool:
+        """Whether the hook is joined with other hooks or has listeners or subscribers."""
+        if len(self._listeners) > 0 or self._has_receivers():
+            return True
+        return len(self._hook_nexus.hooks) > 1
+
     #########################################################
     # Debugging convenience methods
     #########################################################
@@ -175,6 +175,50 @@ except ImportError:
     pass
 
 
+# --- numpy integration ---
+try:
+    import numpy
+
+    from .._xobjects.array_like.array_change import recorded_array_change
+
+    def _value_equality_callback_ndarray(value1: numpy.ndarray, value2: numpy.ndarray) -> bool:
+        """Check equality for numpy arrays, element-wise and vectorized.
+
+        If one array was created from the other by a recorded region edit (see XArray), only
+        that region is compared.
+
+        Args:
+            value1: First array to compare
+            value2: Second array to compare
+
+        Returns:
+            True if both arrays have the same shape and equal elements, False otherwise.
+            Floating point elements are compared with FLOAT_ACCURACY as absolute tolerance,
+            and NaN is considered equal to NaN.
+        """
+        if value1 is value2:
+            return True
+        if value1.shape != value2.shape:
+            return False
+        change = recorded_array_change(value1, value2) or recorded_array_change(value2, value1)
+        if change is not None:
+            value1, value2 = value1[change.region], value2[change.region]
+        kinds: str = value1.dtype.kind + value2.dtype.kind
+        # The tolerance only applies if both arrays are numeric (allclose has no loop for e.g. strings)
+        if ("f" in kinds or "c" in kinds) and all(kind in "biufc" for kind in kinds):
+            return bool(numpy.allclose(value1, value2, rtol=0.0, atol=FLOAT_ACCURACY, equal_nan=True))
+        try:
+            return bool(numpy.array_equal(value1, value2))
+        except TypeError:
+            return False
+
+    _value_equality_callbacks[(numpy.ndarray, numpy.ndarray)] = _value_equality_callback_ndarray # type: ignore
+
+except ImportError:
+    # numpy is not available, skip ndarray support
+    pass
+
+
 # --- Add additional optional integrations here ---
 # Example:
 # try:
@@ -116,6 +116,8 @@ class Nexus(Generic[T]):
         self._hooks: set[weakref.ref["HookWithConnectionProtocol[T]"]] = {weakref.ref(hook) for hook in hooks}
         self._stored_value: T = value
         self._previous_stored_value: T = value
+        # Bumped after every update of the value and when the nexus is merged or loses a hook
+        self._version: int = 0
         self._logger: Optional[logging.Logger] = logger
         self._submit_depth_counter: int = 0
         self._submit_touched_hooks: set["HookWithConnectionProtocol[T]"] = set()
@@ -139,6 +141,20 @@ class Nexus(Generic[T]):
         
         return alive_hooks
 
+    def _refresh_lazy_hooks(self) -> None:
+        """
+        Compute the outdated value of a lazy hook in the nexus (see LazyOwnedHook), before the
+        stored value is used to join the nexus. Lazy hooks are only outdated while they are alone
+        in their nexus, so larger nexuses are not looked at.
+        """
+        from .._hooks.lazy_owned_hook import LazyOwnedHook
+
+        if len(self._hooks) != 1:
+            return
+        for hook in self._get_hooks():
+            if isinstance(hook, LazyOwnedHook):
+                hook._refresh()
+
     def add_hook(self, hook: "HookWithConnectionProtocol[T]") -> tuple[bool, str]:
         self._hooks.add(weakref.ref(hook))
         log(self, "add_hook", self._logger, True, "Successfully added hook")
@@ -178,6 +194,20 @@ class Nexus(Generic[T]):
         """
         return self._stored_value
 
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the Nexus.
+
+        The version increases whenever the stored value is updated and when the nexus is
+        merged into another nexus or a hook is isolated from it. Read the version before the
+        value: submitting with `expected_versions={nexus: version}` then fails if either is stale.
+
+        Returns:
+            The version of this Nexus.
+        """
+        return self._version
+
     @property
     def previous_stored_value(self) -> Any:
         """
@@ -219,12 +249,21 @@ class Nexus(Generic[T]):
                 raise ValueError("The nexus managers must be the same")
         nexus_manager: "NexusManager" = nexuses[0]._nexus_manager
         
-        value_type: Optional[type[T]] = None
+        # Values of different types are only accepted for a persistent collection and its plain
+        # counterpart with the same items (e.g. an XList joined with a hook holding a list). The
+        # merged nexus then stores the reference value for all hooks.
+        from .._xobjects.list_like.persistent_vector import PersistentVector
+        from .._xobjects.set_like.persistent_set import PersistentSet
+        from .._xobjects.dict_like.persistent_map import PersistentMap
+
+        interchangeable_types: tuple[tuple[type, ...], ...] = ((list, PersistentVector), (set, frozenset, PersistentSet), (dict, PersistentMap))
+        value_type: type[T] = type(reference_value)  # type: ignore
         for hook_nexus in nexuses:
-            for hook in hook_nexus._get_hooks():
-                if value_type is None:
-                    value_type = type(hook.value)  # type: ignore
-                elif type(hook.value) != value_type:  # type: ignore
+            other_type: type = type(hook_nexus._stored_value)
+            if other_type != value_type:
+                if not any(value_type in types and other_type in types for types in interchangeable_types):
+                    raise ValueError("The hooks in the hook nexuses must have the same value type")
+                if not nexus_manager.is_equal(reference_value, hook_nexus._stored_value):
                     raise ValueError("The hooks in the hook nexuses must have the same value type")
 
         # Check if any groups have overlapping hooks (not disjoint) and collect all hooks
@@ -249,6 +288,10 @@ class Nexus(Generic[T]):
         for hook_nexus in list_of_hook_nexus:
             for hook in hook_nexus:
                 merged_nexus.add_hook(hook)
+
+        # The merged nexuses are outdated, submissions expecting their versions must fail
+        for nexus in nexuses:
+            nexus._version += 1
         
         return merged_nexus
     
@@ -290,6 +333,9 @@ class Nexus(Generic[T]):
         for hook_pair in hook_pairs:
             nexus_to_take_value_from: Nexus[Any] = hook_pair[0]._get_nexus() # type: ignore
             nexus_to_be_updated: Nexus[Any] = hook_pair[1]._get_nexus() # type: ignore
+            # Lazy hooks on either side must hold their current value before the values are synced
+            nexus_to_take_value_from._refresh_lazy_hooks()
+            nexus_to_be_updated._refresh_lazy_hooks()
             nexus_and_values[nexus_to_be_updated] = nexus_to_take_value_from.stored_value # type: ignore
         success, msg = nexus_manager.submit_values(nexus_and_values)  # type: ignore
         if not success:
@@ -303,6 +349,7 @@ class Nexus(Generic[T]):
             merged_nexus: Nexus[T] = Nexus[T]._merge_nexuses(hook_nexus_1, hook_nexus_2) # type: ignore
             for hook in merged_nexus._get_hooks():
                 hook._replace_nexus(merged_nexus) # type: ignore
+            nexus_manager._nexuses_merged((hook_nexus_1, hook_nexus_2), merged_nexus) # type: ignore
 
         return True, "Successfully linked hook pairs"
     
@@ -337,17 +384,22 @@ class Nexus(Generic[T]):
         
         # Ensure that the value in both hook nexuses is the same
         # The source_hook's value becomes the source of truth
+        source_hook._get_nexus()._refresh_lazy_hooks() # type: ignore
+        target_hook._get_nexus()._refresh_lazy_hooks() # type: ignore
         success, msg = nexus_manager.submit_values({target_hook._get_nexus(): source_hook.value})  # type: ignore
         if not success:
             raise ValueError(msg)
             
         # Then merge the hook nexuses
         # Use the synchronized value for the merged group
-        merged_nexus: Nexus[T] = Nexus[T]._merge_nexuses(source_hook._get_nexus(), target_hook._get_nexus()) # type: ignore
+        source_nexus: Nexus[T] = source_hook._get_nexus() # type: ignore
+        target_nexus: Nexus[T] = target_hook._get_nexus() # type: ignore
+        merged_nexus: Nexus[T] = Nexus[T]._merge_nexuses(source_nexus, target_nexus)
         
         # Replace all hooks' hook nexuses with the merged one
         for hook in merged_nexus._get_hooks():
             hook._replace_nexus(merged_nexus) # type: ignore
+        nexus_manager._nexuses_merged((source_nexus, target_nexus), merged_nexus)
 
         return True, "Successfully linked hooks"
 
@@ -1,19 +1,25 @@
-from typing import Mapping, Any, Optional, TYPE_CHECKING, Callable, Literal, Sequence
+from typing import Awaitable, Iterable, Mapping, Any, Optional, TYPE_CHECKING, Callable, Literal, Sequence
 
 from immutables import Map
 
 from threading import RLock, local
 from logging import Logger
+from itertools import count
+from time import sleep
+import asyncio
+import heapq
 
 from .._utils import log
 
 if TYPE_CHECKING:
     from .._carries_hooks.carries_some_hooks_protocol import CarriesSomeHooksProtocol
 
-from .._hooks.hook_aliases import Hook
+from .._hooks.hook_aliases import Hook, ReadOnlyHook
 from .._auxiliary.listening_protocol import ListeningProtocol
 from .._nexus_system.nexus import Nexus
 from .._nexus_system.update_function_values import UpdateFunctionValues
+from .._nexus_system.propagation_ranks import PropagationRanks, get_derived_hook_keys
+from .._nexus_system.snapshot import Snapshot
 from .._publisher_subscriber.publisher_protocol import PublisherProtocol
 
 class NexusManager:
@@ -74,6 +80,12 @@ class NexusManager:
     ensuring safe concurrent access from multiple threads. The lock serializes
     submissions while allowing nested calls from the same thread.
     
+    Asynchronous Submissions
+    ------------------------
+    `submit_values_async` submits from a coroutine without blocking the event loop: the lock
+    is acquired without waiting and released while asynchronous validators and subscriber
+    reactions are awaited.
+    
     Reentrancy Protection
     ---------------------
     Nested submit_values() calls are allowed as long as they modify independent
@@ -98,6 +110,22 @@ class NexusManager:
         self._value_equality_callbacks: dict[tuple[type[Any], type[Any]], Callable[[Any, Any], bool]] = {}
         self._value_equality_callbacks.update(value_equality_callbacks)
 
+        # ----------- Propagation Order -----------
+
+        self._propagation_ranks = PropagationRanks()
+
+        # ----------- Asynchronous Submissions -----------
+
+        # Incremented whenever nexus values or the nexus topology change, to detect changes
+        # while the lock is released during an asynchronous submission
+        self._change_count: int = 0
+
+        # ----------- Snapshots -----------
+
+        # Incremented before and after the values of a submission are written, so it is odd while
+        # they are written. Lock-free readers retry if it was odd or has changed (see snapshot).
+        self._commit_sequence: int = 0
+
         # ----------------------------------------
 
     ##################################################################################################################
@@ -168,7 +196,29 @@ class NexusManager:
 
     def reset(self) -> None:
         """Reset the nexus manager state for testing purposes."""
-        pass
+        with self._lock:
+            self._propagation_ranks.clear()
+
+    def _nexuses_merged(self, nexuses: tuple["Nexus[Any]", ...], merged_nexus: "Nexus[Any]") -> None:
+        """
+        Notify the manager that hooks have been joined by merging the given nexuses.
+
+        Updates the propagation ranks of the affected owners.
+        """
+        with self._lock:
+            self._change_count += 1
+            self._propagation_ranks.nexuses_merged(nexuses, merged_nexus)
+
+    def _hook_isolating(self, hook: Hook[Any]) -> None:
+        """
+        Notify the manager that the hook is about to be isolated from its nexus.
+
+        Updates the propagation ranks of the affected owners.
+        """
+        with self._lock:
+            self._change_count += 1
+            hook._get_nexus()._version += 1 # type: ignore
+            self._propagation_ranks.hook_isolating(hook)
 
     ##################################################################################################################
     # Synchronization of Nexus and Values
@@ -188,14 +238,28 @@ class NexusManager:
             A tuple containing the value and hook dict corresponding to the owner
         """
 
-        from .._hooks.mixin_protocols.hook_with_owner_protocol import HookWithOwnerProtocol
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
         from .._hooks.hook_aliases import Hook
 
         key_and_value_dict: dict[Any, Any] = {}
         key_and_hook_dict: dict[Any, Hook[Any]] = {}
+
+        # Owners with fewer hooks than the submitted nexuses have (e.g. along a long chain of derived observables,
+        # or many functions joined to one value) look up their own hooks instead of scanning all submitted nexuses.
+        # This needs all hooks of the owner to be listed by its hook keys.
+        hook_keys: set[Any] = owner._get_hook_keys()
+        if not owner._has_unlisted_hooks() and (len(hook_keys) <= len(nexus_and_values) or len(hook_keys) <= sum(len(nexus._hooks) for nexus in nexus_and_values)):
+            for hook_key in hook_keys:
+                owned_hook: Hook[Any] = owner._get_hook_by_key(hook_key) # type: ignore
+                owned_nexus: Nexus[Any] = owned_hook._get_nexus() # type: ignore
+                if owned_nexus in nexus_and_values:
+                    key_and_value_dict[hook_key] = nexus_and_values[owned_nexus]
+                    key_and_hook_dict[hook_key] = owned_hook
+            return key_and_value_dict, key_and_hook_dict
+
         for nexus, value in nexus_and_values.items():
             for hook in nexus.hooks:
-                if isinstance(hook, HookWithOwnerProtocol):
+                if is_hook_with_owner(hook):
                     if hook.owner is owner:
                         hook_key: Any = owner._get_key_by_hook_or_nexus(hook) # type: ignore
                         key_and_value_dict[hook_key] = value
@@ -230,6 +294,11 @@ class NexusManager:
         
         The process continues until no more values need to be added, ensuring all
         related values are synchronized.
+
+        Owners are completed in the order of their propagation rank (see PropagationRanks), and an
+        owner is only completed again if a value of one of its hooks has been added since. Owners that
+        only added values for their derived hooks are not completed again for these values. In a graph
+        of derived observables, every owner is therefore completed once, after all of its inputs.
         """
 
         def insert_value_and_hook_dict_into_nexus_and_values(nexus_and_values: dict["Nexus[Any]", Any], value_dict: dict[Any, Any], hook_dict: dict[Any, Hook[Any]]) -> tuple[bool, str]:
@@ -250,24 +319,21 @@ class NexusManager:
                 nexus_and_values[nexus] = value
             return True, "Successfully inserted value and hook dict into nexus and values"
 
-        def update_nexus_and_value_dict(owner: "CarriesSomeHooksProtocol[Any, Any]", nexus_and_values: dict["Nexus[Any]", Any]) -> tuple[Optional[int], str]:
+        def prepare_update_values(owner: "CarriesSomeHooksProtocol[Any, Any]") -> tuple[dict[Any, Any], dict[Any, Hook[Any]], UpdateFunctionValues[Any, Any]]:
             """
-            This method updates the nexus and values dictionary with the additional nexus and values, if requested by the owner.
+            This method prepares the value and hook dict and the update values to provide to the owner method.
             """
-
-            # Step 1: Prepare the value and hook dict to provide to the owner method
             value_dict, hook_dict = NexusManager._filter_nexus_and_values_for_owner(nexus_and_values, owner)
-
-            # Step 2: Get the additional values from the owner method
             current_values_of_owner: Mapping[Any, Any] = owner._get_dict_of_values() # type: ignore
             update_values = UpdateFunctionValues(current=current_values_of_owner, submitted=Map(value_dict)) # Wrap the value_dict in Map to prevent mutation by the owner function!
+            return value_dict, hook_dict, update_values
 
-            try:
-                additional_value_dict: Mapping[Any, Any] = owner._add_values_to_be_updated(update_values) # type: ignore
-            except Exception as e:
-                return None, f"Error in '_add_values_to_be_updated' of owner '{owner}': {e} (update_values: {update_values})"
+        def insert_additional_values(owner: "CarriesSomeHooksProtocol[Any, Any]", value_dict: dict[Any, Any], hook_dict: dict[Any, Hook[Any]], additional_value_dict: Mapping[Any, Any]) -> tuple[Optional[tuple[list["Nexus[Any]"], set[Any]]], str]:
+            """
+            This method inserts the additional values requested by the owner into the nexus and values dictionary.
+            """
 
-            # Step 4: Make the new values ready for the sync system add them to the value and hook dict
+            # Step 1: Make the new values ready for the sync system add them to the value and hook dict
             for hook_key, value in additional_value_dict.items():
                 error_msg, value_for_storage = self._convert_value_for_storage(value)
                 if error_msg is not None:
@@ -275,41 +341,124 @@ class NexusManager:
                 value_dict[hook_key] = value_for_storage
                 hook_dict[hook_key] = owner._get_hook_by_key(hook_key) # type: ignore
 
-            # Step 5: Insert the value and hook dict into the nexus and values
-            number_of_items_before: int = len(nexus_and_values)
+            # Step 2: Insert the value and hook dict into the nexus and values
+            inserted_nexuses: list[Nexus[Any]] = []
+            for hook_key in additional_value_dict:
+                nexus: Nexus[Any] = hook_dict[hook_key]._get_nexus() # type: ignore
+                if nexus not in nexus_and_values and nexus not in inserted_nexuses:
+                    inserted_nexuses.append(nexus)
             success, msg = insert_value_and_hook_dict_into_nexus_and_values(nexus_and_values, value_dict, hook_dict)
             if success == False:
                 return None, msg
-            number_of_inserted_items: int = len(nexus_and_values) - number_of_items_before
 
-            # Step 6: Return the nexus and values
-            return number_of_inserted_items, "Successfully updated nexus and values"
+            # Step 3: Return the inserted nexuses and the keys of the added values
+            return (inserted_nexuses, set(additional_value_dict.keys())), "Successfully updated nexus and values"
 
-        from .._hooks.mixin_protocols.hook_with_owner_protocol import HookWithOwnerProtocol
-            
-        # This here is the main loop: We iterate over all the hooks to see if they belong to an owner, which require more values to be changed if the current values would change.
-        while True:
+        def update_nexus_and_value_dict(owner: "CarriesSomeHooksProtocol[Any, Any]") -> tuple[Optional[tuple[list["Nexus[Any]"], set[Any]]], str]:
+            """
+            This method updates the nexus and values dictionary with the additional nexus and values, if requested by the owner.
+            """
+            value_dict, hook_dict, update_values = prepare_update_values(owner)
+            try:
+                additional_value_dict: Mapping[Any, Any] = owner._add_values_to_be_updated(update_values) # type: ignore
+            except Exception as e:
+                return None, f"Error in '_add_values_to_be_updated' of owner '{owner}': {e} (update_values: {update_values})"
+            return insert_additional_values(owner, value_dict, hook_dict, additional_value_dict)
 
-            # Step 1: Collect the all the owners that need to be checked for additional nexus and values
-            owners_to_check_for_additional_nexus_and_values: list["CarriesSomeHooksProtocol[Any, Any]"] = []
-            for nexus in nexus_and_values:
+        def update_nexus_and_value_dict_in_batch(batch_group: Any, owners: list["CarriesSomeHooksProtocol[Any, Any]"]) -> tuple[Optional[list[tuple[list["Nexus[Any]"], set[Any]]]], str]:
+            """
+            This method updates the nexus and values dictionary for owners of the same batch group with one call of the group.
+            All owners see the nexus and values before any of them adds values.
+            """
+            prepared = [prepare_update_values(owner) for owner in owners]
+            try:
+                additional_value_dicts: Sequence[Mapping[Any, Any]] = batch_group._add_values_to_be_updated_in_batch(owners, [update_values for _, _, update_values in prepared])
+            except Exception as e:
+                return None, f"Error in '_add_values_to_be_updated_in_batch' of batch group '{batch_group}': {e}"
+            results: list[tuple[list[Nexus[Any]], set[Any]]] = []
+            for owner, (value_dict, hook_dict, _), additional_value_dict in zip(owners, prepared, additional_value_dicts):
+                result, msg = insert_additional_values(owner, value_dict, hook_dict, additional_value_dict)
+                if result is None:
+                    return None, msg
+                results.append(result)
+            return results, "Successfully updated nexus and values"
+
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+            
+        # This here is the main loop: Owners of hooks in the nexus and values are completed in the order of their
+        # propagation rank. Whenever an owner adds values, the owners of hooks in the added nexuses are queued (again).
+        # Owners are tracked by identity: owners that compare equal by value (e.g. two joined lists) are still distinct owners
+        propagation_ranks: PropagationRanks = self._propagation_ranks
+        queue: list[tuple[int, int, "CarriesSomeHooksProtocol[Any, Any]"]] = []
+        queued_owner_ids: set[int] = set()
+        sequence = count()
+
+        # Queued owners per batch group (see _get_batch_group), completed together when the first of them is due
+        queued_batch_members: dict[int, list[tuple[int, "CarriesSomeHooksProtocol[Any, Any]"]]] = {}
+
+        def queue_owners_of(nexuses: Sequence["Nexus[Any]"], completed_owner: Optional["CarriesSomeHooksProtocol[Any, Any]"]) -> None:
+            for nexus in nexuses:
                 for hook in nexus.hooks:
-                    if isinstance(hook, HookWithOwnerProtocol):
-                        if hook.owner not in owners_to_check_for_additional_nexus_and_values:
-                            owners_to_check_for_additional_nexus_and_values.append(hook.owner)
-
-            # Step 2: Check for each owner if there are additional nexus and values
-            number_of_inserted_items: Optional[int] = 0
-            for owner in owners_to_check_for_additional_nexus_and_values:
-                number_of_inserted_items, msg = update_nexus_and_value_dict(owner, nexus_and_values)
-                if number_of_inserted_items is None:
+                    if is_hook_with_owner(hook):
+                        owner = hook.owner
+                        if owner is completed_owner or id(owner) in queued_owner_ids:
+                            continue
+                        queued_owner_ids.add(id(owner))
+                        rank: int = propagation_ranks.get_rank(owner)
+                        heapq.heappush(queue, (rank, next(sequence), owner))
+                        get_batch_group = getattr(owner, "_get_batch_group", None)
+                        batch_group: Any = get_batch_group() if get_batch_group is not None else None
+                        if batch_group is not None:
+                            queued_batch_members.setdefault(id(batch_group), []).append((rank, owner))
+
+        def queue_owners_after_completion(owner: "CarriesSomeHooksProtocol[Any, Any]", inserted_nexuses: list["Nexus[Any]"], added_keys: set[Any]) -> None:
+            # The completed owner itself is only queued again if it added values for other than its derived hooks
+            # (then it may have to complete them as well)
+            if not inserted_nexuses:
+                return
+            if added_keys <= get_derived_hook_keys(owner):
+                queue_owners_of(inserted_nexuses, owner)
+            else:
+                queue_owners_of(inserted_nexuses, None)
+
+        # Step 1: Queue all the owners of the submitted nexuses
+        queue_owners_of(list(nexus_and_values.keys()), None)
+
+        while queue:
+
+            # Step 2: Complete the owner with the lowest rank (entries of owners completed in a batch are skipped)
+            rank, _, owner = heapq.heappop(queue)
+            if id(owner) not in queued_owner_ids:
+                continue
+            queued_owner_ids.discard(id(owner))
+
+            get_batch_group = getattr(owner, "_get_batch_group", None)
+            batch_group: Any = get_batch_group() if get_batch_group is not None else None
+            if batch_group is None:
+                result, msg = update_nexus_and_value_dict(owner)
+                if result is None:
                     return False, msg
-                if number_of_inserted_items > 0:
-                    break
-
-            # Step 3: If no additional nexus and values were found, break the loop
-            if number_of_inserted_items == 0:
-                break
+                queue_owners_after_completion(owner, *result)
+                continue
+
+            # Step 3: Complete all queued owners of the same batch group and rank with one call
+            members: list["CarriesSomeHooksProtocol[Any, Any]"] = [owner]
+            remaining_members: list[tuple[int, "CarriesSomeHooksProtocol[Any, Any]"]] = []
+            for member_rank, member in queued_batch_members.pop(id(batch_group), []):
+                if id(member) not in queued_owner_ids:
+                    continue # Already completed (or listed twice)
+                if member_rank == rank:
+                    queued_owner_ids.discard(id(member))
+                    members.append(member)
+                else:
+                    remaining_members.append((member_rank, member))
+            if remaining_members:
+                queued_batch_members[id(batch_group)] = remaining_members
+            results, msg = update_nexus_and_value_dict_in_batch(batch_group, members)
+            if results is None:
+                return False, msg
+            for member, result in zip(members, results):
+                queue_owners_after_completion(member, *result)
 
         return True, "Successfully updated nexus and values"
 
@@ -322,31 +471,16 @@ class NexusManager:
         # Immutability system disabled - pass through values as-is
         return None, value
 
-    def _internal_submit_values(self, nexus_and_values: Mapping["Nexus[Any]", Any], mode: Literal["Normal submission", "Forced submission", "Check values"], logger: Optional[Logger] = None) -> tuple[bool, str]:
+    def _prepare_submission(self, nexus_and_values: Mapping["Nexus[Any]", Any], mode: Literal["Normal submission", "Forced submission", "Check values"], logger: Optional[Logger] = None) -> tuple[bool, str, Optional[dict["Nexus[Any]", Any]]]:
         """
-        Internal implementation of submit_values.
+        Convert, filter and complete the submitted values.
 
-        This method is not thread-safe and should only be called by the submit_values method.
-        
-        This method is a crucial part of the hook connection process:
-        1. Get the two nexuses from the hooks to connect
-        2. Submit one of the hooks' value to the other nexus (this method)
-        3. If successful, both nexus must now have the same value
-        4. Merge the nexuses to one -> Connection established!
-        
-        Parameters
-        ----------
-        mode : Literal["Normal submission", "Forced submission", "Check values"]
-            Controls the submission behavior:
-            - "Normal submission": Only submits values that differ from current values
-            - "Forced submission": Submits all values regardless of equality
-            - "Check values": Only validates without updating
-        """
+        This method is not thread-safe and should only be called while holding the lock.
 
-        from .._hooks.mixin_protocols.hook_with_owner_protocol import HookWithOwnerProtocol
-        from .._hooks.mixin_protocols.hook_with_isolated_validation_protocol import HookWithIsolatedValidationProtocol
-        from .._hooks.mixin_protocols.hook_with_reaction_protocol import HookWithReactionProtocol
-        from .._hooks.mixin_protocols.hook_with_connection_protocol import HookWithConnectionProtocol
+        Returns:
+            A tuple of (success, message, complete nexus and values). The complete nexus and
+            values are None if the submission failed or nothing needs to be submitted.
+        """
 
         #########################################################
         # Check if the values are immutable
@@ -356,7 +490,7 @@ class NexusManager:
         for nexus, value in nexus_and_values.items():
             error_msg, value_for_storage = self._convert_value_for_storage(value)
             if error_msg is not None:
-                return False, f"Value of type {type(value).__name__} cannot be converted for storage: {error_msg}"
+                return False, f"Value of type {type(value).__name__} cannot be converted for storage: {error_msg}", None
             _nexus_and_values[nexus] = value_for_storage
 
         #########################################################
@@ -376,7 +510,7 @@ class NexusManager:
                 log(self, "NexusManager._internal_submit_values", logger, True, f"Initially {len(nexus_and_values)} nexus and values submitted, after checking for equality {len(_nexus_and_values)}")
 
                 if len(_nexus_and_values) == 0:
-                    return True, "Values are the same as the current values. No submission needed."
+                    return True, "Values are the same as the current values. No submission needed.", None
 
             case "Forced submission":
                 # Use all immutable values
@@ -393,15 +527,54 @@ class NexusManager:
         # Value Completion
         #########################################################
 
-        # Step 1: Update the nexus and values
         complete_nexus_and_values: dict["Nexus[Any]", Any] = {}
         complete_nexus_and_values.update(_nexus_and_values)
         success, msg = self._complete_nexus_and_values_dict(complete_nexus_and_values)
         if success == False:
-            return False, msg
+            return False, msg, None
+        return True, msg, complete_nexus_and_values
+
+    def _internal_submit_values(self, nexus_and_values: Mapping["Nexus[Any]", Any], mode: Literal["Normal submission", "Forced submission", "Check values"], logger: Optional[Logger] = None, deferred_publishers: Optional[list[PublisherProtocol]] = None, prepared_nexus_and_values: Optional[dict["Nexus[Any]", Any]] = None) -> tuple[bool, str]:
+        """
+        Internal implementation of submit_values.
+
+        This method is not thread-safe and should only be called by the submit_values method.
+        
+        This method is a crucial part of the hook connection process:
+        1. Get the two nexuses from the hooks to connect
+        2. Submit one of the hooks' value to the other nexus (this method)
+        3. If successful, both nexus must now have the same value
+        4. Merge the nexuses to one -> Connection established!
+        
+        Parameters
+        ----------
+        mode : Literal["Normal submission", "Forced submission", "Check values"]
+            Controls the submission behavior:
+            - "Normal submission": Only submits values that differ from current values
+            - "Forced submission": Submits all values regardless of equality
+            - "Check values": Only validates without updating
+        deferred_publishers : Optional[list[PublisherProtocol]]
+            If given, the publishers are collected in this list instead of being published
+            (used by submit_values_async to await the publications after the submission).
+        prepared_nexus_and_values : Optional[dict[Nexus[Any], Any]]
+            The result of _prepare_submission for the same values, if nothing has changed since.
+        """
+
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+        from .._hooks.mixin_protocols.hook_with_isolated_validation_protocol import HookWithIsolatedValidationProtocol
+        from .._hooks.mixin_protocols.hook_with_reaction_protocol import HookWithReactionProtocol
+        from .._hooks.mixin_protocols.hook_with_connection_protocol import HookWithConnectionProtocol
+
+        # Step 1: Convert, filter and complete the nexus and values
+        if prepared_nexus_and_values is None:
+            success, msg, prepared_nexus_and_values = self._prepare_submission(nexus_and_values, mode, logger)
+            if prepared_nexus_and_values is None:
+                return success, msg
+        complete_nexus_and_values: dict["Nexus[Any]", Any] = prepared_nexus_and_values
 
         # Step 2: Collect the owners and floating hooks to validate, react to, and notify
         owners_that_are_affected: list["CarriesSomeHooksProtocol[Any, Any]"] = []
+        affected_owner_ids: set[int] = set()
         hooks_with_validation: set[HookWithIsolatedValidationProtocol[Any]] = set()
         hooks_with_reaction: set[HookWithReactionProtocol] = set()
         publishers: set[PublisherProtocol] = set()
@@ -411,10 +584,11 @@ class NexusManager:
                     hooks_with_reaction.add(hook)
                 if isinstance(hook, HookWithIsolatedValidationProtocol):
                     # Hooks that are owned by an observable are validated by the observable. They do not need to be validated in isolation.
-                    if not isinstance(hook, HookWithOwnerProtocol):
+                    if not is_hook_with_owner(hook):
                         hooks_with_validation.add(hook)
-                if isinstance(hook, HookWithOwnerProtocol):
-                    if hook.owner not in owners_that_are_affected:
+                if is_hook_with_owner(hook):
+                    if id(hook.owner) not in affected_owner_ids:
+                        affected_owner_ids.add(id(hook.owner))
                         owners_that_are_affected.append(hook.owner)
                     if isinstance(hook.owner, PublisherProtocol):
                         publishers.add(hook.owner)
@@ -451,9 +625,14 @@ class NexusManager:
             return True, "Values are valid"
 
         # Step 4: Update each nexus with the new value
+        self._change_count += 1
+        self._commit_sequence += 1
         for nexus, value in complete_nexus_and_values.items():
             nexus._previous_stored_value = nexus._stored_value # type: ignore
             nexus._stored_value = value # type: ignore
+            # After the value, so a reader that reads the version first never pairs a new version with an old value
+            nexus._version += 1 # type: ignore
+        self._commit_sequence += 1
 
         #########################################################
         # Invalidation, Reaction, and Notification
@@ -468,8 +647,11 @@ class NexusManager:
             hook.react_to_value_changed()
 
         # Step 5c: Publish the value changes
-        for publisher in publishers:
-            publisher.publish(None)
+        if deferred_publishers is not None:
+            deferred_publishers.extend(publishers)
+        else:
+            for publisher in publishers:
+                publisher.publish(None)
 
         # Step 5d: Notify the listeners
 
@@ -514,7 +696,8 @@ class NexusManager:
         self,
         nexus_and_values: Mapping["Nexus[Any]", Any]|Sequence[tuple["Nexus[Any]", Any]],
         mode: Literal["Normal submission", "Forced submission", "Check values"] = "Normal submission",
-        logger: Optional[Logger] = None
+        logger: Optional[Logger] = None,
+        expected_versions: Optional[Mapping["Nexus[Any]", int]] = None
         ) -> tuple[bool, str]:
         """
         Submit values to the hook nexuses - the central orchestration point for all value changes.
@@ -623,6 +806,11 @@ class NexusManager:
         logger : Optional[Logger], default=None
             Optional logger for debugging the submission process. Currently not actively
             used in the implementation but reserved for future debugging capabilities.
+
+        expected_versions : Optional[Mapping[Nexus[Any], int]], default=None
+            Compare-and-set: the submission fails before completion and validation if the
+            version of any of the given nexuses differs from the expected one (see Nexus.version).
+            Used for optimistic read-modify-write without holding the lock across the read.
         
         Returns
         -------
@@ -767,6 +955,13 @@ class NexusManager:
         FloatingHook.submit_value : Convenient method for submitting a single value to a floating hook
         """
 
+        return self._submit_values(NexusManager._as_nexus_and_values_dict(nexus_and_values), mode, logger, expected_versions=expected_versions)
+
+    @staticmethod
+    def _as_nexus_and_values_dict(nexus_and_values: Mapping["Nexus[Any]", Any]|Sequence[tuple["Nexus[Any]", Any]]) -> Mapping["Nexus[Any]", Any]:
+        """
+        Check a sequence of (nexus, value) pairs and convert it to a mapping.
+        """
         if isinstance(nexus_and_values, Sequence):
             # check if the sequence is a list of tuples of (Nexus[Any], Any) and that the hook nexuses are unique
             if not all(isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], Nexus) for item in nexus_and_values): # type: ignore
@@ -774,7 +969,30 @@ class NexusManager:
             if len(set(item[0] for item in nexus_and_values)) != len(nexus_and_values):
                 raise ValueError("The nexuses must be unique")
             nexus_and_values = dict(nexus_and_values)
-        
+        return nexus_and_values
+
+    @staticmethod
+    def _check_versions(expected_versions: Mapping["Nexus[Any]", int]) -> tuple[bool, str]:
+        """
+        Check that the nexuses have the expected versions.
+        """
+        for nexus, version in expected_versions.items():
+            if nexus._version != version: # type: ignore
+                return False, f"Stale version: expected version {version} of the nexus, it is {nexus._version}" # type: ignore
+        return True, "Versions are current"
+
+    def _submit_values(
+        self,
+        nexus_and_values: Mapping["Nexus[Any]", Any],
+        mode: Literal["Normal submission", "Forced submission", "Check values"],
+        logger: Optional[Logger],
+        deferred_publishers: Optional[list[PublisherProtocol]] = None,
+        prepared_nexus_and_values: Optional[dict["Nexus[Any]", Any]] = None,
+        expected_versions: Optional[Mapping["Nexus[Any]", int]] = None
+        ) -> tuple[bool, str]:
+        """
+        Submit values with reentrancy protection, see submit_values.
+        """
         # Get the set of nexuses being submitted
         new_nexuses = set(nexus_and_values.keys())
         
@@ -799,11 +1017,219 @@ class NexusManager:
             self._thread_local.active_nexuses.update(new_nexuses) # type: ignore
             
             try:
-                return self._internal_submit_values(nexus_and_values, mode, logger)
+                if expected_versions is not None:
+                    success, msg = NexusManager._check_versions(expected_versions)
+                    if not success:
+                        return False, msg
+                return self._internal_submit_values(nexus_and_values, mode, logger, deferred_publishers, prepared_nexus_and_values)
             finally:
                 # Always remove the nexuses we added, even if an error occurs
                 self._thread_local.active_nexuses -= new_nexuses # type: ignore
 
+    ########################################################################################################################
+    # Asynchronous Submission
+    ########################################################################################################################
+
+    # Number of times an asynchronous submission is validated again if other submissions changed the values meanwhile
+    MAX_ASYNC_SUBMISSION_ATTEMPTS: int = 8
+
+    async def submit_values_async(
+        self,
+        nexus_and_values: Mapping["Nexus[Any]", Any]|Sequence[tuple["Nexus[Any]", Any]],
+        mode: Literal["Normal submission", "Forced submission", "Check values"] = "Normal submission",
+        logger: Optional[Logger] = None,
+        expected_versions: Optional[Mapping["Nexus[Any]", int]] = None
+        ) -> tuple[bool, str]:
+        """
+        Submit values to the hook nexuses from a coroutine, without blocking the event loop.
+
+        The submission flow is the one of `submit_values`, with three differences:
+
+        - The lock is never waited for in a blocking way and never held across an `await`:
+          other coroutines and threads keep submitting while this submission awaits.
+        - Owners with an asynchronous validation callback (e.g. XValue's `async_validator`) are
+          validated concurrently, with the complete values, before the submission. If other
+          submissions change any value or join/isolate hooks meanwhile, the values are completed
+          and validated again (at most MAX_ASYNC_SUBMISSION_ATTEMPTS times).
+        - Publishers are published after the listeners were notified and the lock was released;
+          the reactions of their subscribers are awaited concurrently (see Publisher.publish_async).
+
+        Synchronous submissions (`submit_values`) do not run asynchronous validation callbacks.
+
+        Returns
+        -------
+        tuple[bool, str]
+            A tuple of (success, message), see `submit_values`.
+        """
+
+        nexus_and_values = NexusManager._as_nexus_and_values_dict(nexus_and_values)
+
+        for _ in range(NexusManager.MAX_ASYNC_SUBMISSION_ATTEMPTS):
+
+            # Complete the values and start the asynchronous validations
+            await self._acquire_lock_async()
+            try:
+                if expected_versions is not None:
+                    success, msg = NexusManager._check_versions(expected_versions)
+                    if not success:
+                        return False, msg
+                success, msg, prepared_nexus_and_values = self._prepare_submission(nexus_and_values, mode, logger)
+                change_count: int = self._change_count
+                validations: list[Awaitable[tuple[bool, str]]] = []
+                if prepared_nexus_and_values is not None:
+                    validations = self._get_async_validations(prepared_nexus_and_values)
+            finally:
+                self._lock.release()
+            if prepared_nexus_and_values is None:
+                return success, msg
+
+            if validations:
+                results = await asyncio.gather(*validations, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        return False, f"Error in asynchronous validation: {result}"
+                    if result[0] == False:
+                        return False, result[1]
+
+            # Submit, unless the validated values are outdated
+            deferred_publishers: list[PublisherProtocol] = []
+            await self._acquire_lock_async()
+            try:
+                if self._change_count != change_count:
+                    if validations:
+                        continue
+                    prepared_nexus_and_values = None
+                success, msg = self._submit_values(nexus_and_values, mode, logger, deferred_publishers, prepared_nexus_and_values, expected_versions)
+            finally:
+                self._lock.release()
+
+            await NexusManager._publish_async(deferred_publishers)
+            return success, msg
+
+        return False, f"Values were changed by other submissions during asynchronous validation {NexusManager.MAX_ASYNC_SUBMISSION_ATTEMPTS} times"
+
+    async def _acquire_lock_async(self) -> None:
+        """
+        Acquire the lock without blocking the event loop.
+
+        The lock is only held for the short synchronous part of a submission, so it is polled.
+        """
+        delay: float = 0.0
+        while not self._lock.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(max(delay * 2, 0.0001), 0.01)
+
+    @staticmethod
+    def _get_async_validations(complete_nexus_and_values: dict["Nexus[Any]", Any]) -> list[Awaitable[tuple[bool, str]]]:
+        """
+        Start the asynchronous validations of the owners affected by the complete nexus and values.
+        """
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+
+        validations: list[Awaitable[tuple[bool, str]]] = []
+        visited_owner_ids: set[int] = set()
+        for nexus in complete_nexus_and_values:
+            for hook in nexus.hooks:
+                if not is_hook_with_owner(hook) or id(hook.owner) in visited_owner_ids:
+                    continue
+                owner = hook.owner
+                visited_owner_ids.add(id(owner))
+                validate_async = getattr(owner, "_validate_complete_values_in_isolation_async", None)
+                if validate_async is None:
+                    continue
+                value_dict, _ = NexusManager._filter_nexus_and_values_for_owner(complete_nexus_and_values, owner)
+                NexusManager._complete_nexus_and_values_for_owner(value_dict, owner, as_reference_values=True)
+                validation: Optional[Awaitable[tuple[bool, str]]] = validate_async(value_dict)
+                if validation is not None:
+                    validations.append(validation)
+        return validations
+
+    @staticmethod
+    async def _publish_async(publishers: list[PublisherProtocol]) -> None:
+        """
+        Publish and await the reactions of the subscribers concurrently.
+        """
+        publications: list[Awaitable[None]] = []
+        for publisher in publishers:
+            publish_async: Optional[Callable[[], Awaitable[None]]] = getattr(publisher, "publish_async", None)
+            if publish_async is None:
+                publisher.publish(None)
+            else:
+                publications.append(publish_async())
+        if publications:
+            await asyncio.gather(*publications)
+
+    ########################################################################################################################
+    # Snapshots
+    ########################################################################################################################
+
+    # Number of lock-free reads a snapshot attempts before it waits for the lock
+    MAX_LOCK_FREE_SNAPSHOT_ATTEMPTS: int = 64
+
+    def snapshot(self, hooks_or_xobjects: Iterable["Hook[Any] | ReadOnlyHook[Any] | CarriesSomeHooksProtocol[Any, Any]"]) -> Snapshot:
+        """
+        Read the values of many hooks and observables consistently, at one commit point.
+
+        ** Thread-safe, lock-free **
+
+        Values read one by one may combine values from before and after a submission of
+        another thread. The snapshot is read without the lock and read again if a submission
+        wrote values meanwhile; submissions are never blocked by readers. Only if submissions
+        keep interleaving (MAX_LOCK_FREE_SNAPSHOT_ATTEMPTS times) the snapshot is read while
+        holding the lock.
+
+        Values changed by listeners or reactions of a submission are separate commits: a
+        snapshot may be taken between them.
+
+        Args:
+            hooks_or_xobjects: Hooks (snapshot[hook] is the value) and observables
+                (snapshot[xobject] is a dict of the values of all of their hooks by key)
+
+        Returns:
+            The Snapshot of the values
+
+        Example:
+            >>> snapshot = manager.snapshot([selection, price.hook])
+            >>> snapshot[selection]["key"] in snapshot[selection]["dict"]   # Never torn
+            True
+        """
+        from .._hooks.lazy_owned_hook import LazyOwnedHook
+
+        # Resolve the hooks once: (target, hook keys or None for a hook, hooks)
+        targets: list[tuple[Any, Optional[list[Any]], list[Any]]] = []
+        for hook_or_xobject in hooks_or_xobjects:
+            # Told apart by the class: a runtime protocol check would read (and refresh) the value of hooks
+            if getattr(type(hook_or_xobject), "_get_hook_keys", None) is None:
+                targets.append((hook_or_xobject, None, [hook_or_xobject]))
+            else:
+                keys: list[Any] = list(hook_or_xobject._get_hook_keys())
+                targets.append((hook_or_xobject, keys, [hook_or_xobject._get_hook_by_key(key) for key in keys]))
+
+        def read_value(hook: Any) -> Any:
+            # Lazy hooks are read without refreshing them: the reader must not write to the hooks
+            return hook._peek_value() if isinstance(hook, LazyOwnedHook) else hook._get_value()
+
+        def read_values() -> dict[int, tuple[Any, Any]]:
+            values: dict[int, tuple[Any, Any]] = {}
+            for target, keys, hooks in targets:
+                if keys is None:
+                    values[id(target)] = (target, read_value(hooks[0]))
+                else:
+                    values[id(target)] = (target, {key: read_value(hook) for key, hook in zip(keys, hooks)})
+            return values
+
+        for _ in range(NexusManager.MAX_LOCK_FREE_SNAPSHOT_ATTEMPTS):
+            sequence: int = self._commit_sequence
+            if sequence % 2 == 0:
+                values = read_values()
+                if self._commit_sequence == sequence:
+                    return Snapshot(values, sequence // 2)
+            # A submission is writing values: give its thread the interpreter
+            sleep(0)
+
+        with self._lock:
+            return Snapshot(read_values(), self._commit_sequence // 2)
+
     ########################################################################################################################
     # Helper Methods
     ########################################################################################################################
@@ -0,0 +1,196 @@
+"""
+Propagation Ranks - Topological order of owners for the completion of submissions
+
+Derived observables (one-way functions, secondary hooks) compute some of their hooks
+from the others. Joined together they form a graph in which an owner is downstream of
+another owner if one of its (non-derived) hooks shares a nexus with a derived hook of
+the other owner. The rank of an owner is the length of the longest path of such edges
+leading to it, so completing owners in ascending rank order evaluates every owner of a
+diamond (A→B, A→C, B+C→D) once, after all of its inputs are known.
+
+Ranks are computed on demand and cached. When hooks are joined or isolated, only the
+cached ranks of owners that gain or lose an upstream owner, and of the owners downstream
+of them, are discarded. Cycles (e.g. a function output joined back to one of its inputs) are cut
+where they are entered; the ranks of owners on a cycle are then merely a good order.
+"""
+
+from typing import Any, Optional, TYPE_CHECKING
+import weakref
+
+if TYPE_CHECKING:
+    from .._carries_hooks.carries_some_hooks_protocol import CarriesSomeHooksProtocol
+    from .._hooks.hook_aliases import Hook
+    from .nexus import Nexus
+
+
+def get_derived_hook_keys(owner: "CarriesSomeHooksProtocol[Any, Any]") -> set[Any]:
+    """Get the keys of the hooks the owner computes from its other hooks (none for unknown owners)."""
+    get_keys = getattr(owner, "_get_derived_hook_keys", None)
+    if get_keys is None:
+        return set()
+    return get_keys()
+
+
+class PropagationRanks:
+    """
+    Cache of the topological ranks of hook owners.
+
+    ** Not thread-safe, used by the NexusManager while holding its lock. **
+    """
+
+    def __init__(self) -> None:
+        # Owners are tracked by identity; entries disappear when the owner is garbage collected
+        self._ranks: dict[int, int] = {}
+        self._derived_hook_ids: dict[int, frozenset[int]] = {}
+        self._dependents: dict[int, set[int]] = {}
+        self._owner_refs: dict[int, weakref.ref[Any]] = {}
+        # Owners of the derived hooks in a nexus, shared by all owners joined to the nexus
+        self._producers: "weakref.WeakKeyDictionary[Nexus[Any], tuple[weakref.ref[Any], ...]]" = weakref.WeakKeyDictionary()
+
+    def _track(self, owner: "CarriesSomeHooksProtocol[Any, Any]") -> int:
+        owner_id: int = id(owner)
+        reference = self._owner_refs.get(owner_id)
+        if reference is None or reference() is not owner:
+            if reference is not None:
+                self._forget(owner_id)
+            self._owner_refs[owner_id] = weakref.ref(owner, lambda _: self._forget(owner_id))
+        return owner_id
+
+    def _forget(self, owner_id: int) -> None:
+        self._owner_refs.pop(owner_id, None)
+        self._ranks.pop(owner_id, None)
+        self._derived_hook_ids.pop(owner_id, None)
+        self._dependents.pop(owner_id, None)
+
+    def _get_derived_hook_ids(self, owner: "CarriesSomeHooksProtocol[Any, Any]") -> frozenset[int]:
+        owner_id: int = self._track(owner)
+        derived_hook_ids = self._derived_hook_ids.get(owner_id)
+        if derived_hook_ids is None:
+            derived_hook_ids = frozenset(id(owner._get_hook_by_key(key)) for key in get_derived_hook_keys(owner)) # type: ignore
+            self._derived_hook_ids[owner_id] = derived_hook_ids
+        return derived_hook_ids
+
+    def _get_producers(self, nexus: "Nexus[Any]") -> list["CarriesSomeHooksProtocol[Any, Any]"]:
+        """Get the owners that have a derived hook in the nexus."""
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+
+        producer_refs = self._producers.get(nexus)
+        if producer_refs is None:
+            producers: dict[int, "CarriesSomeHooksProtocol[Any, Any]"] = {}
+            for hook in nexus.hooks:
+                if is_hook_with_owner(hook):
+                    owner = hook.owner
+                    if id(hook) in self._get_derived_hook_ids(owner):
+                        producers[id(owner)] = owner
+            producer_refs = tuple(weakref.ref(owner) for owner in producers.values())
+            self._producers[nexus] = producer_refs
+        return [owner for owner in (reference() for reference in producer_refs) if owner is not None]
+
+    def _get_upstream_owners(self, owner: "CarriesSomeHooksProtocol[Any, Any]") -> list["CarriesSomeHooksProtocol[Any, Any]"]:
+        """Get the owners with a derived hook in the nexus of one of the non-derived hooks of the owner."""
+        derived_hook_ids: frozenset[int] = self._get_derived_hook_ids(owner)
+        upstream_owners: dict[int, "CarriesSomeHooksProtocol[Any, Any]"] = {}
+        for key in owner._get_hook_keys():
+            hook: "Hook[Any]" = owner._get_hook_by_key(key) # type: ignore
+            if id(hook) in derived_hook_ids:
+                continue
+            for producer in self._get_producers(hook._get_nexus()): # type: ignore
+                if producer is not owner:
+                    upstream_owners[id(producer)] = producer
+        return list(upstream_owners.values())
+
+    def get_rank(self, owner: "CarriesSomeHooksProtocol[Any, Any]") -> int:
+        """
+        Get the rank of an owner: 0 without upstream owners, else one more than the highest upstream rank.
+        """
+        cached_rank: Optional[int] = self._ranks.get(self._track(owner))
+        if cached_rank is not None:
+            return cached_rank
+
+        # Iterative depth-first search, chains of derived observables can be long
+        on_path: set[int] = {id(owner)}
+        stack: list[list[Any]] = [[owner, self._get_upstream_owners(owner), 0]]
+        while stack:
+            frame = stack[-1]
+            current, upstream_owners = frame[0], frame[1]
+            descended: bool = False
+            while upstream_owners:
+                upstream_owner = upstream_owners.pop()
+                upstream_rank: Optional[int] = self._ranks.get(self._track(upstream_owner))
+                if upstream_rank is None:
+                    if id(upstream_owner) in on_path:
+                        continue # Cycle: the edge closing it is ignored
+                    upstream_owners.append(upstream_owner) # Revisit once its rank is known
+                    on_path.add(id(upstream_owner))
+                    stack.append([upstream_owner, self._get_upstream_owners(upstream_owner), 0])
+                    descended = True
+                    break
+                self._dependents.setdefault(id(upstream_owner), set()).add(id(current))
+                frame[2] = max(frame[2], upstream_rank + 1)
+            if descended:
+                continue
+            stack.pop()
+            on_path.discard(id(current))
+            self._ranks[id(current)] = frame[2]
+
+        return self._ranks[id(owner)]
+
+    def _discard_ranks(self, owner_ids: list[int]) -> None:
+        """Discard the ranks of the owners and of every owner downstream of them."""
+        to_discard: list[int] = owner_ids
+        while to_discard:
+            owner_id: int = to_discard.pop()
+            if self._ranks.pop(owner_id, None) is None:
+                continue
+            to_discard.extend(self._dependents.pop(owner_id, ()))
+
+    def _discard_ranks_of_owners_in(self, nexus: "Nexus[Any]") -> None:
+        """Discard the ranks of the owners of the hooks in the nexus and of every owner downstream of them."""
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+
+        if not self._ranks:
+            return
+        self._discard_ranks([id(hook.owner) for hook in nexus.hooks if is_hook_with_owner(hook)])
+
+    def nexuses_merged(self, nexuses: tuple["Nexus[Any]", ...], merged_nexus: "Nexus[Any]") -> None:
+        """
+        Update the cache after nexuses have been merged (the merged nexuses still know their hooks).
+
+        Only the owners of a nexus that gains producers are affected; joining hooks that are not
+        derived (e.g. binding many values to one source) discards no ranks.
+        """
+        producers_per_nexus: list[list["CarriesSomeHooksProtocol[Any, Any]"]] = [self._get_producers(nexus) for nexus in nexuses]
+        all_producers: dict[int, "CarriesSomeHooksProtocol[Any, Any]"] = {id(owner): owner for producers in producers_per_nexus for owner in producers}
+        for nexus, producers in zip(nexuses, producers_per_nexus):
+            if len(producers) < len(all_producers):
+                self._discard_ranks_of_owners_in(nexus)
+            self._producers.pop(nexus, None)
+        self._producers[merged_nexus] = tuple(weakref.ref(owner) for owner in all_producers.values())
+
+    def hook_isolating(self, hook: "Hook[Any]") -> None:
+        """
+        Update the cache before a hook is isolated from its nexus.
+
+        If the hook is derived, the owners joined to it lose it as producer. Otherwise only the
+        owner of the hook may lose producers.
+        """
+        from .._hooks.mixin_protocols.hook_with_owner_protocol import is_hook_with_owner
+
+        nexus: "Nexus[Any]" = hook._get_nexus() # type: ignore
+        producers: list["CarriesSomeHooksProtocol[Any, Any]"] = self._get_producers(nexus)
+        self._producers.pop(nexus, None)
+        if not producers:
+            return
+        owner = hook.owner if is_hook_with_owner(hook) else None
+        if owner is not None and id(hook) not in self._get_derived_hook_ids(owner):
+            self._discard_ranks([id(owner)])
+        else:
+            self._discard_ranks_of_owners_in(nexus)
+
+    def clear(self) -> None:
+        """Discard all cached ranks."""
+        self._ranks.clear()
+        self._derived_hook_ids.clear()
+        self._dependents.clear()
+        self._owner_refs.clear()
+        self._producers.clear()
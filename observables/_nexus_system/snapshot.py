@@ -0,0 +1,59 @@
+"""
+Snapshot - Values of many hooks and observables read at one commit point
+
+Reading related values one by one (e.g. `selection.dict`, `selection.key` and
+`selection.value`) can interleave with a submission of another thread and combine
+values from before and after it. A snapshot taken with `NexusManager.snapshot` holds
+the values as they were between two commits, without blocking submissions.
+
+Example:
+    >>> snapshot = DEFAULT_NEXUS_MANAGER.snapshot([selection, total.hook])
+    >>> values = snapshot[selection]        # {"dict": ..., "key": ..., "value": ...}
+    >>> snapshot.value(selection, "key") in values["dict"]
+    True
+    >>> snapshot[total.hook]
+    42
+"""
+
+from typing import Any, Mapping
+
+
+class Snapshot:
+    """
+    Immutable record of the values of hooks and observables at one commit point.
+
+    Index it with a hook to get its value, or with an observable to get the values of
+    all of its hooks by key.
+    """
+
+    __slots__ = ("_values", "_commit")
+
+    def __init__(self, values: Mapping[int, tuple[Any, Any]], commit: int) -> None:
+        # id(hook or observable) -> (hook or observable, value or values by key)
+        self._values: Mapping[int, tuple[Any, Any]] = values
+        self._commit: int = commit
+
+    def __getitem__(self, hook_or_xobject: Any) -> Any:
+        entry = self._values.get(id(hook_or_xobject))
+        if entry is None or entry[0] is not hook_or_xobject:
+            raise KeyError(f"{hook_or_xobject} is not part of the snapshot")
+        return entry[1]
+
+    def __contains__(self, hook_or_xobject: Any) -> bool:
+        entry = self._values.get(id(hook_or_xobject))
+        return entry is not None and entry[0] is hook_or_xobject
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def value(self, xobject: Any, key: Any) -> Any:
+        """Get the value of the hook with the given key of an observable in the snapshot."""
+        return self[xobject][key]
+
+    @property
+    def commit(self) -> int:
+        """Number of commits of the nexus manager before the snapshot was taken."""
+        return self._commit
+
+    def __repr__(self) -> str:
+        return f"Snapshot(commit={self._commit}, entries={len(self._values)})"
@@ -42,7 +42,7 @@ Example:
         # Subscriber reactions happen in the background
 """
 
-from typing import Callable, Literal, Optional, TYPE_CHECKING
+from typing import Awaitable, Callable, Literal, Optional, TYPE_CHECKING
 import warnings
 import weakref
 import asyncio
@@ -304,6 +304,10 @@ class Publisher(PublisherProtocol):
 
         return False
 
+    def _has_receivers(self) -> bool:
+        """Whether a publication would reach any callback or subscriber (used to skip building its payload)."""
+        return len(self._callback_storage) > 0 or any(True for _ in self._subscriber_storage.weak_references)
+
     def _handle_task_exception(self, task: asyncio.Task[None], subscriber_or_callback: "Subscriber"|Callable[[], None]) -> None:
         """
         Handle exceptions that occur in subscriber reaction tasks.
@@ -679,6 +683,50 @@ class Publisher(PublisherProtocol):
             case _: # type: ignore
                 raise ValueError(f"Invalid mode: {mode}")
 
+    async def publish_async(self) -> None:
+        """
+        Publish an update from a coroutine and await the reactions.
+
+        With the preferred mode "sync", the reactions of all subscribers and callbacks are
+        awaited concurrently on the running event loop (publish(mode="sync") cannot be used
+        there, it runs the reactions to completion on the loop itself). The other modes
+        behave as with publish().
+
+        Raises:
+            RuntimeError: If a reaction failed and no logger is configured.
+        """
+        if self.preferred_publish_mode != "sync":
+            self.publish()
+            return
+
+        self._subscriber_storage.cleanup()
+        reactions: list[Awaitable[None]] = []
+        reactors: list[str] = []
+        for subscriber_ref in self._subscriber_storage.weak_references:
+            subscriber = subscriber_ref()
+            if subscriber is not None:
+                reactions.append(subscriber._react_async_to_publication(self, "sync")) # type: ignore
+                reactors.append(f"Subscriber {subscriber}")
+        for callback in self._callback_storage:
+            if asyncio.iscoroutinefunction(callback):
+                reactions.append(callback())
+            else:
+                async def run_sync_callback(cb: Callable[[], None]) -> None:
+                    cb()
+                reactions.append(run_sync_callback(callback))
+            reactors.append(f"Callback {callback}")
+        if not reactions:
+            return
+
+        results = await asyncio.gather(*reactions, return_exceptions=True)
+        for reactor, result in zip(reactors, results):
+            if isinstance(result, Exception):
+                error_msg = f"{reactor} failed to react to publication: {result}"
+                if self._logger:
+                    self._logger.error(error_msg, exc_info=result)
+                else:
+                    raise RuntimeError(error_msg) from result
+
     @property
     def preferred_publish_mode(self) -> Literal["async", "sync", "direct", "off"]:
         """
@@ -41,9 +41,12 @@ Example:
         # observable automatically receives the new value
 """
 
-from typing import Generic, Literal, TypeVar
+from typing import Generic, Literal, Optional, TypeVar
+from collections import deque
 
 from .._auxiliary.listening_base import ListeningBase
+from .._nexus_system.nexus_manager import NexusManager
+from .._nexus_system.default_nexus_manager import DEFAULT_NEXUS_MANAGER
 
 from .publisher import Publisher
 
@@ -144,9 +147,23 @@ class ValuePublisher(Publisher, ListeningBase, Generic[T]):
           if you want to prevent external modifications
         - For complex sync logic, use a custom callback in ObservableSubscriber
         - This is unidirectional: changes to subscribers don't affect the source
+        - Every accepted value change increments `generation`; subscribers can
+          remember the generation they last processed and use `changes_since()`
+          or `values_since()` to detect missed or redundant publications
+        - With `suppress_equal_values=True`, assigning a value that is equal to the
+          current one (according to `NexusManager.is_equal`) neither bumps the
+          generation nor publishes
     """
 
-    def __init__(self, value: T, mode: Literal["async", "sync", "direct", "off"] = "sync"):
+    def __init__(
+        self,
+        value: T,
+        mode: Literal["async", "sync", "direct", "off"] = "sync",
+        *,
+        suppress_equal_values: bool = False,
+        history_size: int = 0,
+        nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER
+        ):
         """
         Initialize a new ValuePublisher with an initial value.
         
@@ -154,6 +171,18 @@ class ValuePublisher(Publisher, ListeningBase, Generic[T]):
             value: The initial value to be held and published by this publisher.
                 This value will be accessible via the `value` property and will
                 be available to subscribers when they react to publications.
+            mode: The publish mode used for every value change.
+            suppress_equal_values: If True, setting a value that is equal to the
+                current value (checked with `nexus_manager.is_equal`) is ignored:
+                the generation is not incremented and nothing is published.
+                Default is False (every assignment publishes).
+            history_size: Number of past values (with their generations) to retain
+                for `values_since()`. Default is 0 (no history is kept).
+            nexus_manager: The NexusManager whose `is_equal` is used for equality
+                suppression. Default is DEFAULT_NEXUS_MANAGER.
+        
+        Raises:
+            ValueError: If history_size is negative.
         
         Example:
             Create publishers with different value types::
@@ -170,10 +199,17 @@ class ValuePublisher(Publisher, ListeningBase, Generic[T]):
                 # Custom objects
                 user = ValuePublisher(User(name="Alice"))
         """
+        if history_size < 0:
+            raise ValueError(f"history_size must be non-negative, got {history_size}")
+
         self._mode: Literal["async", "sync", "direct", "off"] = mode
         ListeningBase.__init__(self)
         Publisher.__init__(self)
+        self._nexus_manager: NexusManager = nexus_manager
+        self._suppress_equal_values: bool = suppress_equal_values
         self._value = value
+        self._generation: int = 0
+        self._history: Optional[deque[tuple[int, T]]] = deque([(0, value)], maxlen=history_size) if history_size > 0 else None
         self.publish(mode)
 
     @property
@@ -251,8 +287,17 @@ class ValuePublisher(Publisher, ListeningBase, Generic[T]):
                 
                 # One change updates all subscribers
                 source.value = {"counter": 1}
+        
+        Note:
+            If the publisher was created with `suppress_equal_values=True` and the
+            new value is equal to the current one, the assignment is ignored.
         """
+        if self._suppress_equal_values and self._nexus_manager.is_equal(self._value, value):
+            return
         self._value = value
+        self._generation += 1
+        if self._history is not None:
+            self._history.append((self._generation, value))
         self.publish(mode=self._mode)
 
     def change_value(self, value: T) -> None:
@@ -308,8 +353,114 @@ class ValuePublisher(Publisher, ListeningBase, Generic[T]):
         
         Note:
             - This method internally uses the value setter, which already calls publish()
-            - The extra publish() call is redundant but harmless (idempotent)
             - Use whichever style (property or method) fits your code better
         """
         self.value = value
-        self.publish(mode=self._mode)
\ No newline at end of file
+
+    #########################################################
+    # Generations
+    #########################################################
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the generation of the current value.
+
+        The generation starts at 0 for the initial value and is incremented by one
+        for every accepted value change. Suppressed (equal) assignments do not
+        change the generation.
+
+        Example:
+            Detect a stale cache cheaply::
+
+                publisher = ValuePublisher(0, suppress_equal_values=True)
+                seen = publisher.generation   # 0
+
+                publisher.value = 0           # suppressed, generation stays 0
+                publisher.value = 1           # generation 1
+
+                if publisher.generation != seen:
+                    rebuild_cache(publisher.value)
+        """
+        return self._generation
+
+    def changes_since(self, generation: int) -> int:
+        """
+        Get the number of value changes since the given generation.
+
+        Args:
+            generation: A generation previously read from `generation`.
+
+        Returns:
+            The number of accepted value changes after `generation` (0 if the
+            value has not changed since).
+
+        Raises:
+            ValueError: If the generation is negative or lies in the future.
+
+        Example:
+            Skip redundant work in a slow subscriber::
+
+                def on_publication():
+                    nonlocal last_seen
+                    if publisher.changes_since(last_seen) == 0:
+                        return
+                    last_seen = publisher.generation
+                    process(publisher.value)
+        """
+        if generation < 0 or generation > self._generation:
+            raise ValueError(f"Generation {generation} is not in the range [0, {self._generation}]")
+        return self._generation - generation
+
+    def has_changed_since(self, generation: int) -> bool:
+        """
+        Check if the value has changed since the given generation.
+
+        Args:
+            generation: A generation previously read from `generation`.
+
+        Returns:
+            True if at least one value change happened after `generation`.
+
+        Raises:
+            ValueError: If the generation is negative or lies in the future.
+        """
+        return self.changes_since(generation) > 0
+
+    def values_since(self, generation: int) -> tuple[tuple[int, T], ...]:
+        """
+        Get the values that were set after the given generation.
+
+        Requires the publisher to be created with `history_size > 0`. Only the last
+        `history_size` values are retained.
+
+        Args:
+            generation: A generation previously read from `generation`.
+
+        Returns:
+            A tuple of (generation, value) pairs for all changes after `generation`,
+            oldest first. Empty if nothing changed.
+
+        Raises:
+            ValueError: If no history is kept, if the generation is out of range,
+                or if the history no longer retains all changes since `generation`.
+
+        Example:
+            Replay missed updates::
+
+                publisher = ValuePublisher("idle", history_size=16)
+                seen = publisher.generation
+
+                publisher.value = "active"
+                publisher.value = "done"
+
+                publisher.values_since(seen)  # ((1, "active"), (2, "done"))
+        """
+        missed: int = self.changes_since(generation)
+        if self._history is None:
+            raise ValueError("This publisher keeps no value history (history_size is 0)")
+        if missed == 0:
+            return ()
+        if missed > len(self._history) or self._history[-missed][0] != generation + 1:
+            raise ValueError(f"The history no longer retains all changes since generation {generation}")
+        return tuple(self._history)[-missed:]
\ No newline at end of file
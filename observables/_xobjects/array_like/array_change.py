@@ -0,0 +1,78 @@
+"""
+Array Change - Records of the region in which an array value changed
+
+An edit of an observable array (e.g. `xarray[10:20] = 0`) creates a new array
+that differs from the previous one only in the assigned region. The edit is
+recorded together with weak references to both arrays, so that
+    - the equality check of the nexus system only compares that region, and
+    - the statistics hooks (min, max, mean) only look at that region.
+
+Only basic indices (integers, slices, Ellipsis and tuples of those) are
+recorded, because they select each element at most once. Arrays created in any
+other way have no recorded change and are handled as a whole.
+
+Example:
+    >>> new = previous.copy()
+    >>> new[2:4] = 0
+    >>> record_array_change(previous, new, (slice(2, 4),))
+    >>> recorded_array_change(previous, new)
+    ArrayChange(region=(slice(2, 4, None),))
+"""
+
+from typing import Any, Optional
+from dataclasses import dataclass
+import weakref
+
+_recorded_changes: dict[int, tuple[weakref.ref[Any], weakref.ref[Any], "ArrayChange"]] = {}
+"""Recorded changes by id of the new array. An entry is removed as soon as its new array is garbage collected."""
+
+
+@dataclass(frozen=True, slots=True)
+class ArrayChange:
+    """
+    Immutable record of the region in which an array differs from the array it was derived from.
+
+    Attributes:
+        region: A basic index (a tuple of integers, slices and Ellipsis) selecting the changed elements.
+    """
+
+    region: tuple[Any, ...]
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"ArrayChange(region={self.region!r})"
+
+
+def as_basic_region(index: Any) -> Optional[tuple[Any, ...]]:
+    """
+    Get `index` as a tuple if it is a basic index, None otherwise.
+    """
+    region: tuple[Any, ...] = index if isinstance(index, tuple) else (index,)
+    for item in region:
+        if item is Ellipsis or isinstance(item, slice):
+            continue
+        if isinstance(item, int) and not isinstance(item, bool):
+            continue
+        return None
+    return region
+
+
+def record_array_change(previous: Any, current: Any, region: tuple[Any, ...]) -> None:
+    """
+    Record that `current` was derived from `previous` by assigning the elements in `region`.
+    """
+    key: int = id(current)
+    _recorded_changes[key] = (weakref.ref(previous), weakref.ref(current, lambda _: _recorded_changes.pop(key, None)), ArrayChange(region))
+
+
+def recorded_array_change(previous: Any, current: Any) -> Optional[ArrayChange]:
+    """
+    Get the recorded change that turned `previous` into `current`.
+
+    Returns:
+        The recorded change, or None if `current` was not recorded as an edit of `previous`.
+    """
+    entry = _recorded_changes.get(id(current))
+    if entry is None or entry[1]() is not current or entry[0]() is not previous:
+        return None
+    return entry[2]
@@ -0,0 +1,140 @@
+"""
+IncrementalArrayStatistics - Shape, dtype, min, max and mean of array values, maintained from dirty regions
+
+The secondary hooks of XArray are derived from the array on every submission.
+Reducing the whole array costs O(n) per edit, even if a single element changed.
+
+IncrementalArrayStatistics keeps the statistics of the last arrays together with
+the arrays they were derived from:
+    - The same array object again returns the same statistics, so the secondary
+      hooks are not updated at all.
+    - An array with a recorded change (see `array_change`) is handled by reducing
+      the old and new values of the changed region only: the sum is corrected by
+      their difference, and min/max only have to be recomputed from scratch if the
+      previous extreme value was inside the region and got replaced by a less
+      extreme one.
+    - Any other array is reduced from scratch.
+
+Statistics are only computed for boolean, integer and floating point arrays; for any
+other dtype and for empty arrays min, max and mean are None.
+"""
+
+from typing import Any, Optional
+from dataclasses import dataclass
+
+from ..._auxiliary.derive_cache import DeriveCache
+from .array_change import recorded_array_change
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover - numpy is an optional dependency
+    np = None # type: ignore
+
+_MAX_INCREMENTAL_UPDATES: int = 256
+"""Number of incremental sum updates after which the sum is recomputed, to bound floating point drift."""
+
+_NUMERIC_KINDS: str = "biuf"
+
+
+@dataclass(frozen=True, slots=True)
+class ArrayStatistics:
+    """
+    Immutable statistics of an array value.
+
+    Attributes:
+        shape: The shape of the array.
+        dtype: The dtype of the array.
+        minimum: The smallest element (None for empty or non-numeric arrays).
+        maximum: The largest element (None for empty or non-numeric arrays).
+        total: The sum of all elements (None for empty or non-numeric arrays).
+        incremental_updates: Number of incremental updates since the sum was last computed from scratch.
+    """
+
+    shape: tuple[int, ...]
+    dtype: Any
+    minimum: Any
+    maximum: Any
+    total: Any
+    incremental_updates: int
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Get the mean of all elements (None for empty or non-numeric arrays)."""
+        size: int = 1
+        for dimension in self.shape:
+            size *= dimension
+        if self.total is None or size == 0:
+            return None
+        return self.total / size
+
+
+def _is_numeric(array: Any) -> bool:
+    return array.dtype.kind in _NUMERIC_KINDS and array.size > 0
+
+
+def _full_statistics(array: Any, previous: Optional[ArrayStatistics]) -> ArrayStatistics:
+    shape: tuple[int, ...] = previous.shape if previous is not None and previous.shape == array.shape else array.shape
+    dtype: Any = previous.dtype if previous is not None and previous.dtype == array.dtype else array.dtype
+    if not _is_numeric(array):
+        return ArrayStatistics(shape, dtype, None, None, None, 0)
+    return ArrayStatistics(shape, dtype, array.min().item(), array.max().item(), array.sum().item(), 0)
+
+
+def _has_nan(values: Any) -> bool:
+    return values.dtype.kind == "f" and bool(np.isnan(values).any())
+
+
+def _incremental_statistics(previous_array: Any, array: Any, statistics: ArrayStatistics, region: tuple[Any, ...]) -> ArrayStatistics:
+    """
+    Update the statistics of `previous_array` to `array`, which only differs in `region`.
+    """
+    if statistics.total is None or statistics.incremental_updates >= _MAX_INCREMENTAL_UPDATES:
+        return _full_statistics(array, statistics)
+    old_values = np.asarray(previous_array[region])
+    new_values = np.asarray(array[region])
+    if new_values.size == 0:
+        return statistics
+    if _has_nan(old_values) or _has_nan(new_values) or statistics.total != statistics.total:
+        return _full_statistics(array, statistics)
+
+    new_minimum = new_values.min().item()
+    if new_minimum <= statistics.minimum:
+        minimum = new_minimum
+    elif old_values.min().item() > statistics.minimum:
+        minimum = statistics.minimum
+    else:
+        minimum = array.min().item()
+
+    new_maximum = new_values.max().item()
+    if new_maximum >= statistics.maximum:
+        maximum = new_maximum
+    elif old_values.max().item() < statistics.maximum:
+        maximum = statistics.maximum
+    else:
+        maximum = array.max().item()
+
+    total = statistics.total - old_values.sum().item() + new_values.sum().item()
+    return ArrayStatistics(statistics.shape, statistics.dtype, minimum, maximum, total, statistics.incremental_updates + 1)
+
+
+class IncrementalArrayStatistics(DeriveCache[Any, ArrayStatistics]):
+    """
+    Derives the statistics of array values, reusing the statistics of the previous array.
+
+    Use one instance per observable as the source of its statistics secondary hook callbacks.
+    """
+
+    __slots__ = ()
+
+    def statistics(self, array: Any) -> ArrayStatistics:
+        """Get the statistics of `array`."""
+        return self._derive(array)
+
+    def _derive_from_edit(self, previous_source: Any, previous_value: ArrayStatistics, source: Any) -> Optional[ArrayStatistics]:
+        change = recorded_array_change(previous_source, source)
+        if change is None:
+            return None
+        return _incremental_statistics(previous_source, source, previous_value, change.region)
+
+    def _derive_from_scratch(self, source: Any) -> ArrayStatistics:
+        return _full_statistics(source, self._latest_value())
@@ -0,0 +1,228 @@
+from typing import Generic, TypeVar, Literal, Optional, Any, Mapping
+from logging import Logger
+
+from ..._hooks.hook_aliases import Hook, ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._carries_hooks.x_complex_base import ComplexObservableBase
+from ..._nexus_system.submission_error import SubmissionError
+from .array_change import ArrayChange, as_basic_region, record_array_change, recorded_array_change
+from .incremental_array_statistics import IncrementalArrayStatistics
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover - numpy is an optional dependency
+    np = None # type: ignore
+
+T = TypeVar("T")
+
+
+def _frozen_array(value: Any, dtype: Any = None) -> Any:
+    """Get `value` as a read-only ndarray, copying it unless it already is one with the requested dtype."""
+    if isinstance(value, np.ndarray) and not value.flags.writeable and (dtype is None or value.dtype == dtype):
+        return value
+    array = np.array(value, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+class ObservableArray(ComplexObservableBase[Literal["array"], Literal["shape", "dtype", "min", "max", "mean"], Any, Any, "ObservableArray"], Generic[T]):
+    """
+    An observable NumPy array (requires the optional dependency `numpy`).
+
+    The stored arrays are read-only snapshots: every edit creates a new array, so previous values
+    stay intact and joined hooks never see a half-written array. Assigning to a region
+    (`xarray[10:20] = 0`) records the dirty region, which lets the nexus system compare only that
+    region of the old and new array (see the ndarray equality callback of the default nexus manager)
+    and lets the `min`, `max` and `mean` hooks update from the values in the region instead of
+    reducing the whole array.
+
+    Arrays are compared element-wise, with the tolerance `FLOAT_ACCURACY` of the default nexus
+    manager for floating point arrays (NaN equals NaN).
+
+    Example:
+        >>> samples = ObservableArray(np.zeros(1_000_000))
+        >>> samples.max_hook.add_listener(lambda: print("New max:", samples.max))
+        >>> samples[500:510] = 3.0  # Only 10 elements are compared and reduced
+        New max: 3.0
+    """
+
+    def __init__(self, observable_or_hook_or_value: Any = None, dtype: Any = None, logger: Optional[Logger] = None) -> None:
+        """
+        Initialize an ObservableArray.
+
+        Args:
+            observable_or_hook_or_value: The initial array (anything `numpy.array` accepts; it is
+                copied), a hook holding an ndarray, another ObservableArray to join with, or None
+                for an empty array
+            dtype: Optional dtype of the initial array
+            logger: Optional logger for debugging
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("ObservableArray requires numpy. Install it with `pip install numpy`.")
+
+        if observable_or_hook_or_value is None:
+            initial_array: Any = _frozen_array((), dtype=dtype)
+            hook: Optional[ManagedHookProtocol[Any]] = None
+        elif isinstance(observable_or_hook_or_value, ObservableArray):
+            initial_array = observable_or_hook_or_value.array_hook.value # type: ignore
+            hook = observable_or_hook_or_value.array_hook # type: ignore
+        elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
+            initial_array = observable_or_hook_or_value.value # type: ignore
+            hook = observable_or_hook_or_value # type: ignore
+        else:
+            initial_array = _frozen_array(observable_or_hook_or_value, dtype=dtype)
+            hook = None
+
+        def is_valid_value(x: Mapping[Literal["array"], Any]) -> tuple[bool, str]:
+            return (True, "Verification method passed") if isinstance(x["array"], np.ndarray) else (False, "Value is not a numpy array")
+
+        # Shape, dtype and reductions are maintained from the recorded dirty regions of the array.
+        # The reductions are lazy: they are only computed while somebody reads, joins or listens to them.
+        statistics = IncrementalArrayStatistics()
+
+        super().__init__(
+            initial_hook_values={"array": initial_array},
+            verification_method=is_valid_value,
+            secondary_hook_callbacks={
+                "shape": lambda x: statistics.statistics(x["array"]).shape,
+                "dtype": lambda x: statistics.statistics(x["array"]).dtype,
+                "min": lambda x: statistics.statistics(x["array"]).minimum,
+                "max": lambda x: statistics.statistics(x["array"]).maximum,
+                "mean": lambda x: statistics.statistics(x["array"]).mean
+            },
+            logger=logger,
+            lazy_secondary_hook_keys=("min", "max", "mean")
+        )
+
+        if hook is not None:
+            self._join("array", hook, "use_target_value") # type: ignore
+
+    def _submit_array(self, new_array: Any) -> None:
+        success, msg = self._submit_value("array", new_array)
+        if not success:
+            raise SubmissionError(msg, new_array, "array")
+
+    #########################################################
+    # Array value
+    #########################################################
+
+    @property
+    def array_hook(self) -> Hook[Any]:
+        """Get the hook for the array (contains a read-only ndarray)."""
+        return self._primary_hooks["array"] # type: ignore
+
+    @property
+    def array(self) -> Any:
+        """Get the current array (read-only; use `copy()` for a writable copy)."""
+        return self._primary_hooks["array"].value
+
+    @array.setter
+    def array(self, value: Any) -> None:
+        self.change_array(value)
+
+    def change_array(self, new_array: Any) -> None:
+        """Replace the array (lambda-friendly method). The value is copied into a read-only array."""
+        self._submit_array(_frozen_array(new_array))
+
+    def copy(self) -> Any:
+        """Get a writable copy of the current array."""
+        return self._primary_hooks["array"].value.copy()
+
+    @property
+    def last_change(self) -> Optional[ArrayChange]:
+        """Get the dirty region of the latest change of the array, None if it was not a recorded region edit."""
+        array_hook = self._primary_hooks["array"]
+        return recorded_array_change(array_hook.previous_value, array_hook.value)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """
+        Assign to a region of the array, like `ndarray.__setitem__`.
+
+        The new array is a copy of the current one with the region assigned. For basic indices
+        (integers, slices and Ellipsis) the region is recorded, so that the equality check and the
+        statistics hooks only look at the region.
+        """
+        current = self._primary_hooks["array"].value
+        new_array = current.copy()
+        new_array[index] = value
+        new_array.flags.writeable = False
+        region = as_basic_region(index)
+        if region is not None:
+            record_array_change(current, new_array, region)
+        self._submit_array(new_array)
+
+    def fill(self, value: Any) -> None:
+        """Set all elements to `value`."""
+        self[...] = value
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._primary_hooks["array"].value[index]
+
+    def __len__(self) -> int:
+        return len(self._primary_hooks["array"].value) # type: ignore
+
+    def __iter__(self) -> Any:
+        return iter(self._primary_hooks["array"].value)
+
+    #########################################################
+    # Shape, dtype and statistics
+    #########################################################
+
+    @property
+    def shape_hook(self) -> ReadOnlyHook[tuple[int, ...]]:
+        """Get the hook for the shape of the array."""
+        return self._secondary_hooks["shape"] # type: ignore
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Get the shape of the array."""
+        return self._secondary_hooks["shape"].value # type: ignore
+
+    @property
+    def dtype_hook(self) -> ReadOnlyHook[Any]:
+        """Get the hook for the dtype of the array."""
+        return self._secondary_hooks["dtype"] # type: ignore
+
+    @property
+    def dtype(self) -> Any:
+        """Get the dtype of the array."""
+        return self._secondary_hooks["dtype"].value
+
+    @property
+    def min_hook(self) -> ReadOnlyHook[Any]:
+        """Get the hook for the smallest element (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["min"] # type: ignore
+
+    @property
+    def min(self) -> Any:
+        """Get the smallest element (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["min"].value
+
+    @property
+    def max_hook(self) -> ReadOnlyHook[Any]:
+        """Get the hook for the largest element (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["max"] # type: ignore
+
+    @property
+    def max(self) -> Any:
+        """Get the largest element (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["max"].value
+
+    @property
+    def mean_hook(self) -> ReadOnlyHook[Optional[float]]:
+        """Get the hook for the mean of all elements (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["mean"] # type: ignore
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Get the mean of all elements (None for empty or non-numeric arrays)."""
+        return self._secondary_hooks["mean"].value # type: ignore
+
+    def __str__(self) -> str:
+        return f"OA(array={self._primary_hooks['array'].value})"
+
+    def __repr__(self) -> str:
+        return f"ObservableArray({self._primary_hooks['array'].value!r})"
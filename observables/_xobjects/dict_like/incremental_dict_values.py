@@ -0,0 +1,88 @@
+"""
+IncrementalDictValues - Keys and values of a dict value, maintained from key-level changes
+
+The `keys` and `values` secondary hooks of the dict-like XObjects are derived from
+the dict on every submission. Recomputing `set(dict.keys())` and
+`list(dict.values())` costs O(n) per edit, even if a single key changed or the
+dict did not change at all (e.g. if only the selected key of a selection dict
+changed).
+
+IncrementalDictValues keeps the last derived keys (a PersistentSet) and values (a
+PersistentVector) together with the dict they were derived from:
+    - The same dict object again returns the same keys and values objects, so the
+      secondary hooks are not updated at all.
+    - A PersistentMap derived from that dict by an edit is handled through the
+      recorded MapChange in O(k log n) for k affected keys.
+    - Any other mapping is derived from scratch in O(n).
+
+Example:
+    >>> derived = IncrementalDictValues()
+    >>> d1 = PersistentMap({"a": 1, "b": 2})
+    >>> derived.values(d1)
+    PersistentVector([1, 2])
+    >>> d2 = d1.set("b", 3)
+    >>> derived.values(d2)  # Only the entry of "b" is replaced
+    PersistentVector([1, 3])
+"""
+
+from typing import Any, Generic, Mapping, Optional, TypeVar
+
+from ..._auxiliary.derive_cache import DeriveCache
+from ..list_like.persistent_vector import PersistentVector
+from ..set_like.persistent_set import PersistentSet
+from .persistent_map import PersistentMap
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class IncrementalDictValues(DeriveCache[Mapping[K, V], tuple[PersistentSet[K], PersistentVector[V]]], Generic[K, V]):
+    """
+    Derives the keys and values of dict values, reusing the result for the previous dict.
+
+    Use one instance per observable as the source of its `keys` and `values` secondary
+    hook callbacks.
+    """
+
+    __slots__ = ()
+
+    def keys(self, dict_value: Optional[Mapping[K, V]]) -> PersistentSet[K]:
+        """Get the keys of `dict_value` as a PersistentSet (empty for None)."""
+        return self._derive(PersistentMap() if dict_value is None else dict_value)[0]
+
+    def values(self, dict_value: Optional[Mapping[K, V]]) -> PersistentVector[V]:
+        """Get the values of `dict_value`, in iteration order, as a PersistentVector (empty for None)."""
+        return self._derive(PersistentMap() if dict_value is None else dict_value)[1]
+
+    def _derive_from_edit(self, previous_source: Mapping[K, V], previous_value: tuple[PersistentSet[K], PersistentVector[V]], source: Mapping[K, V]) -> Optional[tuple[PersistentSet[K], PersistentVector[V]]]:
+        if not isinstance(source, PersistentMap) or not isinstance(previous_source, PersistentMap):
+            return None
+        change = source.changes_from(previous_source)
+        if change is None:
+            return None
+        cached_keys, cached_values = previous_value
+        return (
+            cached_keys._apply(change.added, change.removed),
+            _apply_change_to_values(previous_source, source, cached_values, change.added, change.removed, change.changed) # type: ignore
+        )
+
+    def _derive_from_scratch(self, source: Mapping[K, V]) -> tuple[PersistentSet[K], PersistentVector[V]]:
+        return PersistentSet(source.keys()), PersistentVector(source.values())
+
+
+def _apply_change_to_values(previous: PersistentMap[Any, V], current: PersistentMap[Any, V], values: PersistentVector[V], added: frozenset[Any], removed: frozenset[Any], changed: frozenset[Any]) -> PersistentVector[V]:
+    """
+    Update the values of `previous` (in its iteration order) to the values of `current`.
+
+    Removed entries are deleted at their old positions (from the back), changed entries keep
+    their position and added entries are appended, as new keys always go to the end.
+    """
+    for position in sorted((previous._position(previous._index[key][0]) for key in removed), reverse=True): # type: ignore
+        values = values.delete(position)
+    for key in changed:
+        sequence_number, value = current._index[key] # type: ignore
+        values = values.set(current._position(sequence_number), value) # type: ignore
+    if added:
+        added_entries = sorted(current._index[key] for key in added) # type: ignore
+        values = values.extend(value for _, value in added_entries) # type: ignore
+    return values
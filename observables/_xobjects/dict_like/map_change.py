@@ -0,0 +1,63 @@
+"""
+Map Change - Records describing how a dict value changed
+
+A change of an observable dict is described by the keys that were added,
+removed or whose value changed, so consumers can update derived state in
+O(k) instead of comparing both dicts.
+
+Example:
+    >>> change = diff_map_values({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4})
+    >>> change
+    MapChange(added={'c'}, removed=set(), changed={'b'})
+"""
+
+from typing import Generic, Mapping, TypeVar
+from dataclasses import dataclass
+
+K = TypeVar("K")
+
+
+@dataclass(frozen=True, slots=True)
+class MapChange(Generic[K]):
+    """
+    Immutable record of the keys affected by a change of a dict.
+
+    Attributes:
+        added: Keys that are in the new value but not in the previous value.
+        removed: Keys that are in the previous value but not in the new value.
+        changed: Keys that are in both values, but with a different value.
+    """
+
+    added: frozenset[K]
+    removed: frozenset[K]
+    changed: frozenset[K]
+
+    def __bool__(self) -> bool:
+        """Return True if any key was added, removed or changed."""
+        return len(self.added) > 0 or len(self.removed) > 0 or len(self.changed) > 0
+
+    @property
+    def affected_keys(self) -> frozenset[K]:
+        """Get all keys whose value (or presence) changed."""
+        return self.added | self.removed | self.changed
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"MapChange(added={set(self.added)!r}, removed={set(self.removed)!r}, changed={set(self.changed)!r})"
+
+
+def diff_map_values(previous: Mapping[K, object], current: Mapping[K, object]) -> MapChange[K]:
+    """
+    Compute the change between two dict values in O(n).
+    """
+    added: set[K] = set()
+    changed: set[K] = set()
+    for key, value in current.items():
+        if key not in previous:
+            added.add(key)
+        else:
+            previous_value = previous[key]
+            if previous_value is not value and not previous_value == value:
+                changed.add(key)
+    removed: set[K] = {key for key in previous if key not in current}
+    return MapChange(frozenset(added), frozenset(removed), frozenset(changed))
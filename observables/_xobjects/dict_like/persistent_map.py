@@ -0,0 +1,307 @@
+"""
+PersistentMap - Immutable, insertion-ordered mapping with structural sharing, used as XDict backend
+
+Keys are stored in an `immutables.Map` (a hash array mapped trie) together with
+an insertion sequence number, and the entries are additionally kept in a
+PersistentVector ordered by that number. Lookups go through the trie, iteration
+goes through the vector, so the mapping iterates in insertion order like a dict
+while every edit copies only O(log n) nodes and previous versions stay intact.
+
+Complexity (n = number of keys):
+    - Lookup:                         O(log n)
+    - set / delete of one key:        O(log n) trie nodes, O(log² n) to locate the entry
+    - update with k keys:             O(k log² n), the trie is edited with `Map.mutate()`
+    - Equality of consecutive versions: O(1) (decided by the recorded change)
+
+Example:
+    >>> config = PersistentMap({"theme": "dark", "language": "en"})
+    >>> edited = config.set("theme", "light")
+    >>> config["theme"], edited["theme"]
+    ('dark', 'light')
+    >>> edited.changes_from(config)
+    MapChange(added=set(), removed=set(), changed={'theme'})
+"""
+
+from typing import Any, Generic, Iterable, Iterator, Mapping, Optional, TypeVar, ItemsView, KeysView, ValuesView
+from bisect import bisect_left
+from operator import itemgetter
+import weakref
+
+from immutables import Map
+
+from ..list_like.persistent_vector import PersistentVector
+from .map_change import MapChange
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_entry_sequence_number = itemgetter(0)
+_entry_key = itemgetter(1)
+_entry_value = itemgetter(2)
+_entry_item = itemgetter(1, 2)
+
+
+def _values_equal(value_1: Any, value_2: Any) -> bool:
+    return value_1 is value_2 or value_1 == value_2
+
+
+class _PersistentMapKeysView(KeysView[K]):
+    _mapping: "PersistentMap[K, Any]"
+
+    def __iter__(self) -> Iterator[K]:
+        return map(_entry_key, self._mapping._entries) # type: ignore
+
+
+class _PersistentMapItemsView(ItemsView[K, V]):
+    _mapping: "PersistentMap[K, V]"
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return map(_entry_item, self._mapping._entries) # type: ignore
+
+
+class _PersistentMapValuesView(ValuesView[V]):
+    _mapping: "PersistentMap[Any, V]"
+
+    def __iter__(self) -> Iterator[V]:
+        return map(_entry_value, self._mapping._entries) # type: ignore
+
+
+class PersistentMap(Mapping[K, V], Generic[K, V]):
+    """
+    Immutable, insertion-ordered mapping with O(log n) structural-sharing edits.
+
+    All edit methods (`set`, `delete`, `update`, `remove_keys`) return a new mapping
+    and leave the original untouched; they return the mapping itself if nothing
+    changes. The mapping compares equal to any Mapping with the same items.
+
+    Every edit records the added, removed and changed keys together with a weak
+    reference to the mapping it was derived from (see `changes_from`).
+    """
+
+    __slots__ = ("_index", "_entries", "_next_sequence_number", "_hash", "_origin", "__weakref__")
+
+    def __init__(self, items: Mapping[K, V] | Iterable[tuple[K, V]] = ()) -> None:
+        """
+        Create a mapping holding the given items.
+
+        Args:
+            items: A mapping or an iterable of key-value pairs (default: empty). If
+                `items` is already a PersistentMap, its structure is shared, not copied.
+        """
+        if isinstance(items, PersistentMap):
+            self._index: Map[K, tuple[int, V]] = items._index # type: ignore
+            self._entries: PersistentVector[tuple[int, K, V]] = items._entries # type: ignore
+            self._next_sequence_number: int = items._next_sequence_number # type: ignore
+        else:
+            ordered: dict[K, V] = dict(items.items() if isinstance(items, Mapping) else items) # type: ignore
+            entries: list[tuple[int, K, V]] = [(number, key, value) for number, (key, value) in enumerate(ordered.items())]
+            self._index = Map((key, (number, value)) for number, key, value in entries)
+            self._entries = PersistentVector(entries)
+            self._next_sequence_number = len(entries)
+        self._hash: Optional[int] = None
+        self._origin: Optional[tuple[weakref.ref[PersistentMap[K, V]], MapChange[K]]] = None
+
+    def _derive(self, index: "Map[K, tuple[int, V]]", entries: PersistentVector[tuple[int, K, V]], next_sequence_number: int, change: MapChange[K]) -> "PersistentMap[K, V]":
+        derived: PersistentMap[K, V] = PersistentMap.__new__(PersistentMap)
+        derived._index = index
+        derived._entries = entries
+        derived._next_sequence_number = next_sequence_number
+        derived._hash = None
+        derived._origin = (weakref.ref(self), change)
+        return derived
+
+    def _position(self, sequence_number: int) -> int:
+        """Get the position of an entry in the ordered entries."""
+        return bisect_left(self._entries, sequence_number, key=_entry_sequence_number)
+
+    def changes_from(self, previous: Any) -> Optional[MapChange[K]]:
+        """
+        Get the change that turned `previous` into this mapping.
+
+        Returns:
+            The recorded change if this mapping was created by an edit of `previous`,
+            an empty change if `previous` is this mapping and None otherwise.
+        """
+        if previous is self:
+            return MapChange(frozenset(), frozenset(), frozenset())
+        if self._origin is not None and self._origin[0]() is previous:
+            return self._origin[1]
+        return None
+
+    #########################################################
+    # Mapping protocol
+    #########################################################
+
+    def __getitem__(self, key: K) -> V:
+        return self._index[key][1]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[K]:
+        return map(_entry_key, self._entries)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        entry = self._index.get(key)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def keys(self) -> KeysView[K]:
+        return _PersistentMapKeysView(self)
+
+    def items(self) -> ItemsView[K, V]:
+        return _PersistentMapItemsView(self)
+
+    def values(self) -> ValuesView[V]:
+        return _PersistentMapValuesView(self)
+
+    def to_dict(self) -> dict[K, V]:
+        """Return the items as a new dict (in insertion order)."""
+        return {key: value for _, key, value in self._entries}
+
+    #########################################################
+    # Persistent edits
+    #########################################################
+
+    def set(self, key: K, value: V) -> "PersistentMap[K, V]":
+        """
+        Return a new mapping with `key` set to `value`.
+
+        Existing keys keep their position. Returns this mapping if the key already
+        holds an equal value.
+        """
+        entry = self._index.get(key)
+        if entry is None:
+            number: int = self._next_sequence_number
+            return self._derive(
+                self._index.set(key, (number, value)),
+                self._entries.append((number, key, value)),
+                number + 1,
+                MapChange(frozenset((key,)), frozenset(), frozenset())
+            )
+        number, old_value = entry
+        if _values_equal(old_value, value):
+            return self
+        return self._derive(
+            self._index.set(key, (number, value)),
+            self._entries.set(self._position(number), (number, key, value)),
+            self._next_sequence_number,
+            MapChange(frozenset(), frozenset(), frozenset((key,)))
+        )
+
+    def delete(self, key: K) -> "PersistentMap[K, V]":
+        """
+        Return a new mapping without `key`.
+
+        Raises:
+            KeyError: If the key is not present.
+        """
+        number, _ = self._index[key]
+        return self._derive(
+            self._index.delete(key),
+            self._entries.delete(self._position(number)),
+            self._next_sequence_number,
+            MapChange(frozenset(), frozenset((key,)), frozenset())
+        )
+
+    def update(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> "PersistentMap[K, V]":
+        """
+        Return a new mapping with all `items` set, in O(k log² n) for k items.
+        """
+        pairs: Iterable[tuple[K, V]] = items.items() if isinstance(items, Mapping) else items # type: ignore
+        entries = self._entries
+        number: int = self._next_sequence_number
+        added: dict[K, V] = {}
+        changed: set[K] = set()
+        with self._index.mutate() as mutation:
+            for key, value in pairs:
+                entry = mutation.get(key)
+                if entry is None:
+                    mutation[key] = (number, value)
+                    added[key] = value
+                    number += 1
+                elif key in added:
+                    mutation[key] = (entry[0], value)
+                    added[key] = value
+                elif not _values_equal(entry[1], value):
+                    mutation[key] = (entry[0], value)
+                    changed.add(key)
+            index = mutation.finish()
+        if not added and not changed:
+            return self
+        for key in changed:
+            entry_number, value = index[key]
+            entries = entries.set(bisect_left(entries, entry_number, key=_entry_sequence_number), (entry_number, key, value))
+        if added:
+            entries = entries.extend((index[key][0], key, value) for key, value in added.items())
+        return self._derive(index, entries, number, MapChange(frozenset(added), frozenset(), frozenset(changed)))
+
+    def remove_keys(self, keys: Iterable[K]) -> "PersistentMap[K, V]":
+        """
+        Return a new mapping without the given keys. Missing keys are ignored.
+        """
+        entries = self._entries
+        removed: set[K] = set()
+        with self._index.mutate() as mutation:
+            for key in keys:
+                entry = mutation.get(key)
+                if entry is None:
+                    continue
+                del mutation[key]
+                removed.add(key)
+                entries = entries.delete(bisect_left(entries, entry[0], key=_entry_sequence_number))
+            index = mutation.finish()
+        if not removed:
+            return self
+        return self._derive(index, entries, self._next_sequence_number, MapChange(frozenset(), frozenset(removed), frozenset()))
+
+    #########################################################
+    # Comparison and hashing
+    #########################################################
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PersistentMap):
+            if self._index is other._index: # type: ignore
+                return True
+            # Consecutive versions: the recorded change decides without inspecting items
+            change = self.changes_from(other)
+            if change is None:
+                change = other.changes_from(self) # type: ignore
+            if change is not None:
+                return not change
+        if isinstance(other, Mapping):
+            if len(self) != len(other): # type: ignore
+                return False
+            for key, value in other.items(): # type: ignore
+                entry = self._index.get(key)
+                if entry is None or not _values_equal(entry[1], value):
+                    return False
+            return True
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    #########################################################
+    # Other dunder methods
+    #########################################################
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (PersistentMap, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({self.to_dict()!r})"
@@ -0,0 +1,20 @@
+from typing import Any, Mapping, TypeVar
+
+from .map_change import MapChange, diff_map_values
+from .persistent_map import PersistentMap
+
+K = TypeVar("K")
+
+
+def map_changes(previous: Mapping[K, Any], current: Mapping[K, Any]) -> MapChange[K]:
+    """
+    Get the keys added, removed and changed between `previous` and `current`.
+
+    If `current` is a PersistentMap created by an edit of `previous`, the recorded
+    change is returned in O(1). Otherwise the values are diffed in O(n).
+    """
+    if isinstance(current, PersistentMap):
+        recorded = current.changes_from(previous)
+        if recorded is not None:
+            return recorded
+    return diff_map_values(previous, current)
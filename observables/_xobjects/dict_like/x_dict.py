@@ -1,13 +1,25 @@
 from typing import Generic, TypeVar, Optional, overload, Callable, Literal, Any, Mapping, Iterable
+from dataclasses import dataclass
 from logging import Logger
 
 from ..._hooks.hook_aliases import Hook, ReadOnlyHook
 from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
+from ..._nexus_system.update_function_values import UpdateFunctionValues
 from .protocols import ObservableDictProtocol
+from .persistent_map import PersistentMap
+from .utils import map_changes
+from .map_change import MapChange
+from .incremental_dict_values import IncrementalDictValues
 
 K = TypeVar("K")
 V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class _KeyHookKey(Generic[K]):
+    """Hook key of a per-key hook. Wrapping the dict key keeps it apart from the "dict", "length", "keys" and "values" hook keys."""
+    key: K
     
 class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "keys", "values"], Mapping[K, V], int|set[K]|list[V], "ObservableDict"], ObservableDictProtocol[K, V], Generic[K, V]):
     """
@@ -24,6 +36,11 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
     - Automatic copying to prevent external modification
     - Type-safe generic implementation for keys and values
 
+    Internally, the dictionary is stored as an insertion-ordered PersistentMap (backed by an
+    `immutables.Map`). Single-key edits therefore cost O(log n) time and memory instead of
+    copying the whole dictionary, and the equality check of the nexus system can decide on
+    consecutive versions without comparing all items.
+
     Example:
         >>> # Create an observable dictionary
         >>> config = ObservableDict({"theme": "dark", "language": "en"})
@@ -74,13 +91,13 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
 
         if observable_or_hook_or_value is None:
-            initial_dict_value: Mapping[K, V] = {}
+            initial_dict_value: Mapping[K, V] = PersistentMap()
             hook: Optional[ManagedHookProtocol[Mapping[K, V]]] = None
         elif isinstance(observable_or_hook_or_value, Mapping):
-            initial_dict_value = observable_or_hook_or_value
+            initial_dict_value = PersistentMap(observable_or_hook_or_value)
             hook = None
         elif isinstance(observable_or_hook_or_value, ObservableDictProtocol):
-            initial_dict_value = observable_or_hook_or_value.dict # type: ignore
+            initial_dict_value = observable_or_hook_or_value.dict_hook.value # type: ignore
             hook = observable_or_hook_or_value.dict_hook # type: ignore  # For linking
         elif isinstance(observable_or_hook_or_value, ManagedHookProtocol): # type: ignore
             initial_dict_value = observable_or_hook_or_value.value # type: ignore
@@ -91,13 +108,16 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         def is_valid_value(x: Mapping[Literal["dict"], Any]) -> tuple[bool, str]:
             return (True, "Verification method passed") if isinstance(x["dict"], Mapping) else (False, "Value is not a Map")
 
+        # Keys and values are maintained incrementally from the recorded key-level changes of the dict
+        derived_values: IncrementalDictValues[K, V] = IncrementalDictValues()
+
         super().__init__(
             initial_hook_values={"dict": initial_dict_value}, # type: ignore
             verification_method=is_valid_value,
             secondary_hook_callbacks={
                 "length": lambda x: len(x["dict"]),
-                "keys": lambda x: set(x["dict"].keys()),
-                "values": lambda x: list(x["dict"].values())
+                "keys": lambda x: derived_values.keys(x["dict"]),
+                "values": lambda x: derived_values.values(x["dict"])
             },
             logger=logger
         )
@@ -105,6 +125,112 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         if hook is not None:
             self._join("dict", hook, "use_target_value") # type: ignore
 
+    def _get_persistent_map(self) -> PersistentMap[K, V]:
+        """
+        Get the stored dictionary as a PersistentMap.
+
+        The hook may hold any mapping (e.g. if it was joined with a hook holding a plain dict).
+        In that case the value is converted once; the next edit stores the PersistentMap in the nexus.
+        """
+        current = self._primary_hooks["dict"].value
+        if isinstance(current, PersistentMap):
+            return current # type: ignore
+        return PersistentMap(current) # type: ignore
+
+    def _submit_persistent_map(self, current: PersistentMap[K, V], new_map: PersistentMap[K, V]) -> None:
+        """
+        Submit a new PersistentMap as the dictionary, if it differs from `current`.
+        """
+        if new_map is current:
+            return
+        success, msg = self._submit_value("dict", new_map)
+        if not success:
+            raise ValueError(msg)
+
+    def _update_persistent_map(self, update: Callable[[PersistentMap[K, V]], PersistentMap[K, V]]) -> None:
+        """
+        Submit the PersistentMap computed from the current one by the update (compare-and-set).
+
+        Edits of the dictionary from several threads are not lost: if the dictionary was changed
+        between reading and submitting, the update is applied again to the new map. Returning the
+        current map from the update submits nothing.
+        """
+        success, msg = self._update_value("dict", self._as_value_update(update)) # type: ignore
+        if not success:
+            raise ValueError(msg)
+
+    @staticmethod
+    def _as_value_update(update: Callable[[PersistentMap[K, V]], PersistentMap[K, V]]) -> Callable[[Any], Any]:
+        """Turn an update of the PersistentMap into an update of the stored value (which may be any mapping)."""
+        def update_function(current: Any) -> Any:
+            persistent_map: PersistentMap[K, V] = current if isinstance(current, PersistentMap) else PersistentMap(current) # type: ignore
+            new_map: PersistentMap[K, V] = update(persistent_map)
+            return current if new_map is persistent_map else new_map
+        return update_function
+
+    #########################################################
+    # Per-key hooks
+    #########################################################
+
+    def key_hook(self, key: K) -> Hook[Optional[V]]:
+        """
+        Get a hook for the value of a single key.
+
+        The hook is created on first access and returned again on later calls. The dictionary
+        keeps it while it is joined or has listeners or subscribers, otherwise only while it is
+        referenced elsewhere. Its value is the value stored under `key`, or None if the key is
+        not in the dictionary. It can be
+        joined like any other hook, and its nexus (and therefore its listeners) is only updated
+        when the value of this key changes - edits of other keys do not touch it.
+
+        Submitting a value to the hook sets the key in the dictionary. Submitting None for a
+        missing key leaves the dictionary unchanged, and removing the key is not possible through
+        the hook; use `remove_item` instead.
+
+        Args:
+            key: The dictionary key to observe
+
+        Returns:
+            The hook for the value of `key`
+        """
+        return self._get_or_create_dynamic_hook(_KeyHookKey(key), lambda: self._primary_hooks["dict"].value.get(key)) # type: ignore
+
+    @property
+    def key_hooks(self) -> dict[K, Hook[Optional[V]]]:
+        """Get the per-key hooks that are kept by the dictionary or still referenced elsewhere, by dictionary key."""
+        return {hook_key.key: hook for hook_key, hook in self._get_dynamic_hooks().items()} # type: ignore
+
+    def _primary_values_of_dynamic_hooks(self, values: Mapping[Any, Any], update_values: UpdateFunctionValues[Any, Any]) -> Mapping[Any, Any]:
+        """
+        Write the values submitted to per-key hooks into the dictionary.
+        """
+        submitted_dict: Optional[Mapping[K, V]] = update_values.submitted.get("dict")
+        base_dict: Mapping[K, V] = submitted_dict if submitted_dict is not None else update_values.current["dict"]
+        # None stands for a missing key, so it does not add the key
+        key_hook_values: dict[K, Optional[V]] = {
+            hook_key.key: value for hook_key, value in values.items() if value is not None or hook_key.key in base_dict
+        }
+        if not key_hook_values:
+            return {}
+        new_dict: PersistentMap[K, V] = base_dict if isinstance(base_dict, PersistentMap) else PersistentMap(base_dict) # type: ignore
+        new_dict = new_dict.update(key_hook_values) # type: ignore
+        return {"dict": new_dict} if new_dict is not base_dict else {}
+
+    def _derive_dynamic_hook_values(self, current: Mapping[Any, Any], final: Mapping[Any, Any]) -> Mapping[Any, Any]:
+        """
+        Get the values of the per-key hooks of the keys affected by the dict change.
+        """
+        current_dict: Mapping[K, V] = current["dict"]
+        final_dict: Mapping[K, V] = final["dict"]
+        if final_dict is current_dict:
+            return {}
+        change = map_changes(current_dict, final_dict)
+        if len(change.added) + len(change.removed) + len(change.changed) <= len(self._dynamic_hooks) + len(self._released_dynamic_hooks):
+            affected_keys: Iterable[K] = (key for key in change.affected_keys if self._get_dynamic_hook(_KeyHookKey(key)) is not None)
+        else:
+            affected_keys = (hook_key.key for hook_key in self._get_dynamic_hooks() if hook_key.key in change.affected_keys)
+        return {_KeyHookKey(key): final_dict.get(key) for key in affected_keys}
+
     #########################################################
     # ObservableDictProtocol implementation
     #########################################################
@@ -119,15 +245,23 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
     
     @property
     def dict(self) -> dict[K, V]: # type: ignore
-        """Get the current dictionary."""
+        """Get the current dictionary (an immutable, insertion-ordered PersistentMap)."""
         return self._primary_hooks["dict"].value # type: ignore
     
     def change_dict(self, new_dict: Mapping[K, V]) -> None:
         """Change the current dictionary."""
+        if not isinstance(new_dict, PersistentMap):
+            new_dict = PersistentMap(new_dict)
         success, msg = self._submit_value("dict", new_dict)
         if not success:
             raise ValueError(msg)
 
+    @property
+    def last_changes(self) -> MapChange[K]:
+        """Get the keys added, removed and changed by the latest change of the dictionary."""
+        dict_hook = self._primary_hooks["dict"]
+        return map_changes(dict_hook.previous_value, dict_hook.value) # type: ignore
+
     #-------------------------------- Length --------------------------------
 
     @property
@@ -144,8 +278,8 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
 
     @property
     def keys(self) -> set[K]:
-        """Get the current keys of the dictionary."""
-        return frozenset(self._primary_hooks["dict"].value.keys()) # type: ignore
+        """Get the current keys of the dictionary (an immutable PersistentSet)."""
+        return self._secondary_hooks["keys"].value # type: ignore
     
     @property
     def keys_hook(self) -> ReadOnlyHook[Iterable[K]]:
@@ -172,21 +306,13 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
         Set a single key-value pair.
         
-        Creates a new Mapping with the updated key-value pair.
+        Creates a new Mapping with the updated key-value pair in O(log n).
         
         Args:
             key: The key to set or update
             value: The value to associate with the key
         """
-        current = self._primary_hooks["dict"].value
-        if key in current and current[key] == value:
-            return  # No change
-        new_dict = dict(current)
-        new_dict[key] = value
-        
-        success, msg = self._submit_value("dict", new_dict)
-        if not success:
-            raise ValueError(msg)
+        self._update_persistent_map(lambda current: current.set(key, value))
     
     def get_item(self, key: K, default: Optional[V] = None) -> Optional[V]:
         """
@@ -217,18 +343,12 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
         Remove a key-value pair from the dictionary.
         
-        Creates a new Mapping without the specified key.
+        Creates a new Mapping without the specified key in O(log n).
         
         Args:
             key: The key to remove
         """
-        current = self._primary_hooks["dict"].value
-        if key not in current:
-            return  # No change
-        new_dict = {k: v for k, v in current.items() if k != key}
-        success, msg = self._submit_value("dict", new_dict)
-        if not success:
-            raise ValueError(msg)
+        self._update_persistent_map(lambda current: current.delete(key) if key in current else current)
     
     def clear(self) -> None:
         """
@@ -238,7 +358,7 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
         if not self._primary_hooks["dict"].value:
             return  # No change
-        success, msg = self._submit_value("dict", {})
+        success, msg = self._submit_value("dict", PersistentMap())
         if not success:
             raise ValueError(msg)
     
@@ -246,29 +366,15 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
         Update the dictionary with items from another mapping.
         
-        Creates a new Mapping with the updated items.
+        Creates a new Mapping with the updated items in O(k log n) for k items.
+        Nothing is submitted if no value would change.
         
         Args:
             other_dict: Mapping containing items to add or update
         """
         if not other_dict:
             return  # No change
-        # Check if any values would actually change
-        current = self._primary_hooks["dict"].value
-        has_changes = False
-        for key, value in other_dict.items():
-            if key not in current or current[key] != value:
-                has_changes = True
-                break
-        
-        if not has_changes:
-            return  # No change
-        
-        new_dict = dict(current)
-        new_dict.update(other_dict)
-        success, msg = self._submit_value("dict", new_dict)
-        if not success:
-            raise ValueError(msg)
+        self._update_persistent_map(lambda current: current.update(other_dict))
     
     def items(self) -> tuple[tuple[K, V], ...]:
         """
@@ -322,23 +428,19 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         """
         Set a key-value pair in the dictionary.
         
-        Creates a new Mapping with the updated key-value pair.
+        Creates a new Mapping with the updated key-value pair in O(log n).
         
         Args:
             key: The key to set or update
             value: The value to associate with the key
         """
-        current = self._primary_hooks["dict"].value
-        new_dict = {**current, key: value}
-        success, msg = self._submit_value("dict", new_dict)
-        if not success:
-            raise ValueError(msg)
+        self._update_persistent_map(lambda current: current.set(key, value))
     
     def __delitem__(self, key: K) -> None:
         """
         Remove a key-value pair from the dictionary.
         
-        Creates a new Mapping without the specified key.
+        Creates a new Mapping without the specified key in O(log n).
         
         Args:
             key: The key to remove
@@ -346,13 +448,58 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
         Raises:
             KeyError: If the key is not found in the dictionary
         """
-        current = self._primary_hooks["dict"].value
-        if key not in current:
-            raise KeyError(f"Key '{key}' not found in dictionary")
-        new_dict = {k: v for k, v in current.items() if k != key}
-        success, msg = self._submit_value("dict", new_dict)
+        def delete_item(current: PersistentMap[K, V]) -> PersistentMap[K, V]:
+            if key not in current:
+                raise KeyError(f"Key '{key}' not found in dictionary")
+            return current.delete(key)
+        self._update_persistent_map(delete_item)
+
+    #########################################################
+    # Asynchronous methods
+    #########################################################
+
+    # Variants of the mutating methods for coroutines: the submission does not block the
+    # event loop and the reactions of subscribers are awaited (see NexusManager.submit_values_async).
+
+    async def _submit_persistent_map_async(self, current: PersistentMap[K, V], new_map: PersistentMap[K, V]) -> None:
+        """
+        Submit a new PersistentMap as the dictionary from a coroutine, if it differs from `current`.
+        """
+        if new_map is current:
+            return
+        success, msg = await self._submit_values_async({"dict": new_map})
+        if not success:
+            raise ValueError(msg)
+
+    async def change_dict_async(self, new_dict: Mapping[K, V]) -> None:
+        """Change the current dictionary from a coroutine."""
+        if not isinstance(new_dict, PersistentMap):
+            new_dict = PersistentMap(new_dict)
+        await self._submit_persistent_map_async(self._get_persistent_map(), new_dict) # type: ignore
+
+    async def _update_persistent_map_async(self, update: Callable[[PersistentMap[K, V]], PersistentMap[K, V]]) -> None:
+        """
+        Submit the PersistentMap computed from the current one by the update from a coroutine.
+
+        The update is applied again if the dictionary was changed while the submission waited.
+        """
+        success, msg = await self._update_value_async("dict", self._as_value_update(update)) # type: ignore
         if not success:
             raise ValueError(msg)
+
+    async def set_item_async(self, key: K, value: V) -> None:
+        """Set a single key-value pair from a coroutine."""
+        await self._update_persistent_map_async(lambda current: current.set(key, value))
+
+    async def remove_item_async(self, key: K) -> None:
+        """Remove a key-value pair from the dictionary from a coroutine (nothing happens if the key is missing)."""
+        await self._update_persistent_map_async(lambda current: current.delete(key) if key in current else current)
+
+    async def update_async(self, other_dict: Mapping[K, V]) -> None:
+        """Update the dictionary with items from another mapping from a coroutine."""
+        if not other_dict:
+            return  # No change
+        await self._update_persistent_map_async(lambda current: current.update(other_dict))
     
     def __str__(self) -> str:
         return f"OD(dict={dict(self._primary_hooks['dict'].value)})"
@@ -363,9 +510,9 @@ class ObservableDict(ComplexObservableBase[Literal["dict"], Literal["length", "k
     #### ObservableSerializable implementation ####
 
     def get_values_for_serialization(self) -> Mapping[Literal["dict", "length", "keys", "values"], Any]:
-        return {"dict": self._primary_hooks["dict"].value}
+        return {"dict": dict(self._primary_hooks["dict"].value.items())}
 
     def set_values_from_serialization(self, values: Mapping[Literal["dict", "length", "keys", "values"], Any]) -> None:
-        success, msg = self._submit_values({"dict": values["dict"]})
+        success, msg = self._submit_values({"dict": PersistentMap(values["dict"])})
         if not success:
             raise ValueError(msg)
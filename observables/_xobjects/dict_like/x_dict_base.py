@@ -7,6 +7,10 @@ from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
 from ..._auxiliary.listening_base import ListeningBase
 from ..._nexus_system.update_function_values import UpdateFunctionValues
+from .incremental_dict_values import IncrementalDictValues
+from .persistent_map import PersistentMap
+from .map_change import MapChange
+from .utils import map_changes
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -104,6 +108,9 @@ class ObservableDictBase(
 
         # Initialize ListeningBase
         ListeningBase.__init__(self, logger)
+
+        # Keys and values are maintained incrementally and are not touched if only the key changes
+        derived_values: IncrementalDictValues[K, V] = IncrementalDictValues()
         
         # Initialize ComplexObservableBase
         ComplexObservableBase.__init__(  # type: ignore
@@ -114,8 +121,8 @@ class ObservableDictBase(
                 "value": value_hook if value_hook is not None else _initial_value_value
             },
             secondary_hook_callbacks={
-                "keys": lambda values: set(values["dict"].keys()) if values["dict"] is not None else set(),  # type: ignore
-                "values": lambda values: list(values["dict"].values()) if values["dict"] is not None else list(),  # type: ignore
+                "keys": lambda values: derived_values.keys(values["dict"]),  # type: ignore
+                "values": lambda values: derived_values.values(values["dict"]),  # type: ignore
                 "length": lambda values: len(values["dict"]) if values["dict"] is not None else 0  # type: ignore
             },
             verification_method=self._create_validation_callback(),
@@ -158,6 +165,19 @@ class ObservableDictBase(
         """
         ...
 
+    @staticmethod
+    def _dict_with_item(dict_value: Mapping[K, V], key: K, value: V) -> PersistentMap[K, V]:
+        """
+        Return the dictionary with `key` set to `value`, for use in the completion callbacks.
+
+        The result shares its structure with `dict_value` (O(log n)) and records the changed
+        key, so the keys/values hooks and joined dicts can follow the change without comparing
+        all items. If `dict_value` is a PersistentMap that already holds an equal value for
+        `key`, it is returned unchanged.
+        """
+        persistent_dict: PersistentMap[K, V] = dict_value if isinstance(dict_value, PersistentMap) else PersistentMap(dict_value) # type: ignore
+        return persistent_dict.set(key, value)
+
     @abstractmethod
     def _compute_initial_value(self, initial_dict: Mapping[K, V], initial_key: KT) -> VT:
         """
@@ -194,7 +214,7 @@ class ObservableDictBase(
     @property
     def dict(self) -> dict[K, V]:
         """
-        Get the dictionary value.
+        Get the dictionary value (usually an immutable, insertion-ordered PersistentMap).
         """
         return self._primary_hooks["dict"].value # type: ignore
 
@@ -203,9 +223,7 @@ class ObservableDictBase(
         """
         Set the dictionary value.
         """
-        success, msg = self._submit_value("dict", value)
-        if not success:
-            raise ValueError(msg)
+        self.change_dict(value)
 
     def change_dict(self, new_dict: Mapping[K, V]) -> None:
         """
@@ -214,10 +232,20 @@ class ObservableDictBase(
         Args:
             new_dict: The new mapping
         """
+        if not isinstance(new_dict, PersistentMap):
+            new_dict = PersistentMap(new_dict)
         success, msg = self._submit_value("dict", new_dict)
         if not success:
             raise ValueError(msg)
 
+    @property
+    def last_changes(self) -> MapChange[K]:
+        """
+        Get the keys added, removed and changed by the latest change of the dictionary.
+        """
+        dict_hook = self._primary_hooks["dict"]
+        return map_changes(dict_hook.previous_value, dict_hook.value) # type: ignore
+
     @property
     def key_hook(self) -> Hook[KT]:
         """
@@ -310,7 +338,7 @@ class ObservableDictBase(
         Get the keys hook (read-only).
         
         Returns:
-            A read-only hook containing an iterable of dictionary keys.
+            A read-only hook containing the dictionary keys as an immutable PersistentSet.
         """
         return self._secondary_hooks["keys"] # type: ignore
 
@@ -330,6 +358,9 @@ class ObservableDictBase(
     def values_hook(self) -> ReadOnlyHook[Iterable[V]]:
         """
         Get the values hook (read-only).
+
+        Returns:
+            A read-only hook containing the dictionary values as an immutable PersistentVector.
         """
         return self._secondary_hooks["values"] # type: ignore
 
@@ -120,9 +120,8 @@ class ObservableOptionalSelectionDict(
                     if update_values.submitted["key"] is None:
                         return {}
                     else:
-                        _dict = dict(update_values.current["dict"])
-                        _dict[update_values.submitted["key"]] = update_values.submitted["value"]
-                        return {"dict": _dict}
+                        _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], update_values.submitted["value"])
+                        return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, True, False):
                     # Key provided - get value from current dict
@@ -141,9 +140,8 @@ class ObservableOptionalSelectionDict(
                         else:
                             return {}
                     else:
-                        _dict = dict(update_values.current["dict"])
-                        _dict[update_values.current["key"]] = update_values.submitted["value"]
-                        return {"dict": _dict}
+                        _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.current["key"], update_values.submitted["value"])
+                        return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, False, False):
                     # Nothing provided - no updates needed
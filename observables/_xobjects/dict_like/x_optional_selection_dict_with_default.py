@@ -79,9 +79,7 @@ class ObservableOptionalDefaultSelectionDict(
             initial_key = key_hook.value if isinstance(key_hook, ManagedHookProtocol) else key_hook # type: ignore
             # Add default entry if key is not None and not in dict
             if initial_key is not None and initial_key not in dict_hook: # type: ignore
-                _dict = dict(dict_hook) # type: ignore
-                _dict[initial_key] = self._get_default_value(initial_key) # type: ignore
-                dict_hook = _dict # type: ignore
+                dict_hook = self._dict_with_item(dict_hook, initial_key, self._get_default_value(initial_key)) # type: ignore
         
         # Call parent constructor
         super().__init__(dict_hook, key_hook, value_hook, invalidate_callback=None, logger=logger) # type: ignore
@@ -118,9 +116,8 @@ class ObservableOptionalDefaultSelectionDict(
                     else:
                         # Auto-create default if key not in dict
                         if update_values.submitted["key"] not in update_values.submitted["dict"]:
-                            _dict = dict(update_values.submitted["dict"])
                             _default_val = self_ref._get_default_value(update_values.submitted["key"])
-                            _dict[update_values.submitted["key"]] = _default_val
+                            _dict = self_ref._dict_with_item(update_values.submitted["dict"], update_values.submitted["key"], _default_val)
                             return {"dict": _dict, "value": _default_val}
                         return {"value": update_values.submitted["dict"][update_values.submitted["key"]]}
                 
@@ -144,9 +141,8 @@ class ObservableOptionalDefaultSelectionDict(
                     else:
                         # Auto-create default if key not in dict
                         if update_values.current["key"] not in update_values.submitted["dict"]:
-                            _dict = dict(update_values.submitted["dict"])
                             _default_val = self_ref._get_default_value(update_values.current["key"])
-                            _dict[update_values.current["key"]] = _default_val
+                            _dict = self_ref._dict_with_item(update_values.submitted["dict"], update_values.current["key"], _default_val)
                             return {"dict": _dict, "value": _default_val}
                         return {"value": update_values.submitted["dict"][update_values.current["key"]]}
                 
@@ -155,9 +151,8 @@ class ObservableOptionalDefaultSelectionDict(
                     if update_values.submitted["key"] is None:
                         return {}
                     else:
-                        _dict = dict(update_values.current["dict"])
-                        _dict[update_values.submitted["key"]] = update_values.submitted["value"]
-                        return {"dict": _dict}
+                        _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], update_values.submitted["value"])
+                        return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, True, False):
                     # Key provided - get value from current dict (or create default)
@@ -166,9 +161,8 @@ class ObservableOptionalDefaultSelectionDict(
                     else:
                         # Auto-create default if key not in dict
                         if update_values.submitted["key"] not in update_values.current["dict"]:
-                            _dict = dict(update_values.current["dict"])
                             _default_val = self_ref._get_default_value(update_values.submitted["key"])
-                            _dict[update_values.submitted["key"]] = _default_val
+                            _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], _default_val)
                             return {"dict": _dict, "value": _default_val}
                         return {"value": update_values.current["dict"][update_values.submitted["key"]]}
                 
@@ -179,9 +173,8 @@ class ObservableOptionalDefaultSelectionDict(
                             raise ValueError(f"Value {update_values.submitted['value']} is not None when key is None")
                         return {}
                     else:
-                        _dict = dict(update_values.current["dict"])
-                        _dict[update_values.current["key"]] = update_values.submitted["value"]
-                        return {"dict": _dict}
+                        _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.current["key"], update_values.submitted["value"])
+                        return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, False, False):
                     # Nothing provided - no updates needed
@@ -88,9 +88,8 @@ class ObservableSelectionDict(ObservableDictBase[K, V, K, V], ObservableSelectio
                     # Key and value provided - update dict with new value
                     if update_values.submitted["key"] not in update_values.current["dict"]:
                         raise KeyError(f"Key {update_values.submitted['key']} not in current dictionary")
-                    _dict = dict(update_values.current["dict"])
-                    _dict[update_values.submitted["key"]] = update_values.submitted["value"]
-                    return {"dict": _dict}
+                    _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], update_values.submitted["value"])
+                    return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, True, False):
                     # Key provided - get value from current dict
@@ -101,9 +100,8 @@ class ObservableSelectionDict(ObservableDictBase[K, V, K, V], ObservableSelectio
                 case (False, False, True):
                     # Value provided - update dict at current key
                     current_dict = update_values.current["dict"]
-                    _dict = dict(current_dict)
-                    _dict[update_values.current["key"]] = update_values.submitted["value"]
-                    return {"dict": _dict}
+                    _dict = self_ref._dict_with_item(current_dict, update_values.current["key"], update_values.submitted["value"])
+                    return {"dict": _dict} if _dict is not current_dict else {}
                 
                 case (False, False, False):
                     # Nothing provided - no updates needed
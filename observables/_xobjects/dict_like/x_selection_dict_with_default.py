@@ -80,9 +80,7 @@ class ObservableDefaultSelectionDict(
             initial_key = key_hook.value if isinstance(key_hook, ManagedHookProtocol) else key_hook # type: ignore
             # Add default entry if key not in dict
             if initial_key not in dict_hook: # type: ignore
-                _dict = dict(dict_hook) # type: ignore
-                _dict[initial_key] = self._get_default_value(initial_key) # type: ignore
-                dict_hook = _dict # type: ignore
+                dict_hook = self._dict_with_item(dict_hook, initial_key, self._get_default_value(initial_key)) # type: ignore
         
         # Call parent constructor
         super().__init__(dict_hook, key_hook, value_hook, invalidate_callback=None, logger=logger) # type: ignore
@@ -136,24 +134,21 @@ class ObservableDefaultSelectionDict(
                 
                 case (False, True, True):
                     # Key and value provided - update dict with new value
-                    _dict = dict(update_values.current["dict"])
-                    _dict[update_values.submitted["key"]] = update_values.submitted["value"]
-                    return {"dict": _dict}
+                    _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], update_values.submitted["value"])
+                    return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, True, False):
                     # Key provided alone - add key to dict with default if not present
                     if update_values.submitted["key"] not in update_values.current["dict"]:
-                        _dict = dict(update_values.current["dict"])
                         _default_val = self_ref._get_default_value(update_values.submitted["key"])
-                        _dict[update_values.submitted["key"]] = _default_val
+                        _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.submitted["key"], _default_val)
                         return {"dict": _dict, "value": _default_val}
                     return {"value": update_values.current["dict"][update_values.submitted["key"]]}
                 
                 case (False, False, True):
                     # Value provided alone - update dict at current key
-                    _dict = dict(update_values.current["dict"])
-                    _dict[update_values.current["key"]] = update_values.submitted["value"]
-                    return {"dict": _dict}
+                    _dict = self_ref._dict_with_item(update_values.current["dict"], update_values.current["key"], update_values.submitted["value"])
+                    return {"dict": _dict} if _dict is not update_values.current["dict"] else {}
                 
                 case (False, False, False):
                     # Nothing provided - no updates needed
@@ -6,13 +6,16 @@ This module provides function-like observables that transform values between inp
 Available classes:
 - ObservableFunction: Synchronizes multiple values with custom validation logic
 - ObservableOneWayFunction: One-way transformation from inputs to outputs
+- ObservableAsyncOneWayFunction: One-way transformation evaluated in an executor or on an event loop
 """
 
 from .x_function import ObservableFunction
 from .x_one_way_function import ObservableOneWayFunction
+from .x_async_one_way_function import ObservableAsyncOneWayFunction
 
 __all__ = [
     'ObservableFunction',
     'ObservableOneWayFunction',
+    'ObservableAsyncOneWayFunction',
 ]
 
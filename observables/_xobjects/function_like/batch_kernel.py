@@ -0,0 +1,140 @@
+"""
+Batch Kernel - Vectorized evaluation of many homogeneous one-way functions
+
+Many XOneWayFunctions often share the same computation (e.g. price × quantity per
+row of a table). Completed one by one, a bulk update of 10k rows means 10k Python
+calls of the function. A `BatchKernel` evaluates all functions sharing it that are
+affected by a submission in one call: it receives the inputs as columns (lists, or
+NumPy arrays with `as_arrays=True`), returns the outputs as columns, and the results
+are scattered back to the functions.
+
+Example:
+    >>> kernel = BatchKernel(lambda columns: {"total": columns["price"] * columns["quantity"]}, as_arrays=True)
+    >>> rows = [
+    ...     XOneWayFunction({"price": row.price_hook, "quantity": row.quantity_hook}, kernel.evaluate_one, {"total"}, kernel=kernel)
+    ...     for row in table_rows
+    ... ]
+    >>> DEFAULT_NEXUS_MANAGER.submit_values(new_prices)   # One kernel call for all affected rows
+"""
+
+from typing import Any, Callable, Generic, Mapping, Optional, Protocol, Sequence, TypeVar
+from threading import Lock
+
+from ..._nexus_system.update_function_values import UpdateFunctionValues
+
+IHK = TypeVar("IHK")  # Input Hook Keys
+OHK = TypeVar("OHK")  # Output Hook Keys
+
+
+class BatchMemberProtocol(Protocol):
+    """The part of an observable function used by a BatchKernel to evaluate it in a batch."""
+
+    def _get_complete_input_values(self, update_values: UpdateFunctionValues[Any, Any]) -> Optional[dict[Any, Any]]:
+        """Get the complete input values if an input is submitted, else None."""
+        ...
+
+    def _get_values_to_be_added(self, update_values: UpdateFunctionValues[Any, Any], output_values: Mapping[Any, Any]) -> dict[Any, Any]:
+        """Get the values to add to the submission for the given output values."""
+        ...
+
+
+class BatchKernel(Generic[IHK, OHK]):
+    """
+    Vectorized callable shared by many XOneWayFunctions with the same input and output keys.
+
+    Args:
+        kernel_callable: Function transforming columns of input values to columns of output values.
+            Expected signature: (columns: Mapping[IHK, Sequence]) -> Mapping[OHK, Sequence]
+            Every output column must have one value per row, in the order of the input rows.
+        as_arrays: Pass the input columns as NumPy arrays instead of lists (requires NumPy).
+
+    Raises:
+        ImportError: If `as_arrays` is True and NumPy is not installed.
+    """
+
+    def __init__(self, kernel_callable: Callable[[Mapping[IHK, Any]], Mapping[OHK, Sequence[Any]]], as_arrays: bool = False) -> None:
+        self._kernel_callable = kernel_callable
+        self._as_arrays: bool = as_arrays
+        self._numpy: Any = None
+        if as_arrays:
+            import numpy
+            self._numpy = numpy
+
+        self._lock = Lock()
+        self._call_count: int = 0
+        self._row_count: int = 0
+
+    def _make_column(self, values: list[Any]) -> Any:
+        if self._numpy is not None:
+            return self._numpy.asarray(values)
+        return values
+
+    def evaluate(self, rows: Sequence[Mapping[IHK, Any]]) -> list[dict[OHK, Any]]:
+        """
+        Evaluate the kernel for rows of input values with one call.
+
+        Returns:
+            The output values per row.
+
+        Raises:
+            ValueError: If the rows have different input keys or the kernel returns columns of the wrong length.
+        """
+        if len(rows) == 0:
+            return []
+        keys = list(rows[0].keys())
+        for row in rows:
+            if len(row) != len(keys) or any(key not in row for key in keys):
+                raise ValueError("All rows of a batch kernel must have the same input keys")
+
+        columns: dict[IHK, Any] = {key: self._make_column([row[key] for row in rows]) for key in keys}
+        output_columns: Mapping[OHK, Sequence[Any]] = self._kernel_callable(columns)
+        with self._lock:
+            self._call_count += 1
+            self._row_count += len(rows)
+
+        outputs: list[dict[OHK, Any]] = [{} for _ in rows]
+        for key, output_column in output_columns.items():
+            values: list[Any] = output_column.tolist() if hasattr(output_column, "tolist") else list(output_column) # type: ignore
+            if len(values) != len(rows):
+                raise ValueError(f"Kernel returned {len(values)} values for output '{key}', expected {len(rows)}")
+            for output, value in zip(outputs, values):
+                output[key] = value
+        return outputs
+
+    def evaluate_one(self, input_values: Mapping[IHK, Any]) -> dict[OHK, Any]:
+        """
+        Evaluate the kernel for a single row, usable as the callable of the XOneWayFunctions.
+        """
+        return self.evaluate([input_values])[0]
+
+    def _add_values_to_be_updated_in_batch(self, owners: Sequence[BatchMemberProtocol], update_values: Sequence[UpdateFunctionValues[Any, Any]]) -> list[Mapping[Any, Any]]:
+        """
+        Complete the submission for all owners sharing this kernel with one kernel call.
+
+        Called by the NexusManager in place of the completion of every single owner.
+        """
+        added_values: list[Mapping[Any, Any]] = [{} for _ in owners]
+        rows: list[Mapping[IHK, Any]] = []
+        row_indices: list[int] = []
+        for index, (owner, values) in enumerate(zip(owners, update_values)):
+            input_values = owner._get_complete_input_values(values)
+            if input_values is not None:
+                rows.append(input_values)
+                row_indices.append(index)
+
+        for index, output_values in zip(row_indices, self.evaluate(rows)):
+            added_values[index] = owners[index]._get_values_to_be_added(update_values[index], output_values)
+        return added_values
+
+    @property
+    def call_count(self) -> int:
+        """Number of kernel calls so far."""
+        return self._call_count
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows evaluated so far."""
+        return self._row_count
+
+    def __repr__(self) -> str:
+        return f"BatchKernel(calls={self._call_count}, rows={self._row_count})"
@@ -0,0 +1,312 @@
+"""
+Expression - Lightweight derived values built with arithmetic operators
+
+Arithmetic on XValues (`xa + xb * 2`) does not compute a value but builds an
+expression graph of plain nodes. No observable is created per node: when the hook or
+the value of an expression is first requested, the whole graph is compiled into one
+Python function and a single XOneWayFunction computes the read-only result hook from
+the distinct input hooks.
+
+Compilation:
+- Operations on constants only are folded when the expression is built
+- Structurally identical subexpressions are computed once (common subexpression sharing)
+- The graph is compiled to straight-line code, without a call per node
+
+Example:
+    >>> price = XValue(10.0)
+    >>> quantity = XValue(3)
+    >>> gross = price * quantity * (100 + 19) / 100   # (100 + 19) is folded
+    >>> gross.value
+    35.7
+    >>> quantity.value = 4
+    >>> gross.value
+    47.6
+    >>> display = XValue(gross.hook)   # The read-only hook can be joined like any other
+"""
+
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+from threading import Lock
+from functools import lru_cache
+from types import CodeType
+import operator
+
+from ..._hooks.hook_aliases import ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._carries_hooks.carries_single_hook_protocol import CarriesSingleHookProtocol
+from .x_one_way_function import ObservableOneWayFunction
+
+T = TypeVar("T")
+
+_LEAF: str = "leaf"
+_CONSTANT: str = "constant"
+
+# Operator name -> (source template, function for constant folding)
+_BINARY_OPERATORS: dict[str, tuple[str, Callable[[Any, Any], Any]]] = {
+    "add": ("{0} + {1}", operator.add),
+    "sub": ("{0} - {1}", operator.sub),
+    "mul": ("{0} * {1}", operator.mul),
+    "truediv": ("{0} / {1}", operator.truediv),
+    "floordiv": ("{0} // {1}", operator.floordiv),
+    "mod": ("{0} % {1}", operator.mod),
+    "pow": ("{0} ** {1}", operator.pow),
+}
+_UNARY_OPERATORS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "neg": ("-{0}", operator.neg),
+    "pos": ("+{0}", operator.pos),
+    "abs": ("abs({0})", abs),
+}
+
+# Serializes the creation of the function of an expression
+_materialize_lock = Lock()
+
+
+@lru_cache(maxsize=256)
+def _compile_source(source: str) -> CodeType:
+    """Compile the source of an expression function; formulas of the same shape share the code."""
+    return compile(source, "<expression>", "exec")
+
+
+def as_expression(operand: Any) -> "Expression[Any]":
+    """
+    Get an expression for an operand: expressions are returned as they are, hooks and
+    observables with a single hook become inputs, everything else becomes a constant.
+    """
+    if isinstance(operand, Expression):
+        return operand # type: ignore
+    if isinstance(operand, CarriesSingleHookProtocol):
+        return Expression(_LEAF, (operand._get_single_hook(),)) # type: ignore
+    if isinstance(operand, ManagedHookProtocol):
+        return Expression(_LEAF, (operand,))
+    return Expression(_CONSTANT, (operand,))
+
+
+class Expression(Generic[T]):
+    """
+    Node of an expression graph over observable values.
+
+    Expressions are immutable and cheap to build; combining them with the arithmetic
+    operators (+, -, *, /, //, %, **, unary -, unary +, abs) builds larger expressions.
+    The `hook` and `value` of an expression are backed by one XOneWayFunction, created on
+    first access from the compiled graph and kept up to date with the inputs.
+    """
+
+    __slots__ = ("_operator", "_operands", "_function")
+
+    def __init__(self, operator_name: str, operands: tuple[Any, ...]) -> None:
+        self._operator: str = operator_name
+        # The hook of a leaf, the value of a constant, or the operand expressions
+        self._operands: tuple[Any, ...] = operands
+        self._function: Optional[ObservableOneWayFunction[int, str, Any, T]] = None
+
+    #########################################################################
+    # Building
+    #########################################################################
+
+    @classmethod
+    def constant(cls, value: T) -> "Expression[T]":
+        """
+        Create a constant expression, operations on constants only are folded.
+
+        Example:
+            >>> rate = Expression.constant(0.19)
+            >>> gross = price * (1 + rate)   # (1 + rate) is computed once, here
+        """
+        return cls(_CONSTANT, (value,))
+
+    def _unary(self, operator_name: str) -> "Expression[Any]":
+        if self._operator == _CONSTANT:
+            return Expression(_CONSTANT, (_UNARY_OPERATORS[operator_name][1](self._operands[0]),))
+        return Expression(operator_name, (self,))
+
+    def _binary(self, operator_name: str, other: Any, reflected: bool = False) -> "Expression[Any]":
+        left: Expression[Any] = self
+        right: Expression[Any] = as_expression(other)
+        if reflected:
+            left, right = right, left
+        if left._operator == _CONSTANT and right._operator == _CONSTANT:
+            return Expression(_CONSTANT, (_BINARY_OPERATORS[operator_name][1](left._operands[0], right._operands[0]),))
+        return Expression(operator_name, (left, right))
+
+    def __add__(self, other: Any) -> "Expression[Any]":
+        return self._binary("add", other)
+
+    def __radd__(self, other: Any) -> "Expression[Any]":
+        return self._binary("add", other, reflected=True)
+
+    def __sub__(self, other: Any) -> "Expression[Any]":
+        return self._binary("sub", other)
+
+    def __rsub__(self, other: Any) -> "Expression[Any]":
+        return self._binary("sub", other, reflected=True)
+
+    def __mul__(self, other: Any) -> "Expression[Any]":
+        return self._binary("mul", other)
+
+    def __rmul__(self, other: Any) -> "Expression[Any]":
+        return self._binary("mul", other, reflected=True)
+
+    def __truediv__(self, other: Any) -> "Expression[Any]":
+        return self._binary("truediv", other)
+
+    def __rtruediv__(self, other: Any) -> "Expression[Any]":
+        return self._binary("truediv", other, reflected=True)
+
+    def __floordiv__(self, other: Any) -> "Expression[Any]":
+        return self._binary("floordiv", other)
+
+    def __rfloordiv__(self, other: Any) -> "Expression[Any]":
+        return self._binary("floordiv", other, reflected=True)
+
+    def __mod__(self, other: Any) -> "Expression[Any]":
+        return self._binary("mod", other)
+
+    def __rmod__(self, other: Any) -> "Expression[Any]":
+        return self._binary("mod", other, reflected=True)
+
+    def __pow__(self, other: Any) -> "Expression[Any]":
+        return self._binary("pow", other)
+
+    def __rpow__(self, other: Any) -> "Expression[Any]":
+        return self._binary("pow", other, reflected=True)
+
+    def __neg__(self) -> "Expression[Any]":
+        return self._unary("neg")
+
+    def __pos__(self) -> "Expression[Any]":
+        return self._unary("pos")
+
+    def __abs__(self) -> "Expression[Any]":
+        return self._unary("abs")
+
+    #########################################################################
+    # Compilation
+    #########################################################################
+
+    def _post_order(self) -> Iterator["Expression[Any]"]:
+        """Iterate over the distinct nodes, operands first (without recursion, expressions can be deep)."""
+        visited: set[int] = set()
+        stack: list[tuple[Expression[Any], bool]] = [(self, False)]
+        while stack:
+            node, operands_done = stack.pop()
+            if operands_done:
+                yield node
+                continue
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            stack.append((node, True))
+            if node._operator not in (_LEAF, _CONSTANT):
+                for operand in reversed(node._operands):
+                    stack.append((operand, False))
+
+    def _compile(self) -> tuple[list[ManagedHookProtocol[Any]], Callable[[Any], dict[str, T]]]:
+        """
+        Compile the graph to a function of the input values (keyed by input index).
+
+        Returns:
+            The distinct input hooks and the function computing {"value": result}.
+        """
+        input_hooks: list[ManagedHookProtocol[Any]] = []
+        input_names: dict[int, str] = {}
+        namespace: dict[str, Any] = {"abs": abs}
+        lines: list[str] = []
+        names: dict[int, str] = {}
+        shared: dict[tuple[str, ...], str] = {}
+        constant_names: dict[tuple[type, Any], str] = {}
+
+        for node in self._post_order():
+            if node._operator == _LEAF:
+                hook = node._operands[0]
+                name = input_names.get(id(hook))
+                if name is None:
+                    name = f"v{len(input_hooks)}"
+                    input_names[id(hook)] = name
+                    input_hooks.append(hook)
+            elif node._operator == _CONSTANT:
+                # Equal constants share a name, so subexpressions using them can be shared too
+                constant: Any = node._operands[0]
+                try:
+                    # repr tells 0.0 from -0.0, which are equal but not interchangeable
+                    constant_key: Optional[tuple[type, Any]] = (type(constant), repr(constant) if isinstance(constant, (float, complex)) else constant)
+                    name = constant_names.get(constant_key) # type: ignore
+                except TypeError:
+                    constant_key, name = None, None # Unhashable constants get a name each
+                if name is None:
+                    name = f"c{len(namespace)}"
+                    namespace[name] = constant
+                    if constant_key is not None:
+                        constant_names[constant_key] = name
+            else:
+                operand_names: tuple[str, ...] = tuple(names[id(operand)] for operand in node._operands)
+                signature: tuple[str, ...] = (node._operator, *operand_names)
+                name = shared.get(signature) # type: ignore
+                if name is None:
+                    template: str = (_BINARY_OPERATORS.get(node._operator) or _UNARY_OPERATORS[node._operator])[0]
+                    name = f"t{len(shared)}"
+                    shared[signature] = name
+                    lines.append(f"    {name} = {template.format(*operand_names)}")
+            names[id(node)] = name
+
+        source: str = "\n".join([
+            "def _expression(values):",
+            *[f"    v{index} = values[{index}]" for index in range(len(input_hooks))],
+            *lines,
+            f"    return {{'value': {names[id(self)]}}}",
+        ])
+        exec(_compile_source(source), namespace)
+        return input_hooks, namespace["_expression"]
+
+    def _get_function(self) -> ObservableOneWayFunction[int, str, Any, T]:
+        """Get the function computing the value of the expression, creating it on first use."""
+        function = self._function
+        if function is None:
+            with _materialize_lock:
+                if self._function is None:
+                    input_hooks, expression_callable = self._compile()
+                    self._function = ObservableOneWayFunction(
+                        {index: hook for index, hook in enumerate(input_hooks)}, # type: ignore
+                        expression_callable,
+                        {"value"}
+                    )
+                function = self._function
+        return function
+
+    #########################################################################
+    # Public API
+    #########################################################################
+
+    @property
+    def hook(self) -> ReadOnlyHook[T]:
+        """
+        Get the read-only hook holding the value of the expression.
+
+        ** Thread-safe **
+        """
+        return self._get_function().hook("value") # type: ignore
+
+    @property
+    def value(self) -> T:
+        """
+        Get the current value of the expression.
+
+        ** Thread-safe **
+        """
+        return self._get_function().value("value") # type: ignore
+
+    @property
+    def is_constant(self) -> bool:
+        """Whether the expression has no inputs (it was folded to a constant)."""
+        return self._operator == _CONSTANT
+
+    def __repr__(self) -> str:
+        rendered: dict[int, str] = {}
+        for node in self._post_order():
+            if node._operator == _LEAF:
+                rendered[id(node)] = f"<{node._operands[0].value!r}>"
+            elif node._operator == _CONSTANT:
+                rendered[id(node)] = repr(node._operands[0])
+            else:
+                template: str = (_BINARY_OPERATORS.get(node._operator) or _UNARY_OPERATORS[node._operator])[0]
+                operands: list[str] = [rendered[id(operand)] for operand in node._operands]
+                rendered[id(node)] = template.format(*operands) if node._operator == "abs" else f"({template.format(*operands)})"
+        return f"Expression({rendered[id(self)]})"
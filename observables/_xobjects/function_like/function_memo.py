@@ -0,0 +1,165 @@
+"""
+Function Memo - Bounded LRU cache of function results for observable functions
+
+An observable function calls its callable whenever one of its inputs changes,
+even if the same combination of inputs was seen moments before (e.g. when the
+user toggles between two selections). A `FunctionMemo` remembers the outputs
+of the most recently used input combinations, so revisiting one of them costs
+a dictionary lookup instead of a recomputation.
+
+Entries are keyed by the input values (or by a user-supplied key function) and
+evicted in least-recently-used order once `max_entries` entries or, with a
+`cost_function`, a total cost of `max_cost` is exceeded. Inputs that cannot be
+hashed are computed without being cached.
+
+Example:
+    >>> memo = FunctionMemo(max_entries=64)
+    >>> layout = XOneWayFunction({"size": size.hook}, compute_layout, {"layout"}, memo=memo)
+    >>> memo.info()
+    MemoInfo(hits=0, misses=1, uncacheable=0, evictions=0, size=1, cost=1.0)
+"""
+
+from typing import Any, Callable, Generic, Hashable, Mapping, Optional, TypeVar
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+
+K = TypeVar("K")  # Input key type
+V = TypeVar("V")  # Input value type
+R = TypeVar("R")  # Result type
+
+
+@dataclass(frozen=True, slots=True)
+class MemoInfo:
+    """
+    Immutable snapshot of the counters of a FunctionMemo.
+
+    Attributes:
+        hits: Number of calls answered from the cache.
+        misses: Number of calls that computed and cached a result.
+        uncacheable: Number of calls computed without caching (unhashable inputs).
+        evictions: Number of entries removed to stay within the bounds.
+        size: Number of cached entries.
+        cost: Total cost of the cached entries.
+    """
+
+    hits: int
+    misses: int
+    uncacheable: int
+    evictions: int
+    size: int
+    cost: float
+
+
+class FunctionMemo(Generic[K, V, R]):
+    """
+    Bounded LRU cache mapping input values of a function to its result.
+
+    Args:
+        max_entries: Maximum number of cached results (must be positive).
+        key_function: Optional function computing a hashable cache key from the input values.
+            By default the key is the tuple of (key, type of the value, value) of the inputs, so
+            values that are equal but of different types (2 and 2.0) are cached separately.
+        cost_function: Optional function computing the cost (e.g. the size) of a result.
+            Every result costs 1 by default.
+        max_cost: Optional maximum total cost of the cached results. A single result
+            costing more than `max_cost` is not cached.
+
+    Raises:
+        ValueError: If `max_entries` is not positive.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        key_function: Optional[Callable[[Mapping[K, V]], Hashable]] = None,
+        cost_function: Optional[Callable[[R], float]] = None,
+        max_cost: Optional[float] = None
+        ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries: int = max_entries
+        self._key_function: Optional[Callable[[Mapping[K, V]], Hashable]] = key_function
+        self._cost_function: Optional[Callable[[R], float]] = cost_function
+        self._max_cost: Optional[float] = max_cost
+
+        self._entries: OrderedDict[Hashable, tuple[R, float]] = OrderedDict()
+        self._cost: float = 0.0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._uncacheable: int = 0
+        self._evictions: int = 0
+        self._lock: RLock = RLock()
+
+    def _key(self, input_values: Mapping[K, V]) -> Hashable:
+        if self._key_function is not None:
+            return self._key_function(input_values)
+        return tuple((key, type(value), value) for key, value in input_values.items())
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries or (self._max_cost is not None and self._cost > self._max_cost and len(self._entries) > 0):
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._cost -= cost
+            self._evictions += 1
+
+    def call(self, function: Callable[[Mapping[K, V]], R], input_values: Mapping[K, V]) -> R:
+        """
+        Get the result of `function(input_values)`, from the cache if possible.
+
+        The result is cached as the most recently used entry; least recently used entries
+        are evicted to stay within `max_entries` and `max_cost`.
+        """
+        try:
+            key = self._key(input_values)
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self._uncacheable += 1
+            return function(input_values)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+
+        # Compute outside the lock, the function may take long or submit values itself
+        result: R = function(input_values)
+        cost: float = float(self._cost_function(result)) if self._cost_function is not None else 1.0
+
+        with self._lock:
+            self._misses += 1
+            if self._max_cost is not None and cost > self._max_cost:
+                return result
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cost -= previous[1]
+            self._entries[key] = (result, cost)
+            self._cost += cost
+            self._evict()
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached results. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._cost = 0.0
+
+    def info(self) -> MemoInfo:
+        """Get the hit/miss counters and the current size of the cache."""
+        with self._lock:
+            return MemoInfo(self._hits, self._misses, self._uncacheable, self._evictions, len(self._entries), self._cost)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"FunctionMemo(max_entries={self._max_entries}, size={len(self._entries)})"
+
+
+def call_memoized(memo: Optional[FunctionMemo[Any, Any, R]], function: Callable[[Mapping[Any, Any]], R], input_values: Mapping[Any, Any]) -> R:
+    """Call `function` with `input_values`, through `memo` if one is given."""
+    if memo is None:
+        return function(input_values)
+    return memo.call(function, input_values)
@@ -0,0 +1,398 @@
+"""
+ObservableAsyncOneWayFunction Module - One-way transformation evaluated off the submission path
+
+ObservableOneWayFunction evaluates its callable inside the completion phase of a
+submission, i.e. while the NexusManager lock is held. A slow callable therefore
+blocks every other submission in the process.
+
+ObservableAsyncOneWayFunction commits new input values immediately and evaluates
+the callable afterwards in an executor (a thread pool by default, or any
+`concurrent.futures.Executor`, e.g. a process pool) or, for coroutine functions,
+on an asyncio event loop. When the evaluation is done, the outputs are submitted
+like any other value change.
+
+Stale results:
+- Every change of the inputs starts a new evaluation (latest input wins).
+- A superseded evaluation is cancelled if it has not started yet; if it is
+  already running, its result is ignored.
+- Whether the outputs are up to date is published by the "pending" hook.
+
+Example Usage:
+    >>> from observables import XValue, XAsyncOneWayFunction
+    >>>
+    >>> query = XValue("")
+    >>> search = XAsyncOneWayFunction(
+    ...     {"query": query.hook},
+    ...     lambda inputs: {"results": slow_search(inputs["query"])},
+    ...     {"results"}
+    ... )
+    >>> search.pending_hook.add_listener(lambda: spinner.set_visible(search.pending))
+    >>> query.value = "observables"   # Returns immediately, results follow
+    >>> search.wait(timeout=1.0)
+    True
+"""
+
+from typing import Any, Awaitable, Callable, Generic, Mapping, Optional, TypeVar, Union
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from logging import Logger
+import asyncio
+import inspect
+import threading
+
+from ..._hooks.owned_hook import OwnedHook
+from ..._hooks.hook_aliases import Hook, ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._auxiliary.listening_base import ListeningBase
+from ..._carries_hooks.carries_some_hooks_base import CarriesSomeHooksBase
+from ..._nexus_system.nexus import Nexus
+from ..._nexus_system.nexus_manager import NexusManager
+from ..._nexus_system.default_nexus_manager import DEFAULT_NEXUS_MANAGER
+from ..._nexus_system.update_function_values import UpdateFunctionValues
+from ..._nexus_system.submission_error import SubmissionError
+
+# Type variables for input and output hook names and values
+IHK = TypeVar("IHK")  # Input Hook Keys
+OHK = TypeVar("OHK")  # Output Hook Keys
+IHV = TypeVar("IHV")  # Input Hook Values
+OHV = TypeVar("OHV")  # Output Hook Values
+
+PENDING_KEY: str = "pending"
+"""Key of the hook telling whether an evaluation is in flight. Reserved, it cannot be used as input or output key."""
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by all async functions without an explicit executor."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="observables-async-function")
+        return _default_executor
+
+
+def _run_coroutine_function(function: Callable[[Mapping[Any, Any]], Awaitable[Any]], input_values: Mapping[Any, Any]) -> Any:
+    """Run a coroutine function to completion in the calling (executor) thread."""
+    return asyncio.run(function(input_values)) # type: ignore
+
+
+class ObservableAsyncOneWayFunction(ListeningBase, CarriesSomeHooksBase[Union[IHK, OHK, str], Union[IHV, OHV, bool], "ObservableAsyncOneWayFunction"], Generic[IHK, OHK, IHV, OHV]):
+    """
+    An observable that transforms values from input hooks to output hooks, evaluated asynchronously.
+
+    Input changes are committed immediately and set the "pending" hook to True. The callable
+    is then evaluated with the complete set of input values in the executor (or on the event
+    loop for coroutine functions). When the latest evaluation finishes, its outputs are submitted
+    together with pending=False. Results of superseded evaluations are discarded.
+
+    If the callable raises, the outputs keep their previous values, pending becomes False and
+    the exception is available as `last_error`.
+    """
+
+    def __init__(
+        self,
+        input_variables_per_key: Mapping[IHK, Hook[IHV]|ReadOnlyHook[IHV]],
+        one_way_function_callable: Callable[[Mapping[IHK, IHV]], Mapping[OHK, OHV]|Awaitable[Mapping[OHK, OHV]]],
+        function_output_hook_keys: set[OHK],
+        initial_output_values: Optional[Mapping[OHK, OHV]] = None,
+        executor: Optional[Executor] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        logger: Optional[Logger] = None,
+        nexus_manager: NexusManager = DEFAULT_NEXUS_MANAGER
+    ):
+        """
+        Initialize the ObservableAsyncOneWayFunction.
+
+        Args:
+            input_variables_per_key: Dictionary mapping input names to their hooks (or initial values).
+            one_way_function_callable: Function or coroutine function transforming the complete
+                input values to output values. Expected signature:
+                (input_values: Mapping[IHK, IHV]) -> Mapping[OHK, OHV]
+                It is called outside the submission, so it may take long, but it must not
+                rely on being called for every input change.
+            function_output_hook_keys: Set of output hook keys.
+            initial_output_values: Output values until the first evaluation finishes (default: None
+                for every output). The first evaluation is started right away.
+            executor: Executor evaluating the callable. Defaults to a thread pool shared by all
+                async functions. With a process pool, the callable and the values must be picklable.
+            loop: Event loop evaluating coroutine functions. Without a loop, coroutine functions
+                are run to completion in the executor.
+            logger: Optional logger for debugging and monitoring transformations.
+            nexus_manager: The nexus manager coordinating the submissions.
+
+        Raises:
+            ValueError: If an input or output key is the reserved key "pending", or if the keys overlap.
+        """
+
+        input_keys: set[IHK] = set(input_variables_per_key.keys())
+        if PENDING_KEY in input_keys or PENDING_KEY in function_output_hook_keys: # type: ignore
+            raise ValueError(f"The key '{PENDING_KEY}' is reserved for the pending hook")
+        if input_keys & function_output_hook_keys: # type: ignore
+            raise ValueError("Input and output keys must be disjoint")
+
+        self._one_way_function_callable = one_way_function_callable
+        self._executor: Optional[Executor] = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = loop
+        self._is_coroutine_function: bool = inspect.iscoroutinefunction(one_way_function_callable)
+
+        self._input_hooks: dict[IHK, OwnedHook[IHV]] = {}
+        self._output_hooks: dict[OHK, OwnedHook[OHV]] = {}
+
+        # Evaluation state, guarded by the nexus manager lock (see _schedule_evaluation and _finish_evaluation)
+        self._generation: int = 0
+        self._scheduled_inputs: Optional[tuple[Any, ...]] = None
+        self._future: Optional[Future[Any]] = None
+        self._scheduling_thread: Optional[int] = None
+        self._idle: threading.Event = threading.Event()
+        self._last_error: Optional[BaseException] = None
+
+        for key, external_hook_or_value in input_variables_per_key.items():
+            initial_value_input: IHV = external_hook_or_value.value if isinstance(external_hook_or_value, ManagedHookProtocol) else external_hook_or_value # type: ignore
+            self._input_hooks[key] = OwnedHook(owner=self, initial_value=initial_value_input, logger=logger, nexus_manager=nexus_manager)
+
+        for key in function_output_hook_keys:
+            initial_value_output: OHV = initial_output_values[key] if initial_output_values is not None and key in initial_output_values else None # type: ignore
+            self._output_hooks[key] = OwnedHook(owner=self, initial_value=initial_value_output, logger=logger, nexus_manager=nexus_manager)
+
+        self._pending_hook: OwnedHook[bool] = OwnedHook(owner=self, initial_value=True, logger=logger, nexus_manager=nexus_manager)
+
+        ListeningBase.__init__(self, logger)
+
+        def add_values_to_be_updated_callback(
+            self_ref: "ObservableAsyncOneWayFunction[IHK, OHK, IHV, OHV]",
+            update_values: UpdateFunctionValues[Any, Any]
+        ) -> Mapping[Any, Any]:
+            """
+            Mark the outputs as pending when an input changes. The evaluation itself is started
+            after the submission has been committed (see invalidate_callback).
+            """
+            if PENDING_KEY not in update_values.submitted and any(key in update_values.submitted for key in input_keys):
+                return {PENDING_KEY: True}
+            return {}
+
+        def invalidate_callback(self_ref: "ObservableAsyncOneWayFunction[IHK, OHK, IHV, OHV]") -> tuple[bool, str]:
+            self_ref._schedule_evaluation()
+            return True, "Evaluation scheduled"
+
+        CarriesSomeHooksBase.__init__( # type: ignore
+            self,
+            logger=logger,
+            invalidate_callback=invalidate_callback,
+            validate_complete_values_in_isolation_callback=None,
+            add_values_to_be_updated_callback=add_values_to_be_updated_callback,
+            nexus_manager=nexus_manager
+        )
+
+        for key, external_hook_or_value in input_variables_per_key.items():
+            if isinstance(external_hook_or_value, ManagedHookProtocol): # type: ignore
+                self._input_hooks[key].join(external_hook_or_value, "use_caller_value") # type: ignore
+
+        with self._nexus_manager._lock: # type: ignore
+            self._schedule_evaluation()
+
+    #########################################################################
+    # Evaluation
+    #########################################################################
+
+    def _schedule_evaluation(self) -> None:
+        """
+        Start an evaluation if the inputs changed since the last scheduled one.
+
+        Called with the nexus manager lock held, after the new input values have been committed.
+        """
+        input_values: dict[IHK, IHV] = {key: hook.value for key, hook in self._input_hooks.items()}
+        inputs: tuple[Any, ...] = tuple(input_values.values())
+        scheduled = self._scheduled_inputs
+        if scheduled is not None and len(scheduled) == len(inputs) and all(a is b for a, b in zip(scheduled, inputs)):
+            return
+
+        self._generation += 1
+        generation: int = self._generation
+        self._scheduled_inputs = inputs
+        self._idle.clear()
+
+        # Latest input wins: a superseded evaluation that has not started yet is not run at all
+        if self._future is not None:
+            self._future.cancel()
+
+        if self._is_coroutine_function and self._loop is not None:
+            async def evaluate_on_loop() -> None:
+                try:
+                    result = await self._one_way_function_callable(input_values) # type: ignore
+                except Exception as e:
+                    self._finish_evaluation(generation, None, e)
+                else:
+                    self._finish_evaluation(generation, result, None)
+            self._future = asyncio.run_coroutine_threadsafe(evaluate_on_loop(), self._loop)
+            return
+
+        executor: Executor = self._executor if self._executor is not None else _get_default_executor()
+        if self._is_coroutine_function:
+            future: Future[Any] = executor.submit(_run_coroutine_function, self._one_way_function_callable, input_values) # type: ignore
+        else:
+            future = executor.submit(self._one_way_function_callable, input_values) # type: ignore
+        self._future = future
+        self._scheduling_thread = threading.get_ident()
+        try:
+            future.add_done_callback(lambda done: self._on_evaluation_done(generation, done))
+        finally:
+            self._scheduling_thread = None
+
+    def _on_evaluation_done(self, generation: int, future: "Future[Any]") -> None:
+        """
+        Hand the result of an executor evaluation over to _finish_evaluation.
+        """
+        if future.cancelled():
+            return
+        error: Optional[BaseException] = future.exception()
+        result: Any = future.result() if error is None else None
+        if self._scheduling_thread == threading.get_ident():
+            # The evaluation finished before the callback was added, so this runs inside the
+            # submission that scheduled it. Submit the outputs from another thread instead.
+            _get_default_executor().submit(self._finish_evaluation, generation, result, error)
+        else:
+            self._finish_evaluation(generation, result, error)
+
+    def _finish_evaluation(self, generation: int, output_values: Optional[Mapping[OHK, OHV]], error: Optional[BaseException]) -> None:
+        """
+        Submit the outputs of a finished evaluation, unless it has been superseded.
+        """
+        with self._nexus_manager._lock: # type: ignore
+            if generation != self._generation:
+                return
+
+            values: dict[Any, Any] = {PENDING_KEY: False}
+            if error is not None:
+                self._last_error = error
+                self._log("evaluate", False, f"Error in the one way function callable: {error}")
+            else:
+                self._last_error = None
+                assert output_values is not None
+                for key in self._output_hooks:
+                    if key not in output_values:
+                        self._last_error = ValueError(f"Function callable must return all output keys. Missing key: {key}")
+                        values = {PENDING_KEY: False}
+                        break
+                    if output_values[key] is not self._output_hooks[key].value:
+                        values[key] = output_values[key]
+
+            try:
+                success, msg = self._submit_values(values)
+                if not success:
+                    self._last_error = SubmissionError(msg, values)
+                    self._submit_values({PENDING_KEY: False})
+            finally:
+                self._future = None
+                self._idle.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the latest evaluation has finished and its outputs are submitted.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely).
+
+        Returns:
+            True if no evaluation is pending anymore, False if the timeout expired.
+        """
+        return self._idle.wait(timeout)
+
+    #########################################################################
+    # CarriesSomeHooksBase abstract methods
+    #########################################################################
+
+    def _get_hook_by_key(self, key: Any) -> OwnedHook[Any]:
+        if key in self._input_hooks:
+            return self._input_hooks[key] # type: ignore
+        elif key in self._output_hooks:
+            return self._output_hooks[key] # type: ignore
+        elif key == PENDING_KEY:
+            return self._pending_hook # type: ignore
+        else:
+            raise ValueError(f"Key {key} not found in hooks")
+
+    def _get_value_by_key(self, key: Any) -> Any:
+        return self._get_hook_by_key(key).value
+
+    def _get_hook_keys(self) -> set[Any]:
+        return set(self._input_hooks.keys()) | set(self._output_hooks.keys()) | {PENDING_KEY}
+
+    def _get_derived_hook_keys(self) -> set[Any]:
+        # The outputs are submitted after the evaluation, only "pending" is set during the completion
+        return {PENDING_KEY}
+
+    def _get_key_by_hook_or_nexus(self, hook_or_nexus: Hook[Any]|ReadOnlyHook[Any]|Nexus[Any]) -> Any: # type: ignore
+        for key, hook in self._input_hooks.items():
+            if hook is hook_or_nexus or hook._get_nexus() is hook_or_nexus: # type: ignore
+                return key
+        for key, hook in self._output_hooks.items():
+            if hook is hook_or_nexus or hook._get_nexus() is hook_or_nexus: # type: ignore
+                return key
+        if self._pending_hook is hook_or_nexus or self._pending_hook._get_nexus() is hook_or_nexus: # type: ignore
+            return PENDING_KEY
+        raise ValueError(f"Hook {hook_or_nexus} not found in hooks")
+
+    #########################################################################
+    # Public API
+    #########################################################################
+
+    def hook(self, key: IHK|OHK) -> Hook[Any]:
+        """
+        Get an input or output hook by its key.
+
+        ** Thread-safe **
+        """
+        with self._lock:
+            return self._get_hook_by_key(key) # type: ignore
+
+    def keys(self) -> set[IHK|OHK]:
+        """
+        Get all input and output keys.
+
+        ** Thread-safe **
+        """
+        with self._lock:
+            return set(self._input_hooks.keys()) | set(self._output_hooks.keys())
+
+    def value(self, key: IHK|OHK) -> IHV|OHV:
+        """
+        Get an input or output value by its key.
+
+        ** Thread-safe **
+        """
+        with self._lock:
+            return self._get_value_by_key(key)
+
+    @property
+    def pending_hook(self) -> ReadOnlyHook[bool]:
+        """Get the hook telling whether the outputs are being recomputed for the latest inputs."""
+        return self._pending_hook # type: ignore
+
+    @property
+    def pending(self) -> bool:
+        """Whether the outputs are being recomputed for the latest inputs."""
+        return self._pending_hook.value
+
+    @property
+    def last_error(self) -> Optional[BaseException]:
+        """Get the exception of the latest evaluation, None if it succeeded."""
+        return self._last_error
+
+    @property
+    def function_callable(self) -> Callable[[Mapping[IHK, IHV]], Mapping[OHK, OHV]|Awaitable[Mapping[OHK, OHV]]]:
+        """Get the function callable."""
+        return self._one_way_function_callable
+
+    def input_variable_keys(self) -> set[IHK]:
+        """Get the input variable keys."""
+        with self._lock:
+            return set(self._input_hooks.keys())
+
+    def change_values(self, values: Mapping[IHK, IHV]) -> None:
+        """
+        Change input values. The outputs follow once the evaluation has finished.
+        """
+        success, msg = self._submit_values(values) # type: ignore
+        if not success:
+            raise SubmissionError(msg, values)
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Optional, Mapping, Callable
+from typing import Any, Generic, TypeVar, Optional, Mapping, Callable
 from logging import Logger
 
 from ..._hooks.owned_hook import OwnedHook
@@ -15,6 +15,13 @@ from .function_values import FunctionValues
 SHK = TypeVar("SHK")
 SHV = TypeVar("SHV")
 
+def _is_identical_subset(values: Mapping[Any, Any], reference_values: Mapping[Any, Any]) -> bool:
+    """Whether every value is the very same object as the reference value of its key."""
+    for key, value in values.items():
+        if key not in reference_values or reference_values[key] is not value:
+            return False
+    return True
+
 class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "ObservableFunction"], Generic[SHK, SHV]):
     """
     An observable that maintains synchronized relationships between multiple hooks using a function.
@@ -119,7 +126,8 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
         self,
         complete_variables_per_key: Mapping[SHK, Hook[SHV]|ReadOnlyHook[SHV]],
         completing_function_callable: Callable[[FunctionValues[SHK, SHV]], tuple[bool, dict[SHK, SHV]]],
-        logger: Optional[Logger] = None):
+        logger: Optional[Logger] = None,
+        idempotent: bool = False):
         """
         Initialize the ObservableFunction.
 
@@ -133,6 +141,12 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
                 - Returns: (bool indicating validity, dict of values to update)
                 The function should return (False, {}) if the submitted values are invalid.
             logger: Optional logger for debugging and monitoring.
+            idempotent: Declare that the function, called with the completed values, accepts them
+                and returns no other values. The function is then called once per completion
+                instead of a second time to validate the final state.
+                In both modes the completed state is reused while the completion loop of the same
+                submission revisits this observable with values from that state, so the function
+                must be deterministic.
         
         Example:
             >>> def my_function(values: FunctionValues[str, int]) -> tuple[bool, dict[str, int]]:
@@ -142,6 +156,10 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
         """
 
         self._completing_function_callable = completing_function_callable
+        self._idempotent: bool = idempotent
+
+        # Completed state of the latest completion: (current values, completed values, synced values)
+        self._completion_cache: Optional[tuple[Mapping[SHK, SHV], dict[SHK, SHV], dict[SHK, SHV]]] = None
 
         # Create sync hooks with initial values
         self._sync_hooks: dict[SHK, OwnedHook[SHV]] = {}
@@ -167,6 +185,15 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
             submitted (what changed) and current (complete current state) values.
             """
 
+            # The completion loop revisits this observable with the values it already completed
+            # (plus values of other owners). If the submission is part of the cached completed state,
+            # the function would return the same synced values again.
+            cached_completion = self_ref._completion_cache
+            if cached_completion is not None:
+                cached_current, cached_completed, cached_synced = cached_completion
+                if _is_identical_subset(update_values.current, cached_current) and _is_identical_subset(update_values.submitted, cached_completed):
+                    return {key: value for key, value in cached_synced.items() if key not in update_values.submitted}
+
             values_to_be_added: dict[SHK, SHV] = {}
                
             # Create FunctionValues object and call the function
@@ -191,21 +218,32 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
                 if not key in update_values.submitted:
                     values_to_be_added[key] = synced_values[key] # type: ignore
 
-            # Call the function again with completed values to validate the final state
-            try:
-                completed_function_values = FunctionValues(submitted=completed_values, current=completed_values)
-                success, _ = self_ref._completing_function_callable(completed_function_values)
-                if not success:
-                    raise ValueError(f"Function callable returned invalid values for final state {completed_values}")
-            except Exception as e:
-                raise ValueError(f"Function callable validation failed: {e}")
+            # Call the function again with completed values to validate the final state (trusted in idempotent mode)
+            if not self_ref._idempotent:
+                try:
+                    completed_function_values = FunctionValues(submitted=completed_values, current=completed_values)
+                    success, _ = self_ref._completing_function_callable(completed_function_values)
+                    if not success:
+                        raise ValueError(f"Function callable returned invalid values for final state {completed_values}")
+                except Exception as e:
+                    raise ValueError(f"Function callable validation failed: {e}")
+
+            self_ref._completion_cache = (update_values.current, completed_values, dict(values_to_be_added))
 
             return values_to_be_added
 
+        def invalidate_callback(self_ref: "ObservableFunction[SHK, SHV]") -> tuple[bool, str]:
+            """
+            Drop the cached completed state once the values are committed, it does not
+            describe the new current values and would only keep the old values alive.
+            """
+            self_ref._completion_cache = None
+            return True, "Completion cache cleared"
+
         CarriesSomeHooksBase.__init__( # type: ignore
             self,
             logger=logger,
-            invalidate_callback=None,
+            invalidate_callback=invalidate_callback,
             validate_complete_values_in_isolation_callback=None,
             add_values_to_be_updated_callback=add_values_to_be_updated_callback
         )
@@ -347,6 +385,11 @@ class ObservableFunction(ListeningBase, CarriesSomeHooksBase[SHK, SHV, "Observab
         """Get the completing function callable."""
         return self._completing_function_callable
 
+    @property
+    def idempotent(self) -> bool:
+        """Whether the first answer of the function is trusted without validating the final state."""
+        return self._idempotent
+
     def change_values(self, values: Mapping[SHK, SHV]) -> None:
         """
         Change the values of the observable.
@@ -56,6 +56,7 @@ Example Usage:
 Performance Characteristics:
 - O(1) for hook access operations
 - Transformation performance depends on the provided callable
+- With a FunctionMemo, revisited input combinations are answered from a bounded LRU cache
 - Thread-safe operations for concurrent access
 - Atomic updates using the hook system
 """
@@ -71,6 +72,8 @@ from ..._carries_hooks.carries_some_hooks_base import CarriesSomeHooksBase
 from ..._nexus_system.nexus import Nexus
 from ..._nexus_system.update_function_values import UpdateFunctionValues
 from ..._nexus_system.submission_error import SubmissionError
+from .function_memo import FunctionMemo, MemoInfo, call_memoized
+from .batch_kernel import BatchKernel
 
 # Type variables for input and output hook names and values
 IHK = TypeVar("IHK")  # Input Hook Keys
@@ -108,7 +111,9 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
         input_variables_per_key: Mapping[IHK, Hook[IHV]|ReadOnlyHook[IHV]],
         one_way_function_callable: Callable[[Mapping[IHK, IHV]], Mapping[OHK, OHV]],
         function_output_hook_keys: set[OHK],
-        logger: Optional[Logger] = None
+        logger: Optional[Logger] = None,
+        memo: Optional[FunctionMemo[IHK, IHV, Mapping[OHK, OHV]]] = None,
+        kernel: Optional[BatchKernel[IHK, OHK]] = None
     ):
         """
         Initialize the ObservableOneWayFunction.
@@ -125,6 +130,14 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
             function_output_hook_keys: Set of output hook keys.
                 All keys that the function_callable returns must be present in this set.
             logger: Optional logger for debugging and monitoring transformations.
+            memo: Optional FunctionMemo caching the outputs per input combination. With a memo,
+                the callable is only called for input combinations that are not cached, so it
+                must not have side effects. Inputs must be hashable (or the memo needs a key
+                function); unhashable inputs are computed without caching.
+            kernel: Optional BatchKernel shared by functions with the same input and output keys.
+                All functions sharing the kernel that are affected by a submission are evaluated
+                with one kernel call (the memo is not used then). The callable is still used
+                outside of submissions, e.g. for the initial outputs; `kernel.evaluate_one` fits.
         
         Note:
             Internal hooks are created for both inputs and outputs:
@@ -154,6 +167,8 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
         """
 
         self._one_way_function_callable: Callable[[Mapping[IHK, IHV]], Mapping[OHK, OHV]] = one_way_function_callable
+        self._memo: Optional[FunctionMemo[IHK, IHV, Mapping[OHK, OHV]]] = memo
+        self._kernel: Optional[BatchKernel[IHK, OHK]] = kernel
 
         self._input_hooks: dict[IHK, OwnedHook[IHV]] = {}
         self._output_hooks: dict[OHK, OwnedHook[OHV]] = {}
@@ -170,7 +185,7 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
             self._input_hooks[key] = internal_hook_input
 
         # Create output hooks for all keys
-        output_values: dict[OHK, OHV] = self._one_way_function_callable(self.get_input_values()) # type: ignore
+        output_values: dict[OHK, OHV] = call_memoized(memo, one_way_function_callable, {key: hook.value for key, hook in self._input_hooks.items()}) # type: ignore
         for key in function_output_hook_keys:
             if key not in output_values:
                 raise ValueError(f"Function callable must return all output keys. Missing key: {key}")
@@ -196,32 +211,13 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
             This ensures transformations always have all required inputs available.
             """
 
-            values_to_be_added: dict[IHK|OHK, IHV|OHV] = {}
-
-            # Check if any input values changed - if so, trigger function transformation
-            input_keys = set(input_variables_per_key.keys())
-            if any(key in update_values.submitted for key in input_keys):
-                # Trigger function transformation
-
-                # Use submitted values for changed keys, current values for unchanged keys
-                input_values: dict[IHK, IHV] = {}
-                for key in input_keys:
-                    if key in update_values.submitted:
-                        input_values[key] = update_values.submitted[key] # type: ignore
-                    else:
-                        input_values[key] = update_values.current[key] # type: ignore
-                
-                # Call function callable with complete input values
-                output_values: Mapping[OHK, OHV] = one_way_function_callable(input_values)
-                
-                # Add all output values to be updated
-                values_to_be_added.update(output_values) # type: ignore
-
-            # Remove values that are already in the submitted values
-            for key in update_values.submitted:
-                values_to_be_added.pop(key, None)
-
-            return values_to_be_added
+            input_values: Optional[dict[IHK, IHV]] = self_ref._get_complete_input_values(update_values)
+            if input_values is None:
+                return {}
+
+            # Call function callable with complete input values
+            output_values: Mapping[OHK, OHV] = call_memoized(self_ref._memo, self_ref._one_way_function_callable, input_values)
+            return self_ref._get_values_to_be_added(update_values, output_values)
 
         CarriesSomeHooksBase.__init__( # type: ignore
             self,
@@ -235,7 +231,40 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
         for key, external_hook_or_value in input_variables_per_key.items():
             internal_hook_input = self._input_hooks[key]
             if isinstance(external_hook_or_value, ManagedHookProtocol): # type: ignore
-                internal_hook_input.connect_hook(external_hook_or_value, "use_caller_value") # type: ignore
+                internal_hook_input.join(external_hook_or_value, "use_caller_value") # type: ignore
+
+    #########################################################################
+    # Completion
+    #########################################################################
+
+    def _get_complete_input_values(self, update_values: UpdateFunctionValues[IHK|OHK, IHV|OHV]) -> Optional[dict[IHK, IHV]]:
+        """
+        Get the complete input values (submitted values for changed keys, current values for the others).
+
+        Returns:
+            The input values, or None if no input value is submitted.
+        """
+        if not any(key in update_values.submitted for key in self._input_hooks):
+            return None
+        input_values: dict[IHK, IHV] = {}
+        for key in self._input_hooks:
+            if key in update_values.submitted:
+                input_values[key] = update_values.submitted[key] # type: ignore
+            else:
+                input_values[key] = update_values.current[key] # type: ignore
+        return input_values
+
+    def _get_values_to_be_added(self, update_values: UpdateFunctionValues[IHK|OHK, IHV|OHV], output_values: Mapping[OHK, OHV]) -> dict[IHK|OHK, IHV|OHV]:
+        """
+        Get the output values that are not already submitted.
+        """
+        return {key: value for key, value in output_values.items() if key not in update_values.submitted} # type: ignore
+
+    def _get_batch_group(self) -> Optional[BatchKernel[IHK, OHK]]:
+        """
+        Get the kernel evaluating this function together with the other functions sharing it.
+        """
+        return self._kernel
 
     #########################################################################
     # CarriesSomeHooksBase abstract methods
@@ -296,6 +325,14 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
 
         return set(self._input_hooks.keys()) | set(self._output_hooks.keys())
 
+    def _get_derived_hook_keys(self) -> set[OHK]:
+        """
+        Get the output hook keys, their values are computed from the input values.
+
+        ** This method is not thread-safe and should only be called internally.
+        """
+        return set(self._output_hooks.keys())
+
     def _get_key_by_hook_or_nexus(self, hook_or_nexus: Hook[IHV]|ReadOnlyHook[OHV]|Nexus[IHV|OHV]) -> IHK|OHK: # type: ignore
         """
         Get the key for a hook or nexus.
@@ -393,6 +430,20 @@ class ObservableOneWayFunction(ListeningBase, CarriesSomeHooksBase[IHK|OHK, IHV|
         """Get the function callable."""
         return self._one_way_function_callable
 
+    @property
+    def memo(self) -> Optional[FunctionMemo[IHK, IHV, Mapping[OHK, OHV]]]:
+        """Get the FunctionMemo caching the outputs, None if the function is not memoized."""
+        return self._memo
+
+    def memo_info(self) -> Optional[MemoInfo]:
+        """Get the hit/miss counters of the memo, None if the function is not memoized."""
+        return self._memo.info() if self._memo is not None else None
+
+    @property
+    def kernel(self) -> Optional[BatchKernel[IHK, OHK]]:
+        """Get the BatchKernel evaluating this function in batches, None if it is evaluated on its own."""
+        return self._kernel
+
     def input_variable_keys(self) -> set[IHK]:
         """Get the input variable keys."""
         with self._lock:
@@ -0,0 +1,135 @@
+"""
+List Change - Splice records describing how a list value changed
+
+A change of an observable list is described by a tuple of `ListChange` splices.
+Applying the splices in order to the previous list yields the new list, so a
+view (e.g. a virtualized table) can patch k rows instead of rebuilding all n.
+
+Example:
+    >>> rows = ["a", "b", "c"]
+    >>> changes = (ListChange(1, 1, ("x", "y")),)
+    >>> apply_list_changes(rows, changes)
+    >>> rows
+    ['a', 'x', 'y', 'c']
+"""
+
+from typing import Generic, Literal, MutableSequence, Optional, TypeVar
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from logging import Logger
+
+from ..._publisher_subscriber.publisher import Publisher
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class ListChange(Generic[T]):
+    """
+    Immutable splice record: at `index`, `removed_count` items were replaced by `inserted`.
+
+    Attributes:
+        index: The position of the splice in the list, as it is after all preceding
+               splices of the same change have been applied.
+        removed_count: The number of items removed at `index`.
+        inserted: The items inserted at `index`.
+
+    Example:
+        >>> ListChange(3, 0, ("new",))      # insert "new" at index 3
+        >>> ListChange(0, 2, ())            # delete the first two items
+        >>> ListChange(5, 1, ("replaced",)) # replace the item at index 5
+    """
+
+    index: int
+    removed_count: int
+    inserted: tuple[T, ...]
+
+    def apply_to(self, target: MutableSequence[T]) -> None:
+        """
+        Apply this splice to a mutable sequence in place.
+        """
+        target[self.index:self.index + self.removed_count] = self.inserted
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"ListChange(index={self.index}, removed_count={self.removed_count}, inserted={self.inserted!r})"
+
+
+def apply_list_changes(target: MutableSequence[T], changes: Iterable[ListChange[T]]) -> None:
+    """
+    Apply a sequence of splices to a mutable sequence in place.
+    """
+    for change in changes:
+        change.apply_to(target)
+
+
+def diff_list_values(previous: Iterable[T], current: Iterable[T]) -> tuple[ListChange[T], ...]:
+    """
+    Compute the splices between two list values in O(n).
+
+    The common prefix and suffix are trimmed, everything in between is reported
+    as a single splice. Returns an empty tuple if both values are equal.
+    """
+    previous_items: Sequence[T] = previous if isinstance(previous, (list, tuple)) else tuple(previous) # type: ignore
+    current_items: Sequence[T] = current if isinstance(current, (list, tuple)) else tuple(current) # type: ignore
+    previous_length: int = len(previous_items)
+    current_length: int = len(current_items)
+    shorter_length: int = min(previous_length, current_length)
+
+    prefix: int = 0
+    while prefix < shorter_length:
+        item_1 = previous_items[prefix]
+        item_2 = current_items[prefix]
+        if item_1 is not item_2 and not item_1 == item_2:
+            break
+        prefix += 1
+
+    if prefix == previous_length == current_length:
+        return ()
+
+    suffix: int = 0
+    while suffix < shorter_length - prefix:
+        item_1 = previous_items[previous_length - 1 - suffix]
+        item_2 = current_items[current_length - 1 - suffix]
+        if item_1 is not item_2 and not item_1 == item_2:
+            break
+        suffix += 1
+
+    return (ListChange(prefix, previous_length - prefix - suffix, tuple(current_items[prefix:current_length - suffix])),)
+
+
+class ListChangePublisher(Publisher, Generic[T]):
+    """
+    A Publisher that carries the splices of the latest list change.
+
+    Subscribers and callbacks read `changes` when they are notified. The publisher
+    is owned by an observable list and published after every change of the list.
+
+    Example:
+        >>> todos = XList(["a", "b"])
+        >>> todos.change_publisher.add_subscriber(lambda: print(todos.change_publisher.changes))
+        >>> todos.append("c")
+        (ListChange(index=2, removed_count=0, inserted=('c',)),)
+    """
+
+    def __init__(
+        self,
+        preferred_publish_mode: Literal["async", "sync", "direct", "off"] = "sync",
+        logger: Optional[Logger] = None
+        ) -> None:
+        super().__init__(preferred_publish_mode=preferred_publish_mode, logger=logger)
+        self._changes: tuple[ListChange[T], ...] = ()
+
+    @property
+    def changes(self) -> tuple[ListChange[T], ...]:
+        """
+        Get the splices of the latest published change.
+        """
+        return self._changes
+
+    def publish_changes(self, changes: tuple[ListChange[T], ...], mode: Literal["async", "sync", "direct", "off", None] = None) -> None:
+        """
+        Store the splices and publish them to all subscribers.
+        """
+        self._changes = changes
+        self.publish(mode)
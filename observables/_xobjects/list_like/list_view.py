@@ -0,0 +1,168 @@
+"""
+ListView - Read-only, zero-copy view on a list value
+
+A ListView references the stored sequence of an observable list (usually a
+PersistentVector) together with a `range` of indices. Indexing, `len` and
+slicing never copy items: slicing a view only slices its range. Because the
+stored sequence is immutable, a view keeps showing the value it was taken from,
+even if the observable list changes afterwards.
+
+Example:
+    >>> prices = XList([1.0, 2.0, 3.0, 4.0])
+    >>> view = prices.view
+    >>> window = view[1:3]         # no copy
+    >>> window[0], len(window)
+    (2.0, 2)
+    >>> prices.append(5.0)
+    >>> len(view)                  # still the value at the time of `prices.view`
+    4
+"""
+
+from typing import Any, Generic, Iterator, Optional, Sequence, TypeVar, overload
+from array import array
+from itertools import islice
+
+from .persistent_vector import PersistentVector
+
+T = TypeVar("T")
+
+
+class ListView(Sequence[T], Generic[T]):
+    """
+    Immutable, zero-copy sequence view on a list value.
+
+    Complexity (n = number of items of the source):
+        - `len`, slicing:           O(1)
+        - Index access:             O(log n) on a PersistentVector, O(1) on a list or tuple
+        - Iteration over k items:   O(k + log n)
+    """
+
+    __slots__ = ("_source", "_range", "_buffers")
+
+    def __init__(self, source: Sequence[T], indices: Optional[range] = None) -> None:
+        """
+        Create a view on a sequence.
+
+        Args:
+            source: The sequence to view. It must not be mutated while the view is in use,
+                which is guaranteed for the PersistentVector stored by an observable list.
+            indices: The indices of `source` the view shows (default: all).
+        """
+        self._source: Sequence[T] = source
+        self._range: range = range(len(source)) if indices is None else indices
+        self._buffers: Optional[dict[str, memoryview]] = None
+
+    #########################################################
+    # Sequence protocol
+    #########################################################
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> "ListView[T]": ...
+    def __getitem__(self, index: int|slice) -> "T|ListView[T]":
+        if isinstance(index, slice):
+            return ListView(self._source, self._range[index])
+        try:
+            return self._source[self._range[index]]
+        except IndexError:
+            raise IndexError("ListView index out of range") from None
+
+    def __iter__(self) -> Iterator[T]:
+        indices: range = self._range
+        if len(indices) == 0:
+            return iter(())
+        if indices.step == 1:
+            if isinstance(self._source, PersistentVector):
+                return self._source._iter_slice(indices.start, indices.stop) # type: ignore
+            return islice(self._source, indices.start, indices.stop)
+        source = self._source
+        return (source[i] for i in indices)
+
+    def __reversed__(self) -> Iterator[T]:
+        source = self._source
+        return (source[i] for i in reversed(self._range))
+
+    def __contains__(self, item: object) -> bool:
+        for value in self:
+            if value is item or value == item:
+                return True
+        return False
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Return the first index of a value.
+
+        Raises:
+            ValueError: If the value is not present.
+        """
+        begin, end, _ = slice(start, stop).indices(len(self))
+        for offset, value in enumerate(self[begin:end]):
+            if value is item or value == item:
+                return begin + offset
+        raise ValueError(f"{item} is not in ListView")
+
+    def count(self, item: Any) -> int:
+        """Return the number of occurrences of a value."""
+        return sum(1 for value in self if value is item or value == item)
+
+    def tolist(self) -> list[T]:
+        """Return the items as a new list."""
+        return list(self)
+
+    #########################################################
+    # Numeric data
+    #########################################################
+
+    def as_memoryview(self, typecode: str = "d") -> memoryview:
+        """
+        Get the items as a read-only, contiguous memoryview.
+
+        The items are packed into an `array.array` with the given typecode on the first call;
+        later calls for the same typecode return the same buffer, so repeated numeric reads of
+        one view (e.g. by numpy via `numpy.asarray(view.as_memoryview())`) do not copy again.
+
+        Args:
+            typecode: An `array` typecode such as "d" (float), "q" (int64) or "i" (int32).
+
+        Raises:
+            TypeError: If an item cannot be stored with the given typecode.
+        """
+        if self._buffers is None:
+            self._buffers = {}
+        buffer = self._buffers.get(typecode)
+        if buffer is None:
+            buffer = memoryview(array(typecode, self)).toreadonly()
+            self._buffers[typecode] = buffer
+        return buffer
+
+    #########################################################
+    # Comparison and hashing
+    #########################################################
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, (ListView, PersistentVector, list, tuple)):
+            if len(self) != len(other): # type: ignore
+                return False
+            for item_1, item_2 in zip(self, other): # type: ignore
+                if item_1 is not item_2 and not item_1 == item_2:
+                    return False
+            return True
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"ListView({list(self)!r})"
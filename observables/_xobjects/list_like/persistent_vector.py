@@ -0,0 +1,459 @@
+"""
+PersistentVector - Immutable, structurally shared sequence used as XList backend
+
+The vector stores its items in a balanced tree of chunks (a persistent B+-tree
+rope). Leaves are tuples of at most `_CHUNK_SIZE` items, branches hold up to
+`_CHUNK_SIZE` children together with the offset of each child. Every edit copies
+only the path from the root to the touched leaf, so all previous versions stay
+intact and share the untouched chunks with the new version.
+
+Complexity (n = number of items):
+    - Index access:                     O(log n)
+    - append / insert / set / delete:   O(log n) time and memory
+    - extend by k items:                O(k log n)
+    - Equality of two versions that share structure: O(log n) per differing chunk
+    - Construction from an iterable:    O(n)
+
+Example:
+    >>> v1 = PersistentVector([1, 2, 3])
+    >>> v2 = v1.append(4)
+    >>> v1
+    PersistentVector([1, 2, 3])
+    >>> v2
+    PersistentVector([1, 2, 3, 4])
+    >>> v2 == [1, 2, 3, 4]
+    True
+"""
+
+from typing import Any, Generic, Iterable, Iterator, Optional, Sequence, TypeVar, overload
+from bisect import bisect_right
+from itertools import chain, islice
+import weakref
+
+from .list_change import ListChange
+
+T = TypeVar("T")
+
+_CHUNK_SIZE: int = 32
+"""Maximum number of items per leaf and children per branch."""
+
+
+class _Branch:
+    """
+    Internal tree node holding child nodes and their start offsets.
+    """
+
+    __slots__ = ("children", "starts", "size")
+
+    def __init__(self, children: tuple[Any, ...]) -> None:
+        starts: list[int] = []
+        size: int = 0
+        for child in children:
+            starts.append(size)
+            size += _node_size(child)
+        self.children: tuple[Any, ...] = children
+        self.starts: tuple[int, ...] = tuple(starts)
+        self.size: int = size
+
+    def child_index(self, index: int) -> int:
+        """Get the index of the child that contains the item at `index`."""
+        return bisect_right(self.starts, index) - 1
+
+
+def _node_size(node: Any) -> int:
+    if isinstance(node, _Branch):
+        return node.size
+    return len(node)
+
+
+def _node_get(node: Any, index: int) -> Any:
+    while isinstance(node, _Branch):
+        child_index: int = node.child_index(index)
+        index -= node.starts[child_index]
+        node = node.children[child_index]
+    return node[index]
+
+
+def _node_set(node: Any, index: int, value: Any) -> Any:
+    if isinstance(node, _Branch):
+        child_index: int = node.child_index(index)
+        child = node.children[child_index]
+        new_child = _node_set(child, index - node.starts[child_index], value)
+        if new_child is child:
+            return node
+        return _Branch(node.children[:child_index] + (new_child,) + node.children[child_index + 1:])
+    if node[index] is value:
+        return node
+    return node[:index] + (value,) + node[index + 1:]
+
+
+def _split(items: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Split an overfull tuple of items or children into two halves."""
+    half: int = len(items) // 2
+    return items[:half], items[half:]
+
+
+def _node_insert(node: Any, index: int, value: Any) -> tuple[Any, ...]:
+    """Insert a value and return the one or two nodes replacing `node`."""
+    if isinstance(node, _Branch):
+        child_index: int = node.child_index(index)
+        replacements = _node_insert(node.children[child_index], index - node.starts[child_index], value)
+        children = node.children[:child_index] + replacements + node.children[child_index + 1:]
+        if len(children) > _CHUNK_SIZE:
+            return tuple(_Branch(half) for half in _split(children))
+        return (_Branch(children),)
+    items = node[:index] + (value,) + node[index:]
+    if len(items) > _CHUNK_SIZE:
+        return _split(items)
+    return (items,)
+
+
+def _node_delete(node: Any, index: int) -> Any:
+    """Delete a value and return the replacing node (an empty tuple if nothing is left)."""
+    if isinstance(node, _Branch):
+        child_index: int = node.child_index(index)
+        new_child = _node_delete(node.children[child_index], index - node.starts[child_index])
+        if _node_size(new_child) == 0:
+            children = node.children[:child_index] + node.children[child_index + 1:]
+        else:
+            children = node.children[:child_index] + (new_child,) + node.children[child_index + 1:]
+        if len(children) == 0:
+            return ()
+        return _Branch(children)
+    return node[:index] + node[index + 1:]
+
+
+def _iter_leaves(node: Any) -> Iterator[tuple[Any, ...]]:
+    if isinstance(node, _Branch):
+        # All leaves are on the same level, so branches hold either only leaves or only branches
+        if isinstance(node.children[0], _Branch):
+            for child in node.children:
+                yield from _iter_leaves(child)
+        else:
+            yield from node.children
+    else:
+        yield node
+
+
+def _iter_leaves_reversed(node: Any) -> Iterator[tuple[Any, ...]]:
+    if isinstance(node, _Branch):
+        for child in reversed(node.children):
+            yield from _iter_leaves_reversed(child)
+    else:
+        yield node
+
+
+def _iter_range(node: Any, start: int, stop: int) -> Iterator[Any]:
+    """Iterate over the items in [start, stop) of a node, skipping unrelated subtrees."""
+    if isinstance(node, _Branch):
+        first: int = node.child_index(start)
+        for child_index in range(first, len(node.children)):
+            offset: int = node.starts[child_index]
+            if offset >= stop:
+                break
+            yield from _iter_range(node.children[child_index], max(start - offset, 0), stop - offset)
+    else:
+        yield from islice(node, start, stop)
+
+
+def _items_equal(items_1: Iterable[Any], items_2: Iterable[Any]) -> bool:
+    for item_1, item_2 in zip(items_1, items_2):
+        if item_1 is not item_2 and not item_1 == item_2:
+            return False
+    return True
+
+
+def _nodes_equal(node_1: Any, node_2: Any) -> bool:
+    """
+    Compare two nodes of the same size.
+
+    Shared subtrees are recognized by identity, so comparing two versions derived
+    from each other only inspects the paths that actually differ.
+    """
+    if node_1 is node_2:
+        return True
+    if isinstance(node_1, _Branch) and isinstance(node_2, _Branch) and node_1.starts == node_2.starts:
+        return all(_nodes_equal(child_1, child_2) for child_1, child_2 in zip(node_1.children, node_2.children))
+    if isinstance(node_1, tuple) and isinstance(node_2, tuple):
+        return _items_equal(node_1, node_2) # type: ignore
+    return _items_equal(
+        (item for leaf in _iter_leaves(node_1) for item in leaf),
+        (item for leaf in _iter_leaves(node_2) for item in leaf)
+    )
+
+
+def _build(items: Iterable[Any]) -> Any:
+    """Build a balanced tree from an iterable in O(n)."""
+    iterator = iter(items)
+    nodes: list[Any] = []
+    while True:
+        chunk = tuple(islice(iterator, _CHUNK_SIZE))
+        if len(chunk) == 0:
+            break
+        nodes.append(chunk)
+    if len(nodes) == 0:
+        return ()
+    while len(nodes) > 1:
+        nodes = [_Branch(tuple(nodes[i:i + _CHUNK_SIZE])) for i in range(0, len(nodes), _CHUNK_SIZE)]
+    return nodes[0]
+
+
+class PersistentVector(Sequence[T], Generic[T]):
+    """
+    Immutable sequence with O(log n) structural-sharing edits.
+
+    All edit methods (`append`, `extend`, `insert`, `set`, `delete`) return a new
+    vector and leave the original untouched. The vector compares equal to any
+    list, tuple or PersistentVector with the same items in the same order.
+
+    Every edit records the splice it performed together with a weak reference to
+    the vector it was derived from, so `changes_from` can report the delta between
+    two consecutive versions without comparing their items.
+
+    Example:
+        >>> log = PersistentVector()
+        >>> for i in range(1_000_000):
+        ...     log = log.append(i)      # O(log n) per append
+        >>> old = log
+        >>> log = log.set(0, -1)         # `old` is unchanged
+        >>> old[0], log[0]
+        (0, -1)
+    """
+
+    __slots__ = ("_root", "_hash", "_origin", "__weakref__")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """
+        Create a vector holding the items of an iterable.
+
+        Args:
+            items: The items of the vector (default: empty). If `items` is
+                already a PersistentVector, its tree is shared, not copied.
+        """
+        if isinstance(items, PersistentVector):
+            self._root: Any = items._root # type: ignore
+        else:
+            self._root = _build(items)
+        self._hash: Optional[int] = None
+        self._origin: Optional[tuple[weakref.ref[PersistentVector[T]], tuple[ListChange[T], ...]]] = None
+
+    @classmethod
+    def _from_root(cls, root: Any) -> "PersistentVector[T]":
+        vector: PersistentVector[T] = cls.__new__(cls)
+        vector._root = root
+        vector._hash = None
+        vector._origin = None
+        return vector
+
+    def _record_origin(self, previous: "PersistentVector[T]", changes: tuple[ListChange[T], ...]) -> "PersistentVector[T]":
+        """
+        Record that this vector was derived from `previous` by applying `changes`.
+        """
+        self._origin = (weakref.ref(previous), changes)
+        return self
+
+    def changes_from(self, previous: Any) -> Optional[tuple[ListChange[T], ...]]:
+        """
+        Get the splices that turned `previous` into this vector.
+
+        Args:
+            previous: The vector this vector is expected to be derived from.
+
+        Returns:
+            The recorded splices if this vector was created by an edit of `previous`,
+            an empty tuple if `previous` is this vector and None otherwise.
+        """
+        if previous is self:
+            return ()
+        if self._origin is not None and self._origin[0]() is previous:
+            return self._origin[1]
+        return None
+
+    def _normalize_index(self, index: int) -> int:
+        length: int = _node_size(self._root)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PersistentVector index out of range")
+        return index
+
+    #########################################################
+    # Sequence protocol
+    #########################################################
+
+    def __len__(self) -> int:
+        return _node_size(self._root)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> "PersistentVector[T]": ...
+    def __getitem__(self, index: int|slice) -> "T|PersistentVector[T]":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return PersistentVector(_iter_range(self._root, start, stop) if start < stop else ())
+            return PersistentVector(_node_get(self._root, i) for i in range(start, stop, step))
+        return _node_get(self._root, self._normalize_index(index))
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(_iter_leaves(self._root))
+
+    def _iter_slice(self, start: int, stop: int) -> Iterator[T]:
+        """Iterate over the items in [start, stop) without visiting unrelated chunks."""
+        if start >= stop:
+            return iter(())
+        return _iter_range(self._root, start, stop)
+
+    def __reversed__(self) -> Iterator[T]:
+        for leaf in _iter_leaves_reversed(self._root):
+            yield from reversed(leaf)
+
+    def __contains__(self, item: object) -> bool:
+        for leaf in _iter_leaves(self._root):
+            if item in leaf:
+                return True
+        return False
+
+    def index(self, item: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Return the first index of a value.
+
+        Raises:
+            ValueError: If the value is not present.
+        """
+        length: int = len(self)
+        begin, end, _ = slice(start, stop).indices(length)
+        for offset, value in enumerate(_iter_range(self._root, begin, end) if begin < end else ()):
+            if value is item or value == item:
+                return begin + offset
+        raise ValueError(f"{item} is not in PersistentVector")
+
+    def count(self, item: Any) -> int:
+        """Return the number of occurrences of a value."""
+        return sum(1 for value in self if value is item or value == item)
+
+    #########################################################
+    # Persistent edits
+    #########################################################
+
+    def set(self, index: int, value: T) -> "PersistentVector[T]":
+        """
+        Return a new vector with the item at `index` replaced.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        index = self._normalize_index(index)
+        root = _node_set(self._root, index, value)
+        if root is self._root:
+            return self
+        return PersistentVector._from_root(root)._record_origin(self, (ListChange(index, 1, (value,)),))
+
+    def insert(self, index: int, value: T) -> "PersistentVector[T]":
+        """
+        Return a new vector with `value` inserted before `index`.
+
+        Out-of-range indices are clamped like `list.insert`.
+        """
+        length: int = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        index = min(index, length)
+        nodes = _node_insert(self._root, index, value)
+        root = nodes[0] if len(nodes) == 1 else _Branch(nodes)
+        return PersistentVector._from_root(root)._record_origin(self, (ListChange(index, 0, (value,)),))
+
+    def append(self, value: T) -> "PersistentVector[T]":
+        """Return a new vector with `value` added at the end."""
+        return self.insert(len(self), value)
+
+    def extend(self, values: Iterable[T]) -> "PersistentVector[T]":
+        """Return a new vector with all `values` added at the end."""
+        values = tuple(values)
+        if len(values) == 0:
+            return self
+        length: int = len(self)
+        if length == 0:
+            vector: PersistentVector[T] = PersistentVector(values)
+        else:
+            vector = self
+            for value in values:
+                vector = vector.append(value)
+        return vector._record_origin(self, (ListChange(length, 0, values),))
+
+    def delete(self, index: int) -> "PersistentVector[T]":
+        """
+        Return a new vector without the item at `index`.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        index = self._normalize_index(index)
+        root = _node_delete(self._root, index)
+        while isinstance(root, _Branch) and len(root.children) == 1:
+            root = root.children[0]
+        return PersistentVector._from_root(root)._record_origin(self, (ListChange(index, 1, ()),))
+
+    def tolist(self) -> list[T]:
+        """Return the items as a new list."""
+        return list(self)
+
+    #########################################################
+    # Comparison and hashing
+    #########################################################
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PersistentVector):
+            if len(self) != len(other): # type: ignore
+                return False
+            return _nodes_equal(self._root, other._root) # type: ignore
+        if isinstance(other, (list, tuple)):
+            if len(self) != len(other): # type: ignore
+                return False
+            return _items_equal(self, other) # type: ignore
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __lt__(self, other: Any) -> bool:
+        return tuple(self) < tuple(other)
+
+    def __le__(self, other: Any) -> bool:
+        return tuple(self) <= tuple(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return tuple(self) > tuple(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return tuple(self) >= tuple(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    #########################################################
+    # Other dunder methods
+    #########################################################
+
+    def __add__(self, other: Iterable[T]) -> "PersistentVector[T]":
+        return self.extend(other)
+
+    def __mul__(self, times: int) -> "PersistentVector[T]":
+        return PersistentVector(item for _ in range(times) for item in self)
+
+    def __rmul__(self, times: int) -> "PersistentVector[T]":
+        return self.__mul__(times)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (PersistentVector, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"PersistentVector({list(self)!r})"
@@ -0,0 +1,404 @@
+"""
+Ring Buffer - Fixed-capacity storage and snapshots used as XRingBuffer backend
+
+A ring buffer writes its items into a preallocated slot storage (a stdlib
+`array` for numeric typecodes, a list otherwise) and overwrites the oldest item
+once it is full, so pushing costs O(1) and the memory stays constant no matter
+how many items are pushed.
+
+The value of an XRingBuffer is a `RingBufferSnapshot`: a read-only sequence over
+the absolute item numbers [start, stop) of a storage. Taking a snapshot copies
+nothing. Because later pushes overwrite the slots of the oldest items, a snapshot
+only stays readable for the items that have not been overwritten yet; reading an
+overwritten item raises an IndexError. The newest items of an old snapshot (e.g.
+`previous_value` of the hook) stay readable.
+
+Every push records the appended and evicted items (`RingBufferAppend`) together
+with a weak reference to the snapshot it was derived from, so derived values
+(e.g. the window statistics) are updated from the delta instead of a rescan.
+
+Example:
+    >>> storage = RingStorage(3, "d")
+    >>> snapshot = RingBufferSnapshot(storage, 0, 0)
+    >>> for value in (1.0, 2.0, 3.0):
+    ...     snapshot = snapshot.push((value,))
+    >>> latest = snapshot.push((4.0,))
+    >>> list(latest)
+    [2.0, 3.0, 4.0]
+    >>> latest.changes_from(snapshot)
+    RingBufferAppend(appended=(4.0,), evicted=(1.0,))
+"""
+
+from typing import Any, Generic, Iterator, Optional, Sequence, TypeVar, Literal, overload
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from array import array
+from logging import Logger
+import weakref
+
+from ..._publisher_subscriber.publisher import Publisher
+
+T = TypeVar("T")
+
+NUMERIC_TYPECODES: str = "bBhHiIlLqQfd"
+"""Typecodes of the stdlib `array` module holding numbers. Statistics are only computed for these."""
+
+
+@dataclass(frozen=True, slots=True)
+class RingBufferAppend(Generic[T]):
+    """
+    Immutable record of a push to a ring buffer.
+
+    Attributes:
+        appended: The items added at the end, oldest first.
+        evicted: The items dropped from the front to make room, oldest first.
+    """
+
+    appended: tuple[T, ...]
+    evicted: tuple[T, ...]
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"RingBufferAppend(appended={self.appended!r}, evicted={self.evicted!r})"
+
+
+class RingStorage(Generic[T]):
+    """
+    Preallocated slots of a ring buffer and the number of items written so far.
+
+    The item with absolute number i is stored in slot i % capacity.
+    """
+
+    __slots__ = ("capacity", "typecode", "slots", "written", "__weakref__")
+
+    def __init__(self, capacity: int, typecode: Optional[str] = "d") -> None:
+        if capacity <= 0:
+            raise ValueError("The capacity of a ring buffer must be positive")
+        self.capacity: int = capacity
+        self.typecode: Optional[str] = typecode
+        self.slots: array[Any]|list[Any] = array(typecode, bytes(array(typecode).itemsize * capacity)) if typecode is not None else [None] * capacity
+        self.written: int = 0
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether the storage holds numbers (a stdlib array with a numeric typecode)."""
+        return self.typecode is not None and self.typecode in NUMERIC_TYPECODES
+
+
+class RingBufferSnapshot(Sequence[T], Generic[T]):
+    """
+    Read-only sequence over the items [start, stop) (absolute item numbers) of a ring storage.
+
+    Two snapshots of the same storage are equal if they cover the same items; pushing an
+    item therefore always produces a different value, even if the items happen to compare
+    equal. Snapshots of different storages (or other sequences) are compared item by item.
+    """
+
+    __slots__ = ("_storage", "_start", "_stop", "_origin", "_overwritten", "__weakref__")
+
+    def __init__(self, storage: RingStorage[T], start: int, stop: int) -> None:
+        self._storage: RingStorage[T] = storage
+        self._start: int = start
+        self._stop: int = stop
+        self._origin: Optional[tuple[weakref.ref[RingBufferSnapshot[T]], RingBufferAppend[T]]] = None
+        # Previous contents of the slots written by the push that created this snapshot (see _undo_push)
+        self._overwritten: tuple[T, ...] = ()
+
+    @classmethod
+    def from_items(cls, items: Iterable[T], capacity: int, typecode: Optional[str] = "d") -> "RingBufferSnapshot[T]":
+        """Create a new storage holding the last `capacity` of `items` and return its snapshot."""
+        snapshot: RingBufferSnapshot[T] = cls(RingStorage(capacity, typecode), 0, 0)
+        return snapshot._write(tuple(items))
+
+    @property
+    def storage(self) -> RingStorage[T]:
+        return self._storage
+
+    @property
+    def capacity(self) -> int:
+        return self._storage.capacity
+
+    def is_latest(self) -> bool:
+        """Whether no item has been written to the storage after this snapshot was taken."""
+        return self._stop == self._storage.written
+
+    def is_intact(self) -> bool:
+        """Whether none of the items has been overwritten by later pushes."""
+        return self._start >= self._storage.written - self._storage.capacity
+
+    def changes_from(self, previous: Any) -> Optional[RingBufferAppend[T]]:
+        """
+        Get the push that turned `previous` into this snapshot.
+
+        Returns:
+            The recorded push if this snapshot was created by a push to `previous`, an empty
+            push if `previous` is this snapshot and None otherwise.
+        """
+        if previous is self:
+            return RingBufferAppend((), ())
+        if self._origin is not None and self._origin[0]() is previous:
+            return self._origin[1]
+        return None
+
+    #########################################################
+    # Writing
+    #########################################################
+
+    def _write(self, items: tuple[T, ...]) -> "RingBufferSnapshot[T]":
+        """Write `items` into the storage (only the last `capacity` of them) and return the new snapshot."""
+        storage = self._storage
+        capacity: int = storage.capacity
+        if len(items) > capacity:
+            items = items[-capacity:]
+        slots = storage.slots
+        position: int = storage.written % capacity
+        first_part: int = min(len(items), capacity - position)
+        slots[position:position + first_part] = array(storage.typecode, items[:first_part]) if storage.typecode is not None else list(items[:first_part])
+        if first_part < len(items):
+            slots[0:len(items) - first_part] = array(storage.typecode, items[first_part:]) if storage.typecode is not None else list(items[first_part:])
+        storage.written += len(items)
+        stop: int = storage.written
+        return RingBufferSnapshot(storage, max(self._start, stop - capacity), stop)
+
+    def push(self, items: tuple[T, ...]) -> "RingBufferSnapshot[T]":
+        """
+        Return a snapshot with `items` appended, overwriting the oldest items if the storage is full.
+
+        This writes into the shared storage; it requires this snapshot to be the latest one of
+        its storage (see `is_latest`). Costs O(k) for k items.
+        """
+        if not self.is_latest():
+            raise ValueError("Only the latest snapshot of a ring buffer can be pushed to")
+        if len(items) == 0:
+            return self
+        number_evicted: int = max(0, len(self) + len(items) - self._storage.capacity)
+        evicted: tuple[T, ...] = tuple(self._iter_absolute(self._start, self._start + min(number_evicted, len(self))))
+        # Older snapshots (e.g. from before a clear) may still read slots that are not part of this one
+        storage = self._storage
+        overwritten: tuple[T, ...] = tuple(storage.slots[number % storage.capacity] for number in range(self._stop, self._stop + min(len(items), storage.capacity)))
+        snapshot = self._write(items)
+        snapshot._overwritten = overwritten
+        # Read the appended items back, so they have the type of the stored items (e.g. float for "d")
+        appended: tuple[T, ...] = tuple(snapshot._iter_absolute(snapshot._stop - min(len(items), self._storage.capacity), snapshot._stop))
+        snapshot._origin = (weakref.ref(self), RingBufferAppend(appended, evicted))
+        return snapshot
+
+    def _undo_push(self, previous: "RingBufferSnapshot[T]") -> None:
+        """Restore the storage as it was before this snapshot was pushed to `previous` (e.g. after a rejected submission)."""
+        change = self.changes_from(previous)
+        if change is None or not self.is_latest():
+            raise ValueError("Only the latest push can be undone")
+        storage = self._storage
+        storage.written = previous._stop
+        # Restore every slot the push wrote to, not only those of the evicted items
+        for number, item in zip(range(previous._stop, previous._stop + len(self._overwritten)), self._overwritten):
+            storage.slots[number % storage.capacity] = item
+
+    def cleared(self) -> "RingBufferSnapshot[T]":
+        """Return an empty snapshot of the same storage. Costs O(1)."""
+        if len(self) == 0:
+            return self
+        return RingBufferSnapshot(self._storage, self._stop, self._stop)
+
+    #########################################################
+    # Sequence protocol
+    #########################################################
+
+    def _check_readable(self, number: int) -> None:
+        if number < self._storage.written - self._storage.capacity:
+            raise IndexError("The item has been overwritten by later pushes to the ring buffer")
+
+    def _iter_absolute(self, start: int, stop: int) -> Iterator[T]:
+        storage = self._storage
+        capacity: int = storage.capacity
+        slots = storage.slots
+        for number in range(start, stop):
+            self._check_readable(number)
+            yield slots[number % capacity]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int|slice) -> "T|list[T]":
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length: int = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("RingBufferSnapshot index out of range")
+        number: int = self._start + index
+        self._check_readable(number)
+        return self._storage.slots[number % self._storage.capacity]
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iter_absolute(self._start, self._stop)
+
+    def __reversed__(self) -> Iterator[T]:
+        for number in range(self._stop - 1, self._start - 1, -1):
+            self._check_readable(number)
+            yield self._storage.slots[number % self._storage.capacity]
+
+    def tolist(self) -> list[T]:
+        """Return the items as a new list."""
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, RingBufferSnapshot):
+            if other._storage is self._storage: # type: ignore
+                return other._start == self._start and other._stop == self._stop # type: ignore
+            return len(self) == len(other) and list(self) == list(other) # type: ignore
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and list(self) == list(other) # type: ignore
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        return hash((id(self._storage), self._start, self._stop))
+
+    def __repr__(self) -> str:
+        return f"RingBufferSnapshot({list(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class WindowStatistics:
+    """
+    Immutable statistics of the items in a ring buffer.
+
+    Attributes:
+        count: The number of items.
+        total: The sum of the items (None if the buffer is empty or not numeric).
+        minimum: The smallest item (None if the buffer is empty or not numeric).
+        maximum: The largest item (None if the buffer is empty or not numeric).
+    """
+
+    count: int
+    total: Any
+    minimum: Any
+    maximum: Any
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Get the mean of the items (None if the buffer is empty or not numeric)."""
+        if self.total is None or self.count == 0:
+            return None
+        return self.total / self.count
+
+
+class IncrementalWindowStatistics:
+    """
+    Derives the window statistics of ring buffer snapshots in O(1) amortized per pushed item.
+
+    The running sum is corrected by the appended and evicted items of each recorded push and
+    recomputed after `capacity` corrections, which bounds the floating point drift at O(1)
+    amortized cost. Minimum and maximum are kept in monotonic deques of (item number, item).
+    A snapshot that is not a recorded push of the last one is derived from scratch in O(n).
+    """
+
+    __slots__ = ("_snapshot", "_statistics", "_minima", "_maxima", "_corrections")
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[RingBufferSnapshot[Any]] = None
+        self._statistics: WindowStatistics = WindowStatistics(0, None, None, None)
+        self._minima: deque[tuple[int, Any]] = deque()
+        self._maxima: deque[tuple[int, Any]] = deque()
+        self._corrections: int = 0
+
+    def _add(self, number: int, item: Any) -> None:
+        minima, maxima = self._minima, self._maxima
+        while minima and not minima[-1][1] < item:
+            minima.pop()
+        minima.append((number, item))
+        while maxima and not maxima[-1][1] > item:
+            maxima.pop()
+        maxima.append((number, item))
+
+    def _rebuild(self, snapshot: RingBufferSnapshot[Any]) -> WindowStatistics:
+        self._minima.clear()
+        self._maxima.clear()
+        self._corrections = 0
+        if not snapshot.storage.is_numeric or len(snapshot) == 0:
+            return WindowStatistics(len(snapshot), None, None, None)
+        for number, item in zip(range(snapshot._start, snapshot._stop), snapshot): # type: ignore
+            self._add(number, item)
+        return WindowStatistics(len(snapshot), sum(snapshot), self._minima[0][1], self._maxima[0][1])
+
+    def statistics(self, snapshot: RingBufferSnapshot[Any]) -> WindowStatistics:
+        """Get the statistics of a ring buffer snapshot."""
+        if snapshot is self._snapshot:
+            return self._statistics
+
+        change = snapshot.changes_from(self._snapshot) if self._snapshot is not None else None
+        previous: WindowStatistics = self._statistics
+        if change is None or not snapshot.storage.is_numeric:
+            statistics = self._rebuild(snapshot)
+        elif len(snapshot) == 0:
+            statistics = WindowStatistics(0, None, None, None)
+        else:
+            first_new: int = snapshot._stop - len(change.appended) # type: ignore
+            for number, item in zip(range(first_new, snapshot._stop), change.appended): # type: ignore
+                self._add(number, item)
+            while self._minima[0][0] < snapshot._start: # type: ignore
+                self._minima.popleft()
+            while self._maxima[0][0] < snapshot._start: # type: ignore
+                self._maxima.popleft()
+            self._corrections += 1
+            if previous.total is None or self._corrections >= snapshot.capacity:
+                self._corrections = 0
+                total = sum(snapshot)
+            else:
+                total = previous.total + sum(change.appended) - sum(change.evicted)
+            statistics = WindowStatistics(len(snapshot), total, self._minima[0][1], self._maxima[0][1])
+
+        self._snapshot = snapshot
+        self._statistics = statistics
+        return statistics
+
+
+class RingBufferAppendPublisher(Publisher, Generic[T]):
+    """
+    A Publisher that carries the latest push to a ring buffer.
+
+    Subscribers and callbacks read `append` when they are notified. The publisher
+    is owned by an XRingBuffer and published after every push.
+
+    Example:
+        >>> samples = XRingBuffer(capacity=3)
+        >>> samples.append_publisher.add_subscriber(lambda: print(samples.append_publisher.append))
+        >>> samples.push(1.0)
+        RingBufferAppend(appended=(1.0,), evicted=())
+    """
+
+    def __init__(
+        self,
+        preferred_publish_mode: Literal["async", "sync", "direct", "off"] = "sync",
+        logger: Optional[Logger] = None
+        ) -> None:
+        super().__init__(preferred_publish_mode=preferred_publish_mode, logger=logger)
+        self._append: RingBufferAppend[T] = RingBufferAppend((), ())
+
+    @property
+    def append(self) -> RingBufferAppend[T]:
+        """
+        Get the latest published push.
+        """
+        return self._append
+
+    def publish_append(self, append: RingBufferAppend[T], mode: Literal["async", "sync", "direct", "off", None] = None) -> None:
+        """
+        Store the push and publish it to all subscribers.
+        """
+        self._append = append
+        self.publish(mode)
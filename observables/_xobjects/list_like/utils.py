@@ -2,6 +2,9 @@ from typing import TypeVar
 from collections.abc import Iterable
 from itertools import islice
 
+from .list_change import ListChange, diff_list_values
+from .persistent_vector import PersistentVector
+
 T = TypeVar("T")
 
 def can_be_list(value: Iterable[T]) -> bool:
@@ -11,4 +14,20 @@ def can_be_list(value: Iterable[T]) -> bool:
         next(islice(iter(value), 0, 1), None)
         return True
     except Exception:
-        return False
\ No newline at end of file
+        return False
+
+def list_changes(previous: Iterable[T], current: Iterable[T]) -> tuple[ListChange[T], ...]:
+    """
+    Get the splices that turn `previous` into `current`.
+
+    If `current` is a PersistentVector created by an edit of `previous`, the recorded
+    splices are returned in O(k). Otherwise the values are diffed in O(n).
+
+    Example:
+        >>> hook.add_listener(lambda: view.patch(list_changes(hook.previous_value, hook.value)))
+    """
+    if isinstance(current, PersistentVector):
+        recorded = current.changes_from(previous)
+        if recorded is not None:
+            return recorded
+    return diff_list_values(previous, current)
@@ -0,0 +1,74 @@
+"""
+Window Index - Find the key windows [lower, upper) that a change of a sorted list touches
+
+The distinct finite bounds of all windows split the keys into segments, and each
+segment lists the windows covering it. The windows overlapping the keys from
+`first` to `last` are then found by bisecting the bounds and reading the segments
+in between, instead of checking every window.
+
+Example:
+    >>> index = WindowIndex()
+    >>> index.add("low", None, 10)
+    >>> index.add("mid", 10, 20)
+    >>> index.add("high", 20, None)
+    >>> sorted(index.overlapping(12, 15))
+    ['mid']
+    >>> sorted(index.overlapping(5, 10))
+    ['low', 'mid']
+"""
+
+from typing import Any, Generic, TypeVar
+from bisect import bisect_right
+
+W = TypeVar("W")
+
+
+class WindowIndex(Generic[W]):
+    """
+    Index of windows [lower, upper) of keys by position in the key order (None: unbounded).
+
+    Adding or removing windows only marks the index as outdated; the segments are rebuilt on
+    the next lookup. A lookup costs O(log b) for b bounds plus the segments and windows it
+    reads. Windows nested in many others are listed in every segment they cover.
+    """
+
+    def __init__(self) -> None:
+        self._windows: dict[W, tuple[Any, Any]] = {}
+        self._bounds: list[Any] = []
+        self._segments: list[list[W]] = [[]]
+        """Segment i holds the windows covering the keys in [bounds[i - 1], bounds[i])."""
+        self._outdated: bool = False
+
+    def add(self, window: W, lower: Any, upper: Any) -> None:
+        """Add a window for the keys in [lower, upper)."""
+        self._windows[window] = (lower, upper)
+        self._outdated = True
+
+    def discard(self, window: W) -> None:
+        """Remove a window, if it is in the index."""
+        if self._windows.pop(window, None) is not None:
+            self._outdated = True
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def overlapping(self, first: Any, last: Any) -> set[W]:
+        """Get the windows containing any key from `first` to `last` (both inclusive)."""
+        if self._outdated:
+            self._rebuild()
+        found: set[W] = set()
+        for segment in self._segments[bisect_right(self._bounds, first):bisect_right(self._bounds, last) + 1]:
+            found.update(segment)
+        return found
+
+    def _rebuild(self) -> None:
+        bounds: list[Any] = sorted({bound for window_bounds in self._windows.values() for bound in window_bounds if bound is not None})
+        segments: list[list[W]] = [[] for _ in range(len(bounds) + 1)]
+        for window, (lower, upper) in self._windows.items():
+            start: int = 0 if lower is None else bisect_right(bounds, lower)
+            stop: int = len(segments) if upper is None else bisect_right(bounds, upper)
+            for segment in segments[start:stop]:
+                segment.append(window)
+        self._bounds = bounds
+        self._segments = segments
+        self._outdated = False
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, Sequence, Callable, Literal, Optional, Any
+from typing import Generic, TypeVar, Sequence, Callable, Literal, Optional, Any, Mapping
 from collections.abc import Iterable, Iterator
 from logging import Logger
 
@@ -7,7 +7,10 @@ from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
 from ..._nexus_system.submission_error import SubmissionError
 from .protocols import ObservableListProtocol
-from .utils import can_be_list
+from .utils import can_be_list, list_changes
+from .persistent_vector import PersistentVector
+from .list_change import ListChange, ListChangePublisher
+from .list_view import ListView
 
 T = TypeVar("T")
   
@@ -17,6 +20,15 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
     Acting like a list.
 
     The hooks store an Iterable - allowing them to connect to any other iterable. But values requested from this object will be a list.
+
+    Internally, the list is stored as a PersistentVector. Single-element edits (append, insert,
+    pop, item assignment and deletion) therefore cost O(log n) time and memory, previous values
+    stay intact (e.g. for `previous_stored_value`) and the equality check of the nexus system only
+    has to inspect the changed chunks.
+
+    Every change is also described by compact splices (`ListChange`), which are delivered to
+    change listeners (`add_change_listener`), to the `change_publisher` and can be read from
+    `last_changes` or, for any hook, via `list_changes(hook.previous_value, hook.value)`.
     """
     def __init__(self, observable_or_hook_or_value: Iterable[T] | Hook[Iterable[T]] | ReadOnlyHook[Iterable[T]] | None = None, logger: Optional[Logger] = None) -> None: # type: ignore
         """
@@ -43,7 +55,7 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
             ValueError: If the value is not a valid sequence (validation failure).
         
         Note:
-            Values are **automatically converted to immutable tuples** by the nexus system.
+            Values are **converted to an immutable PersistentVector**.
             This ensures that external code cannot modify the internal state. All
             changes go through the observable's methods and trigger proper notifications.
         
@@ -70,16 +82,18 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
             initial_value: Sequence[T] = ()
             hook: Optional[ManagedHookProtocol[Iterable[T]]] = None
         elif isinstance(observable_or_hook_or_value, ObservableListProtocol):
-            initial_value = observable_or_hook_or_value.value # type: ignore
+            initial_value = observable_or_hook_or_value.value_hook.value # type: ignore
             hook = observable_or_hook_or_value.value_hook # type: ignore
         elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
             initial_value = observable_or_hook_or_value.value # type: ignore
             hook = observable_or_hook_or_value # type: ignore
         else:
-            # Pass sequence directly - nexus system will convert to tuple
-            initial_value = observable_or_hook_or_value # type: ignore
+            initial_value = PersistentVector(observable_or_hook_or_value)
             hook = None
 
+        self._change_listeners: set[Callable[[tuple[ListChange[T], ...]], None]] = set()
+        self._change_publisher: Optional[ListChangePublisher[T]] = None
+
         super().__init__(
             initial_hook_values={"value": initial_value}, # type: ignore
             verification_method=lambda x: (True, "Verification method passed") if can_be_list(x) else (False, "Value has not been converted to a list!"), # type: ignore
@@ -90,6 +104,121 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         if hook is not None:
             self._join("value", hook, "use_target_value") # type: ignore
 
+    def _get_vector(self) -> PersistentVector[T]:
+        """
+        Get the stored list as a PersistentVector.
+
+        The hook may hold any iterable (e.g. if it was joined with a hook holding a plain list).
+        In that case the value is converted once; the next edit stores the vector in the nexus.
+        """
+        current = self._primary_hooks["value"].value
+        if isinstance(current, PersistentVector):
+            return current # type: ignore
+        return PersistentVector(current) # type: ignore
+
+    def _get_sequence(self) -> Sequence[T]:
+        """
+        Get the stored list value as an indexable sequence without copying it if possible.
+        """
+        current = self._primary_hooks["value"].value
+        if isinstance(current, (PersistentVector, list, tuple)):
+            return current # type: ignore
+        return PersistentVector(current) # type: ignore
+
+    def _submit_vector(self, new_vector: PersistentVector[T]) -> None:
+        """
+        Submit a new PersistentVector as the list value.
+        """
+        success, msg = self._submit_value("value", new_vector)
+        if not success:
+            raise SubmissionError(msg, new_vector, "value")
+
+    def _update_vector(self, update: Callable[[PersistentVector[T]], PersistentVector[T]]) -> None:
+        """
+        Submit the vector computed from the current vector by the update (compare-and-set).
+
+        Edits of the list from several threads are not lost: if the list was changed between
+        reading and submitting, the update is applied again to the new vector. Returning the
+        current vector from the update submits nothing.
+        """
+        new_vectors: list[PersistentVector[T]] = []
+        success, msg = self._update_value("value", self._as_value_update(update, new_vectors)) # type: ignore
+        if not success:
+            raise SubmissionError(msg, new_vectors[-1] if new_vectors else None, "value")
+
+    @staticmethod
+    def _as_value_update(update: Callable[[PersistentVector[T]], PersistentVector[T]], new_vectors: list[PersistentVector[T]]) -> Callable[[Any], Any]:
+        """
+        Turn an update of the vector into an update of the stored value (which may be any iterable).
+
+        The computed vectors are appended to `new_vectors`, for the error message of a rejected update.
+        """
+        def update_function(current: Any) -> Any:
+            vector: PersistentVector[T] = current if isinstance(current, PersistentVector) else PersistentVector(current) # type: ignore
+            new_vector: PersistentVector[T] = update(vector)
+            new_vectors.append(new_vector)
+            return current if new_vector is vector else new_vector
+        return update_function
+
+    #########################################################
+    # Change records
+    #########################################################
+
+    @property
+    def last_changes(self) -> tuple[ListChange[T], ...]:
+        """
+        Get the splices of the latest change of the list value.
+
+        Applying them in order to the previous value yields the current value. For edits made
+        through this (or a joined) list the recorded splices are returned in O(k), otherwise the
+        previous and current value are diffed.
+        """
+        value_hook = self._primary_hooks["value"]
+        return list_changes(value_hook.previous_value, value_hook.value) # type: ignore
+
+    @property
+    def change_publisher(self) -> ListChangePublisher[T]:
+        """
+        Get the publisher that publishes the splices of every change (see `ListChangePublisher.changes`).
+
+        The publisher is created on first access; before that, no splices are published.
+        """
+        if self._change_publisher is None:
+            self._change_publisher = ListChangePublisher(logger=self._logger)
+        return self._change_publisher
+
+    def add_change_listener(self, *callbacks: Callable[[tuple[ListChange[T], ...]], None]) -> None:
+        """
+        Add one or more listeners that are called with the splices of every change.
+        """
+        for callback in callbacks:
+            self._change_listeners.add(callback)
+
+    def remove_change_listener(self, *callbacks: Callable[[tuple[ListChange[T], ...]], None]) -> None:
+        """
+        Remove one or more change listeners. Unknown callbacks are ignored.
+        """
+        for callback in callbacks:
+            self._change_listeners.discard(callback)
+
+    def _notify_listeners(self) -> None:
+        super()._notify_listeners()
+        publish: bool = self._change_publisher is not None and self._change_publisher._has_receivers() # type: ignore
+        if len(self._change_listeners) == 0 and not publish:
+            return
+        changes = self.last_changes
+        if len(changes) == 0:
+            return
+        for callback in list(self._change_listeners):
+            try:
+                callback(changes)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                self._log("notify_change_listeners", False, f"Error in change listener callback: {e}")
+        if publish:
+            self._change_publisher.publish_changes(changes) # type: ignore
+
     #########################################################
     # ObservableListProtocol implementation
     #########################################################
@@ -107,6 +236,8 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
     def value(self) -> list[T]: # type: ignore
         """
         Get the list value as mutable list (copied from the hook).
+
+        This copies all items. For reads use `view` or the sequence dunder methods instead.
         """
         value = self._primary_hooks["value"].value
         return list(value)
@@ -119,10 +250,21 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         """
         Change the list value (lambda-friendly method).
         """
-        success, msg = self._submit_value("value", list(new_value))
+        if not isinstance(new_value, PersistentVector):
+            new_value = PersistentVector(new_value)
+        success, msg = self._submit_value("value", new_value)
         if not success:
             raise SubmissionError(msg, new_value, "value")
 
+    @property
+    def view(self) -> ListView[T]:
+        """
+        Get a read-only, zero-copy view on the current list value.
+
+        The view shows the value at the time of access and does not follow later changes.
+        """
+        return ListView(self._get_sequence())
+
     #-------------------------------- length --------------------------------
 
     @property
@@ -148,48 +290,42 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         """
         Add an item to the end of the list.
         
-        Creates a new tuple with the appended item.
+        Creates a new vector with the appended item in O(log n).
         
         Args:
             item: The item to add to the list
         """
-        current_value = self._primary_hooks["value"].value
-        new_list: list[T] = list(current_value) + [item] # type: ignore
-        self.change_value(new_list)
+        self._update_vector(lambda vector: vector.append(item))
     
     def extend(self, iterable: Iterable[T]) -> None:
         """
         Extend the list by appending elements from the iterable.
         
-        Creates a new tuple with the extended elements.
+        Creates a new vector with the extended elements in O(k log n) for k elements.
         
         Args:
             iterable: The iterable containing elements to add
         """
-        current_value = self._primary_hooks["value"].value
-        new_list = list(current_value) + list(iterable) # type: ignore
-        self.change_value(new_list)
+        items: list[T] = list(iterable)
+        self._update_vector(lambda vector: vector.extend(items))
     
     def insert(self, index: int, item: T) -> None:
         """
         Insert an item at a given position.
         
-        Creates a new tuple with the item inserted.
+        Creates a new vector with the item inserted in O(log n).
         
         Args:
             index: The position to insert the item at
             item: The item to insert
         """
-        current = self._primary_hooks["value"].value # type: ignore
-        new_list = list(current)
-        new_list.insert(index, item)
-        self.change_value(new_list)
+        self._update_vector(lambda vector: vector.insert(index, item))
     
     def remove(self, item: T) -> None:
         """
         Remove the first occurrence of a value from the list.
         
-        Creates a new tuple without the first occurrence of the item.
+        Creates a new vector without the first occurrence of the item.
         
         Args:
             item: The item to remove from the list
@@ -197,20 +333,19 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Raises:
             ValueError: If the item is not in the list
         """
-        current = self._primary_hooks["value"].value # type: ignore
-        if item not in current:
-            raise ValueError(f"{item} not in list")
-        
-        # Create new list without the first occurrence
-        new_list = list(current)
-        new_list.remove(item)
-        self.change_value(new_list)
+        def remove_item(vector: PersistentVector[T]) -> PersistentVector[T]:
+            try:
+                index = vector.index(item)
+            except ValueError:
+                raise ValueError(f"{item} not in list")
+            return vector.delete(index)
+        self._update_vector(remove_item)
     
     def pop(self, index: int = -1) -> T:
         """
         Remove and return the item at the specified index.
         
-        Creates a new tuple without the popped item.
+        Creates a new vector without the popped item in O(log n).
         
         Args:
             index: The index of the item to remove (default: -1, last item)
@@ -221,11 +356,14 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Raises:
             IndexError: If the index is out of range
         """
-        current = self._primary_hooks["value"].value # type: ignore
-        new_list = list(current)
-        item: T = new_list.pop(index)
-        self.change_value(new_list)
-        return item
+        popped: list[T] = []
+        def pop_item(vector: PersistentVector[T]) -> PersistentVector[T]:
+            if len(vector) == 0:
+                raise IndexError("pop from empty list")
+            popped[:] = [vector[index]]
+            return vector.delete(index)
+        self._update_vector(pop_item)
+        return popped[0]
     
     def clear(self) -> None:
         """
@@ -233,30 +371,27 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         
         Creates an empty list.
         """
-        if self._primary_hooks["value"].value:
-            self.change_value([])
+        self._update_vector(lambda vector: PersistentVector() if len(vector) > 0 else vector)
     
     def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
         """
         Sort the list in place.
         
-        Creates a new sorted tuple.
+        Creates a new sorted vector.
         
         Args:
             key: Optional function to extract comparison key from each element
             reverse: If True, sort in descending order (default: False)
         """
-        current_value = self._primary_hooks["value"].value
-        self.change_value(sorted(current_value, key=key, reverse=reverse)) # type: ignore
+        self._update_vector(lambda vector: PersistentVector(sorted(vector, key=key, reverse=reverse))) # type: ignore
     
     def reverse(self) -> None:
         """
         Reverse the elements of the list in place.
         
-        Creates a new tuple with elements in reversed order.
+        Creates a new vector with elements in reversed order.
         """
-        current_value = self._primary_hooks["value"].value
-        self.change_value(reversed(current_value)) # type: ignore
+        self._update_vector(lambda vector: PersistentVector(reversed(vector))) # type: ignore
     
     def count(self, item: T) -> int:
         """
@@ -268,7 +403,7 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Returns:
             The number of times the item appears in the list
         """
-        return list(self._primary_hooks["value"].value).count(item)
+        return self._get_sequence().count(item)
     
     def index(self, item: T, start: int = 0, stop: Optional[int] = None) -> int:
         """
@@ -285,17 +420,78 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Raises:
             ValueError: If the item is not found in the specified range
         """
-        list_value = list(self._primary_hooks["value"].value)
-        if stop is None:
-            return list_value.index(item, start)
-        else:
-            return list_value.index(item, start, stop)
+        sequence = self._get_sequence()
+        try:
+            if stop is None:
+                return sequence.index(item, start)
+            return sequence.index(item, start, stop)
+        except ValueError:
+            raise ValueError(f"{item} is not in list") from None
+
+    #########################################################
+    # Asynchronous methods
+    #########################################################
+
+    # Variants of the mutating methods for coroutines: the submission does not block the
+    # event loop and the reactions of subscribers are awaited (see NexusManager.submit_values_async).
+
+    async def _submit_vector_async(self, new_vector: PersistentVector[T]) -> None:
+        """
+        Submit a new PersistentVector as the list value from a coroutine.
+        """
+        success, msg = await self._submit_values_async({"value": new_vector})
+        if not success:
+            raise SubmissionError(msg, new_vector, "value")
+
+    async def change_value_async(self, new_value: Iterable[T]) -> None:
+        """
+        Change the list value from a coroutine.
+        """
+        if not isinstance(new_value, PersistentVector):
+            new_value = PersistentVector(new_value)
+        await self._submit_vector_async(new_value) # type: ignore
+
+    async def _update_vector_async(self, update: Callable[[PersistentVector[T]], PersistentVector[T]]) -> None:
+        """
+        Submit the vector computed from the current vector by the update from a coroutine.
+
+        The update is applied again if the list was changed while the submission waited.
+        """
+        new_vectors: list[PersistentVector[T]] = []
+        success, msg = await self._update_value_async("value", self._as_value_update(update, new_vectors)) # type: ignore
+        if not success:
+            raise SubmissionError(msg, new_vectors[-1] if new_vectors else None, "value")
+
+    async def append_async(self, item: T) -> None:
+        """
+        Add an item to the end of the list from a coroutine.
+        """
+        await self._update_vector_async(lambda vector: vector.append(item))
+
+    async def extend_async(self, iterable: Iterable[T]) -> None:
+        """
+        Extend the list by appending elements from the iterable from a coroutine.
+        """
+        items: list[T] = list(iterable)
+        await self._update_vector_async(lambda vector: vector.extend(items))
+
+    async def insert_async(self, index: int, item: T) -> None:
+        """
+        Insert an item at a given position from a coroutine.
+        """
+        await self._update_vector_async(lambda vector: vector.insert(index, item))
+
+    async def clear_async(self) -> None:
+        """
+        Remove all items from the list from a coroutine.
+        """
+        await self._update_vector_async(lambda vector: PersistentVector() if len(vector) > 0 else vector)
     
     def __str__(self) -> str:
-        return f"OL(value={self._primary_hooks['value'].value})"
+        return f"OL(value={list(self._primary_hooks['value'].value)})"
     
     def __repr__(self) -> str:
-        return f"ObservableList({self._primary_hooks['value'].value})"
+        return f"ObservableList({list(self._primary_hooks['value'].value)})"
     
     def __len__(self) -> int:
         """
@@ -304,60 +500,89 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Returns:
             The number of items in the list
         """
-        return len(list(self._primary_hooks["value"].value))
+        return len(self._get_sequence())
     
-    def __getitem__(self, index: int) -> T:
+    def __getitem__(self, index: int|slice) -> Any:
         """
         Get an item at the specified index or slice.
+
+        Item access is O(log n) and does not copy the list. A slice copies only the selected
+        items into a new list; use `view[...]` for a slice without any copy.
         
         Args:
             index: Integer index or slice object
             
         Returns:
-            The item at the index or a slice of items
+            The item at the index or a list of the sliced items
             
         Raises:
             IndexError: If the index is out of range
         """
-        return list(self._primary_hooks["value"].value)[index]
+        sequence = self._get_sequence()
+        if isinstance(index, slice):
+            return list(ListView(sequence)[index])
+        try:
+            return sequence[index]
+        except IndexError:
+            raise IndexError("list index out of range") from None
     
-    def __setitem__(self, index: int, value: T) -> None:
+    def __setitem__(self, index: int|slice, value: T) -> None:
         """
         Set an item at the specified index.
         
-        Creates a new tuple with the item replaced.
+        Creates a new vector with the item replaced in O(log n). Slices are supported as well,
+        but rebuild the whole vector.
         
         Args:
-            index: Integer index
+            index: Integer index or slice object
             value: The value to set
             
         Raises:
             IndexError: If the index is out of range
         """
-        current = self._primary_hooks["value"].value # type: ignore
-        # Modify list
-        new_list = list(current)
-        new_list[index] = value
-        if new_list != current: # type: ignore
-            self.change_value(new_list)
+        new_items = tuple(value) if isinstance(index, slice) else () # type: ignore
+        def set_item(current: PersistentVector[T]) -> PersistentVector[T]:
+            if isinstance(index, slice):
+                new_list = list(current)
+                start, stop, step = index.indices(len(current))
+                new_list[index] = new_items
+                if step == 1:
+                    changes = (ListChange(start, max(stop - start, 0), new_items),)
+                else:
+                    changes = tuple(ListChange(i, 1, (item,)) for i, item in zip(range(start, stop, step), new_items))
+                new_vector = PersistentVector(new_list)._record_origin(current, changes) # type: ignore
+            else:
+                new_vector = current.set(index, value)
+            return new_vector if new_vector != current else current
+        self._update_vector(set_item)
     
-    def __delitem__(self, index: int) -> None:
+    def __delitem__(self, index: int|slice) -> None:
         """
         Delete an item at the specified index.
         
-        Creates a new tuple without the deleted item.
+        Creates a new vector without the deleted item in O(log n). Slices are supported as well,
+        but rebuild the whole vector.
         
         Args:
-            index: Integer index
+            index: Integer index or slice object
             
         Raises:
             IndexError: If the index is out of range
         """
-        current = self._primary_hooks["value"].value # type: ignore
-        # Create list without the item at index
-        new_list = list(current)
-        del new_list[index]
-        self.change_value(new_list)
+        def delete_item(current: PersistentVector[T]) -> PersistentVector[T]:
+            if not isinstance(index, slice):
+                return current.delete(index)
+            indices = range(*index.indices(len(current)))
+            if len(indices) == 0:
+                return current
+            new_list = list(current)
+            del new_list[index]
+            if indices.step == 1:
+                changes = (ListChange(indices.start, len(indices), ()),)
+            else:
+                changes = tuple(ListChange(i, 1, ()) for i in sorted(indices, reverse=True))
+            return PersistentVector(new_list)._record_origin(current, changes) # type: ignore
+        self._update_vector(delete_item)
     
     def __contains__(self, item: T) -> bool:
         """
@@ -387,7 +612,7 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Returns:
             A reverse iterator that yields each item in the list in reverse order
         """
-        return reversed(list(self._primary_hooks["value"].value))
+        return reversed(self._get_sequence())
     
     def __eq__(self, other: Any) -> bool:
         """
@@ -494,9 +719,9 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
             other: The number of times to repeat the list
             
         Returns:
-            A new tuple with the original items repeated
+            A new list with the original items repeated
         """
-        return self._primary_hooks["value"].value * other # type: ignore
+        return list(self._primary_hooks["value"].value) * other # type: ignore
     
     def __rmul__(self, other: int) -> tuple[T, ...]:
         """
@@ -506,9 +731,9 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
             other: The number of times to repeat the list
             
         Returns:
-            A new tuple with the original items repeated
+            A new list with the original items repeated
         """
-        return other * self._primary_hooks["value"].value # type: ignore
+        return other * list(self._primary_hooks["value"].value) # type: ignore
     
     def __hash__(self) -> int:
         """
@@ -517,4 +742,14 @@ class ObservableList(ComplexObservableBase[Literal["value"], Literal["length"],
         Returns:
             Hash value of the tuple
         """
-        return hash(self._primary_hooks["value"].value) # type: ignore
\ No newline at end of file
+        return hash(self._primary_hooks["value"].value) # type: ignore
+
+    #########################################################
+    # ObservableSerializable implementation
+    #########################################################
+
+    def get_values_for_serialization(self) -> Mapping[Literal["value", "length"], Any]:
+        return {"value": list(self._primary_hooks["value"].value)}
+
+    def set_values_from_serialization(self, values: Mapping[Literal["value", "length"], Any]) -> None:
+        self.change_value(values["value"])
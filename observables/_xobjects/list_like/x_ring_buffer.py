@@ -0,0 +1,306 @@
+from typing import Generic, TypeVar, Literal, Optional, Any, Mapping, Callable, overload
+from collections.abc import Iterable, Iterator
+from logging import Logger
+
+from ..._hooks.hook_aliases import Hook, ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._carries_hooks.x_complex_base import ComplexObservableBase
+from ..._nexus_system.submission_error import SubmissionError
+from .ring_buffer import RingBufferSnapshot, RingBufferAppend, RingBufferAppendPublisher, WindowStatistics, IncrementalWindowStatistics
+
+T = TypeVar("T")
+
+
+class ObservableRingBuffer(ComplexObservableBase[Literal["values"], Literal["length", "latest", "statistics"], Any, Any, "ObservableRingBuffer"], Generic[T]):
+    """
+    A fixed-capacity buffer of the latest pushed items, e.g. samples of a measurement.
+
+    The items are written into preallocated storage (a stdlib `array` for the given typecode,
+    or a list if the typecode is None). Once the buffer is full, every push overwrites the
+    oldest item, so pushing costs O(1) per item and the memory stays constant no matter how
+    long the process runs.
+
+    The value of the buffer is a `RingBufferSnapshot`, a read-only sequence that shares the
+    storage instead of copying it. Later pushes overwrite the oldest items of older snapshots;
+    reading such an item raises an IndexError (see `RingBufferSnapshot`).
+
+    The secondary hooks `length`, `latest` and `statistics` (count, sum, mean, min and max of
+    the items, see `WindowStatistics`) are updated from the pushed and evicted items in O(1)
+    amortized per item. Every push is delivered as a `RingBufferAppend` to append listeners
+    (`add_append_listener`) and to the `append_publisher`.
+
+    Example:
+        >>> samples = ObservableRingBuffer(capacity=3)
+        >>> samples.push_many([1.0, 2.0, 3.0, 4.0])
+        >>> list(samples)
+        [2.0, 3.0, 4.0]
+        >>> samples.statistics.mean
+        3.0
+    """
+
+    def __init__(
+        self,
+        observable_or_hook_or_value: "Iterable[T] | Hook[Any] | ReadOnlyHook[Any] | ObservableRingBuffer[T] | None" = None,
+        capacity: Optional[int] = None,
+        typecode: Optional[str] = "d",
+        logger: Optional[Logger] = None) -> None:
+        """
+        Initialize an ObservableRingBuffer.
+
+        Args:
+            observable_or_hook_or_value: The initial items (only the last `capacity` are kept),
+                a hook holding a RingBufferSnapshot, another ObservableRingBuffer to join with,
+                or None for an empty buffer
+            capacity: The maximum number of items. Required unless joining with a buffer or hook;
+                defaults to the number of initial items if only these are given.
+            typecode: The stdlib `array` typecode of the storage (default "d" for floats), or None
+                to store arbitrary objects in a list. Statistics are only computed for numeric typecodes.
+            logger: Optional logger for debugging
+
+        Raises:
+            ValueError: If no positive capacity can be determined.
+        """
+
+        if isinstance(observable_or_hook_or_value, ObservableRingBuffer):
+            initial_value: RingBufferSnapshot[T] = observable_or_hook_or_value.values_hook.value # type: ignore
+            hook: Optional[ManagedHookProtocol[Any]] = observable_or_hook_or_value.values_hook # type: ignore
+        elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
+            initial_value = observable_or_hook_or_value.value # type: ignore
+            hook = observable_or_hook_or_value # type: ignore
+        else:
+            items: tuple[T, ...] = tuple(observable_or_hook_or_value) if observable_or_hook_or_value is not None else ()
+            if capacity is None:
+                capacity = len(items)
+            initial_value = RingBufferSnapshot.from_items(items, capacity, typecode)
+            hook = None
+
+        def is_valid_value(x: Mapping[Literal["values"], Any]) -> tuple[bool, str]:
+            value = x["values"]
+            if not isinstance(value, RingBufferSnapshot):
+                return False, "Value is not a RingBufferSnapshot"
+            if not value.is_intact():
+                return False, "The snapshot has items that were overwritten by later pushes"
+            return True, "Verification method passed"
+
+        # The window statistics are maintained from the recorded pushes of the snapshots
+        statistics = IncrementalWindowStatistics()
+
+        self._append_listeners: set[Callable[[RingBufferAppend[T]], None]] = set()
+        self._append_publisher: Optional[RingBufferAppendPublisher[T]] = None
+
+        super().__init__(
+            initial_hook_values={"values": initial_value},
+            verification_method=is_valid_value,
+            secondary_hook_callbacks={
+                "length": lambda x: len(x["values"]),
+                "latest": lambda x: x["values"][-1] if len(x["values"]) > 0 else None,
+                "statistics": lambda x: statistics.statistics(x["values"])
+            },
+            logger=logger
+        )
+
+        if hook is not None:
+            self._join("values", hook, "use_target_value") # type: ignore
+
+    def _get_snapshot(self) -> RingBufferSnapshot[T]:
+        return self._primary_hooks["values"].value # type: ignore
+
+    def _submit_snapshot(self, new_snapshot: RingBufferSnapshot[T]) -> None:
+        success, msg = self._submit_value("values", new_snapshot)
+        if not success:
+            raise SubmissionError(msg, new_snapshot, "values")
+
+    #########################################################
+    # Pushing
+    #########################################################
+
+    def _push(self, items: tuple[T, ...]) -> None:
+        if len(items) == 0:
+            return
+        current = self._get_snapshot()
+        if not current.is_latest():
+            # The value was set to an older snapshot: continue on a copy, so newer snapshots stay intact
+            current = RingBufferSnapshot.from_items(current, current.capacity, current.storage.typecode)
+        new_snapshot = current.push(items)
+        try:
+            self._submit_snapshot(new_snapshot)
+        except BaseException:
+            if new_snapshot.is_latest():
+                new_snapshot._undo_push(current) # type: ignore
+            raise
+
+    def push(self, item: T) -> None:
+        """
+        Append an item, overwriting the oldest item if the buffer is full. Costs O(1).
+
+        Raises:
+            SubmissionError: If the submission is rejected (the buffer is left unchanged).
+        """
+        self._push((item,))
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """
+        Append several items in one submission. Costs O(k) for k items.
+
+        If more than `capacity` items are pushed, only the last `capacity` are kept.
+
+        Raises:
+            SubmissionError: If the submission is rejected (the buffer is left unchanged).
+        """
+        self._push(tuple(items))
+
+    def clear(self) -> None:
+        """Remove all items. Costs O(1)."""
+        current = self._get_snapshot()
+        if len(current) > 0:
+            self._submit_snapshot(current.cleared())
+
+    def change_values(self, items: Iterable[T]) -> None:
+        """Replace all items (lambda-friendly method). Only the last `capacity` items are kept."""
+        current = self._get_snapshot()
+        self._submit_snapshot(RingBufferSnapshot.from_items(items, current.capacity, current.storage.typecode))
+
+    #########################################################
+    # Values
+    #########################################################
+
+    @property
+    def values_hook(self) -> Hook[Any]:
+        """Get the hook for the items (contains a RingBufferSnapshot)."""
+        return self._primary_hooks["values"] # type: ignore
+
+    @property
+    def values(self) -> list[T]:
+        """Get a copy of the items, oldest first."""
+        return self._get_snapshot().tolist()
+
+    @values.setter
+    def values(self, items: Iterable[T]) -> None:
+        self.change_values(items)
+
+    @property
+    def snapshot(self) -> RingBufferSnapshot[T]:
+        """Get the items as a RingBufferSnapshot, without copying them."""
+        return self._get_snapshot()
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of items."""
+        return self._get_snapshot().capacity
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """Get the typecode of the storage (None if it stores arbitrary objects)."""
+        return self._get_snapshot().storage.typecode
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the next push evicts the oldest item."""
+        snapshot = self._get_snapshot()
+        return len(snapshot) == snapshot.capacity
+
+    def __len__(self) -> int:
+        return len(self._get_snapshot())
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int|slice) -> "T|list[T]":
+        return self._get_snapshot()[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._get_snapshot())
+
+    #########################################################
+    # Length, latest and statistics
+    #########################################################
+
+    @property
+    def length_hook(self) -> ReadOnlyHook[int]:
+        """Get the hook for the number of items."""
+        return self._secondary_hooks["length"] # type: ignore
+
+    @property
+    def length(self) -> int:
+        """Get the number of items."""
+        return self._secondary_hooks["length"].value # type: ignore
+
+    @property
+    def latest_hook(self) -> ReadOnlyHook[Optional[T]]:
+        """Get the hook for the latest pushed item (None if the buffer is empty)."""
+        return self._secondary_hooks["latest"] # type: ignore
+
+    @property
+    def latest(self) -> Optional[T]:
+        """Get the latest pushed item (None if the buffer is empty)."""
+        return self._secondary_hooks["latest"].value # type: ignore
+
+    @property
+    def statistics_hook(self) -> ReadOnlyHook[WindowStatistics]:
+        """Get the hook for the statistics of the items."""
+        return self._secondary_hooks["statistics"] # type: ignore
+
+    @property
+    def statistics(self) -> WindowStatistics:
+        """Get the statistics (count, sum, mean, min and max) of the items."""
+        return self._secondary_hooks["statistics"].value # type: ignore
+
+    #########################################################
+    # Append records
+    #########################################################
+
+    @property
+    def last_append(self) -> Optional[RingBufferAppend[T]]:
+        """Get the latest push, None if the latest change of the value was not a push."""
+        values_hook = self._primary_hooks["values"]
+        return self._get_snapshot().changes_from(values_hook.previous_value)
+
+    @property
+    def append_publisher(self) -> RingBufferAppendPublisher[T]:
+        """
+        Get the publisher that publishes every push (see `RingBufferAppendPublisher.append`).
+
+        The publisher is created on first access; before that, no pushes are published.
+        """
+        if self._append_publisher is None:
+            self._append_publisher = RingBufferAppendPublisher(logger=self._logger)
+        return self._append_publisher
+
+    def add_append_listener(self, *callbacks: Callable[[RingBufferAppend[T]], None]) -> None:
+        """
+        Add one or more listeners that are called with every push.
+        """
+        for callback in callbacks:
+            self._append_listeners.add(callback)
+
+    def remove_append_listener(self, *callbacks: Callable[[RingBufferAppend[T]], None]) -> None:
+        """
+        Remove one or more append listeners. Unknown callbacks are ignored.
+        """
+        for callback in callbacks:
+            self._append_listeners.discard(callback)
+
+    def _notify_listeners(self) -> None:
+        super()._notify_listeners()
+        publish: bool = self._append_publisher is not None and self._append_publisher._has_receivers() # type: ignore
+        if len(self._append_listeners) == 0 and not publish:
+            return
+        append = self.last_append
+        if append is None or len(append.appended) == 0:
+            return
+        for callback in list(self._append_listeners):
+            try:
+                callback(append)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                self._log("notify_append_listeners", False, f"Error in append listener callback: {e}")
+        if publish:
+            self._append_publisher.publish_append(append) # type: ignore
+
+    def __str__(self) -> str:
+        return f"ORB(values={self._get_snapshot().tolist()}, capacity={self.capacity})"
+
+    def __repr__(self) -> str:
+        return f"ObservableRingBuffer({self._get_snapshot().tolist()!r}, capacity={self.capacity})"
@@ -0,0 +1,601 @@
+from typing import Generic, TypeVar, Callable, Literal, Optional, Any, Mapping
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from logging import Logger
+import weakref
+
+from ..._hooks.hook_aliases import Hook, ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._carries_hooks.x_complex_base import ComplexObservableBase
+from ..._nexus_system.submission_error import SubmissionError
+from .utils import can_be_list
+from .persistent_vector import PersistentVector
+from .list_change import ListChange
+from .list_view import ListView
+from .window_index import WindowIndex
+
+T = TypeVar("T")
+
+_MERGE_THRESHOLD: int = 64
+"""Number of items above which `update` merges all items at once instead of inserting them one by one."""
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+@dataclass(frozen=True, slots=True)
+class _WindowHookKey:
+    """Hook key of a window hook. Wrapping the bounds keeps it apart from the "value", "length", "min" and "max" hook keys."""
+    lower: Any
+    upper: Any
+
+
+def _inserted_positions(changes: tuple[ListChange[Any], ...]) -> list[int]:
+    """
+    Get the positions of all items inserted by `changes` in the resulting list.
+
+    Splice indices refer to the list as it is after the preceding splices, so earlier positions
+    are shifted (or dropped, if removed again) by every later splice. O(k^2) for k splices.
+    """
+    positions: list[int] = []
+    for change in changes:
+        shift: int = len(change.inserted) - change.removed_count
+        end_of_removal: int = change.index + change.removed_count
+        positions = [p if p < change.index else p + shift for p in positions if p < change.index or p >= end_of_removal]
+        positions.extend(range(change.index, change.index + len(change.inserted)))
+    return positions
+
+
+class ObservableSortedList(ComplexObservableBase[Literal["value"], Literal["length", "min", "max"], Iterable[T], Any, "ObservableSortedList"], Generic[T]):
+    """
+    Acting like a sorted list (optionally keyed and unique).
+
+    The items are kept sorted by `key` (the items themselves if no key is given). The list is
+    stored as a PersistentVector, so the position of an item is found by bisection and `add`,
+    `remove` and `discard` cost O(log n) per probe and edit - no item is copied and previous
+    values stay intact.
+
+    Besides the `length`, `min` and `max` hooks, the list offers window hooks for the items whose
+    key is in [lower, upper) (`window_hook`). A window hook is only updated (and its listeners are
+    only notified) if a change actually touches its window; an edit inside the window is applied
+    to the window by the same splice instead of slicing it again.
+
+    Example:
+        >>> scores = ObservableSortedList([30, 10, 20])
+        >>> top = scores.window_hook(25, None)
+        >>> scores.add(40)
+        >>> scores.value, top.value
+        ([10, 20, 30, 40], PersistentVector([30, 40]))
+        >>> scores.add(15)  # Outside the window: `top` is not notified
+    """
+
+    def __init__(self, observable_or_hook_or_value: Iterable[T] | Hook[Iterable[T]] | ReadOnlyHook[Iterable[T]] | None = None, key: Optional[Callable[[T], Any]] = None, unique: bool = False, logger: Optional[Logger] = None) -> None: # type: ignore
+        """
+        Initialize an ObservableSortedList.
+
+        Args:
+            observable_or_hook_or_value: The initial items (in any order), a hook holding a sorted
+                iterable, another ObservableSortedList to join with, or None for an empty list
+            key: Optional function to extract the sort key from each item (default: the item)
+            unique: If True, no two items may have the same key. Adding an item whose key is
+                already present leaves the list unchanged.
+            logger: Optional logger for debugging
+
+        Raises:
+            ValueError: If the value of a hook to join with is not sorted (or not unique).
+        """
+
+        self._key: Callable[[T], Any] = key if key is not None else _identity
+        self._unique: bool = unique
+
+        if observable_or_hook_or_value is None:
+            initial_value: Iterable[T] = PersistentVector()
+            hook: Optional[ManagedHookProtocol[Iterable[T]]] = None
+        elif isinstance(observable_or_hook_or_value, ObservableSortedList):
+            initial_value = observable_or_hook_or_value.value_hook.value # type: ignore
+            hook = observable_or_hook_or_value.value_hook # type: ignore
+        elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
+            initial_value = observable_or_hook_or_value.value # type: ignore
+            hook = observable_or_hook_or_value # type: ignore
+        else:
+            initial_value = self._sorted_vector(observable_or_hook_or_value)
+            hook = None
+
+        self_ref: weakref.ref[ObservableSortedList[T]] = weakref.ref(self)
+
+        def is_valid_value(x: Mapping[Literal["value"], Iterable[T]]) -> tuple[bool, str]:
+            value = x["value"]
+            if not can_be_list(value):
+                return False, "Value has not been converted to a list!"
+            owner = self_ref()
+            if owner is None:
+                return True, "Verification method passed"
+            return owner._check_order(value)
+
+        def first_item(x: Mapping[Literal["value"], Iterable[T]]) -> Optional[T]:
+            value = self._as_sequence(x["value"])
+            return value[0] if len(value) > 0 else None
+
+        def last_item(x: Mapping[Literal["value"], Iterable[T]]) -> Optional[T]:
+            value = self._as_sequence(x["value"])
+            return value[-1] if len(value) > 0 else None
+
+        super().__init__(
+            initial_hook_values={"value": initial_value}, # type: ignore
+            verification_method=is_valid_value,
+            secondary_hook_callbacks={"length": lambda x: len(self._as_sequence(x["value"])), "min": first_item, "max": last_item}, # type: ignore
+            logger=logger
+        )
+
+        # The window hooks by their bounds, to find the windows a change touches
+        self._window_index: WindowIndex[_WindowHookKey] = WindowIndex()
+
+        if hook is not None:
+            self._join("value", hook, "use_target_value") # type: ignore
+
+    #########################################################
+    # Internal helpers
+    #########################################################
+
+    def _sorted_vector(self, items: Iterable[T]) -> PersistentVector[T]:
+        """
+        Sort `items` into a new PersistentVector, keeping the first item of each key if the list is unique.
+        """
+        ordered: list[T] = sorted(items, key=self._key)
+        if self._unique and len(ordered) > 1:
+            key = self._key
+            deduplicated: list[T] = [ordered[0]]
+            for item in ordered[1:]:
+                if key(item) != key(deduplicated[-1]):
+                    deduplicated.append(item)
+            ordered = deduplicated
+        return PersistentVector(ordered)
+
+    @staticmethod
+    def _as_sequence(value: Iterable[T]) -> PersistentVector[T]|list[T]|tuple[T, ...]:
+        if isinstance(value, (PersistentVector, list, tuple)):
+            return value # type: ignore
+        return PersistentVector(value)
+
+    def _get_vector(self) -> PersistentVector[T]:
+        """
+        Get the stored list as a PersistentVector.
+
+        The hook may hold any iterable (e.g. if it was joined with a hook holding a plain list).
+        In that case the value is converted once; the next edit stores the vector in the nexus.
+        """
+        current = self._primary_hooks["value"].value
+        if isinstance(current, PersistentVector):
+            return current # type: ignore
+        return PersistentVector(current) # type: ignore
+
+    def _submit_vector(self, new_vector: PersistentVector[T]) -> None:
+        """
+        Submit a new PersistentVector as the list value.
+        """
+        success, msg = self._submit_value("value", new_vector)
+        if not success:
+            raise SubmissionError(msg, new_vector, "value")
+
+    def _in_order(self, key_1: Any, key_2: Any) -> bool:
+        return key_1 < key_2 if self._unique else not key_2 < key_1
+
+    def _check_order(self, value: Iterable[T]) -> tuple[bool, str]:
+        """
+        Check that `value` is sorted (and unique, if required).
+
+        If `value` was created by an edit of the current value, which is already sorted, only the
+        neighbours of the inserted items are compared. Removing items never breaks the order.
+        """
+        sequence = self._as_sequence(value)
+        key = self._key
+        changes: Optional[tuple[ListChange[T], ...]] = None
+        if self._primary_hooks and isinstance(sequence, PersistentVector):
+            changes = sequence.changes_from(self._primary_hooks["value"].value)
+
+        if changes is not None:
+            length: int = len(sequence)
+            for position in _inserted_positions(changes):
+                item_key = key(sequence[position])
+                if position > 0 and not self._in_order(key(sequence[position - 1]), item_key):
+                    return False, f"Item {sequence[position]!r} is not in sorted order"
+                if position + 1 < length and not self._in_order(item_key, key(sequence[position + 1])):
+                    return False, f"Item {sequence[position]!r} is not in sorted order"
+            return True, "Verification method passed"
+
+        previous_key: Any = None
+        for index, item in enumerate(sequence):
+            item_key = key(item)
+            if index > 0 and not self._in_order(previous_key, item_key):
+                return False, f"Item {item!r} is not in sorted order"
+            previous_key = item_key
+        return True, "Verification method passed"
+
+    def _index_range(self, sequence: PersistentVector[T]|list[T]|tuple[T, ...], lower: Any, upper: Any) -> tuple[int, int]:
+        """Get the index range [start, stop) of the items whose key is in [lower, upper). None is unbounded."""
+        start: int = 0 if lower is None else bisect_left(sequence, lower, key=self._key)
+        stop: int = len(sequence) if upper is None else bisect_left(sequence, upper, key=self._key)
+        return start, max(start, stop)
+
+    def _slice(self, sequence: PersistentVector[T]|list[T]|tuple[T, ...], lower: Any, upper: Any) -> PersistentVector[T]:
+        start, stop = self._index_range(sequence, lower, upper)
+        if isinstance(sequence, PersistentVector):
+            return PersistentVector(sequence._iter_slice(start, stop))
+        return PersistentVector(sequence[start:stop])
+
+    #########################################################
+    # Window hooks
+    #########################################################
+
+    def window_hook(self, lower: Any = None, upper: Any = None) -> ReadOnlyHook[PersistentVector[T]]:
+        """
+        Get a read-only hook for the items whose key is in [lower, upper).
+
+        The hook is created on first access and returned again for the same bounds. The list keeps
+        it while it is joined or has listeners or subscribers, otherwise only while it is referenced
+        elsewhere. Its value is a PersistentVector of the items in the window, in sorted order.
+        The hook is only updated - and its listeners are only notified - if a change of the list
+        touches its window.
+
+        Args:
+            lower: The inclusive lower bound of the keys (None: unbounded)
+            upper: The exclusive upper bound of the keys (None: unbounded)
+
+        Returns:
+            The hook for the items in the window
+        """
+        return self._get_or_create_dynamic_hook(
+            _WindowHookKey(lower, upper),
+            lambda: self._slice(self._as_sequence(self._primary_hooks["value"].value), lower, upper)) # type: ignore
+
+    @property
+    def window_hooks(self) -> dict[tuple[Any, Any], ReadOnlyHook[PersistentVector[T]]]:
+        """Get the window hooks that are kept by the list or still referenced elsewhere, by their (lower, upper) bounds."""
+        return {(hook_key.lower, hook_key.upper): hook for hook_key, hook in self._get_dynamic_hooks().items()} # type: ignore
+
+    def _updated_window(self, hook_key: _WindowHookKey, window: PersistentVector[T], previous: Any, current: Any) -> PersistentVector[T]:
+        """
+        Get the window of `hook_key` in `current`, returning `window` itself if it did not change.
+
+        A single recorded splice is checked against the bounds and, if it lies inside the window,
+        applied to the window in O(log n). Any other change is sliced and compared.
+        """
+        lower, upper = hook_key.lower, hook_key.upper
+        key = self._key
+        changes: Optional[tuple[ListChange[T], ...]] = None
+        if isinstance(current, PersistentVector):
+            changes = current.changes_from(previous)
+        if changes is not None and len(changes) == 1:
+            change = changes[0]
+            previous_sequence = self._as_sequence(previous)
+            removed: list[T] = [previous_sequence[i] for i in range(change.index, change.index + change.removed_count)]
+            inside: list[bool] = [
+                (lower is None or not key(item) < lower) and (upper is None or key(item) < upper)
+                for item in (*removed, *change.inserted)
+            ]
+            if not any(inside):
+                return window
+            if all(inside):
+                offset: int = change.index - self._index_range(previous_sequence, lower, None)[0]
+                for _ in range(change.removed_count):
+                    window = window.delete(offset)
+                for position, item in enumerate(change.inserted):
+                    window = window.insert(offset + position, item)
+                return window
+        new_window: PersistentVector[T] = self._slice(self._as_sequence(current), lower, upper)
+        return window if new_window == window else new_window
+
+    def _dynamic_hook_created(self, hook_key: _WindowHookKey) -> None:
+        self._window_index.add(hook_key, hook_key.lower, hook_key.upper)
+
+    def _dynamic_hook_dropped(self, hook_key: _WindowHookKey) -> None:
+        self._window_index.discard(hook_key)
+
+    def _changed_key_range(self, previous: Any, current: Any) -> Optional[tuple[Any, Any]]:
+        """
+        Get the smallest and largest key of the items removed or inserted by the change from `previous` to `current`.
+
+        Returns None if the change is not known from recorded splices (or if it removes items
+        in more than one splice, as the removed items are not known then).
+        """
+        if not isinstance(current, PersistentVector):
+            return None
+        changes: Optional[tuple[ListChange[T], ...]] = current.changes_from(previous)
+        if changes is None or (len(changes) > 1 and any(change.removed_count > 0 for change in changes)):
+            return None
+        items: list[T] = [item for change in changes for item in change.inserted]
+        if len(changes) == 1:
+            previous_sequence = self._as_sequence(previous)
+            items.extend(previous_sequence[i] for i in range(changes[0].index, changes[0].index + changes[0].removed_count))
+        keys: list[Any] = [self._key(item) for item in items]
+        if not keys:
+            return None
+        return min(keys), max(keys)
+
+    def _derive_dynamic_hook_values(self, current: Mapping[Any, Any], final: Mapping[Any, Any]) -> Mapping[Any, Any]:
+        """
+        Get the new windows of the window hooks whose window changed.
+
+        Only the windows overlapping the keys of the removed and inserted items are looked at,
+        unless the change is not known from recorded splices.
+        """
+        current_value: Any = current["value"]
+        final_value: Any = final["value"]
+        if final_value is current_value:
+            return {}
+        key_range: Optional[tuple[Any, Any]] = self._changed_key_range(current_value, final_value)
+        if key_range is None:
+            window_hooks: dict[Any, Any] = self._get_dynamic_hooks()
+        else:
+            window_hooks = {}
+            for hook_key in self._window_index.overlapping(*key_range):
+                window_hook = self._get_dynamic_hook(hook_key)
+                if window_hook is not None:
+                    window_hooks[hook_key] = window_hook
+
+        derived: dict[Any, Any] = {}
+        # The completion may run more than once per submission, so the windows are always derived from the hook values
+        for hook_key, window_hook in window_hooks.items():
+            window = window_hook.value
+            new_window = self._updated_window(hook_key, window if isinstance(window, PersistentVector) else PersistentVector(window), current_value, final_value) # type: ignore
+            if new_window is not window:
+                derived[hook_key] = new_window
+        return derived
+
+    #########################################################
+    # Value, length, min and max
+    #########################################################
+
+    @property
+    def value_hook(self) -> Hook[Iterable[T]]:
+        """
+        Get the hook for the sorted list (contains a sorted PersistentVector).
+        """
+        return self._primary_hooks["value"] # type: ignore
+
+    @property
+    def value(self) -> list[T]:
+        """
+        Get the sorted items as a mutable list (copied from the hook).
+
+        This copies all items. For reads use `view`, `irange` or the sequence dunder methods instead.
+        """
+        return list(self._primary_hooks["value"].value)
+
+    @value.setter
+    def value(self, value: Iterable[T]) -> None:
+        self.change_value(value)
+
+    def change_value(self, new_value: Iterable[T]) -> None:
+        """
+        Replace all items (lambda-friendly method). The items are sorted in O(n log n).
+        """
+        self._submit_vector(self._sorted_vector(new_value))
+
+    @property
+    def view(self) -> ListView[T]:
+        """
+        Get a read-only, zero-copy view on the current sorted items.
+        """
+        return ListView(self._as_sequence(self._primary_hooks["value"].value))
+
+    @property
+    def key(self) -> Callable[[T], Any]:
+        """Get the function extracting the sort key from an item."""
+        return self._key
+
+    @property
+    def unique(self) -> bool:
+        """Whether no two items may have the same key."""
+        return self._unique
+
+    @property
+    def length_hook(self) -> ReadOnlyHook[int]:
+        """Get the hook for the number of items."""
+        return self._secondary_hooks["length"] # type: ignore
+
+    @property
+    def length(self) -> int:
+        """Get the number of items."""
+        return self._secondary_hooks["length"].value # type: ignore
+
+    @property
+    def min_hook(self) -> ReadOnlyHook[Optional[T]]:
+        """Get the hook for the first (smallest) item, None if the list is empty."""
+        return self._secondary_hooks["min"] # type: ignore
+
+    @property
+    def min(self) -> Optional[T]:
+        """Get the first (smallest) item, None if the list is empty."""
+        return self._secondary_hooks["min"].value # type: ignore
+
+    @property
+    def max_hook(self) -> ReadOnlyHook[Optional[T]]:
+        """Get the hook for the last (largest) item, None if the list is empty."""
+        return self._secondary_hooks["max"] # type: ignore
+
+    @property
+    def max(self) -> Optional[T]:
+        """Get the last (largest) item, None if the list is empty."""
+        return self._secondary_hooks["max"].value # type: ignore
+
+    #########################################################
+    # Sorted list methods
+    #########################################################
+
+    def add(self, item: T) -> None:
+        """
+        Insert an item at its sorted position (after items with an equal key) in O(log n).
+
+        If the list is unique and an item with the same key is present, nothing changes.
+
+        Args:
+            item: The item to add
+        """
+        current = self._get_vector()
+        item_key = self._key(item)
+        index: int = bisect_right(current, item_key, key=self._key)
+        if self._unique and index > 0 and not self._key(current[index - 1]) < item_key:
+            return
+        self._submit_vector(current.insert(index, item))
+
+    def update(self, items: Iterable[T]) -> None:
+        """
+        Add several items in a single change.
+
+        Few items are inserted one by one in O(k log n); many items are merged with the
+        current items in O(n + k log k).
+
+        Args:
+            items: The items to add
+        """
+        new_items: list[T] = list(items)
+        if len(new_items) == 0:
+            return
+        current = self._get_vector()
+        if len(new_items) > _MERGE_THRESHOLD:
+            merged = merge(current, sorted(new_items, key=self._key), key=self._key)
+            self._submit_vector(self._sorted_vector(merged) if self._unique else PersistentVector(merged))
+            return
+        vector: PersistentVector[T] = current
+        splices: list[ListChange[T]] = []
+        for item in new_items:
+            item_key = self._key(item)
+            index: int = bisect_right(vector, item_key, key=self._key)
+            if self._unique and index > 0 and not self._key(vector[index - 1]) < item_key:
+                continue
+            vector = vector.insert(index, item)
+            splices.append(ListChange(index, 0, (item,)))
+        if vector is current:
+            return
+        self._submit_vector(vector._record_origin(current, tuple(splices)))
+
+    def _find(self, vector: PersistentVector[T], item: T) -> Optional[int]:
+        """Get the index of `item` by bisecting to its key and scanning the items with an equal key."""
+        item_key = self._key(item)
+        index: int = bisect_left(vector, item_key, key=self._key)
+        length: int = len(vector)
+        while index < length:
+            candidate = vector[index]
+            if self._key(candidate) != item_key:
+                break
+            if candidate is item or candidate == item:
+                return index
+            index += 1
+        return None
+
+    def remove(self, item: T) -> None:
+        """
+        Remove an item in O(log n).
+
+        Raises:
+            ValueError: If the item is not in the list
+        """
+        current = self._get_vector()
+        index = self._find(current, item)
+        if index is None:
+            raise ValueError(f"{item} not in sorted list")
+        self._submit_vector(current.delete(index))
+
+    def discard(self, item: T) -> None:
+        """
+        Remove an item in O(log n) if it is present.
+        """
+        current = self._get_vector()
+        index = self._find(current, item)
+        if index is not None:
+            self._submit_vector(current.delete(index))
+
+    def pop(self, index: int = -1) -> T:
+        """
+        Remove and return the item at the specified index (default: the largest item).
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        current = self._get_vector()
+        if len(current) == 0:
+            raise IndexError("pop from empty sorted list")
+        item: T = current[index]
+        self._submit_vector(current.delete(index))
+        return item
+
+    def clear(self) -> None:
+        """
+        Remove all items.
+        """
+        if len(self._get_vector()) > 0:
+            self._submit_vector(PersistentVector())
+
+    def bisect_left(self, key: Any) -> int:
+        """Get the index of the first item whose key is not less than `key`."""
+        return bisect_left(self._as_sequence(self._primary_hooks["value"].value), key, key=self._key)
+
+    def bisect_right(self, key: Any) -> int:
+        """Get the index after the last item whose key is not greater than `key`."""
+        return bisect_right(self._as_sequence(self._primary_hooks["value"].value), key, key=self._key)
+
+    def irange(self, lower: Any = None, upper: Any = None) -> Iterator[T]:
+        """
+        Iterate over the items whose key is in [lower, upper) without visiting any other item.
+
+        Args:
+            lower: The inclusive lower bound of the keys (None: unbounded)
+            upper: The exclusive upper bound of the keys (None: unbounded)
+        """
+        sequence = self._as_sequence(self._primary_hooks["value"].value)
+        start, stop = self._index_range(sequence, lower, upper)
+        if isinstance(sequence, PersistentVector):
+            return sequence._iter_slice(start, stop)
+        return iter(sequence[start:stop])
+
+    def window(self, lower: Any = None, upper: Any = None) -> PersistentVector[T]:
+        """
+        Get the items whose key is in [lower, upper) as a PersistentVector.
+        """
+        return self._slice(self._as_sequence(self._primary_hooks["value"].value), lower, upper)
+
+    def count(self, item: T) -> int:
+        """Return the number of occurrences of an item."""
+        current = self._get_vector()
+        index = self._find(current, item)
+        if index is None:
+            return 0
+        return sum(1 for candidate in current._iter_slice(index, self.bisect_right(self._key(item))) if candidate is item or candidate == item)
+
+    def index(self, item: T) -> int:
+        """
+        Return the index of the first occurrence of an item in O(log n).
+
+        Raises:
+            ValueError: If the item is not in the list
+        """
+        index = self._find(self._get_vector(), item)
+        if index is None:
+            raise ValueError(f"{item} is not in sorted list")
+        return index
+
+    #########################################################
+    # Sequence dunder methods
+    #########################################################
+
+    def __len__(self) -> int:
+        return len(self._primary_hooks["value"].value) # type: ignore
+
+    def __getitem__(self, index: int) -> T:
+        return self._as_sequence(self._primary_hooks["value"].value)[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._primary_hooks["value"].value)
+
+    def __contains__(self, item: object) -> bool:
+        return self._find(self._get_vector(), item) is not None # type: ignore
+
+    def __str__(self) -> str:
+        return f"OSL(value={list(self._primary_hooks['value'].value)})"
+
+    def __repr__(self) -> str:
+        return f"ObservableSortedList({list(self._primary_hooks['value'].value)})"
@@ -0,0 +1,197 @@
+"""
+PersistentSet - Immutable hash set with structural sharing, used as XSet backend
+
+The set is stored as the keys of an `immutables.Map` (a hash array mapped trie).
+Adding or removing an item copies only the path to the touched trie node, so
+single-element edits cost O(log n) and previous versions stay intact.
+
+Example:
+    >>> s1 = PersistentSet({1, 2, 3})
+    >>> s2 = s1.add(4)
+    >>> s1 == {1, 2, 3}, s2 == {1, 2, 3, 4}
+    (True, True)
+    >>> s2.changes_from(s1)
+    SetChange(added={4}, removed=set())
+"""
+
+from typing import AbstractSet, Any, Generic, Iterable, Iterator, Optional, TypeVar
+import weakref
+
+from immutables import Map
+
+from .set_change import SetChange
+
+T = TypeVar("T")
+
+
+class PersistentSet(AbstractSet[T], Generic[T]):
+    """
+    Immutable set with O(log n) structural-sharing edits.
+
+    All edit methods (`add`, `discard`, `update`, `difference_update`) return a new
+    set and leave the original untouched. The set compares equal to any set,
+    frozenset or PersistentSet with the same items.
+
+    Every edit records the added and removed items together with a weak reference
+    to the set it was derived from, so `changes_from` reports the delta between two
+    consecutive versions in O(1), and comparing them does not inspect any item.
+    """
+
+    __slots__ = ("_map", "_hash", "_origin", "__weakref__")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """
+        Create a set holding the items of an iterable.
+
+        Args:
+            items: The items of the set (default: empty). If `items` is already
+                a PersistentSet, its trie is shared, not copied.
+        """
+        if isinstance(items, PersistentSet):
+            self._map: Map[T, None] = items._map # type: ignore
+        else:
+            self._map = Map((item, None) for item in items)
+        self._hash: Optional[int] = None
+        self._origin: Optional[tuple[weakref.ref[PersistentSet[T]], SetChange[T]]] = None
+
+    @classmethod
+    def _from_map(cls, map: "Map[T, None]", previous: "PersistentSet[T]", change: SetChange[T]) -> "PersistentSet[T]":
+        persistent_set: PersistentSet[T] = cls.__new__(cls)
+        persistent_set._map = map
+        persistent_set._hash = None
+        persistent_set._origin = (weakref.ref(previous), change)
+        return persistent_set
+
+    @classmethod
+    def _from_iterable(cls, items: Iterable[T]) -> "PersistentSet[T]":
+        # Used by the set operators of collections.abc.Set (&, |, -, ^)
+        return cls(items)
+
+    def changes_from(self, previous: Any) -> Optional[SetChange[T]]:
+        """
+        Get the change that turned `previous` into this set.
+
+        Returns:
+            The recorded change if this set was created by an edit of `previous`,
+            an empty change if `previous` is this set and None otherwise.
+        """
+        if previous is self:
+            return SetChange(frozenset(), frozenset())
+        if self._origin is not None and self._origin[0]() is previous:
+            return self._origin[1]
+        return None
+
+    #########################################################
+    # Set protocol
+    #########################################################
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            return item in self._map
+        except TypeError:
+            # Unhashable items cannot be in the set
+            return False
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._map)
+
+    #########################################################
+    # Persistent edits
+    #########################################################
+
+    def _apply(self, added: Iterable[T], removed: Iterable[T]) -> "PersistentSet[T]":
+        """
+        Return a new set with `removed` discarded and then `added` added.
+        """
+        actually_added: set[T] = set()
+        actually_removed: set[T] = set()
+        with self._map.mutate() as mutation:
+            for item in removed:
+                if item in mutation:
+                    del mutation[item]
+                    actually_removed.add(item)
+            for item in added:
+                if item not in mutation:
+                    mutation[item] = None
+                    actually_added.add(item)
+            new_map = mutation.finish()
+        readded: set[T] = actually_added & actually_removed
+        if readded:
+            actually_added -= readded
+            actually_removed -= readded
+        if not actually_added and not actually_removed:
+            return self
+        return PersistentSet._from_map(new_map, self, SetChange(frozenset(actually_added), frozenset(actually_removed)))
+
+    def add(self, item: T) -> "PersistentSet[T]":
+        """Return a new set with `item` added (or this set if it is already present)."""
+        if item in self._map:
+            return self
+        return PersistentSet._from_map(self._map.set(item, None), self, SetChange(frozenset((item,)), frozenset()))
+
+    def discard(self, item: T) -> "PersistentSet[T]":
+        """Return a new set without `item` (or this set if it is not present)."""
+        if item not in self._map:
+            return self
+        return PersistentSet._from_map(self._map.delete(item), self, SetChange(frozenset(), frozenset((item,))))
+
+    def update(self, items: Iterable[T]) -> "PersistentSet[T]":
+        """Return a new set with all `items` added, in O(k log n) for k items."""
+        return self._apply(items, ())
+
+    def difference_update(self, items: Iterable[T]) -> "PersistentSet[T]":
+        """Return a new set with all `items` removed, in O(k log n) for k items."""
+        return self._apply((), items)
+
+    def symmetric_difference_update(self, items: Iterable[T]) -> "PersistentSet[T]":
+        """Return a new set with the items of `items` toggled, in O(k log n) for k items."""
+        other: set[T] = set(items)
+        present: list[T] = [item for item in other if item in self._map]
+        return self._apply((item for item in other if item not in self._map), present)
+
+    #########################################################
+    # Comparison and hashing
+    #########################################################
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PersistentSet):
+            if self._map is other._map: # type: ignore
+                return True
+            # Consecutive versions: the recorded change decides without inspecting items
+            change = self.changes_from(other)
+            if change is None:
+                change = other.changes_from(self) # type: ignore
+            if change is not None:
+                return not change
+            return self._map == other._map # type: ignore
+        if isinstance(other, AbstractSet):
+            if len(self) != len(other): # type: ignore
+                return False
+            return all(item in self._map for item in other) # type: ignore
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._map))
+        return self._hash
+
+    #########################################################
+    # Other dunder methods
+    #########################################################
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (PersistentSet, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"PersistentSet({set(self)!r})"
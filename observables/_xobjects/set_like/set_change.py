@@ -0,0 +1,58 @@
+"""
+Set Change - Records describing how a set value changed
+
+A change of an observable set is described by the items that were added and
+the items that were removed, so a consumer can update derived state in O(k)
+instead of comparing both sets.
+
+Example:
+    >>> change = SetChange(added=frozenset({4}), removed=frozenset({1}))
+    >>> tags = {1, 2, 3}
+    >>> change.apply_to(tags)
+    >>> tags
+    {2, 3, 4}
+"""
+
+from typing import Generic, TypeVar
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class SetChange(Generic[T]):
+    """
+    Immutable record of the items added to and removed from a set.
+
+    Attributes:
+        added: The items that are in the new value but not in the previous value.
+        removed: The items that are in the previous value but not in the new value.
+    """
+
+    added: frozenset[T]
+    removed: frozenset[T]
+
+    def __bool__(self) -> bool:
+        """Return True if the change adds or removes any item."""
+        return len(self.added) > 0 or len(self.removed) > 0
+
+    def apply_to(self, target: set[T]) -> None:
+        """
+        Apply this change to a mutable set in place.
+        """
+        target.difference_update(self.removed)
+        target.update(self.added)
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"SetChange(added={set(self.added)!r}, removed={set(self.removed)!r})"
+
+
+def diff_set_values(previous: Iterable[T], current: Iterable[T]) -> SetChange[T]:
+    """
+    Compute the change between two set values in O(n).
+    """
+    previous_set: frozenset[T] = previous if isinstance(previous, frozenset) else frozenset(previous) # type: ignore
+    current_set: frozenset[T] = current if isinstance(current, frozenset) else frozenset(current) # type: ignore
+    return SetChange(current_set - previous_set, previous_set - current_set)
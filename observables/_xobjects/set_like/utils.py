@@ -1,5 +1,8 @@
-from typing import TypeVar
-from collections.abc import Iterator, Iterable
+from typing import Generic, Optional, TypeVar
+from collections.abc import Iterator, Iterable, Set
+
+from .set_change import SetChange, diff_set_values
+from .persistent_set import PersistentSet
 
 T = TypeVar("T")
 
@@ -13,4 +16,68 @@ def likely_settable(value: Iterable[T]) -> bool:
         first = next(iter_value)
     except StopIteration:
         return True  # empty iterable is fine
-    return hasattr(first, "__hash__") and first.__hash__ is not None
\ No newline at end of file
+    return hasattr(first, "__hash__") and first.__hash__ is not None
+
+
+def set_changes(previous: Iterable[T], current: Iterable[T]) -> SetChange[T]:
+    """
+    Get the items added and removed between `previous` and `current`.
+
+    If `current` is a PersistentSet created by an edit of `previous`, the recorded
+    change is returned in O(1). Otherwise the values are diffed in O(n).
+    """
+    if isinstance(current, PersistentSet):
+        recorded = current.changes_from(previous)
+        if recorded is not None:
+            return recorded
+    return diff_set_values(previous, current)
+
+
+
+def recorded_set_changes(previous: Iterable[T], current: Iterable[T]) -> Optional[SetChange[T]]:
+    """
+    Get the items added and removed between `previous` and `current` if that is known without a diff.
+
+    Returns:
+        An empty change if `current` is `previous`, the recorded change if `current` is a
+        PersistentSet created by an edit of `previous`, and None otherwise.
+    """
+    if current is previous:
+        return SetChange(frozenset(), frozenset())
+    if isinstance(current, PersistentSet):
+        return current.changes_from(previous)
+    return None
+
+
+def as_persistent_set(value: Iterable[T]) -> PersistentSet[T]:
+    """
+    Return `value` as a PersistentSet, without copying if it already is one.
+    """
+    if isinstance(value, PersistentSet):
+        return value # type: ignore
+    return PersistentSet(value)
+
+
+class MembershipIndex(Generic[T]):
+    """
+    Hash index for membership tests on an options value.
+
+    Sets (including PersistentSet) are used directly. Any other iterable (e.g. a list
+    held by a joined hook) is indexed in a frozenset, which is reused for as long as
+    the same object is checked, so repeated validations do not scan it again.
+    """
+
+    __slots__ = ("_options", "_index")
+
+    def __init__(self) -> None:
+        self._options: Optional[Iterable[T]] = None
+        self._index: frozenset[T] = frozenset()
+
+    def lookup(self, options: Iterable[T]) -> Set[T]:
+        """Get a set supporting O(1) membership tests for `options`."""
+        if isinstance(options, Set):
+            return options # type: ignore
+        if options is not self._options:
+            self._index = frozenset(options)
+            self._options = options
+        return self._index
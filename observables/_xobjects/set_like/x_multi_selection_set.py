@@ -1,13 +1,15 @@
 from typing import Generic, TypeVar, Optional, Literal, Mapping
 from collections.abc import Iterable
 from logging import Logger
+import weakref
 
 from ..._hooks.hook_aliases import Hook, ReadOnlyHook
 from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
 from ..._nexus_system.submission_error import SubmissionError
 from .protocols import ObservableMultiSelectionOptionsProtocol
-from .utils import likely_settable
+from .utils import likely_settable, recorded_set_changes, as_persistent_set, MembershipIndex
+from .persistent_set import PersistentSet
 
 T = TypeVar("T")
 
@@ -87,25 +89,45 @@ class ObservableMultiSelectionSet(ComplexObservableBase[Literal["selected_option
                 initial_available_options = available_options.value # type: ignore
                 available_options_hook = available_options # type: ignore
             else:
-                initial_available_options = set(available_options) # type: ignore
+                initial_available_options = PersistentSet(available_options) # type: ignore
                 available_options_hook = None
 
             if isinstance(selected_options, ManagedHookProtocol):
                 initial_selected_options = selected_options.value # type: ignore
                 selected_options_hook = selected_options # type: ignore
             else:
-                initial_selected_options = set(selected_options) # type: ignore
+                initial_selected_options = PersistentSet(selected_options) # type: ignore
                 selected_options_hook = None
 
+        self_ref: weakref.ref[ObservableMultiSelectionSet[T]] = weakref.ref(self)
+        available_options_index: MembershipIndex[T] = MembershipIndex()
+        selected_options_index: MembershipIndex[T] = MembershipIndex()
+
         def is_valid_value(x: Mapping[Literal["selected_options", "available_options"], Iterable[T]]) -> tuple[bool, str]:
-            selected_options = set(x["selected_options"])
+            selected_options = x["selected_options"]
             available_options = x["available_options"]
             
             if not likely_settable(available_options):
                 return False, f"Available options '{available_options}' cannot be used as a set!"
-            
-            if not selected_options.issubset(available_options):
-                return False, f"Selected options '{selected_options}' not in available options '{available_options}'!"
+
+            # Delta path: the current values are valid, so only the changed options need to be checked
+            owner = self_ref()
+            if owner is not None and owner._primary_hooks:
+                selected_change = recorded_set_changes(owner._primary_hooks["selected_options"].value, selected_options) # type: ignore
+                available_change = recorded_set_changes(owner._primary_hooks["available_options"].value, available_options) # type: ignore
+                if selected_change is not None and available_change is not None:
+                    available_index = available_options_index.lookup(available_options)
+                    valid: bool = all(option in available_index for option in selected_change.added)
+                    if valid and available_change.removed:
+                        selected_index = selected_options_index.lookup(selected_options)
+                        valid = not any(option in selected_index for option in available_change.removed)
+                    if not valid:
+                        return False, f"Selected options '{set(selected_options)}' not in available options '{available_options}'!"
+                    return True, "Verification method passed"
+
+            available_index = available_options_index.lookup(available_options)
+            if not all(option in available_index for option in selected_options):
+                return False, f"Selected options '{set(selected_options)}' not in available options '{available_options}'!"
 
             return True, "Verification method passed"
 
@@ -137,8 +159,8 @@ class ObservableMultiSelectionSet(ComplexObservableBase[Literal["selected_option
 
     @property
     def available_options(self) -> Iterable[T]: # type: ignore
-        """Get the available options as an immutable set."""
-        return self._primary_hooks["available_options"].value # type: ignore
+        """Get a copy of the available options as a set."""
+        return set(self._primary_hooks["available_options"].value) # type: ignore
     
     @available_options.setter
     def available_options(self, available_options: Iterable[T]) -> None:
@@ -166,8 +188,7 @@ class ObservableMultiSelectionSet(ComplexObservableBase[Literal["selected_option
     
     def change_selected_options(self, selected_options: Iterable[T]) -> None:
         """Set the selected options (automatically converted to set by nexus system)."""
-        # Let nexus system handle immutability conversion
-        success, msg = self._submit_value("selected_options", set(selected_options))
+        success, msg = self._submit_value("selected_options", as_persistent_set(selected_options))
         if not success:
             raise SubmissionError(msg, selected_options)
 
@@ -211,68 +232,67 @@ class ObservableMultiSelectionSet(ComplexObservableBase[Literal["selected_option
             selected_options: The new selected options (set automatically converted)
             available_options: The new set of available options (set automatically converted)
         """
-        # Let nexus system handle immutability conversion
-        success, msg = self._submit_values({"selected_options": set(selected_options), "available_options": set(available_options)})
+        success, msg = self._submit_values({"selected_options": as_persistent_set(selected_options), "available_options": as_persistent_set(available_options)})
         if not success: 
             raise ValueError(msg)
 
-    def add_available_option(self, option: T) -> None:
-        """Add an option to the available options set."""
-        success, msg = self._submit_value("available_options", set(self._primary_hooks["available_options"].value) | {option})
+    def _edit_options(self, key: Literal["selected_options", "available_options"], added: Iterable[T], removed: Iterable[T]) -> None:
+        """
+        Submit the options of `key` with `removed` discarded and `added` added.
+
+        The edit is a PersistentSet edit in O(k log n) for k options and records the change,
+        so the validation only has to look at the changed options. Nothing is submitted if
+        the options do not change.
+        """
+        current = as_persistent_set(self._primary_hooks[key].value) # type: ignore
+        new_options = current._apply(added, removed)
+        if new_options is current:
+            return
+        success, msg = self._submit_value(key, new_options) # type: ignore
         if not success:
             raise ValueError(msg)
 
+    def add_available_option(self, option: T) -> None:
+        """Add an option to the available options set."""
+        self._edit_options("available_options", (option,), ())
+
     def add_available_options(self, options: Iterable[T]) -> None:
         """Add an option to the available options set."""
-        success, msg = self._submit_value("available_options", set(self._primary_hooks["available_options"].value) | set(options))
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("available_options", options, ())
 
     def remove_available_option(self, option: T) -> None:
         """Remove an option from the available options set."""
-        success, msg = self._submit_value("available_options", set(self._primary_hooks["available_options"].value) - {option})
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("available_options", (), (option,))
 
     def remove_available_options(self, option: Iterable[T]) -> None:
         """Remove an option from the available options set."""
-        success, msg = self._submit_value("available_options", set(self._primary_hooks["available_options"].value) - set(option))
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("available_options", (), option)
 
     def clear_available_options(self) -> None:
         """Remove all items from the available options set."""
-        success, msg = self._submit_value("available_options", set()) # type: ignore
+        success, msg = self._submit_value("available_options", PersistentSet()) # type: ignore
         if not success:
             raise ValueError(msg)
 
     def add_selected_option(self, option: T) -> None:
         """Add an option to the selected options set."""
-        success, msg = self._submit_value("selected_options", set(self._primary_hooks["selected_options"].value) | {option})
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("selected_options", (option,), ())
 
     def add_selected_options(self, options: Iterable[T]) -> None:
         """Add an option to the selected options set."""
-        success, msg = self._submit_value("selected_options", set(self._primary_hooks["selected_options"].value) | set(options))
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("selected_options", options, ())
 
     def remove_selected_option(self, option: T) -> None:
         """Remove an option from the selected options set."""
-        success, msg = self._submit_value("selected_options", set(self._primary_hooks["selected_options"].value) - {option})
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("selected_options", (), (option,))
 
     def remove_selected_options(self, option: Iterable[T]) -> None:
         """Remove an option from the selected options set."""
-        success, msg = self._submit_value("selected_options", set(self._primary_hooks["selected_options"].value) - set(option))
-        if not success:
-            raise ValueError(msg)
+        self._edit_options("selected_options", (), option)
 
     def clear_selected_options(self) -> None:
         """Remove all items from the selected options set."""
-        success, msg = self._submit_value("selected_options", set())
+        success, msg = self._submit_value("selected_options", PersistentSet())
         if not success:
             raise ValueError(msg)
 
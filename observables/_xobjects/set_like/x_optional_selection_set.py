@@ -7,7 +7,8 @@ from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
 from ..._nexus_system.submission_error import SubmissionError
 from .protocols import ObservableOptionalSelectionOptionProtocol
-from .utils import likely_settable
+from .utils import likely_settable, as_persistent_set, MembershipIndex
+from .persistent_set import PersistentSet
 
 T = TypeVar("T")
 
@@ -36,7 +37,7 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
                 hook_selected_option = None
 
             if available_options is None:
-                initial_available_options = set()
+                initial_available_options = PersistentSet()
                 hook_available_options = None
 
             elif isinstance(available_options, ManagedHookProtocol):
@@ -45,9 +46,12 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
 
             else:
                 # available_options is an Iterable[T]
-                initial_available_options = set(available_options) # type: ignore
+                initial_available_options = PersistentSet(available_options) # type: ignore
                 hook_available_options = None
                 
+        # Hash index for the membership test, in case the available options are not a set (e.g. a list from a joined hook)
+        available_options_index: MembershipIndex[T] = MembershipIndex()
+
         def is_valid_value(x: Mapping[Literal["selected_option", "available_options"], Any]) -> tuple[bool, str]:
             selected_option = x["selected_option"]
             available_options = x["available_options"]
@@ -55,7 +59,7 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
             if not likely_settable(available_options):
                 return False, f"Available options '{available_options}' cannot be used as a set!"
 
-            if not selected_option is None and selected_option not in available_options:
+            if not selected_option is None and selected_option not in available_options_index.lookup(available_options):
                 return False, f"Selected option '{selected_option}' not in available options '{available_options}'!"
 
             return True, "Verification method passed"
@@ -91,7 +95,7 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
         self.change_available_options(available_options)
 
     def change_available_options(self, available_options: Iterable[T]) -> None:
-        success, msg = self._submit_values({"available_options": set(available_options)}) # type: ignore
+        success, msg = self._submit_values({"available_options": as_persistent_set(available_options)}) # type: ignore
         if not success:
             raise SubmissionError(msg, available_options, "available_options")
 
@@ -123,7 +127,7 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
         if selected_option == self._primary_hooks["selected_option"].value and available_options == self._primary_hooks["available_options"].value:
             return
         
-        success, msg = self._submit_values({"selected_option": selected_option, "available_options": set(available_options)})
+        success, msg = self._submit_values({"selected_option": selected_option, "available_options": as_persistent_set(available_options)})
         if not success:
             raise ValueError(msg)
 
@@ -139,12 +143,25 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
 
     #-------------------------------- convenience methods --------------------------------
 
-    def add_available_option(self, option: T) -> None:
-        """Add an option to the available options set."""
-        success, msg = self._submit_values({"available_options": set(self._primary_hooks["available_options"].value) | {option}}) # type: ignore
+    def _edit_available_options(self, added: Iterable[T], removed: Iterable[T]) -> None:
+        """
+        Submit the available options with `removed` discarded and `added` added.
+
+        The edit is a PersistentSet edit in O(k log n) for k options. Nothing is submitted
+        if the available options do not change.
+        """
+        current = as_persistent_set(self._primary_hooks["available_options"].value) # type: ignore
+        new_options = current._apply(added, removed)
+        if new_options is current:
+            return
+        success, msg = self._submit_values({"available_options": new_options}) # type: ignore
         if not success:
             raise ValueError(msg)
 
+    def add_available_option(self, option: T) -> None:
+        """Add an option to the available options set."""
+        self._edit_available_options((option,), ())
+
     def add_selected_option(self, option: T) -> None:
         """Add an option to the selected options set."""
         success, msg = self._submit_values({"selected_option": option})
@@ -153,25 +170,19 @@ class ObservableOptionalSelectionSet(ComplexObservableBase[Literal["selected_opt
 
     def remove_available_option(self, option: T) -> None:
         """Remove an option from the available options set."""
-        success, msg = self._submit_values({"available_options": set(self._primary_hooks["available_options"].value) - {option}}) # type: ignore
-        if not success:
-            raise ValueError(msg)
+        self._edit_available_options((), (option,))
 
     def add_available_options(self, options: Iterable[T]) -> None:
         """Add an option to the available options set."""
-        success, msg = self._submit_values({"available_options": set(self._primary_hooks["available_options"].value) | {option for option in options}}) # type: ignore
-        if not success:
-            raise ValueError(msg)
+        self._edit_available_options(options, ())
 
     def remove_available_options(self, options: Iterable[T]) -> None:
         """Remove an option from the available options set."""
-        success, msg = self._submit_values({"available_options": set(self._primary_hooks["available_options"].value) - {option for option in options}}) # type: ignore
-        if not success:
-            raise ValueError(msg)
+        self._edit_available_options((), options)
 
     def clear_available_options(self) -> None:
         """Remove all items from the available options set."""
-        success, msg = self._submit_values({"available_options": set()})
+        success, msg = self._submit_values({"available_options": PersistentSet()})
         if not success:
             raise ValueError(msg)
 
@@ -1,4 +1,5 @@
-from typing import Any, Generic, Optional, TypeVar, Iterable, Literal, Iterator, Set
+from typing import AbstractSet, Any, Callable, Generic, Optional, TypeVar, Iterable, Literal, Iterator, Set
+from itertools import chain
 from logging import Logger
 
 from ..._hooks.hook_aliases import Hook, ReadOnlyHook
@@ -6,7 +7,9 @@ from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
 from ..._carries_hooks.x_complex_base import ComplexObservableBase
 from ..._nexus_system.submission_error import SubmissionError
 from .protocols import ObservableSetProtocol
-from .utils import likely_settable
+from .utils import likely_settable, set_changes
+from .persistent_set import PersistentSet
+from .set_change import SetChange
 
 
 T = TypeVar("T")
@@ -16,6 +19,14 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
     Acting like a set.
 
     The hooks store an Iterable - allowing them to connect to any other iterable. But values requested from this object will be a set.
+
+    Internally, the set is stored as a PersistentSet (a hash array mapped trie). Single-element
+    edits (add, remove, discard, pop) therefore cost O(log n), bulk edits O(k log n) for k items,
+    and the equality check of the nexus system does not have to compare all items.
+
+    Every change is also described by a `SetChange` (added and removed items), which is delivered
+    to change listeners (`add_change_listener`) and can be read from `last_changes` or, for any
+    hook, via `set_changes(hook.previous_value, hook.value)`.
     """
 
     def __init__(self, observable_or_hook_or_value: Iterable[T] | Hook[Iterable[T]] | ReadOnlyHook[Iterable[T]] | None = None, logger: Optional[Logger] = None) -> None: # type: ignore
@@ -30,19 +41,20 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
             ValueError: If the initial value is not a valid set type
         """
         if observable_or_hook_or_value is None:
-            initial_value: Iterable[T] = set()
+            initial_value: Iterable[T] = PersistentSet()
             hook: Optional[ManagedHookProtocol[Iterable[T]]] = None 
         elif isinstance(observable_or_hook_or_value, ObservableSetProtocol):
-            initial_value = observable_or_hook_or_value.value # type: ignore
+            initial_value = observable_or_hook_or_value.value_hook.value # type: ignore
             hook = observable_or_hook_or_value.value_hook # type: ignore
         elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
             initial_value = observable_or_hook_or_value.value # type: ignore
             hook = observable_or_hook_or_value # type: ignore
         else:
-            # Pass set directly - nexus system will convert to frozenset
-            initial_value = observable_or_hook_or_value # type: ignore
+            initial_value = PersistentSet(observable_or_hook_or_value)
             hook = None
-        
+
+        self._change_listeners: set[Callable[[SetChange[T]], None]] = set()
+
         super().__init__(
             initial_hook_values={"value": initial_value}, # type: ignore
             verification_method=lambda x: (True, "Verification method passed") if likely_settable(x["value"]) else (False, "Value cannot be used as a set!"), # type: ignore
@@ -53,6 +65,69 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         if hook is not None:
             self._join("value", hook, "use_target_value") # type: ignore
 
+    def _get_persistent_set(self) -> PersistentSet[T]:
+        """
+        Get the stored set as a PersistentSet.
+
+        The hook may hold any iterable (e.g. if it was joined with a hook holding a plain set).
+        In that case the value is converted once; the next edit stores the PersistentSet in the nexus.
+        """
+        current = self._primary_hooks["value"].value
+        if isinstance(current, PersistentSet):
+            return current # type: ignore
+        return PersistentSet(current) # type: ignore
+
+    def _submit_persistent_set(self, current: PersistentSet[T], new_set: PersistentSet[T]) -> None:
+        """
+        Submit a new PersistentSet as the set value, if it differs from `current`.
+        """
+        if new_set is current:
+            return
+        success, msg = self._submit_value("value", new_set)
+        if not success:
+            raise ValueError(msg)
+
+    #########################################################
+    # Change records
+    #########################################################
+
+    @property
+    def last_changes(self) -> SetChange[T]:
+        """
+        Get the items added and removed by the latest change of the set value.
+        """
+        value_hook = self._primary_hooks["value"]
+        return set_changes(value_hook.previous_value, value_hook.value) # type: ignore
+
+    def add_change_listener(self, *callbacks: Callable[[SetChange[T]], None]) -> None:
+        """
+        Add one or more listeners that are called with the added and removed items of every change.
+        """
+        for callback in callbacks:
+            self._change_listeners.add(callback)
+
+    def remove_change_listener(self, *callbacks: Callable[[SetChange[T]], None]) -> None:
+        """
+        Remove one or more change listeners. Unknown callbacks are ignored.
+        """
+        for callback in callbacks:
+            self._change_listeners.discard(callback)
+
+    def _notify_listeners(self) -> None:
+        super()._notify_listeners()
+        if len(self._change_listeners) == 0:
+            return
+        change = self.last_changes
+        if not change:
+            return
+        for callback in list(self._change_listeners):
+            try:
+                callback(change)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                self._log("notify_change_listeners", False, f"Error in change listener callback: {e}")
+
     #########################################################
     # ObservableSetProtocol implementation
     #########################################################
@@ -93,7 +168,8 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         Args:
             value: Any iterable that can be converted to a set
         """
-        success, msg = self._submit_values({"value": set(value)})
+        new_value = value if isinstance(value, PersistentSet) else PersistentSet(value)
+        success, msg = self._submit_values({"value": new_value})
         if not success:
             raise SubmissionError(msg, value, "value")
 
@@ -124,22 +200,19 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         """
         Add an element to the set.
         
-        Creates a new set with the added element.
+        Creates a new set with the added element in O(log n).
         
         Args:
             item: The element to add to the set
         """
-        if item not in self._primary_hooks["value"].value: # type: ignore
-            new_set = set(self._primary_hooks["value"].value) | {item} # type: ignore
-            success, msg = self._submit_value("value", new_set)
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        self._submit_persistent_set(current, current.add(item))
     
     def remove(self, item: T) -> None:
         """
         Remove an element from the set.
         
-        Creates a new set without the element.
+        Creates a new set without the element in O(log n).
         
         Args:
             item: The element to remove from the set
@@ -147,35 +220,29 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         Raises:
             KeyError: If the item is not in the set
         """
-        if item not in self._primary_hooks["value"].value: # type: ignore
+        current = self._get_persistent_set()
+        if item not in current:
             raise KeyError(item)
-        
-        new_set = set(self._primary_hooks["value"].value) - {item} # type: ignore
-        success, msg = self._submit_value("value", new_set)
-        if not success:
-            raise ValueError(msg)
+        self._submit_persistent_set(current, current.discard(item))
     
     def discard(self, item: T) -> None:
         """
         Remove an element from the set if it is present.
         
-        Creates a new set without the element (if present).
+        Creates a new set without the element (if present) in O(log n).
         Unlike remove(), this method does not raise an error if the item is not found.
         
         Args:
             item: The element to remove from the set
         """
-        if item in self._primary_hooks["value"].value: # type: ignore
-            new_set = set(self._primary_hooks["value"].value) - {item} # type: ignore
-            success, msg = self._submit_value("value", new_set)
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        self._submit_persistent_set(current, current.discard(item))
     
     def pop(self) -> T:
         """
         Remove and return an arbitrary element from the set.
         
-        Creates a new set without the popped element.
+        Creates a new set without the popped element in O(log n).
         
         Returns:
             The removed element
@@ -183,14 +250,12 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         Raises:
             KeyError: If the set is empty
         """
-        if not self._primary_hooks["value"].value: # type: ignore
+        current = self._get_persistent_set()
+        if len(current) == 0:
             raise KeyError("pop from an empty set")
         
-        item: T = next(iter(self._primary_hooks["value"].value)) # type: ignore
-        new_set = set(self._primary_hooks["value"].value) - {item} # type: ignore
-        success, msg = self._submit_value("value", set(new_set))
-        if not success:
-            raise ValueError(msg)
+        item: T = next(iter(current))
+        self._submit_persistent_set(current, current.discard(item))
         return item 
     
     def clear(self) -> None:
@@ -199,86 +264,70 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
         
         Creates an empty set.
         """
-        if self._primary_hooks["value"].value:
-            new_set: set[T] = set()
-            success, msg = self._submit_values({"value": new_set})
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        if len(current) > 0:
+            self._submit_persistent_set(current, current.difference_update(list(current)))
     
     def update(self, *others: Iterable[T]) -> None:
         """
         Update the set with elements from all other iterables.
         
-        Creates a new set with all elements from current set and provided iterables.
+        Creates a new set with all elements from current set and provided iterables
+        in O(k log n) for k elements. Nothing is submitted if no element is new.
         
         Args:
             *others: Variable number of iterables to add elements from
         """
-        new_set: set[T] = self._primary_hooks["value"].value # type: ignore
-        for other in others:
-            new_set = new_set | set(other) # type: ignore
-        if new_set != self._primary_hooks["value"].value:
-            success, msg = self._submit_values({"value": new_set})
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        self._submit_persistent_set(current, current.update(chain(*others)))
     
     def intersection_update(self, *others: Iterable[T]) -> None:
         """
         Update the set keeping only elements found in this set and all others.
         
-        Creates a new set with only common elements.
+        Creates a new set with only common elements. Only the elements that are not
+        kept are removed from the stored set.
         
         Args:
             *others: Variable number of iterables to intersect with
         """
-        new_set: set[T] = self._primary_hooks["value"].value # type: ignore
+        current = self._get_persistent_set()
+        removed: list[T] = []
         for other in others:
-            new_set = new_set & set(other) # type: ignore
-        if new_set != self._primary_hooks["value"].value:
-            success, msg = self._submit_values({"value": new_set})
-            if not success:
-                raise ValueError(msg)
+            other_set: AbstractSet[T] = other if isinstance(other, AbstractSet) else set(other)
+            removed.extend(item for item in current if item not in other_set)
+        self._submit_persistent_set(current, current.difference_update(removed))
     
     def difference_update(self, *others: Iterable[T]) -> None:
         """
         Update the set removing elements found in any of the others.
         
-        Creates a new set without elements from the provided iterables.
+        Creates a new set without elements from the provided iterables in O(k log n)
+        for k elements. Nothing is submitted if no element was present.
         
         Args:
             *others: Variable number of iterables to remove elements from
         """
-        new_set: set[T] = self._primary_hooks["value"].value # type: ignore
-        for other in others:
-            new_set = new_set - set(other) # type: ignore
-        if new_set != self._primary_hooks["value"].value:
-            success, msg = self._submit_values({"value": new_set})
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        self._submit_persistent_set(current, current.difference_update(chain(*others)))
     
     def symmetric_difference_update(self, other: Iterable[T]) -> None:
         """
         Update the set keeping only elements found in either set but not both.
         
-        Creates a new set with symmetric difference.
+        Creates a new set with symmetric difference in O(k log n) for k elements.
         
         Args:
             other: An iterable to compute symmetric difference with
         """
-        current_set: set[T] = self._primary_hooks["value"].value # type: ignore
-        new_set = current_set ^ set(other) # type: ignore
-        
-        # Only update if there's an actual change
-        if new_set != current_set:
-            success, msg = self._submit_values({"value": new_set})
-            if not success:
-                raise ValueError(msg)
+        current = self._get_persistent_set()
+        self._submit_persistent_set(current, current.symmetric_difference_update(other))
     
     def __str__(self) -> str:
-        return f"OS(options={self._primary_hooks['value'].value!r})"
+        return f"OS(options={set(self._primary_hooks['value'].value)!r})"
     
     def __repr__(self) -> str:
-        return f"ObservableSet({self._primary_hooks['value'].value!r})"
+        return f"ObservableSet({set(self._primary_hooks['value'].value)!r})"
     
     def __len__(self) -> int:
         """
@@ -403,8 +452,8 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
             A new set containing elements common to both sets
         """
         if isinstance(other, ObservableSet):
-            return self._primary_hooks["value"].value & other._primary_hooks["value"].value # type: ignore
-        return self._primary_hooks["value"].value & set(other) # type: ignore
+            return self.value & set(other._primary_hooks["value"].value) # type: ignore
+        return self.value & set(other) # type: ignore
     
     def __or__(self, other: Any) -> Set[T]:
         """
@@ -417,8 +466,8 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
             A new set containing all elements from both sets
         """
         if isinstance(other, ObservableSet):
-            return self._primary_hooks["value"].value | other._primary_hooks["value"].value # type: ignore
-        return self._primary_hooks["value"].value | set(other) # type: ignore
+            return self.value | set(other._primary_hooks["value"].value) # type: ignore
+        return self.value | set(other) # type: ignore
     
     def __sub__(self, other: Any) -> Set[T]:
         """
@@ -431,8 +480,8 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
             A new set containing elements in this set but not in the other
         """
         if isinstance(other, ObservableSet):
-            return self._primary_hooks["value"].value - other._primary_hooks["value"].value # type: ignore
-        return self._primary_hooks["value"].value - set(other) # type: ignore
+            return self.value - set(other._primary_hooks["value"].value) # type: ignore
+        return self.value - set(other) # type: ignore
     
     def __xor__(self, other: Any) -> Set[T]:
         """
@@ -445,5 +494,5 @@ class ObservableSet(ComplexObservableBase[Literal["value"], Literal["length"], I
             A new set containing elements in either set but not in both
         """
         if isinstance(other, ObservableSet):
-            return self._primary_hooks["value"].value ^ other._primary_hooks["value"].value # type: ignore
-        return self._primary_hooks["value"].value ^ set(other) # type: ignore
\ No newline at end of file
+            return self.value ^ set(other._primary_hooks["value"].value) # type: ignore
+        return self.value ^ set(other) # type: ignore
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Table Index - Secondary indexes of XTable, maintained from row-level changes
+
+An index is declared on a record field (a key of mapping records, an attribute
+name or a function of the record):
+    - HashIndex maps each field value to the PersistentSet of ids of the rows
+      holding it (equality lookups).
+    - SortedIndex keeps (field value, row id) pairs sorted by field value in a
+      PersistentVector (equality and range lookups).
+
+Both are immutable values. If the rows of the table are a PersistentMap derived
+from the previous rows by an edit, the recorded MapChange is applied to the
+previous index in O(k log n) for k changed rows; otherwise the index is built
+from scratch in O(n) (HashIndex) or O(n log n) (SortedIndex).
+
+Example:
+    >>> index = HashIndex("status")
+    >>> rows = PersistentMap({1: {"status": "open"}, 2: {"status": "done"}})
+    >>> value = index.build(rows)
+    >>> index.lookup(value, "open")
+    PersistentSet({1})
+"""
+
+from typing import Any, Callable, Generic, Iterable, Mapping, Optional, TypeVar
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+
+from ..._auxiliary.derive_cache import DeriveCache
+from ..list_like.persistent_vector import PersistentVector
+from ..set_like.persistent_set import PersistentSet
+from ..dict_like.persistent_map import PersistentMap
+from ..dict_like.map_change import MapChange
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+_EMPTY_IDS: PersistentSet[Any] = PersistentSet()
+
+
+def _field_value_getter(field: str|Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if callable(field):
+        return field
+    def get_field_value(record: Any) -> Any:
+        if isinstance(record, Mapping):
+            return record[field] # type: ignore
+        return getattr(record, field)
+    return get_field_value
+
+
+def _entry_field_value(entry: tuple[Any, Any]) -> Any:
+    return entry[0]
+
+
+def _changed_field_values(get_field_value: Callable[[Any], Any], previous_rows: Mapping[I, Any], current_rows: Mapping[I, Any], change: MapChange[I]) -> tuple[list[tuple[I, Any]], list[tuple[I, Any]]]:
+    """
+    Get the (row id, field value) pairs that leave and enter an index through `change`.
+
+    Changed rows whose field value stayed the same are left out.
+    """
+    leaving: list[tuple[I, Any]] = [(row_id, get_field_value(previous_rows[row_id])) for row_id in change.removed]
+    entering: list[tuple[I, Any]] = [(row_id, get_field_value(current_rows[row_id])) for row_id in change.added]
+    for row_id in change.changed:
+        previous_value = get_field_value(previous_rows[row_id])
+        current_value = get_field_value(current_rows[row_id])
+        if previous_value is not current_value and not previous_value == current_value:
+            leaving.append((row_id, previous_value))
+            entering.append((row_id, current_value))
+    return leaving, entering
+
+
+@dataclass(frozen=True, slots=True)
+class HashIndex(Generic[I, R]):
+    """
+    Index of the row ids by the value of a record field, for equality lookups.
+
+    The index value is a PersistentMap from field value to the PersistentSet of the
+    ids of all rows holding that value. Field values must be hashable.
+
+    Attributes:
+        field: The key (for mapping records) or attribute name of the field, or a
+               function computing the indexed value from a record.
+    """
+
+    field: str|Callable[[R], Any]
+
+    def field_value(self, record: R) -> Any:
+        """Get the indexed value of a record."""
+        return _field_value_getter(self.field)(record)
+
+    def build(self, rows: Mapping[I, R]) -> PersistentMap[Any, PersistentSet[I]]:
+        """Build the index of `rows` from scratch in O(n)."""
+        get_field_value = _field_value_getter(self.field)
+        groups: dict[Any, list[I]] = {}
+        for row_id, record in rows.items():
+            groups.setdefault(get_field_value(record), []).append(row_id)
+        return PersistentMap((value, PersistentSet(row_ids)) for value, row_ids in groups.items())
+
+    def apply(self, index: PersistentMap[Any, PersistentSet[I]], previous_rows: Mapping[I, R], current_rows: Mapping[I, R], change: MapChange[I]) -> PersistentMap[Any, PersistentSet[I]]:
+        """Update the index of `previous_rows` to the index of `current_rows`."""
+        leaving, entering = _changed_field_values(_field_value_getter(self.field), previous_rows, current_rows, change)
+        removed: dict[Any, list[I]] = {}
+        added: dict[Any, list[I]] = {}
+        for row_id, value in leaving:
+            removed.setdefault(value, []).append(row_id)
+        for row_id, value in entering:
+            added.setdefault(value, []).append(row_id)
+        updated: dict[Any, PersistentSet[I]] = {}
+        emptied: list[Any] = []
+        for value in removed.keys() | added.keys():
+            row_ids: PersistentSet[I] = index.get(value, _EMPTY_IDS)._apply(added.get(value, ()), removed.get(value, ()))
+            if len(row_ids) == 0:
+                emptied.append(value)
+            else:
+                updated[value] = row_ids
+        return index.update(updated).remove_keys(emptied)
+
+    def lookup(self, index: PersistentMap[Any, PersistentSet[I]], value: Any) -> PersistentSet[I]:
+        """Get the ids of the rows holding `value` in O(1)."""
+        return index.get(value, _EMPTY_IDS)
+
+
+@dataclass(frozen=True, slots=True)
+class SortedIndex(Generic[I, R]):
+    """
+    Index of the row ids sorted by the value of a record field, for equality and range lookups.
+
+    The index value is a PersistentVector of (field value, row id) pairs, sorted by
+    field value; rows with equal field values keep the order in which they entered.
+    Field values must be mutually comparable.
+
+    Attributes:
+        field: The key (for mapping records) or attribute name of the field, or a
+               function computing the indexed value from a record.
+    """
+
+    field: str|Callable[[R], Any]
+
+    def field_value(self, record: R) -> Any:
+        """Get the indexed value of a record."""
+        return _field_value_getter(self.field)(record)
+
+    def build(self, rows: Mapping[I, R]) -> PersistentVector[tuple[Any, I]]:
+        """Build the index of `rows` from scratch in O(n log n)."""
+        get_field_value = _field_value_getter(self.field)
+        return PersistentVector(sorted(((get_field_value(record), row_id) for row_id, record in rows.items()), key=_entry_field_value))
+
+    def apply(self, index: PersistentVector[tuple[Any, I]], previous_rows: Mapping[I, R], current_rows: Mapping[I, R], change: MapChange[I]) -> PersistentVector[tuple[Any, I]]:
+        """
+        Update the index of `previous_rows` to the index of `current_rows`.
+
+        Raises:
+            ValueError: If a leaving row is not in `index` under its previous field value
+                (e.g. if the record was modified in place).
+        """
+        leaving, entering = _changed_field_values(_field_value_getter(self.field), previous_rows, current_rows, change)
+        for row_id, value in leaving:
+            position: int = bisect_left(index, value, key=_entry_field_value)
+            stop: int = bisect_right(index, value, lo=position, key=_entry_field_value)
+            while position < stop and index[position][1] != row_id:
+                position += 1
+            if position == stop:
+                raise ValueError(f"Row {row_id!r} is not in the sorted index under its field value {value!r}; the index does not match the previous rows")
+            index = index.delete(position)
+        for row_id, value in entering:
+            index = index.insert(bisect_right(index, value, key=_entry_field_value), (value, row_id))
+        return index
+
+    def lookup(self, index: PersistentVector[tuple[Any, I]], value: Any) -> PersistentSet[I]:
+        """Get the ids of the rows holding `value` in O(log n + m) for m rows."""
+        start: int = bisect_left(index, value, key=_entry_field_value)
+        stop: int = bisect_right(index, value, key=_entry_field_value)
+        if start == stop:
+            return _EMPTY_IDS
+        return PersistentSet(row_id for _, row_id in index._iter_slice(start, stop))
+
+    def range(self, index: PersistentVector[tuple[Any, I]], lower: Any = None, upper: Any = None) -> PersistentVector[I]:
+        """
+        Get the ids of the rows whose field value is in [lower, upper), in field value order.
+
+        None is unbounded. O(log n + m) for m rows in the range.
+        """
+        start: int = 0 if lower is None else bisect_left(index, lower, key=_entry_field_value)
+        stop: int = len(index) if upper is None else bisect_left(index, upper, key=_entry_field_value)
+        return PersistentVector(row_id for _, row_id in index._iter_slice(start, stop))
+
+
+TableIndex = HashIndex[Any, Any] | SortedIndex[Any, Any]
+"""Any declared index of an XTable."""
+
+
+class IncrementalIndex(DeriveCache[Mapping[I, R], Any], Generic[I, R]):
+    """
+    Derives the value of an index for row values, reusing the index of the previous rows.
+
+    Use one instance per declared index as the source of its secondary hook callback.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: TableIndex) -> None:
+        super().__init__()
+        self._index: TableIndex = index
+
+    def derive(self, rows: Optional[Mapping[I, R]]) -> Any:
+        """Get the index value of `rows` (of an empty table for None)."""
+        return self._derive(PersistentMap() if rows is None else rows)
+
+    def _derive_from_edit(self, previous_source: Mapping[I, R], previous_value: Any, source: Mapping[I, R]) -> Any:
+        if not isinstance(source, PersistentMap):
+            return None
+        change = source.changes_from(previous_source)
+        if change is None:
+            return None
+        return self._index.apply(previous_value, previous_source, source, change)
+
+    def _derive_from_scratch(self, source: Mapping[I, R]) -> Any:
+        return self._index.build(source)
+
+
+def changed_field_values(index: TableIndex, previous_rows: Mapping[Any, Any], current_rows: Mapping[Any, Any], change: MapChange[Any]) -> Iterable[Any]:
+    """
+    Get the field values whose set of rows in `index` is affected by `change`.
+    """
+    leaving, entering = _changed_field_values(_field_value_getter(index.field), previous_rows, current_rows, change)
+    return [value for _, value in leaving] + [value for _, value in entering]
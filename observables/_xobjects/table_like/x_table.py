@@ -0,0 +1,397 @@
+from typing import Generic, TypeVar, Callable, Literal, Optional, Any, Mapping
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from logging import Logger
+
+from ..._hooks.hook_aliases import Hook, ReadOnlyHook
+from ..._hooks.hook_protocols.managed_hook_protocol import ManagedHookProtocol
+from ..._carries_hooks.x_complex_base import ComplexObservableBase
+from ..._nexus_system.submission_error import SubmissionError
+from ..list_like.persistent_vector import PersistentVector
+from ..set_like.persistent_set import PersistentSet
+from ..dict_like.persistent_map import PersistentMap
+from ..dict_like.map_change import MapChange
+from ..dict_like.utils import map_changes
+from .table_index import HashIndex, SortedIndex, TableIndex, IncrementalIndex, changed_field_values
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+_RESERVED_HOOK_KEYS: frozenset[str] = frozenset({"rows", "length"})
+
+
+@dataclass(frozen=True, slots=True)
+class _LookupHookKey:
+    """Hook key of a lookup hook: the rows of `index` holding `value`."""
+    index: str
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class _RangeHookKey:
+    """Hook key of a range hook: the rows of the sorted `index` with a value in [lower, upper)."""
+    index: str
+    lower: Any
+    upper: Any
+
+
+class ObservableTable(ComplexObservableBase[Literal["rows"], str, Mapping[I, R], Any, "ObservableTable"], Generic[I, R]):
+    """
+    A table of records by row id, with declared secondary indexes on record fields.
+
+    The rows are stored as a PersistentMap (like XDict), so single-row edits cost O(log n). Each
+    declared index (`HashIndex` or `SortedIndex`) is a read-only secondary hook, keyed by its name,
+    that is updated from the changed rows only - an edit of k rows costs O(k log n) instead of
+    scanning all rows.
+
+    On top of the index hooks, the table offers lazily created read-only hooks for single lookups:
+    `lookup_hook(index, value)` (the ids of the rows holding `value`) and, for sorted indexes,
+    `range_hook(index, lower, upper)` (the ids of the rows with a value in [lower, upper)). They are
+    only updated - and their listeners only notified - if a change affects their rows.
+
+    Example:
+        >>> tasks = ObservableTable(
+        ...     {1: {"status": "open", "due": 3}, 2: {"status": "done", "due": 1}},
+        ...     indexes={"by_status": HashIndex("status"), "by_due": SortedIndex("due")}
+        ... )
+        >>> open_tasks = tasks.lookup_hook("by_status", "open")
+        >>> tasks[3] = {"status": "open", "due": 2}
+        >>> open_tasks.value
+        PersistentSet({1, 3})
+        >>> tasks.range("by_due", None, 3)
+        PersistentVector([2, 3])
+    """
+
+    def __init__(self, observable_or_hook_or_value: Mapping[I, R] | Hook[Mapping[I, R]] | ReadOnlyHook[Mapping[I, R]] | None = None, indexes: Mapping[str, TableIndex] = {}, logger: Optional[Logger] = None) -> None: # type: ignore
+        """
+        Initialize an ObservableTable.
+
+        Args:
+            observable_or_hook_or_value: The initial rows (a Mapping from row id to record), a hook
+                holding such a mapping, another ObservableTable to join with, or None for no rows
+            indexes: The secondary indexes by name. The names are the keys of the index hooks and
+                must not be "rows" or "length".
+            logger: Optional logger for debugging
+
+        Raises:
+            ValueError: If an index name is reserved or the rows are not a Mapping.
+        """
+
+        reserved_names = _RESERVED_HOOK_KEYS & indexes.keys()
+        if reserved_names:
+            raise ValueError(f"Index names {sorted(reserved_names)} are reserved")
+
+        if observable_or_hook_or_value is None:
+            initial_rows: Mapping[I, R] = PersistentMap()
+            hook: Optional[ManagedHookProtocol[Mapping[I, R]]] = None
+        elif isinstance(observable_or_hook_or_value, ObservableTable):
+            initial_rows = observable_or_hook_or_value.rows_hook.value # type: ignore
+            hook = observable_or_hook_or_value.rows_hook # type: ignore
+        elif isinstance(observable_or_hook_or_value, ManagedHookProtocol):
+            initial_rows = observable_or_hook_or_value.value # type: ignore
+            hook = observable_or_hook_or_value # type: ignore
+        elif isinstance(observable_or_hook_or_value, Mapping):
+            initial_rows = PersistentMap(observable_or_hook_or_value)
+            hook = None
+        else:
+            raise ValueError("Invalid initial value")
+
+        def is_valid_value(x: Mapping[Literal["rows"], Any]) -> tuple[bool, str]:
+            return (True, "Verification method passed") if isinstance(x["rows"], Mapping) else (False, "Rows are not a Mapping")
+
+        self._indexes: dict[str, TableIndex] = dict(indexes)
+        secondary_hook_callbacks: dict[str, Callable[[Mapping[Literal["rows"], Any]], Any]] = {"length": lambda x: len(x["rows"])}
+        for name, index in self._indexes.items():
+            incremental_index: IncrementalIndex[I, R] = IncrementalIndex(index)
+            secondary_hook_callbacks[name] = lambda x, incremental_index=incremental_index: incremental_index.derive(x["rows"]) # type: ignore
+
+        super().__init__(
+            initial_hook_values={"rows": initial_rows}, # type: ignore
+            verification_method=is_valid_value,
+            secondary_hook_callbacks=secondary_hook_callbacks, # type: ignore
+            logger=logger
+        )
+
+        # Lookup and range hooks are dynamic hooks; the range hooks are listed by index, lookup hooks only counted
+        self._range_hook_keys: dict[str, list[_RangeHookKey]] = {}
+        self._number_of_lookup_hooks: dict[str, int] = {}
+
+        if hook is not None:
+            self._join("rows", hook, "use_target_value") # type: ignore
+
+    def _get_persistent_map(self) -> PersistentMap[I, R]:
+        """
+        Get the stored rows as a PersistentMap.
+
+        The hook may hold any mapping (e.g. if it was joined with a hook holding a plain dict).
+        In that case the value is converted once; the next edit stores the PersistentMap in the nexus.
+        """
+        current = self._primary_hooks["rows"].value
+        if isinstance(current, PersistentMap):
+            return current # type: ignore
+        return PersistentMap(current) # type: ignore
+
+    def _submit_persistent_map(self, current: PersistentMap[I, R], new_rows: PersistentMap[I, R]) -> None:
+        """
+        Submit a new PersistentMap as the rows, if it differs from `current`.
+        """
+        if new_rows is current:
+            return
+        success, msg = self._submit_value("rows", new_rows)
+        if not success:
+            raise SubmissionError(msg, new_rows, "rows")
+
+    def _get_index(self, name: str) -> TableIndex:
+        if name not in self._indexes:
+            raise ValueError(f"No index named {name!r}")
+        return self._indexes[name]
+
+    def _get_sorted_index(self, name: str) -> SortedIndex[I, R]:
+        index = self._get_index(name)
+        if not isinstance(index, SortedIndex):
+            raise ValueError(f"Index {name!r} is not a SortedIndex")
+        return index # type: ignore
+
+    def _lookup_value(self, hook_key: _LookupHookKey|_RangeHookKey, index_value: Any) -> Any:
+        """Get the value of a lookup or range hook from the value of its index."""
+        if isinstance(hook_key, _RangeHookKey):
+            return self._get_sorted_index(hook_key.index).range(index_value, hook_key.lower, hook_key.upper)
+        return self._get_index(hook_key.index).lookup(index_value, hook_key.value) # type: ignore
+
+    #########################################################
+    # Lookup and range hooks
+    #########################################################
+
+    def _get_or_create_lookup_hook(self, hook_key: _LookupHookKey|_RangeHookKey) -> ReadOnlyHook[Any]:
+        return self._get_or_create_dynamic_hook(hook_key, lambda: self._lookup_value(hook_key, self._secondary_hooks[hook_key.index].value)) # type: ignore
+
+    def _dynamic_hook_created(self, hook_key: _LookupHookKey|_RangeHookKey) -> None:
+        if isinstance(hook_key, _RangeHookKey):
+            self._range_hook_keys.setdefault(hook_key.index, []).append(hook_key)
+        else:
+            self._number_of_lookup_hooks[hook_key.index] = self._number_of_lookup_hooks.get(hook_key.index, 0) + 1
+
+    def _dynamic_hook_dropped(self, hook_key: _LookupHookKey|_RangeHookKey) -> None:
+        if isinstance(hook_key, _RangeHookKey):
+            self._range_hook_keys[hook_key.index].remove(hook_key)
+        else:
+            self._number_of_lookup_hooks[hook_key.index] -= 1
+
+    def lookup_hook(self, index: str, value: Any) -> ReadOnlyHook[PersistentSet[I]]:
+        """
+        Get a read-only hook for the ids of the rows whose indexed field holds `value`.
+
+        The hook is created on first access and returned again on later calls. It is only
+        updated if a change adds, removes or moves a row with this field value.
+
+        Args:
+            index: The name of the index (hash or sorted)
+            value: The field value to look up
+
+        Raises:
+            ValueError: If there is no index with this name.
+        """
+        self._get_index(index)
+        return self._get_or_create_lookup_hook(_LookupHookKey(index, value)) # type: ignore
+
+    def range_hook(self, index: str, lower: Any = None, upper: Any = None) -> ReadOnlyHook[PersistentVector[I]]:
+        """
+        Get a read-only hook for the ids of the rows whose indexed field is in [lower, upper).
+
+        The ids are ordered by field value. The hook is created on first access and returned
+        again on later calls. It is only updated if a change affects a row in the range.
+
+        Args:
+            index: The name of a sorted index
+            lower: The inclusive lower bound (None: unbounded)
+            upper: The exclusive upper bound (None: unbounded)
+
+        Raises:
+            ValueError: If there is no sorted index with this name.
+        """
+        self._get_sorted_index(index)
+        return self._get_or_create_lookup_hook(_RangeHookKey(index, lower, upper)) # type: ignore
+
+    def _affected_lookup_hook_keys(self, previous_rows: Mapping[I, R], current_rows: Mapping[I, R], change: MapChange[I]) -> list[_LookupHookKey|_RangeHookKey]:
+        """
+        Get the keys of the lookup and range hooks whose rows may be affected by `change`.
+
+        Lookup hooks are found by the changed field values, so their number does not matter;
+        the range hooks of an index are checked against the changed field values one by one.
+        """
+        affected: list[_LookupHookKey|_RangeHookKey] = []
+        for name, index in self._indexes.items():
+            range_hook_keys = self._range_hook_keys.get(name, ())
+            if self._number_of_lookup_hooks.get(name, 0) == 0 and not range_hook_keys:
+                continue
+            field_values = changed_field_values(index, previous_rows, current_rows, change)
+            for value in set(field_values):
+                hook_key = _LookupHookKey(name, value)
+                if self._get_dynamic_hook(hook_key) is not None:
+                    affected.append(hook_key)
+            for range_hook_key in range_hook_keys:
+                lower, upper = range_hook_key.lower, range_hook_key.upper
+                if any((lower is None or not value < lower) and (upper is None or value < upper) for value in field_values):
+                    affected.append(range_hook_key)
+        return affected
+
+    def _derive_dynamic_hook_values(self, current: Mapping[Any, Any], final: Mapping[Any, Any]) -> Mapping[Any, Any]:
+        """
+        Get the new values of the lookup and range hooks affected by the row change.
+        """
+        current_rows: Mapping[I, R] = current["rows"]
+        final_rows: Mapping[I, R] = final["rows"]
+        derived: dict[Any, Any] = {}
+        if final_rows is current_rows:
+            return derived
+        for hook_key in self._affected_lookup_hook_keys(current_rows, final_rows, map_changes(current_rows, final_rows)):
+            lookup_hook = self._get_dynamic_hook(hook_key)
+            if lookup_hook is None:
+                continue
+            # The completion has derived the indexes of the final rows before
+            value = self._lookup_value(hook_key, self._secondary_values[hook_key.index]) # type: ignore
+            if not value == lookup_hook.value:
+                derived[hook_key] = value
+        return derived
+
+    #########################################################
+    # Rows, length and indexes
+    #########################################################
+
+    @property
+    def rows_hook(self) -> Hook[Mapping[I, R]]:
+        """Get the hook for the rows (a Mapping from row id to record)."""
+        return self._primary_hooks["rows"] # type: ignore
+
+    @property
+    def rows(self) -> Mapping[I, R]:
+        """Get the current rows (an immutable, insertion-ordered PersistentMap)."""
+        return self._primary_hooks["rows"].value # type: ignore
+
+    def change_rows(self, new_rows: Mapping[I, R]) -> None:
+        """Replace all rows. The indexes are rebuilt."""
+        if not isinstance(new_rows, PersistentMap):
+            new_rows = PersistentMap(new_rows)
+        success, msg = self._submit_value("rows", new_rows)
+        if not success:
+            raise SubmissionError(msg, new_rows, "rows")
+
+    @property
+    def last_changes(self) -> MapChange[I]:
+        """Get the row ids added, removed and changed by the latest change of the rows."""
+        rows_hook = self._primary_hooks["rows"]
+        return map_changes(rows_hook.previous_value, rows_hook.value) # type: ignore
+
+    @property
+    def length_hook(self) -> ReadOnlyHook[int]:
+        """Get the hook for the number of rows."""
+        return self._secondary_hooks["length"] # type: ignore
+
+    @property
+    def length(self) -> int:
+        """Get the number of rows."""
+        return len(self._primary_hooks["rows"].value) # type: ignore
+
+    @property
+    def indexes(self) -> dict[str, TableIndex]:
+        """Get the declared indexes by name."""
+        return dict(self._indexes)
+
+    def index_hook(self, index: str) -> ReadOnlyHook[Any]:
+        """
+        Get the read-only hook holding the value of an index.
+
+        For a HashIndex this is a PersistentMap from field value to the PersistentSet of row ids,
+        for a SortedIndex a PersistentVector of (field value, row id) pairs sorted by field value.
+
+        Raises:
+            ValueError: If there is no index with this name.
+        """
+        self._get_index(index)
+        return self._secondary_hooks[index] # type: ignore
+
+    def lookup(self, index: str, value: Any) -> PersistentSet[I]:
+        """
+        Get the ids of the rows whose indexed field holds `value`.
+
+        Raises:
+            ValueError: If there is no index with this name.
+        """
+        return self._get_index(index).lookup(self._secondary_hooks[index].value, value) # type: ignore
+
+    def range(self, index: str, lower: Any = None, upper: Any = None) -> PersistentVector[I]:
+        """
+        Get the ids of the rows whose indexed field is in [lower, upper), ordered by field value.
+
+        Raises:
+            ValueError: If there is no sorted index with this name.
+        """
+        return self._get_sorted_index(index).range(self._secondary_hooks[index].value, lower, upper) # type: ignore
+
+    #########################################################
+    # Row edits
+    #########################################################
+
+    def set_row(self, row_id: I, record: R) -> None:
+        """Add or replace a row in O(log n), updating the indexes in O(log n)."""
+        current = self._get_persistent_map()
+        self._submit_persistent_map(current, current.set(row_id, record))
+
+    def update_rows(self, rows: Mapping[I, R] | Iterable[tuple[I, R]]) -> None:
+        """Add or replace several rows in a single change, in O(k log n) for k rows."""
+        current = self._get_persistent_map()
+        self._submit_persistent_map(current, current.update(rows))
+
+    def remove_row(self, row_id: I) -> None:
+        """
+        Remove a row in O(log n).
+
+        Raises:
+            KeyError: If there is no row with this id.
+        """
+        current = self._get_persistent_map()
+        if row_id not in current:
+            raise KeyError(row_id)
+        self._submit_persistent_map(current, current.delete(row_id))
+
+    def remove_rows(self, row_ids: Iterable[I]) -> None:
+        """Remove several rows in a single change. Missing ids are ignored."""
+        current = self._get_persistent_map()
+        self._submit_persistent_map(current, current.remove_keys(row_ids))
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        if len(self._primary_hooks["rows"].value) > 0: # type: ignore
+            self.change_rows(PersistentMap())
+
+    def get(self, row_id: I, default: Optional[R] = None) -> Optional[R]:
+        """Get the record of a row, or `default` if there is no row with this id."""
+        return self._primary_hooks["rows"].value.get(row_id, default) # type: ignore
+
+    #########################################################
+    # Mapping dunder methods
+    #########################################################
+
+    def __getitem__(self, row_id: I) -> R:
+        return self._primary_hooks["rows"].value[row_id] # type: ignore
+
+    def __setitem__(self, row_id: I, record: R) -> None:
+        self.set_row(row_id, record)
+
+    def __delitem__(self, row_id: I) -> None:
+        self.remove_row(row_id)
+
+    def __contains__(self, row_id: object) -> bool:
+        return row_id in self._primary_hooks["rows"].value # type: ignore
+
+    def __iter__(self) -> Iterator[I]:
+        return iter(self._primary_hooks["rows"].value) # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._primary_hooks["rows"].value) # type: ignore
+
+    def __str__(self) -> str:
+        return f"OT(rows={dict(self._primary_hooks['rows'].value)})" # type: ignore
+
+    def __repr__(self) -> str:
+        return f"ObservableTable({dict(self._primary_hooks['rows'].value)})" # type: ignore
@@ -1,10 +1,12 @@
-from typing import Any, Callable, Generic, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Generic, Literal, Optional, TypeVar
 from logging import Logger
 
 from .._hooks.hook_aliases import Hook, ReadOnlyHook
 from .._carries_hooks.x_single_value_base import XValueBase
 from .._carries_hooks.carries_single_hook_protocol import CarriesSingleHookProtocol
 from .._nexus_system.submission_error import SubmissionError
+from .function_like.expression import Expression, as_expression
+from .function_like.function_memo import FunctionMemo, MemoInfo
 
 T = TypeVar("T")
 
@@ -46,6 +48,7 @@ class ObservableSingleValue(XValueBase[T], CarriesSingleHookProtocol[T], Generic
         - **Listener Notifications**: Callbacks triggered on value changes
         - **Thread Safety**: All operations protected by NexusManager's lock
         - **Memory Efficient**: Shares centralized storage via HookNexus
+        - **Expressions**: Arithmetic operators build derived values (`xa + xb * 2`), see Expression
     
     Example:
         Basic usage::
@@ -95,7 +98,7 @@ class ObservableSingleValue(XValueBase[T], CarriesSingleHookProtocol[T], Generic
             counter.value = 2  # Prints: "Count: 2"
     """
 
-    def __init__(self, value_or_hook: T | Hook[T] | ReadOnlyHook[T] | CarriesSingleHookProtocol[T], validator: Optional[Callable[[T], tuple[bool, str]]] = None, logger: Optional[Logger] = None) -> None: # type: ignore
+    def __init__(self, value_or_hook: T | Hook[T] | ReadOnlyHook[T] | CarriesSingleHookProtocol[T], validator: Optional[Callable[[T], tuple[bool, str]]] = None, logger: Optional[Logger] = None, validation_memo: Optional[FunctionMemo[Literal["value"], T, tuple[bool, str]]] = None, async_validator: Optional[Callable[[T], Awaitable[tuple[bool, str]]]] = None) -> None: # type: ignore
         """
         Initialize an ObservableSingleValue.
         
@@ -117,6 +120,14 @@ class ObservableSingleValue(XValueBase[T], CarriesSingleHookProtocol[T], Generic
             logger: Optional logger for debugging observable operations. If provided,
                 hook connections, value changes, and errors will be logged.
                 Default is None.
+            validation_memo: Optional FunctionMemo caching the validation results per value.
+                Only for pure validators (the result depends on the value only): validating
+                or submitting a cached value again, e.g. on every keystroke of a form field,
+                does not call the validator. Default is None (no caching).
+            async_validator: Optional coroutine function validating a value, e.g. against a
+                database. It is awaited by the asynchronous methods (change_value_async,
+                validate_value_async) before the value is submitted; synchronous submissions
+                do not run it. Default is None.
         
         Raises:
             SubmissionError: If validator is provided and the initial value fails validation.
@@ -147,7 +158,9 @@ class ObservableSingleValue(XValueBase[T], CarriesSingleHookProtocol[T], Generic
             value_or_hook=value_or_hook,
             verification_method=validator,
             invalidate_callback=None,
-            logger=logger
+            logger=logger,
+            validation_memo=validation_memo,
+            async_verification_method=async_validator
         )
 
     #########################################################
@@ -205,6 +218,148 @@ class ObservableSingleValue(XValueBase[T], CarriesSingleHookProtocol[T], Generic
             raise SubmissionError(msg, new_value, "value")
         return success, msg
 
+    def compare_and_set(self, expected_value: T, new_value: T) -> bool:
+        """
+        Set a new value only if the current value equals the expected value (thread-safe).
+
+        The check and the change are atomic with respect to other submissions, without holding
+        the lock while the caller computes the new value:
+
+            >>> counter = XValue(0)
+            >>> while True:
+            ...     current = counter.value
+            ...     if counter.compare_and_set(current, current + 1):
+            ...         break
+
+        Args:
+            expected_value: The value the observable must hold (compared with the nexus manager's equality)
+            new_value: The new value to set
+
+        Returns:
+            True if the value was set, False if the current value differs from the expected value
+
+        Raises:
+            SubmissionError: If the new value fails validation
+        """
+        hook = self._get_single_hook()
+        while True:
+            nexus = hook._get_nexus() # type: ignore
+            # The version is read before the value, see Nexus.version
+            version: int = nexus.version
+            if not self._nexus_manager.is_equal(nexus.stored_value, expected_value):
+                return False
+            success, msg = self._nexus_manager.submit_values({nexus: new_value}, expected_versions={nexus: version})
+            if success:
+                return True
+            if nexus.version == version and hook._get_nexus() is nexus: # type: ignore
+                raise SubmissionError(msg, new_value, "value")
+
+    async def change_value_async(self, new_value: T, *, raise_submission_error_flag: bool = True) -> tuple[bool, str]:
+        """
+        Change the value from a coroutine, without blocking the event loop.
+
+        The async_validator (if any) is awaited before the value is submitted.
+
+        Args:
+            new_value: The new value to set
+
+        Raises:
+            SubmissionError: If the new value fails validation
+        """
+        success, msg = await self._submit_values_async({"value": new_value})
+        if not success and raise_submission_error_flag:
+            raise SubmissionError(msg, new_value, "value")
+        return success, msg
+
+    async def validate_value_async(self, value: T) -> tuple[bool, str]:
+        """
+        Validate a value without changing it, including the async_validator (if any).
+
+        Returns:
+            Tuple of (success, message)
+        """
+        return await self._submit_values_async({"value": value}, mode="Check values")
+
+    @property
+    def validation_memo(self) -> Optional[FunctionMemo[Literal["value"], T, tuple[bool, str]]]:
+        """Get the FunctionMemo caching the validation results, None if they are not cached."""
+        return self._validation_memo
+
+    def validation_memo_info(self) -> Optional[MemoInfo]:
+        """Get the hit/miss counters of the validation memo, None if the validation results are not cached."""
+        return self._validation_memo.info() if self._validation_memo is not None else None
+
+    #########################################################
+    # Expressions
+    #########################################################
+
+    # Arithmetic builds an Expression whose hook follows this value, instead of computing
+    # a plain value once. Comparisons and conversions still use the current value.
+
+    def __add__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self + other`."""
+        return as_expression(self) + other
+
+    def __radd__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other + self`."""
+        return as_expression(other) + as_expression(self)
+
+    def __sub__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self - other`."""
+        return as_expression(self) - other
+
+    def __rsub__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other - self`."""
+        return as_expression(other) - as_expression(self)
+
+    def __mul__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self * other`."""
+        return as_expression(self) * other
+
+    def __rmul__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other * self`."""
+        return as_expression(other) * as_expression(self)
+
+    def __truediv__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self / other`."""
+        return as_expression(self) / other
+
+    def __rtruediv__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other / self`."""
+        return as_expression(other) / as_expression(self)
+
+    def __floordiv__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self // other`."""
+        return as_expression(self) // other
+
+    def __rfloordiv__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other // self`."""
+        return as_expression(other) // as_expression(self)
+
+    def __mod__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self % other`."""
+        return as_expression(self) % other
+
+    def __rmod__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other % self`."""
+        return as_expression(other) % as_expression(self)
+
+    def __pow__(self, other: Any) -> Expression[Any]:
+        """Build the expression `self ** other`."""
+        return as_expression(self) ** other
+
+    def __rpow__(self, other: Any) -> Expression[Any]:
+        """Build the expression `other ** self`."""
+        return as_expression(other) ** as_expression(self)
+
+    def __neg__(self) -> Expression[Any]:
+        """Build the expression `-self`."""
+        return -as_expression(self)
+
+    def __pos__(self) -> Expression[Any]:
+        """Build the expression `+self`."""
+        return +as_expression(self)
+
     #########################################################
     # Standard object methods
     #########################################################
@@ -21,6 +21,9 @@ Core Components:
 - BaseListening/BaseListeningProtocol: Base classes for listener management
 - DEFAULT_NEXUS_MANAGER: The default nexus manager instance
 - default_nexus_manager: Module containing configuration (e.g., FLOAT_ACCURACY)
+- PersistentVector: Immutable, structurally shared sequence stored by XList
+- PersistentSet: Immutable, structurally shared hash set stored by XSet
+- PersistentMap: Immutable, insertion-ordered mapping (backed by immutables.Map) stored by XDict
 
 Example Usage with New Protocol-Based Architecture:
     >>> from observables.core import BaseObservable, OwnedHook, HookWithOwnerProtocol
@@ -83,6 +86,9 @@ from ._publisher_subscriber.subscriber import Subscriber
 from ._nexus_system import default_nexus_manager
 from ._nexus_system.submission_error import SubmissionError
 from ._nexus_system.update_function_values import UpdateFunctionValues
+from ._xobjects.list_like.persistent_vector import PersistentVector
+from ._xobjects.set_like.persistent_set import PersistentSet
+from ._xobjects.dict_like.persistent_map import PersistentMap
 
 # Re-export the module for easy access to configuration
 # Users should modify: observables.core.default_nexus_manager.FLOAT_ACCURACY
@@ -104,5 +110,8 @@ __all__ = [
     'Subscriber',
     'SubmissionError',
     'UpdateFunctionValues',
+    'PersistentVector',
+    'PersistentSet',
+    'PersistentMap',
 ]
 
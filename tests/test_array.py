@@ -0,0 +1,112 @@
+"""
+Test cases for XArray and the ndarray equality callback
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from observables import XArray, XValue, ArrayChange
+from observables.core import DEFAULT_NEXUS_MANAGER
+from observables._xobjects.array_like.array_change import as_basic_region, record_array_change, recorded_array_change
+
+from tests.test_base import ObservableTestCase
+
+
+class TestArrayEquality(ObservableTestCase):
+    """Test the vectorized equality of numpy arrays in the nexus system"""
+
+    def test_is_equal_with_tolerance(self):
+        """Test element-wise equality with float tolerance and NaN"""
+        assert DEFAULT_NEXUS_MANAGER.is_equal(np.array([1.0, np.nan]), np.array([1.0 + 1e-12, np.nan]))
+        assert not DEFAULT_NEXUS_MANAGER.is_equal(np.array([1.0, 2.0]), np.array([1.0, 2.1]))
+        assert not DEFAULT_NEXUS_MANAGER.is_equal(np.zeros(3), np.zeros(4))
+        assert DEFAULT_NEXUS_MANAGER.is_equal(np.arange(3), np.arange(3))
+
+    def test_is_equal_with_non_numeric_arrays(self):
+        """Test that string and object arrays are compared without the float tolerance"""
+        assert not DEFAULT_NEXUS_MANAGER.is_equal(np.array(["a", "b"]), np.array([1.0, 2.0]))
+        assert not DEFAULT_NEXUS_MANAGER.is_equal(np.array([1, "x"], dtype=object), np.array([1.0, 2.0]))
+        assert DEFAULT_NEXUS_MANAGER.is_equal(np.array(["a", "b"]), np.array(["a", "b"]))
+
+        value = XValue(np.array([1.0, 2.0]))
+        value.value = np.array(["a", "b"])
+        assert value.value.dtype.kind == "U"
+
+    def test_xvalue_holding_array(self):
+        """Test that an XValue can hold arrays and ignores equal submissions"""
+        value = XValue(np.zeros(3))
+        calls: list[int] = []
+        value.add_listener(lambda: calls.append(1))
+
+        value.value = np.zeros(3)
+        assert calls == []
+        value.value = np.ones(3)
+        assert calls == [1]
+
+    def test_recorded_region(self):
+        """Test that region edits are recorded for basic indices only"""
+        previous = np.zeros(4)
+        current = previous.copy()
+        current[1:3] = 1
+        record_array_change(previous, current, (slice(1, 3),))
+
+        assert recorded_array_change(previous, current) == ArrayChange((slice(1, 3),))
+        assert recorded_array_change(current, previous) is None
+        assert as_basic_region((1, slice(None), Ellipsis)) == (1, slice(None), Ellipsis)
+        assert as_basic_region([0, 1]) is None
+
+
+class TestXArray(ObservableTestCase):
+    """Test region edits and the secondary hooks of XArray"""
+
+    def test_region_edit(self):
+        """Test that assigning a region creates a new read-only array"""
+        xarray = XArray([0.0, 1.0, 2.0, 3.0])
+        previous = xarray.array
+        xarray[1:3] = 5.0
+
+        assert xarray.array.tolist() == [0.0, 5.0, 5.0, 3.0]
+        assert previous.tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert xarray.last_change == ArrayChange((slice(1, 3),))
+        with pytest.raises(ValueError):
+            xarray.array[0] = 1.0
+
+    def test_statistics_hooks(self):
+        """Test that min, max and mean follow region edits and only notify on changes"""
+        xarray = XArray(np.arange(10))
+        calls: list[str] = []
+        xarray.max_hook.add_listener(lambda: calls.append("max"))
+        xarray.shape_hook.add_listener(lambda: calls.append("shape"))
+
+        xarray[2] = 5
+        assert calls == []
+        assert xarray.mean == pytest.approx(4.8)
+
+        xarray[9] = 1
+        assert xarray.max == 8
+        assert xarray.min == 0
+        assert calls == ["max"]
+
+    def test_random_region_edits_match_reductions(self):
+        """Test random region edits against reductions of the whole array"""
+        rng = np.random.default_rng(1)
+        xarray = XArray(rng.integers(0, 100, size=(40, 3)))
+        for _ in range(200):
+            start, stop = sorted(int(i) for i in rng.integers(0, 40, size=2))
+            xarray[start:stop, int(rng.integers(0, 3))] = rng.integers(-50, 150, size=stop - start)
+            assert xarray.min == xarray.array.min()
+            assert xarray.max == xarray.array.max()
+            assert xarray.mean == pytest.approx(xarray.array.mean())
+
+    def test_joined_arrays(self):
+        """Test that joined arrays share edits and non-numeric arrays have no statistics"""
+        source = XArray(np.zeros(3))
+        linked = XArray(source)
+        source[0] = 2.0
+        assert linked[0] == 2.0
+        assert linked.shape == (3,)
+
+        names = XArray(["a", "b"])
+        assert names.min is None
+        assert names.mean is None
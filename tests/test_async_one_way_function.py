@@ -0,0 +1,145 @@
+"""
+Test cases for XAsyncOneWayFunction
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from observables import XValue, XAsyncOneWayFunction
+
+from tests.test_base import ObservableTestCase
+
+
+class InlineExecutor(Executor):
+    """Executor running every call immediately in the submitting thread"""
+
+    def submit(self, fn, /, *args, **kwargs): # type: ignore
+        future: Future[object] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class TestXAsyncOneWayFunction(ObservableTestCase):
+    """Test the off-submission evaluation, the pending hook and stale result handling"""
+
+    def test_outputs_follow_inputs(self):
+        """Test that input changes return immediately and the outputs follow with pending=False"""
+        release = threading.Event()
+        x = XValue(2)
+
+        def square(values):
+            release.wait(5)
+            return {"square": values["x"] ** 2}
+
+        function = XAsyncOneWayFunction({"x": x.hook}, square, {"square"}, initial_output_values={"square": 0})
+        assert function.pending
+        assert function.value("square") == 0
+
+        release.set()
+        assert function.wait(5)
+        assert not function.pending
+        assert function.value("square") == 4
+
+        pending_values: list[bool] = []
+        function.pending_hook.add_listener(lambda: pending_values.append(function.pending))
+        x.value = 3
+        assert function.wait(5)
+        assert function.value("square") == 9
+        assert pending_values == [True, False]
+
+    def test_latest_input_wins(self):
+        """Test that superseded evaluations are skipped or their results discarded"""
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+        x = XValue(1)
+
+        def slow_identity(values):
+            calls.append(values["x"])
+            started.set()
+            release.wait(5)
+            return {"y": values["x"] * 10}
+
+        function = XAsyncOneWayFunction({"x": x.hook}, slow_identity, {"y"})
+        assert started.wait(5)
+        for value in (2, 3, 4):
+            x.value = value
+        outputs: list[int] = []
+        function.hook("y").add_listener(lambda: outputs.append(function.value("y")))
+
+        release.set()
+        assert function.wait(5)
+        assert function.value("y") == 40
+        assert outputs == [40]
+        assert calls[0] == 1 and calls[-1] == 4
+
+    def test_coroutine_function(self):
+        """Test coroutine functions run in the executor and on an event loop"""
+        async def negate(values):
+            await asyncio.sleep(0)
+            return {"negated": -values["x"]}
+
+        x = XValue(5)
+        in_executor = XAsyncOneWayFunction({"x": x.hook}, negate, {"negated"})
+        assert in_executor.wait(5)
+        assert in_executor.value("negated") == -5
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            on_loop = XAsyncOneWayFunction({"x": x.hook}, negate, {"negated"}, loop=loop)
+            x.value = 7
+            assert on_loop.wait(5) and in_executor.wait(5)
+            assert on_loop.value("negated") == -7
+            assert in_executor.value("negated") == -7
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+
+    def test_error_keeps_outputs(self):
+        """Test that a raising callable keeps the previous outputs and sets last_error"""
+        x = XValue(4)
+
+        def inverse(values):
+            return {"inverse": 1 / values["x"]}
+
+        function = XAsyncOneWayFunction({"x": x.hook}, inverse, {"inverse"})
+        assert function.wait(5)
+        assert function.value("inverse") == 0.25
+
+        x.value = 0
+        assert function.wait(5)
+        assert function.value("inverse") == 0.25
+        assert isinstance(function.last_error, ZeroDivisionError)
+        assert not function.pending
+
+        x.value = 2
+        assert function.wait(5)
+        assert function.value("inverse") == 0.5
+        assert function.last_error is None
+
+    def test_inline_executor(self):
+        """Test that an executor finishing within the submission does not submit recursively"""
+        x = XValue(1)
+        function = XAsyncOneWayFunction({"x": x.hook}, lambda values: {"y": values["x"] + 1}, {"y"}, executor=InlineExecutor())
+        x.value = 5
+
+        assert function.wait(5)
+        assert function.value("y") == 6
+        assert not function.pending
+
+    def test_reserved_and_overlapping_keys(self):
+        """Test that the pending key and overlapping input and output keys are rejected"""
+        x = XValue(1)
+        with pytest.raises(ValueError):
+            XAsyncOneWayFunction({"pending": x.hook}, lambda values: {}, set())
+        with pytest.raises(ValueError):
+            XAsyncOneWayFunction({"x": x.hook}, lambda values: {"x": 1}, {"x"})
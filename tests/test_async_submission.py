@@ -0,0 +1,175 @@
+"""
+Test cases for asynchronous submissions with async validators and awaited publications
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from observables import XValue, XList, XDict, XOneWayFunction
+from observables._nexus_system.submission_error import SubmissionError
+
+from tests.test_base import ObservableTestCase
+
+
+class TestAsyncSubmission(ObservableTestCase):
+    """Test submit_values_async and the async variants of the observables"""
+
+    def test_async_validator(self):
+        """Test that the async validator is awaited by async submissions only"""
+        taken: set[str] = {"alice"}
+        calls: list[str] = []
+
+        async def is_unique(name: str) -> tuple[bool, str]:
+            calls.append(name)
+            await asyncio.sleep(0)
+            return name not in taken, f"'{name}' is taken"
+
+        async def test():
+            user = XValue("bob", async_validator=is_unique)
+            assert await user.validate_value_async("carol") == (True, "Values are valid")
+            assert user.value == "bob"
+
+            await user.change_value_async("carol")
+            assert user.value == "carol"
+
+            with pytest.raises(SubmissionError):
+                await user.change_value_async("alice")
+            assert user.value == "carol"
+            assert calls == ["carol", "carol", "alice"]
+
+            user.value = "alice"
+            assert calls == ["carol", "carol", "alice"]
+
+        asyncio.run(test())
+
+    def test_loop_is_not_blocked(self):
+        """Test that other coroutines run while a submission awaits its validator"""
+        async def test():
+            gate = asyncio.Event()
+            progress: list[str] = []
+
+            async def wait_for_gate(value: int) -> tuple[bool, str]:
+                await gate.wait()
+                return True, ""
+
+            slow = XValue(0, async_validator=wait_for_gate)
+            fast = XValue(0)
+
+            submission = asyncio.create_task(slow.change_value_async(1))
+            await asyncio.sleep(0)
+            await fast.change_value_async(5)
+            progress.append("fast")
+            gate.set()
+            await submission
+            progress.append("slow")
+
+            assert progress == ["fast", "slow"]
+            assert slow.value == 1 and fast.value == 5
+
+        asyncio.run(test())
+
+    def test_revalidation_after_concurrent_change(self):
+        """Test that values changed during the async validation are completed and validated again"""
+        async def test():
+            validated: list[int] = []
+            gate = asyncio.Event()
+            a = XValue(1)
+            b = XValue(0)
+            total = XOneWayFunction({"a": a.hook, "b": b.hook}, lambda v: {"sum": v["a"] + v["b"]}, {"sum"})
+
+            async def check_sum(value: int) -> tuple[bool, str]:
+                validated.append(value)
+                await gate.wait()
+                return value < 100, "Too large"
+
+            watched = XValue(total.hook("sum"), async_validator=check_sum)
+            submission = asyncio.create_task(b.change_value_async(10))
+            await asyncio.sleep(0)
+            a.value = 2
+            gate.set()
+            assert (await submission)[0]
+            assert validated == [11, 12]
+            assert watched.value == 12
+
+        asyncio.run(test())
+
+    def test_list_and_dict_variants(self):
+        """Test the async variants of XList and XDict and the awaited publications"""
+        async def test():
+            items: XList[int] = XList([1])
+            await items.append_async(2)
+            await items.extend_async([3, 4])
+            await items.insert_async(0, 0)
+            assert items.value == [0, 1, 2, 3, 4]
+            await items.clear_async()
+            assert items.value == []
+
+            reactions: list[str] = []
+
+            async def on_publication() -> None:
+                await asyncio.sleep(0)
+                reactions.append("published")
+
+            mapping: XDict[str, int] = XDict({"a": 1})
+            mapping.dict_hook.preferred_publish_mode = "sync"
+            mapping.dict_hook.add_subscriber(on_publication)
+            await mapping.set_item_async("b", 2)
+            assert reactions == ["published"]
+            await mapping.update_async({"c": 3})
+            await mapping.remove_item_async("a")
+            assert dict(mapping.dict) == {"b": 2, "c": 3}
+            assert len(reactions) == 3
+
+        asyncio.run(test())
+
+    def test_lock_held_by_other_thread(self):
+        """Test that an async submission waits for a submission of another thread without blocking"""
+        async def test():
+            value = XValue(0)
+            holding = threading.Event()
+            release = threading.Event()
+
+            def hold_lock():
+                with value._nexus_manager._lock:
+                    holding.set()
+                    release.wait(5)
+
+            thread = threading.Thread(target=hold_lock)
+            thread.start()
+            holding.wait(5)
+            submission = asyncio.create_task(value.change_value_async(3))
+            await asyncio.sleep(0.01)
+            assert not submission.done()
+            release.set()
+            await submission
+            thread.join(5)
+            assert value.value == 3
+
+        asyncio.run(test())
+
+    def test_concurrent_edits_under_contention(self):
+        """Test that concurrent async edits are computed from the latest value when they get the lock"""
+        async def test():
+            items: XList[int] = XList()
+            mapping: XDict[str, int] = XDict()
+            holding = threading.Event()
+
+            def hold_lock():
+                with items._nexus_manager._lock:
+                    holding.set()
+                    threading.Event().wait(0.02)
+
+            thread = threading.Thread(target=hold_lock)
+            thread.start()
+            holding.wait(5)
+            await asyncio.gather(
+                *(items.append_async(i) for i in range(1, 4)),
+                *(mapping.set_item_async(str(i), i) for i in range(1, 4)),
+            )
+            thread.join(5)
+            assert sorted(items.value) == [1, 2, 3]
+            assert dict(mapping.dict) == {"1": 1, "2": 2, "3": 3}
+
+        asyncio.run(test())
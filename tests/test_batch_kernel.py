@@ -0,0 +1,59 @@
+"""
+Test cases for BatchKernel and batch evaluated XOneWayFunctions
+"""
+
+import pytest
+
+from observables import XValue, XOneWayFunction, BatchKernel
+from observables.core import DEFAULT_NEXUS_MANAGER
+
+from tests.test_base import ObservableTestCase
+
+
+class TestBatchKernel(ObservableTestCase):
+    """Test the vectorized evaluation of functions sharing a kernel"""
+
+    def test_one_kernel_call_per_submission(self):
+        """Test that all functions affected by a submission are evaluated with one kernel call"""
+        rate = XValue(1.0)
+        kernel: BatchKernel[str, str] = BatchKernel(lambda columns: {"total": [p * q * columns["rate"][0] for p, q in zip(columns["price"], columns["quantity"])]})
+        rows = [XOneWayFunction({"price": float(i), "quantity": 2.0, "rate": rate.hook}, kernel.evaluate_one, {"total"}, kernel=kernel) for i in range(50)]
+        assert kernel.call_count == 50
+
+        rate.value = 3.0
+        assert kernel.call_count == 51
+        assert kernel.row_count == 100
+        assert [row.value("total") for row in rows] == [i * 6.0 for i in range(50)]
+
+    def test_numpy_columns_and_bulk_update(self):
+        """Test NumPy columns and a bulk update of independent inputs"""
+        pytest.importorskip("numpy")
+        kernel: BatchKernel[str, str] = BatchKernel(lambda columns: {"square": columns["x"] ** 2}, as_arrays=True)
+        inputs = [XValue(i) for i in range(20)]
+        rows = [XOneWayFunction({"x": value.hook}, kernel.evaluate_one, {"square"}, kernel=kernel) for value in inputs]
+
+        success, msg = DEFAULT_NEXUS_MANAGER.submit_values({value.hook._get_nexus(): value.value + 1 for value in inputs}) # type: ignore
+        assert success, msg
+        assert kernel.call_count == 21
+        assert [row.value("square") for row in rows] == [(i + 1) ** 2 for i in range(20)]
+        assert type(rows[0].value("square")) is int
+
+    def test_chained_kernels_follow_rank(self):
+        """Test that kernel functions feeding each other are evaluated in rank order"""
+        kernel: BatchKernel[str, str] = BatchKernel(lambda columns: {"y": [x + 1 for x in columns["x"]]})
+        source = XValue(0)
+        first = XOneWayFunction({"x": source.hook}, kernel.evaluate_one, {"y"}, kernel=kernel)
+        second = XOneWayFunction({"x": first.hook("y")}, kernel.evaluate_one, {"y"}, kernel=kernel)
+
+        calls_before = kernel.call_count
+        source.value = 10
+        assert second.value("y") == 12
+        assert kernel.call_count == calls_before + 2
+
+    def test_invalid_kernel_output(self):
+        """Test that a kernel returning the wrong number of values rejects the submission"""
+        kernel: BatchKernel[str, str] = BatchKernel(lambda columns: {"y": [0] * (len(columns["x"]) + 1)})
+        with pytest.raises(ValueError):
+            kernel.evaluate([{"x": 1}])
+        with pytest.raises(ValueError):
+            kernel.evaluate([{"x": 1}, {"z": 2}])
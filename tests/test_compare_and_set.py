@@ -0,0 +1,126 @@
+"""
+Test cases for nexus versions and compare-and-set submissions
+"""
+
+import threading
+
+import pytest
+
+from observables import XValue, XList, XDict
+from observables._nexus_system.submission_error import SubmissionError
+
+from tests.test_base import ObservableTestCase
+
+
+class TestCompareAndSet(ObservableTestCase):
+    """Test the versions of nexuses and optimistic submissions based on them"""
+
+    def test_version_is_bumped(self):
+        """Test that the version changes on updates, merges and isolation, but not on equal values"""
+        a = XValue(1)
+        b = XValue(2)
+        nexus = a.hook._get_nexus()
+        version = nexus.version
+
+        a.value = 3
+        assert nexus.version == version + 1
+        a.value = 3
+        assert nexus.version == version + 1
+
+        a.hook.join(b.hook, "use_caller_value")
+        assert nexus.version == version + 2
+        merged = a.hook._get_nexus()
+        merged_version = merged.version
+
+        b.hook.isolate()
+        assert merged.version == merged_version + 1
+
+    def test_stale_version_is_rejected(self):
+        """Test that a submission with an outdated version fails before completion and validation"""
+        validated: list[int] = []
+
+        def validator(value: int) -> tuple[bool, str]:
+            validated.append(value)
+            return True, "Valid"
+
+        value = XValue(0, validator=validator)
+        nexus = value.hook._get_nexus()
+        version = nexus.version
+        value.value = 1
+        validated.clear()
+
+        manager = value._nexus_manager
+        success, msg = manager.submit_values({nexus: 2}, expected_versions={nexus: version})
+        assert not success and "Stale" in msg
+        assert validated == []
+        assert value.value == 1
+
+        success, _ = manager.submit_values({nexus: 2}, expected_versions={nexus: nexus.version})
+        assert success
+        assert value.value == 2
+
+    def test_compare_and_set(self):
+        """Test that compare_and_set only changes the expected value"""
+        value = XValue(5, validator=lambda x: (x >= 0, "Must not be negative"))
+        assert value.compare_and_set(5, 6)
+        assert value.value == 6
+        assert not value.compare_and_set(5, 7)
+        assert value.value == 6
+        with pytest.raises(SubmissionError):
+            value.compare_and_set(6, -1)
+        assert value.value == 6
+
+    def test_concurrent_edits_are_not_lost(self):
+        """Test that edits of lists, dicts and counters from several threads are all applied"""
+        items: XList[int] = XList()
+        mapping: XDict[int, int] = XDict()
+        counter = XValue(0)
+
+        def work(offset: int) -> None:
+            for index in range(100):
+                items.append(offset + index)
+                mapping[offset + index] = index
+                while True:
+                    current = counter.value
+                    if counter.compare_and_set(current, current + 1):
+                        break
+
+        threads = [threading.Thread(target=work, args=(offset * 1000,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert sorted(items.value) == sorted(offset * 1000 + index for offset in range(4) for index in range(100))
+        assert len(mapping) == 400
+        assert counter.value == 400
+
+    def test_sort_reapplied_after_concurrent_edit(self):
+        """Test that sort is computed again if the list was changed while it was sorting"""
+        items: XList[int] = XList([3, 1, 2])
+        edited: list[bool] = []
+
+        def key(item: int) -> int:
+            if not edited:
+                edited.append(True)
+                items.append(0)
+            return item
+
+        items.sort(key=key)
+        assert items.value == [0, 1, 2, 3]
+
+    def test_concurrent_deletions_are_not_lost(self):
+        """Test that item deletions from several threads are all applied"""
+        items: XList[int] = XList(range(400))
+
+        def work() -> None:
+            for _ in range(100):
+                del items[0]
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert items.value == []
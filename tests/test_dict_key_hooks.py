@@ -0,0 +1,128 @@
+"""
+Test cases for the per-key hooks of XDict
+"""
+
+import gc
+
+from observables import XDict, XValue, FloatingHook
+
+from tests.test_base import ObservableTestCase
+
+
+class TestXDictKeyHooks(ObservableTestCase):
+    """Test the lazily created per-key hooks of XDict"""
+
+    def test_key_hook_only_notified_for_its_key(self):
+        """Test that a key hook is only updated when its own key changes"""
+        xdict = XDict({"a": 1, "b": 2})
+        hook_a = xdict.key_hook("a")
+        calls: list[str] = []
+        hook_a.add_listener(lambda: calls.append("a"))
+
+        xdict["b"] = 5
+        xdict.update({"c": 3})
+        assert calls == []
+
+        xdict["a"] = 4
+        assert calls == ["a"]
+        assert hook_a.value == 4
+        assert xdict.key_hook("a") is hook_a
+
+    def test_missing_and_removed_keys(self):
+        """Test that missing and removed keys are represented by None"""
+        xdict = XDict({"a": 1})
+        hook_b = xdict.key_hook("b")
+        assert hook_b.value is None
+
+        xdict["b"] = 2
+        assert hook_b.value == 2
+        xdict.remove_item("b")
+        assert hook_b.value is None
+        assert "b" not in xdict
+
+    def test_writing_through_key_hook(self):
+        """Test that submitting to a key hook sets the key in the dictionary"""
+        xdict = XDict({"a": 1, "b": 2})
+        calls: list[int] = []
+        xdict.add_listener(lambda: calls.append(1))
+
+        xdict.key_hook("a").change_value(10)
+        xdict.key_hook("c").change_value(3)
+
+        assert xdict.dict == {"a": 10, "b": 2, "c": 3}
+        assert xdict.length == 3
+        assert calls == [1, 1]
+
+    def test_joined_key_hook(self):
+        """Test that a key hook can be joined with a floating hook and with other dicts"""
+        source = XDict({"a": 1})
+        linked = XDict(source)
+        floating = FloatingHook[int | None](0)
+        floating.join(linked.key_hook("a"), "use_target_value")
+        assert floating.value == 1
+
+        source["a"] = 7
+        assert floating.value == 7
+
+        floating.change_value(8)
+        assert source["a"] == 8
+        assert linked["a"] == 8
+
+    def test_key_hooks_are_isolated_with_the_dict(self):
+        """Test that isolating all hooks also isolates the key hooks"""
+        xdict = XDict({"a": 1})
+        floating = FloatingHook[int | None](0)
+        floating.join(xdict.key_hook("a"), "use_target_value")
+
+        xdict.isolate_all()
+        xdict["a"] = 2
+
+        assert floating.value == 1
+        assert xdict.key_hooks["a"].value == 2
+
+    def test_many_key_hooks(self):
+        """Test that an edit only reaches the hook of the edited key among many"""
+        xdict = XDict({i: 0 for i in range(1000)})
+        notified: list[int] = []
+        for i in range(1000):
+            xdict.key_hook(i).add_listener(lambda i=i: notified.append(i))
+
+        xdict[500] = 1
+        xdict.change_dict({**xdict.dict, 3: 1, 7: 2})
+
+        assert sorted(notified) == [3, 7, 500]
+
+    def test_unobserved_key_hooks_are_released(self):
+        """Test that key hooks which are neither joined nor observed do not pile up"""
+        xdict = XDict({i: 0 for i in range(5000)})
+        kept = xdict.key_hook(0)
+        observed: list[int] = []
+        xdict.key_hook(1).add_listener(lambda: observed.append(1))
+        floating = FloatingHook[int | None](None)
+        floating.join(xdict.key_hook(2), "use_target_value")
+        for i in range(3, 5000):
+            xdict.key_hook(i)
+            if i % 1000 == 0:
+                gc.collect()
+
+        assert len(xdict._dynamic_hooks) + len(xdict._released_dynamic_hooks) < 500 # type: ignore
+        xdict.update({0: 1, 1: 1, 2: 1})
+        assert kept.value == 1
+        assert observed == [1]
+        assert floating.value == 1
+        assert xdict.key_hook(0) is kept
+
+    def test_key_hook_in_large_nexus(self):
+        """Test that writes through a key hook joined with many hooks reach the dictionary"""
+        xdict = XDict({"a": 1})
+        values = [XValue[int | None](0) for _ in range(4)]
+        values[0].join(xdict.key_hook("a"), "use_target_value")
+        values[0].value = 9
+        assert xdict.dict == {"a": 9}
+
+        for value in values[1:]:
+            value.join(xdict.key_hook("a"), "use_target_value")
+        values[-1].value = 10
+
+        assert xdict.key_hook("a").value == 10
+        assert xdict.dict == {"a": 10}
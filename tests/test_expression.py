@@ -0,0 +1,99 @@
+"""
+Test cases for expressions built with arithmetic operators on XValues
+"""
+
+from typing import Any
+
+from observables import XValue, Expression
+
+from tests.test_base import ObservableTestCase
+
+
+class CountingNumber:
+    """Number counting the additions made with it"""
+
+    additions: int = 0
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+
+    def __add__(self, other: Any) -> "CountingNumber":
+        CountingNumber.additions += 1
+        return CountingNumber(self.number + other.number)
+
+    def __mul__(self, other: Any) -> "CountingNumber":
+        return CountingNumber(self.number * other.number)
+
+
+class TestExpression(ObservableTestCase):
+    """Test building, compiling and updating expression graphs"""
+
+    def test_expression_follows_inputs(self):
+        """Test that the value and hook of an expression follow its inputs"""
+        a = XValue(2)
+        b = XValue(3)
+        expression = a + b * 2 - 1
+        assert isinstance(expression, Expression)
+        assert expression.value == 7
+
+        values: list[int] = []
+        expression.hook.add_listener(lambda: values.append(expression.value))
+        b.value = 10
+        a.value = 0
+        assert values == [21, 19]
+        assert (2 ** b - a).value == 1024
+        assert (10 / (a + 5)).value == 2.0
+        assert (-a + abs(a - 5)).value == 5
+
+    def test_constant_folding(self):
+        """Test that operations on constants are folded when the expression is built"""
+        a = XValue(4)
+        expression = a * (Expression.constant(2) + 3)
+        assert repr(expression) == "Expression((<4> * 5))"
+        assert (Expression.constant(2) ** 3).is_constant
+        assert expression.value == 20
+
+    def test_common_subexpressions_are_shared(self):
+        """Test that identical subexpressions are computed once per update"""
+        a = XValue(CountingNumber(1))
+        b = XValue(CountingNumber(2))
+        expression = (a + b) * (a + b)
+        assert expression.value.number == 9
+
+        CountingNumber.additions = 0
+        a.value = CountingNumber(2)
+        assert expression.value.number == 16
+        assert CountingNumber.additions == 1
+
+        c = XValue(CountingNumber(2))
+        two = CountingNumber(2)
+        with_constants = (c + two) * (c + two)
+        assert with_constants.value.number == 16
+        CountingNumber.additions = 0
+        c.value = CountingNumber(3)
+        assert with_constants.value.number == 25
+        assert CountingNumber.additions == 1
+
+    def test_derived_values_can_be_joined(self):
+        """Test that expressions can be combined further and joined to other values"""
+        width = XValue(2.0)
+        height = XValue(3.0)
+        area = width * height
+        perimeter = 2 * (width + height)
+        ratio = area / perimeter
+        display = XValue(ratio.hook)
+        assert display.value == 0.6
+
+        width.value = 3.0
+        assert display.value == 0.75
+        assert area.value == 9.0
+
+    def test_deep_expression(self):
+        """Test that deep expressions compile without recursion"""
+        a = XValue(0)
+        total: Any = a
+        for _ in range(2000):
+            total = total + 1
+        assert total.value == 2000
+        a.value = 5
+        assert total.value == 2005
@@ -0,0 +1,124 @@
+"""
+Test cases for FunctionMemo, memoized XOneWayFunction and memoized validation
+"""
+
+import pytest
+
+from observables import XValue, XOneWayFunction, FunctionMemo, MemoInfo, FloatingHook
+
+from tests.test_base import ObservableTestCase
+
+
+class TestFunctionMemo(ObservableTestCase):
+    """Test the bounded LRU cache of function results"""
+
+    def test_lru_eviction_and_counters(self):
+        """Test that the least recently used entry is evicted and hits and misses are counted"""
+        memo: FunctionMemo[str, int, int] = FunctionMemo(max_entries=2)
+        calls: list[int] = []
+
+        def double(values):
+            calls.append(values["x"])
+            return values["x"] * 2
+
+        assert memo.call(double, {"x": 1}) == 2
+        assert memo.call(double, {"x": 2}) == 4
+        assert memo.call(double, {"x": 1}) == 2
+        assert memo.call(double, {"x": 3}) == 6
+        assert memo.call(double, {"x": 1}) == 2
+        assert memo.call(double, {"x": 2}) == 4
+
+        assert calls == [1, 2, 3, 2]
+        assert memo.info() == MemoInfo(hits=2, misses=4, uncacheable=0, evictions=2, size=2, cost=2.0)
+
+    def test_cost_bound_and_key_function(self):
+        """Test cost-based eviction, oversized results and a custom key function"""
+        memo: FunctionMemo[str, object, list[int]] = FunctionMemo(max_entries=10, key_function=lambda values: len(values["items"]), cost_function=len, max_cost=5)
+
+        memo.call(lambda values: list(values["items"]), {"items": [1, 2, 3]})
+        memo.call(lambda values: list(values["items"]), {"items": [4, 5]})
+        assert memo.info().cost == 5.0
+        assert memo.call(lambda values: [], {"items": [7, 8]}) == [4, 5]
+
+        memo.call(lambda values: list(values["items"]), {"items": [1]})
+        assert memo.info().size == 2
+        memo.call(lambda values: list(values["items"]), {"items": list(range(6))})
+        assert memo.info().size == 2
+
+    def test_unhashable_inputs(self):
+        """Test that unhashable inputs are computed without caching"""
+        memo: FunctionMemo[str, object, int] = FunctionMemo()
+        assert memo.call(lambda values: len(values["items"]), {"items": [1, 2]}) == 2
+        assert memo.info().uncacheable == 1
+        assert len(memo) == 0
+        with pytest.raises(ValueError):
+            FunctionMemo(max_entries=0)
+
+
+class TestMemoizedOneWayFunction(ObservableTestCase):
+    """Test XOneWayFunction with a FunctionMemo"""
+
+    def test_revisited_inputs_are_not_recomputed(self):
+        """Test that toggling between inputs reuses the cached outputs"""
+        celsius = XValue(0.0)
+        calls: list[float] = []
+
+        def convert(inputs):
+            calls.append(inputs["celsius"])
+            return {"fahrenheit": inputs["celsius"] * 9 / 5 + 32}
+
+        converter = XOneWayFunction({"celsius": celsius.hook}, convert, {"fahrenheit"}, memo=FunctionMemo(max_entries=4))
+        for value in (100.0, 0.0, 100.0, 0.0):
+            celsius.value = value
+
+        assert converter.value("fahrenheit") == 32.0
+        assert calls == [0.0, 100.0]
+        info = converter.memo_info()
+        assert info is not None and info.misses == 2 and info.hits > 0
+
+
+class TestValidationMemo(ObservableTestCase):
+    """Test the caching of pure validation results"""
+
+    def test_repeated_validation_uses_cache(self):
+        """Test that validating and submitting cached values does not call the validator again"""
+        calls: list[str] = []
+
+        def is_short(value: str) -> tuple[bool, str]:
+            calls.append(value)
+            return len(value) <= 3, "Too long"
+
+        field = XValue("a", validator=is_short, validation_memo=FunctionMemo(max_entries=8))
+        for _ in range(3):
+            assert field.validate_value("ab")[0]
+            assert not field.validate_value("abcd")[0]
+        field.value = "ab"
+        assert calls == ["ab", "abcd"]
+        with pytest.raises(Exception):
+            field.value = "abcd"
+        assert calls == ["ab", "abcd"]
+        assert field.value == "ab"
+        assert field.validation_memo_info() is not None
+
+    def test_floating_hook_validation(self):
+        """Test that a floating hook caches its isolated validation results"""
+        calls: list[int] = []
+
+        def is_positive(value: int) -> tuple[bool, str]:
+            calls.append(value)
+            return value > 0, "Must be positive"
+
+        hook = FloatingHook(1, isolated_validation_callback=is_positive, validation_memo=FunctionMemo(max_entries=8))
+        for _ in range(3):
+            assert hook.validate_value_in_isolation(5)[0]
+            assert not hook.validate_value_in_isolation(-1)[0]
+        assert calls == [5, -1]
+
+    def test_equal_values_of_other_types_are_validated(self):
+        """Test that a cached result for 2.0 is not reused for the int 2"""
+        value = XValue(1.0, validator=lambda x: (isinstance(x, float), "Must be a float"), validation_memo=FunctionMemo())
+        value.value = 2.0
+        value.value = 1.0
+        with pytest.raises(Exception):
+            value.value = 2
+        assert value.value == 1.0 and isinstance(value.value, float)
@@ -0,0 +1,67 @@
+"""
+Test cases for the incrementally maintained keys and values hooks of dict-like XObjects
+"""
+
+import random
+
+from observables import XDict
+from observables.core import PersistentMap
+from observables._xobjects.dict_like.incremental_dict_values import IncrementalDictValues
+
+from tests.test_base import ObservableTestCase
+
+
+class TestIncrementalDictValues(ObservableTestCase):
+    """Test deriving keys and values from recorded dict changes"""
+
+    def test_same_dict_returns_same_objects(self):
+        """Test that the derived objects are reused for the same dict"""
+        derived: IncrementalDictValues[str, int] = IncrementalDictValues()
+        d = PersistentMap({"a": 1, "b": 2})
+
+        assert derived.keys(d) is derived.keys(d)
+        assert derived.values(d) is derived.values(d)
+        assert derived.keys(None) == set()
+        assert derived.values(None) == []
+
+    def test_random_edits_match_dict(self):
+        """Test random edits of a PersistentMap against a rebuild from scratch"""
+        rng = random.Random(5)
+        derived: IncrementalDictValues[int, int] = IncrementalDictValues()
+        persistent: PersistentMap[int, int] = PersistentMap({i: i for i in range(100)})
+        for _ in range(300):
+            operation = rng.random()
+            if operation < 0.4:
+                persistent = persistent.set(rng.randint(0, 150), rng.randint(0, 5))
+            elif operation < 0.7:
+                persistent = persistent.update({rng.randint(0, 150): rng.randint(0, 5) for _ in range(3)})
+            else:
+                persistent = persistent.remove_keys([rng.randint(0, 150) for _ in range(3)])
+            assert derived.keys(persistent) == set(persistent.keys())
+            assert derived.values(persistent) == list(persistent.values())
+
+
+class TestDictSecondaryHooks(ObservableTestCase):
+    """Test the keys, values and length hooks of XDict"""
+
+    def test_xdict_hooks_follow_edits(self):
+        """Test that the secondary hooks follow single-key edits"""
+        xdict = XDict({"a": 1, "b": 2})
+        xdict["c"] = 3
+        xdict["a"] = 10
+        del xdict["b"]
+
+        assert xdict.keys_hook.value == {"a", "c"}
+        assert xdict.values_hook.value == [10, 3]
+        assert xdict.length_hook.value == 2
+
+    def test_values_change_updates_values_hook_only(self):
+        """Test that changing a value notifies the values hook but not the keys hook"""
+        xdict = XDict({"a": 1, "b": 2})
+        calls: list[str] = []
+        xdict.keys_hook.add_listener(lambda: calls.append("keys"))
+        xdict.values_hook.add_listener(lambda: calls.append("values"))
+
+        xdict["a"] = 5
+
+        assert calls == ["values"]
@@ -0,0 +1,109 @@
+"""
+Test cases for list splice records (ListChange) of XList
+"""
+
+import random
+
+from observables import XList, FloatingHook, ListChange, apply_list_changes, list_changes
+
+from tests.test_base import ObservableTestCase
+
+
+class TestListChanges(ObservableTestCase):
+    """Test splice records delivered by XList"""
+
+    def test_single_element_edits_produce_splices(self):
+        """Test that append, insert, pop, remove and item assignment report one splice each"""
+        xlist = XList([1, 2, 3])
+        received: list[tuple[ListChange[int], ...]] = []
+        xlist.add_change_listener(received.append)
+
+        xlist.append(4)
+        xlist.insert(0, 0)
+        xlist.pop()
+        xlist.remove(2)
+        xlist[0] = 9
+
+        assert received == [
+            (ListChange(3, 0, (4,)),),
+            (ListChange(0, 0, (0,)),),
+            (ListChange(4, 1, ()),),
+            (ListChange(2, 1, ()),),
+            (ListChange(0, 1, (9,)),),
+        ]
+
+    def test_slices_sort_and_reverse_patch_a_view(self):
+        """Test that applying the splices to a copy keeps it in sync"""
+        xlist = XList(list(range(10)))
+        view = xlist.value
+        xlist.add_change_listener(lambda changes: apply_list_changes(view, changes))
+
+        xlist[2:5] = ["a", "b"]
+        del xlist[::3]
+        xlist[::2] = ["x"] * len(range(0, len(xlist), 2))
+        xlist.extend([7, 8])
+        xlist.reverse()
+        xlist.clear()
+        xlist.extend([3, 1, 2])
+        xlist.sort()
+
+        assert view == xlist.value == [1, 2, 3]
+
+    def test_no_splices_for_unchanged_value(self):
+        """Test that listeners are not called if nothing changed"""
+        xlist = XList([1, 2, 3])
+        received: list[tuple[ListChange[int], ...]] = []
+        xlist.add_change_listener(received.append)
+
+        xlist.change_value([1, 2, 3])
+        del xlist[5:8]
+
+        assert received == []
+        xlist.remove_change_listener(received.append)
+        xlist.append(4)
+        assert received == []
+
+    def test_joined_list_receives_recorded_splices(self):
+        """Test that a joined list receives the same O(k) splices"""
+        source = XList(list(range(100)))
+        joined = XList(source)
+        received: list[tuple[ListChange[int], ...]] = []
+        joined.add_change_listener(received.append)
+
+        source.insert(50, -1)
+
+        assert received == [(ListChange(50, 0, (-1,)),)]
+        assert joined.last_changes == (ListChange(50, 0, (-1,)),)
+
+    def test_change_publisher(self):
+        """Test that the change publisher carries the splices"""
+        xlist = XList(["a"])
+        published: list[tuple[ListChange[str], ...]] = []
+        xlist.change_publisher.add_subscriber(lambda: published.append(xlist.change_publisher.changes))
+        xlist.change_publisher.preferred_publish_mode = "direct"
+
+        xlist.append("b")
+
+        assert published == [(ListChange(1, 0, ("b",)),)]
+
+    def test_hook_listener_reads_splices(self):
+        """Test that any hook listener can get the splices from the previous and current value"""
+        xlist = XList([1, 2])
+        floating: FloatingHook[list[int]] = FloatingHook([1, 2])
+        floating.join(xlist.value_hook, "use_target_value") # type: ignore
+        received: list[tuple[ListChange[int], ...]] = []
+        floating.add_listener(lambda: received.append(list_changes(floating.previous_value, floating.value)))
+
+        xlist.append(3)
+
+        assert received == [(ListChange(2, 0, (3,)),)]
+
+    def test_diff_fallback_matches_random_edits(self):
+        """Test that the diff fallback always reproduces the new value"""
+        rng = random.Random(7)
+        for _ in range(200):
+            previous = [rng.randint(0, 3) for _ in range(rng.randint(0, 8))]
+            current = [rng.randint(0, 3) for _ in range(rng.randint(0, 8))]
+            patched = list(previous)
+            apply_list_changes(patched, list_changes(previous, current))
+            assert patched == current
@@ -0,0 +1,62 @@
+"""
+Test cases for the zero-copy ListView and the read accessors of XList
+"""
+
+import pytest
+
+from observables import XList, ListView
+
+from tests.test_base import ObservableTestCase
+
+
+class TestListView(ObservableTestCase):
+    """Test ListView and the non-copying read accessors of XList"""
+
+    def test_view_is_a_snapshot(self):
+        """Test that a view keeps showing the value it was taken from"""
+        xlist = XList([1, 2, 3])
+        view = xlist.view
+        xlist.append(4)
+
+        assert list(view) == [1, 2, 3]
+        assert xlist.view == [1, 2, 3, 4]
+
+    def test_slicing_views(self):
+        """Test that slices of views behave like list slices"""
+        items = list(range(100))
+        view = XList(items).view
+
+        for window in [slice(10, 20), slice(None, None, -1), slice(5, 80, 7), slice(90, 10, -3), slice(200, 300)]:
+            assert isinstance(view[window], ListView)
+            assert list(view[window]) == items[window]
+        assert list(view[10:50][5:30:5]) == items[10:50][5:30:5]
+        assert view[10:20][-1] == 19
+        assert list(reversed(view[10:20])) == list(reversed(items[10:20]))
+        assert view[10:20].index(15) == 5
+        assert 15 in view[10:20] and 25 not in view[10:20]
+        with pytest.raises(IndexError):
+            view[10:20][10]
+
+    def test_as_memoryview(self):
+        """Test that numeric data can be read as a contiguous buffer"""
+        view = XList([1.5, 2.5, 3.5]).view[1:]
+        buffer = view.as_memoryview("d")
+
+        assert buffer.tolist() == [2.5, 3.5]
+        assert buffer.readonly
+        assert view.as_memoryview("d") is buffer
+
+    def test_read_accessors(self):
+        """Test the dunder accessors of XList on the stored sequence"""
+        xlist = XList([3, 1, 3, 2])
+
+        assert len(xlist) == 4
+        assert xlist[0] == 3 and xlist[-1] == 2
+        assert xlist[1:3] == [1, 3]
+        assert xlist.count(3) == 2
+        assert xlist.index(3, 1) == 2
+        assert list(reversed(xlist)) == [2, 3, 1, 3]
+        with pytest.raises(IndexError):
+            xlist[4]
+        with pytest.raises(ValueError):
+            xlist.index(5)
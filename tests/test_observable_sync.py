@@ -460,3 +460,44 @@ class TestObservableSync:
                 "root_value": 5.0,  # Inconsistent! 5² ≠ 100
                 "domain": "positive"
             })
+
+
+class TestObservableSyncCompletionCalls:
+    """Test how often the completing function is called per submission."""
+
+    @staticmethod
+    def _meters_to_centimeters(calls: list[dict[str, float]]):
+        def convert(values: FunctionValues[str, float]) -> tuple[bool, dict[str, float]]:
+            calls.append(dict(values.submitted))
+            if "m" in values.submitted:
+                return (True, {"cm": values.submitted["m"] * 100})
+            if "cm" in values.submitted:
+                return (True, {"m": values.submitted["cm"] / 100})
+            return (True, {})
+        return convert
+
+    def test_completed_state_is_reused(self):
+        """Test that revisiting the function with its completed values does not call it again."""
+        calls: list[dict[str, float]] = []
+        meters = ObservableSingleValue(1.0)
+        centimeters = ObservableSingleValue(100.0)
+        sync = ObservableSync[str, float]({"m": meters.hook, "cm": centimeters.hook}, self._meters_to_centimeters(calls))
+
+        calls.clear()
+        meters.value = 2.0
+        assert centimeters.value == 200.0
+        assert calls == [{"m": 2.0}, {"m": 2.0, "cm": 200.0}]
+        assert not sync.idempotent
+
+    def test_idempotent_mode_calls_once(self):
+        """Test that an idempotent function is called once per submission and still syncs both ways."""
+        calls: list[dict[str, float]] = []
+        meters = ObservableSingleValue(1.0)
+        centimeters = ObservableSingleValue(100.0)
+        ObservableSync[str, float]({"m": meters.hook, "cm": centimeters.hook}, self._meters_to_centimeters(calls), idempotent=True)
+
+        calls.clear()
+        meters.value = 2.0
+        centimeters.value = 50.0
+        assert meters.value == 0.5
+        assert calls == [{"m": 2.0}, {"cm": 50.0}]
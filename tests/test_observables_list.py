@@ -572,4 +572,55 @@ class TestObservableList(ObservableTestCase):
         obs_restored.set_values_from_serialization(serialized_data)
         
         # Step 7: Check if the object is the same as after step 2
-        assert obs_restored.value == expected_list
\ No newline at end of file
+        assert obs_restored.value == expected_list
+
+    def test_single_element_edits_keep_previous_value(self):
+        """Test that edits are structurally shared and leave the previous value intact"""
+        obs = ObservableList(range(1000))
+        nexus = obs.value_hook._get_nexus() # type: ignore
+
+        obs.append(1000)
+        assert list(nexus.previous_stored_value) == list(range(1000))
+        assert list(nexus.stored_value) == list(range(1001))
+
+        obs[0] = -1
+        assert nexus.previous_stored_value[0] == 0
+        assert obs[0] == -1
+
+        obs.insert(500, "x")
+        del obs[1]
+        assert obs.pop() == 1000
+        assert obs.value == [-1] + list(range(2, 500)) + ["x"] + list(range(500, 1000))
+        assert obs.length == 1000
+
+    def test_slice_assignment_and_deletion(self):
+        """Test that slices are still supported by __setitem__ and __delitem__"""
+        obs = ObservableList([1, 2, 3, 4, 5])
+        obs[1:3] = [20, 30, 35] # type: ignore
+        assert obs.value == [1, 20, 30, 35, 4, 5]
+        del obs[::2]
+        assert obs.value == [20, 35, 5]
+
+    def test_join_with_plain_list_hook(self):
+        """Test that an observable list can be joined with a hook holding a plain list"""
+        from observables import FloatingHook
+        hook = FloatingHook[list[int]]([1, 2, 3])
+        obs = ObservableList([1, 2, 3])
+        obs.value_hook.join(hook, "use_caller_value") # type: ignore
+
+        obs.append(4)
+        assert list(hook.value) == [1, 2, 3, 4]
+        assert obs.value == [1, 2, 3, 4]
+
+    def test_merge_only_accepts_list_for_vector(self):
+        """Test that nexuses holding values of different types only merge for a plain list and a vector"""
+        from observables import FloatingHook
+        from observables._nexus_system.nexus import Nexus
+        from observables._xobjects.list_like.persistent_vector import PersistentVector
+
+        vector_nexus = FloatingHook(PersistentVector([1, 2]))._get_nexus() # type: ignore
+        assert Nexus._merge_nexuses(vector_nexus, FloatingHook([1, 2])._get_nexus()) is not None # type: ignore
+        with pytest.raises(ValueError):
+            Nexus._merge_nexuses(vector_nexus, FloatingHook((1, 2))._get_nexus()) # type: ignore
+        with pytest.raises(ValueError):
+            Nexus._merge_nexuses(FloatingHook(1)._get_nexus(), FloatingHook(1.0)._get_nexus()) # type: ignore
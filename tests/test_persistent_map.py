@@ -0,0 +1,101 @@
+"""
+Test cases for the PersistentMap backend of XDict
+"""
+
+import pickle
+import random
+
+import pytest
+
+from observables import XDict
+from observables.core import PersistentMap
+from observables import MapChange
+
+from tests.test_base import ObservableTestCase
+
+
+class TestPersistentMap(ObservableTestCase):
+    """Test the insertion-ordered persistent mapping"""
+
+    def test_edits_keep_previous_versions_and_order(self):
+        """Test that edits return new mappings and keep the insertion order"""
+        m1 = PersistentMap({"b": 1, "a": 2})
+        m2 = m1.set("c", 3).set("b", 10).delete("a")
+
+        assert list(m1.items()) == [("b", 1), ("a", 2)]
+        assert list(m2.items()) == [("b", 10), ("c", 3)]
+        assert list(m2.values()) == [10, 3]
+        assert m2 == {"c": 3, "b": 10}
+        assert {"c": 3, "b": 10} == m2
+        assert m1.set("b", 1) is m1
+        with pytest.raises(KeyError):
+            m1.delete("z")
+
+    def test_recorded_changes(self):
+        """Test that edits record the affected keys"""
+        m1 = PersistentMap({"a": 1, "b": 2})
+        m2 = m1.update({"b": 3, "c": 4, "a": 1})
+        m3 = m2.remove_keys(["a", "z"])
+
+        assert m2.changes_from(m1) == MapChange(frozenset({"c"}), frozenset(), frozenset({"b"}))
+        assert m3.changes_from(m2) == MapChange(frozenset(), frozenset({"a"}), frozenset())
+        assert m3.changes_from(m1) is None
+        assert m1.update({"a": 1}) is m1
+        assert m1 != m2
+
+    def test_hash_and_pickle(self):
+        """Test hashing and pickling"""
+        m = PersistentMap({"a": 1, "b": (2, 3)})
+
+        assert hash(m) == hash(PersistentMap({"b": (2, 3), "a": 1}))
+        restored = pickle.loads(pickle.dumps(m))
+        assert restored == m
+        assert list(restored) == ["a", "b"]
+
+    def test_random_edits_match_dict(self):
+        """Test random edits, including order, against the built-in dict"""
+        rng = random.Random(11)
+        reference: dict[int, int] = {}
+        persistent: PersistentMap[int, int] = PersistentMap()
+        for _ in range(1000):
+            key = rng.randint(0, 80)
+            operation = rng.random()
+            if operation < 0.5:
+                reference[key] = rng.randint(0, 3)
+                persistent = persistent.set(key, reference[key])
+            elif operation < 0.8:
+                items = {rng.randint(0, 80): rng.randint(0, 3) for _ in range(3)}
+                reference.update(items)
+                persistent = persistent.update(items)
+            elif key in reference:
+                del reference[key]
+                persistent = persistent.delete(key)
+            assert list(persistent.items()) == list(reference.items())
+
+
+class TestXDictStorage(ObservableTestCase):
+    """Test XDict on top of PersistentMap"""
+
+    def test_single_key_edits_keep_previous_value(self):
+        """Test that single-key edits leave the previous value intact"""
+        xdict = XDict({"a": 1, "b": 2})
+        previous = xdict.dict
+        xdict["c"] = 3
+        xdict.remove_item("a")
+
+        assert previous == {"a": 1, "b": 2}
+        assert xdict.dict == {"b": 2, "c": 3}
+        assert list(xdict.dict.keys()) == ["b", "c"]
+        assert xdict.keys == {"b", "c"}
+
+    def test_unchanged_edits_do_not_notify(self):
+        """Test that setting equal values does not notify listeners"""
+        xdict = XDict({"a": 1})
+        calls: list[int] = []
+        xdict.add_listener(lambda: calls.append(1))
+
+        xdict["a"] = 1
+        xdict.update({"a": 1})
+        xdict.remove_item("z")
+
+        assert calls == []
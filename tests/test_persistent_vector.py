@@ -0,0 +1,106 @@
+"""
+Test cases for the PersistentVector backend of XList
+"""
+
+import pickle
+import random
+
+import pytest
+
+from observables._xobjects.list_like import persistent_vector
+from observables._xobjects.list_like.persistent_vector import PersistentVector
+
+from tests.test_base import ObservableTestCase
+
+
+class TestPersistentVector(ObservableTestCase):
+    """Test the persistent vector against the behaviour of a plain list"""
+
+    def test_empty_vector(self):
+        """Test an empty vector"""
+        vector: PersistentVector[int] = PersistentVector()
+        assert len(vector) == 0
+        assert vector == []
+        assert list(vector) == []
+        with pytest.raises(IndexError):
+            vector[0]
+
+    def test_edits_do_not_modify_the_original(self):
+        """Test that all edits return new vectors"""
+        original = PersistentVector(range(100))
+        appended = original.append(100)
+        inserted = original.insert(0, -1)
+        replaced = original.set(50, "x")
+        deleted = original.delete(99)
+
+        assert original == list(range(100))
+        assert appended == list(range(101))
+        assert inserted == [-1] + list(range(100))
+        assert replaced[50] == "x"
+        assert deleted == list(range(99))
+
+    def test_random_operations_match_list(self, monkeypatch: pytest.MonkeyPatch):
+        """Test random edits against a reference list (small chunks force deep trees)"""
+        monkeypatch.setattr(persistent_vector, "_CHUNK_SIZE", 4)
+        rng = random.Random(42)
+        reference: list[int] = []
+        vector: PersistentVector[int] = PersistentVector()
+
+        for step in range(3000):
+            operation = rng.random()
+            if operation < 0.35:
+                index = rng.randint(-len(reference) - 2, len(reference) + 2)
+                reference.insert(index, step)
+                vector = vector.insert(index, step)
+            elif operation < 0.5 and reference:
+                index = rng.randrange(-len(reference), len(reference))
+                reference[index] = step
+                vector = vector.set(index, step)
+            elif operation < 0.75 and reference:
+                index = rng.randrange(-len(reference), len(reference))
+                del reference[index]
+                vector = vector.delete(index)
+            else:
+                reference.append(step)
+                vector = vector.append(step)
+
+        assert len(vector) == len(reference)
+        assert list(vector) == reference
+        assert list(reversed(vector)) == reference[::-1]
+        assert all(vector[i] == reference[i] for i in range(-len(reference), len(reference)))
+        assert list(vector[10:200]) == reference[10:200]
+        assert list(vector[-50::3]) == reference[-50::3]
+
+    def test_equality(self):
+        """Test equality with vectors, lists and tuples"""
+        vector = PersistentVector(range(1000))
+        assert vector == PersistentVector(range(1000))
+        assert vector == list(range(1000))
+        assert vector == tuple(range(1000))
+        assert vector != vector.append(1)
+        assert vector != vector.set(999, -1)
+        assert vector.set(999, -1).set(999, 999) == vector
+        assert vector != "not a sequence"
+
+    def test_index_and_count(self):
+        """Test the index and count methods"""
+        vector = PersistentVector([1, 2, 3, 2, 1])
+        assert vector.index(2) == 1
+        assert vector.index(2, 2) == 3
+        assert vector.count(1) == 2
+        assert 3 in vector
+        with pytest.raises(ValueError):
+            vector.index(4)
+
+    def test_hash_and_pickle(self):
+        """Test hashing and pickling"""
+        vector = PersistentVector([1, 2, 3])
+        assert hash(vector) == hash((1, 2, 3))
+        assert pickle.loads(pickle.dumps(vector)) == vector
+
+    def test_extend_and_concatenation(self):
+        """Test extend and the + operator"""
+        vector = PersistentVector([1, 2])
+        assert vector.extend([3, 4]) == [1, 2, 3, 4]
+        assert vector + [3] == [1, 2, 3]
+        assert vector * 2 == [1, 2, 1, 2]
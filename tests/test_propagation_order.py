@@ -0,0 +1,84 @@
+"""
+Test cases for the topological completion order of derived observables
+"""
+
+from typing import Any, Callable, Mapping
+
+from observables import XValue, XOneWayFunction, XDict, FloatingHook
+
+from tests.test_base import ObservableTestCase
+
+
+def recording(name: str, calls: list[str], function: Callable[[Mapping[str, Any]], Mapping[str, Any]]) -> Callable[[Mapping[str, Any]], Mapping[str, Any]]:
+    def record(values: Mapping[str, Any]) -> Mapping[str, Any]:
+        calls.append(name)
+        return function(values)
+    return record
+
+
+class TestPropagationOrder(ObservableTestCase):
+    """Test that chained one-way functions are completed once each, after their inputs"""
+
+    def test_diamond_evaluates_each_function_once(self):
+        """Test a diamond with an extra edge from the source to the last function"""
+        calls: list[str] = []
+        a = XValue(1)
+        b = XOneWayFunction({"a": a.hook}, recording("b", calls, lambda v: {"b": v["a"] + 1}), {"b"})
+        c = XOneWayFunction({"a": a.hook}, recording("c", calls, lambda v: {"c": v["a"] * 2}), {"c"})
+        d = XOneWayFunction({"b": b.hook("b"), "c": c.hook("c")}, recording("d", calls, lambda v: {"d": v["b"] + v["c"]}), {"d"})
+        e = XOneWayFunction({"d": d.hook("d"), "a": a.hook}, recording("e", calls, lambda v: {"e": v["d"] - v["a"]}), {"e"})
+
+        calls.clear()
+        a.value = 5
+
+        assert sorted(calls[:2]) == ["b", "c"]
+        assert calls[2:] == ["d", "e"]
+        assert d.value("d") == 16
+        assert e.value("e") == 11
+
+    def test_ranks_follow_rewiring(self):
+        """Test that joining and isolating hooks updates the order"""
+        calls: list[str] = []
+        a = XValue(1)
+        mid = XOneWayFunction({"a": a.hook}, recording("mid", calls, lambda v: {"m": v["a"] * 10}), {"m"})
+        last = XOneWayFunction({"p": a.hook, "q": 0}, recording("last", calls, lambda v: {"r": v["p"] + v["q"]}), {"r"})
+
+        a.value = 2
+        last.hook("q").join(mid.hook("m"), "use_target_value")
+        calls.clear()
+        a.value = 3
+        assert calls == ["mid", "last"]
+        assert last.value("r") == 33
+
+        last.hook("q").isolate()
+        calls.clear()
+        a.value = 4
+        assert sorted(calls) == ["last", "mid"]
+        assert last.value("r") == 34
+
+    def test_chain_longer_than_recursion_limit(self):
+        """Test that long chains are ranked without recursion"""
+        calls: list[str] = []
+        source = XValue(0)
+        previous = source.hook
+        functions: list[XOneWayFunction[str, str, int, int]] = []
+        for index in range(1200):
+            function = XOneWayFunction({"x": previous}, recording(str(index), calls, lambda v: {"y": v["x"] + 1}), {"y"})
+            functions.append(function)
+            previous = function.hook("y")
+
+        calls.clear()
+        source.value = 1
+        assert calls == [str(index) for index in range(1200)]
+        assert functions[-1].value("y") == 1201
+
+    def test_owner_with_dynamic_hooks_in_large_submission(self):
+        """Test that an owner sees writes to its dynamic hooks if a submission carries many nexuses"""
+        xdict = XDict({"a": 1, "b": 2, "c": 3, "d": 4})
+        floating_hooks = {key: FloatingHook[int | None](None) for key in "abcd"}
+        for key, floating in floating_hooks.items():
+            floating.join(xdict.key_hook(key), "use_target_value")
+
+        success, msg = xdict._get_nexus_manager().submit_values({floating._get_nexus(): 10 for floating in floating_hooks.values()}) # type: ignore
+        assert success, msg
+        assert xdict.dict == {"a": 10, "b": 10, "c": 10, "d": 10}
@@ -0,0 +1,142 @@
+"""
+Test cases for XRingBuffer and ring buffer snapshots
+"""
+
+import random
+
+import pytest
+
+from observables import XRingBuffer, FloatingHook, RingBufferAppend, RingBufferSnapshot
+from observables.core import SubmissionError
+from observables._xobjects.list_like.ring_buffer import RingStorage
+
+from tests.test_base import ObservableTestCase
+
+
+class TestRingBufferSnapshot(ObservableTestCase):
+    """Test the storage sharing snapshots of ring buffers"""
+
+    def test_push_overwrites_oldest(self):
+        """Test that pushes to a full storage overwrite the oldest items of older snapshots"""
+        first = RingBufferSnapshot(RingStorage(3, "i"), 0, 0).push((1, 2, 3))
+        second = first.push((4,))
+
+        assert list(second) == [2, 3, 4]
+        assert second.changes_from(first) == RingBufferAppend((4,), (1,))
+        assert first[-1] == 3
+        assert not first.is_intact()
+        with pytest.raises(IndexError):
+            first[0]
+        with pytest.raises(ValueError):
+            first.push((5,))
+
+    def test_equality(self):
+        """Test that snapshots of one storage compare by range and others by items"""
+        snapshot = RingBufferSnapshot.from_items([1.0, 1.0], 3)
+        pushed = snapshot.push((1.0,))
+
+        assert snapshot != RingBufferSnapshot(snapshot.storage, 0, 3)
+        assert pushed == RingBufferSnapshot(snapshot.storage, 0, 3)
+        assert pushed == RingBufferSnapshot.from_items([1.0, 1.0, 1.0], 5)
+        assert pushed == [1.0, 1.0, 1.0]
+
+    def test_undo_push(self):
+        """Test that undoing a push restores the evicted items"""
+        snapshot = RingBufferSnapshot.from_items([1, 2, 3], 3, None)
+        pushed = snapshot.push((4, 5))
+        pushed._undo_push(snapshot)
+
+        assert snapshot.is_latest()
+        assert list(snapshot) == [1, 2, 3]
+
+
+class TestXRingBuffer(ObservableTestCase):
+    """Test pushing, the secondary hooks and the append records of XRingBuffer"""
+
+    def test_push_and_hooks(self):
+        """Test that pushes update length, latest and statistics"""
+        buffer = XRingBuffer(capacity=3)
+        buffer.push_many([1, 2, 3, 4])
+        buffer.push(6)
+
+        assert buffer.values == [3.0, 4.0, 6.0]
+        assert buffer.length == 3
+        assert buffer.latest == 6.0
+        assert buffer.is_full
+        assert buffer.statistics.minimum == 3.0
+        assert buffer.statistics.maximum == 6.0
+        assert buffer.statistics.mean == pytest.approx(13 / 3)
+
+        buffer.clear()
+        assert buffer.length == 0
+        assert buffer.latest is None
+        assert buffer.statistics.mean is None
+
+    def test_random_pushes_match_items(self):
+        """Test random pushes against the statistics of the items"""
+        rng = random.Random(3)
+        buffer = XRingBuffer(capacity=16)
+        reference: list[float] = []
+        for _ in range(500):
+            items = [rng.uniform(-10, 10) for _ in range(rng.randint(0, 20))]
+            buffer.push_many(items)
+            reference = (reference + items)[-16:]
+            assert buffer.values == reference
+            if reference:
+                assert buffer.statistics.total == pytest.approx(sum(reference))
+                assert buffer.statistics.minimum == min(reference)
+                assert buffer.statistics.maximum == max(reference)
+
+    def test_append_listeners_and_publisher(self):
+        """Test that every push is delivered with its appended and evicted items"""
+        buffer = XRingBuffer([1, 2], capacity=2, typecode="i")
+        appends: list[RingBufferAppend[int]] = []
+        published: list[RingBufferAppend[int]] = []
+        buffer.add_append_listener(appends.append)
+        buffer.append_publisher.add_subscriber(lambda: published.append(buffer.append_publisher.append))
+
+        buffer.push(3)
+        buffer.push_many([4, 5, 6])
+
+        assert appends == [RingBufferAppend((3,), (1,)), RingBufferAppend((5, 6), (2, 3))]
+        assert published == appends
+        assert buffer.last_append == RingBufferAppend((5, 6), (2, 3))
+
+    def test_rejected_push_restores_items(self):
+        """Test that a rejected push leaves the buffer and its storage unchanged"""
+        buffer = XRingBuffer([1, 2, 3], capacity=3, typecode=None)
+        limit = FloatingHook[object](None, isolated_validation_callback=lambda value: (True, "") if 99 not in value else (False, "No 99")) # type: ignore
+        limit.join(buffer.values_hook, "use_target_value")
+
+        with pytest.raises(SubmissionError):
+            buffer.push(99)
+        assert buffer.values == [1, 2, 3]
+        buffer.push(4)
+        assert buffer.values == [2, 3, 4]
+        assert buffer.statistics.count == 3
+
+    def test_rejected_push_after_clear_restores_older_snapshots(self):
+        """Test that a rejected push restores all slots it wrote, also those read by snapshots from before a clear"""
+        buffer = XRingBuffer([1.0, 2.0, 3.0], capacity=3)
+        before_clear = buffer.values_hook.value
+        buffer.clear()
+        limit = FloatingHook[object](None, isolated_validation_callback=lambda value: (True, "") if 9.0 not in value else (False, "No 9")) # type: ignore
+        limit.join(buffer.values_hook, "use_target_value")
+
+        with pytest.raises(SubmissionError):
+            buffer.push(9.0)
+        assert list(before_clear) == [1.0, 2.0, 3.0]
+        assert buffer.values == []
+
+    def test_joined_buffers(self):
+        """Test that joined buffers share the storage and non-numeric buffers have no statistics"""
+        source = XRingBuffer(["a"], capacity=2, typecode=None)
+        linked = XRingBuffer(source)
+        source.push("b")
+        linked.push("c")
+
+        assert source.values == ["b", "c"]
+        assert linked.latest == "c"
+        assert source.statistics.total is None
+        with pytest.raises(ValueError):
+            XRingBuffer()
@@ -283,4 +283,107 @@ class TestSecondaryHooksEdgeCases:
         obs_list.join_by_key("length", target.hook, "use_caller_value")  # type: ignore
         
         # Should sync immediately
-        assert target.value == 3
\ No newline at end of file
+        assert target.value == 3
+
+class TestLazyAndDependentSecondaryHooks:
+    """Test secondary hooks with declared dependencies and lazy secondary hooks."""
+
+    @staticmethod
+    def _create(calls: list[str]):
+        from observables.core import ComplexObservableBase
+
+        def total(values):
+            calls.append("total")
+            return values["a"] + values["b"]
+
+        def label(values):
+            calls.append("label")
+            return values["name"].upper()
+
+        return ComplexObservableBase(
+            initial_hook_values={"a": 1, "b": 2, "name": "x"},
+            secondary_hook_callbacks={"total": total, "label": label},
+            secondary_hook_dependencies={"label": ["name"]},
+            lazy_secondary_hook_keys=["total"]
+        )
+
+    def test_dependencies_skip_unrelated_changes(self):
+        """Test that a secondary hook is only recomputed when one of its dependencies changes."""
+        calls: list[str] = []
+        obs = self._create(calls)
+        calls.clear()
+
+        obs.submit_value_by_key("a", 5)
+        assert "label" not in calls
+        obs.submit_value_by_key("name", "y")
+        assert "label" in calls
+        assert obs.value_by_key("label") == "Y"
+
+    def test_lazy_hook_computed_on_read(self):
+        """Test that an unobserved lazy hook is only computed when it is read."""
+        calls: list[str] = []
+        obs = self._create(calls)
+        assert "total" not in calls
+
+        obs.submit_value_by_key("a", 5)
+        obs.submit_value_by_key("b", 7)
+        assert "total" not in calls
+        assert obs.value_by_key("total") == 12
+        assert obs.value_by_key("total") == 12
+        assert calls.count("total") == 1
+
+    def test_observed_lazy_hook_is_updated(self):
+        """Test that a lazy hook with a listener or a joined hook is kept up to date."""
+        from observables import ObservableSingleValue
+
+        obs = self._create([])
+        notifications: list[int] = []
+        obs.hook_by_key("total").add_listener(lambda: notifications.append(obs.value_by_key("total")))
+        target = ObservableSingleValue(0)
+        obs.join_by_key("total", target.hook, "use_caller_value") # type: ignore
+        assert target.value == 3
+
+        obs.submit_value_by_key("b", 10)
+        assert notifications == [11]
+        assert target.value == 11
+
+    def test_lazy_hook_joined_from_other_side(self):
+        """Test that a lazy hook is computed before another hook joins it with its value."""
+        from observables import ObservableSingleValue
+
+        obs = self._create([])
+        obs.submit_value_by_key("a", 5)
+        target = ObservableSingleValue(0)
+        target.hook.join(obs.hook_by_key("total"), "use_target_value") # type: ignore
+        assert target.value == 7
+        assert obs.value_by_key("total") == 7
+
+        obs.submit_value_by_key("b", 10)
+        assert target.value == 15
+
+    def test_lazy_hook_refreshed_under_manager_lock(self):
+        """Test that reading an outdated lazy hook waits for a submission holding the manager lock."""
+        import threading
+
+        obs = self._create([])
+        obs.submit_value_by_key("a", 5)
+        hook = obs.hook_by_key("total")
+        read_values: list[int] = []
+        reader = threading.Thread(target=lambda: read_values.append(hook.value))
+
+        with hook._nexus_manager._lock: # type: ignore
+            reader.start()
+            reader.join(timeout=0.1)
+            assert reader.is_alive()
+            assert read_values == []
+        reader.join(timeout=5)
+        assert read_values == [7]
+
+    def test_invalid_declarations(self):
+        """Test that dependencies and lazy keys must refer to existing hooks."""
+        from observables.core import ComplexObservableBase
+
+        with pytest.raises(ValueError):
+            ComplexObservableBase({"a": 1}, secondary_hook_callbacks={"double": lambda values: values["a"] * 2}, secondary_hook_dependencies={"double": ["missing"]})
+        with pytest.raises(ValueError):
+            ComplexObservableBase({"a": 1}, lazy_secondary_hook_keys=["missing"])
@@ -0,0 +1,73 @@
+"""
+Test cases for the structural-sharing dict updates of the selection dicts
+"""
+
+from observables import XSelectionDict, XOptionalSelectionDict, XDefaultSelectionDict, XDict, MapChange
+from observables.core import PersistentMap
+
+from tests.test_base import ObservableTestCase
+
+
+class TestSelectionDictPersistentUpdates(ObservableTestCase):
+    """Test that selection dicts update their dict with single-key edits"""
+
+    def test_value_edit_records_single_key_change(self):
+        """Test that changing the value sets only the selected key"""
+        selection_dict = XSelectionDict({"a": 1, "b": 2}, "a")
+        previous = selection_dict.dict
+
+        selection_dict.value = 5
+
+        assert isinstance(selection_dict.dict, PersistentMap)
+        assert selection_dict.dict == {"a": 5, "b": 2}
+        assert previous == {"a": 1, "b": 2}
+        assert selection_dict.last_changes == MapChange(frozenset(), frozenset(), frozenset({"a"}))
+        assert selection_dict.values_hook.value == [5, 2]
+
+    def test_key_change_does_not_update_dict_hooks(self):
+        """Test that changing only the selected key leaves the dict and its derived hooks untouched"""
+        selection_dict = XSelectionDict({"a": 1, "b": 2}, "a")
+        selection_dict.value = 3
+        calls: list[str] = []
+        selection_dict.dict_hook.add_listener(lambda: calls.append("dict"))
+        selection_dict.keys_hook.add_listener(lambda: calls.append("keys"))
+        selection_dict.values_hook.add_listener(lambda: calls.append("values"))
+        dict_before = selection_dict.dict
+
+        selection_dict.key = "b"
+
+        assert selection_dict.value == 2
+        assert calls == []
+        assert selection_dict.dict is dict_before
+
+    def test_optional_selection_value_edit(self):
+        """Test a value edit of the optional selection dict"""
+        selection_dict = XOptionalSelectionDict({"a": 1, "b": 2}, "b")
+        selection_dict.value = 7
+
+        assert selection_dict.dict == {"a": 1, "b": 7}
+        assert selection_dict.last_changes == MapChange(frozenset(), frozenset(), frozenset({"b"}))
+
+    def test_default_key_is_added_as_single_key_change(self):
+        """Test that selecting a missing key adds only its default entry"""
+        selection_dict = XDefaultSelectionDict({"a": 1}, "a", default_value=0)
+
+        selection_dict.key = "z"
+
+        assert selection_dict.dict == {"a": 1, "z": 0}
+        assert selection_dict.value == 0
+        assert selection_dict.last_changes == MapChange(frozenset({"z"}), frozenset(), frozenset())
+
+    def test_joined_dict_receives_change(self):
+        """Test that a dict joined to the selection dict follows the single-key change"""
+        selection_dict = XSelectionDict({"a": 1, "b": 2}, "a")
+        xdict = XDict(selection_dict.dict_hook)
+        hook_b = xdict.key_hook("b")
+        hook_a = xdict.key_hook("a")
+
+        selection_dict.value = 10
+
+        assert xdict.dict == {"a": 10, "b": 2}
+        assert xdict.last_changes == MapChange(frozenset(), frozenset(), frozenset({"a"}))
+        assert hook_a.value == 10
+        assert hook_b.value == 2
@@ -0,0 +1,98 @@
+"""
+Test cases for the delta-based validation and persistent storage of the selection sets
+"""
+
+import pytest
+
+from observables import XMultiSelectionSet, XSelectionSet, XOptionalSelectionSet, XList, SetChange
+from observables.core import PersistentSet
+from observables._xobjects.set_like.utils import recorded_set_changes, MembershipIndex
+
+from tests.test_base import ObservableTestCase
+
+
+class TestSetDeltaUtils(ObservableTestCase):
+    """Test the helpers for delta validation"""
+
+    def test_recorded_set_changes(self):
+        """Test that only known changes are reported"""
+        s1 = PersistentSet({1, 2})
+        s2 = s1.add(3)
+
+        assert recorded_set_changes(s1, s1) == SetChange(frozenset(), frozenset())
+        assert recorded_set_changes(s1, s2) == SetChange(frozenset({3}), frozenset())
+        assert recorded_set_changes(s2, s1) is None
+        assert recorded_set_changes({1, 2}, {1, 2, 3}) is None
+
+    def test_membership_index_reuses_index(self):
+        """Test that non-set options are indexed once per object"""
+        index: MembershipIndex[int] = MembershipIndex()
+        options = [1, 2, 3]
+        options_set = {1, 2}
+
+        assert index.lookup(options) is index.lookup(options)
+        assert 3 in index.lookup(options)
+        assert index.lookup(options_set) is options_set
+
+
+class TestMultiSelectionSetDeltas(ObservableTestCase):
+    """Test single-option edits of the multi-selection set"""
+
+    def test_edits_are_persistent_and_validated(self):
+        """Test that edits only submit the changed options and are still validated"""
+        selection = XMultiSelectionSet({1, 2}, set(range(1000)))
+        selection.add_selected_option(500)
+        selection.remove_selected_option(1)
+
+        assert isinstance(selection.selected_options, PersistentSet)
+        assert selection.selected_options == {2, 500}
+        assert selection.number_of_selected_options == 2
+        with pytest.raises(ValueError):
+            selection.add_selected_option(5000)
+        with pytest.raises(ValueError):
+            selection.remove_available_option(500)
+        assert selection.selected_options == {2, 500}
+        assert 500 in selection.available_options
+
+    def test_removing_unselected_available_option(self):
+        """Test that an available option which is not selected can be removed"""
+        selection = XMultiSelectionSet({1}, {1, 2, 3})
+        selection.remove_available_options([2, 3])
+        selection.add_available_option(4)
+
+        assert selection.available_options == {1, 4}
+        assert selection.number_of_available_options == 2
+
+    def test_replacing_both_values_uses_full_validation(self):
+        """Test that unrelated new values are validated completely"""
+        selection = XMultiSelectionSet({1}, {1, 2, 3})
+
+        selection.change_selected_options_and_available_options({4, 5}, {4, 5, 6})
+        assert selection.selected_options == {4, 5}
+        with pytest.raises(ValueError):
+            selection.change_selected_options_and_available_options({7}, {4, 5})
+
+
+class TestSelectionSetDeltas(ObservableTestCase):
+    """Test the membership index and persistent edits of the single selection sets"""
+
+    def test_selection_with_list_options(self):
+        """Test validation against options held as a list by a joined hook"""
+        options = XList([1, 2, 3])
+        selection = XSelectionSet(1, options.value_hook)
+
+        selection.selected_option = 3
+        with pytest.raises(ValueError):
+            selection.selected_option = 4
+        assert selection.selected_option == 3
+
+    def test_available_option_edits(self):
+        """Test that editing available options keeps the selection valid"""
+        selection = XOptionalSelectionSet(1, {1, 2})
+        selection.add_available_options([3, 4])
+        selection.remove_available_option(2)
+
+        assert selection.available_options == {1, 3, 4}
+        assert selection.number_of_available_options == 3
+        with pytest.raises(ValueError):
+            selection.remove_available_option(1)
@@ -0,0 +1,115 @@
+"""
+Test cases for the PersistentSet backend of XSet and its change records
+"""
+
+import pickle
+import random
+
+import pytest
+
+from observables import XSet, SetChange, set_changes
+from observables.core import PersistentSet
+
+from tests.test_base import ObservableTestCase
+
+
+class TestPersistentSet(ObservableTestCase):
+    """Test the persistent hash set"""
+
+    def test_edits_keep_previous_versions(self):
+        """Test that edits return new sets and leave the original untouched"""
+        s1 = PersistentSet({1, 2, 3})
+        s2 = s1.add(4).discard(1)
+
+        assert s1 == {1, 2, 3}
+        assert s2 == {2, 3, 4}
+        assert {2, 3, 4} == s2
+        assert s1.add(1) is s1
+        assert s1.discard(5) is s1
+
+    def test_recorded_changes(self):
+        """Test that every edit records its delta relative to its parent"""
+        s1 = PersistentSet({1, 2, 3})
+        s2 = s1.symmetric_difference_update({3, 4})
+
+        assert s2.changes_from(s1) == SetChange(frozenset({4}), frozenset({3}))
+        assert s2.changes_from(PersistentSet({1, 2, 3})) is None
+        assert s1.update([1, 2]) is s1
+
+    def test_set_operations_hash_and_pickle(self):
+        """Test set operators, hashing and pickling"""
+        s = PersistentSet({1, 2, 3})
+
+        assert s & {2, 3, 4} == {2, 3}
+        assert s | {4} == {1, 2, 3, 4}
+        assert s <= {1, 2, 3, 4}
+        assert hash(s) == hash(frozenset({1, 2, 3}))
+        assert pickle.loads(pickle.dumps(s)) == s
+        assert [1] not in s
+
+    def test_random_edits_match_builtin_set(self):
+        """Test random edits against the built-in set"""
+        rng = random.Random(3)
+        reference: set[int] = set()
+        persistent: PersistentSet[int] = PersistentSet()
+        for _ in range(500):
+            items = [rng.randint(0, 50) for _ in range(rng.randint(1, 4))]
+            previous = persistent
+            if rng.random() < 0.5:
+                reference.update(items)
+                persistent = persistent.update(items)
+            else:
+                reference.difference_update(items)
+                persistent = persistent.difference_update(items)
+            assert persistent == reference
+            patched = set(previous)
+            set_changes(previous, persistent).apply_to(patched)
+            assert patched == reference
+
+
+class TestXSetChanges(ObservableTestCase):
+    """Test the change records delivered by XSet"""
+
+    def test_change_listeners(self):
+        """Test that listeners receive the added and removed items of every change"""
+        xset = XSet({1, 2, 3})
+        received: list[SetChange[int]] = []
+        xset.add_change_listener(received.append)
+
+        xset.add(4)
+        xset.add(4)
+        xset.discard(1)
+        xset.update([5, 6], [2])
+        xset.intersection_update({2, 3, 5})
+        xset.symmetric_difference_update({3, 7})
+
+        assert received == [
+            SetChange(frozenset({4}), frozenset()),
+            SetChange(frozenset(), frozenset({1})),
+            SetChange(frozenset({5, 6}), frozenset()),
+            SetChange(frozenset(), frozenset({4, 6})),
+            SetChange(frozenset({7}), frozenset({3})),
+        ]
+        assert xset.value == {2, 5, 7}
+
+    def test_joined_set_receives_changes(self):
+        """Test that a joined set receives the recorded change"""
+        source = XSet(range(1000))
+        joined = XSet(source)
+        received: list[SetChange[int]] = []
+        joined.add_change_listener(received.append)
+
+        source.remove(500)
+
+        assert received == [SetChange(frozenset(), frozenset({500}))]
+        assert joined.last_changes == SetChange(frozenset(), frozenset({500}))
+        assert 500 not in joined
+
+    def test_change_value_diffs(self):
+        """Test that replacing the whole value reports the difference"""
+        xset = XSet({1, 2})
+        xset.change_value({2, 3})
+
+        assert xset.last_changes == SetChange(frozenset({3}), frozenset({1}))
+        with pytest.raises(KeyError):
+            xset.remove(1)
@@ -0,0 +1,85 @@
+"""
+Test cases for consistent snapshots of many hooks and observables
+"""
+
+import threading
+
+import pytest
+
+from observables import XValue, XSelectionDict, XOneWayFunction, Snapshot
+from observables.core import DEFAULT_NEXUS_MANAGER
+
+from tests.test_base import ObservableTestCase
+
+
+class TestSnapshot(ObservableTestCase):
+    """Test NexusManager.snapshot"""
+
+    def test_snapshot_of_hooks_and_observables(self):
+        """Test that a snapshot holds the values of hooks and of all hooks of observables"""
+        selection = XSelectionDict({"a": 1, "b": 2}, "a")
+        count = XValue(3)
+        snapshot = DEFAULT_NEXUS_MANAGER.snapshot([selection, count.hook])
+        assert isinstance(snapshot, Snapshot)
+        assert snapshot[count.hook] == 3
+        assert snapshot.value(selection, "key") == "a"
+        assert snapshot.value(selection, "value") == 1
+        assert dict(snapshot[selection]["dict"]) == {"a": 1, "b": 2}
+
+        commit = snapshot.commit
+        selection.key = "b"
+        count.value = 4
+        assert snapshot.value(selection, "key") == "a"
+        assert snapshot[count.hook] == 3
+        assert DEFAULT_NEXUS_MANAGER.snapshot([count.hook]).commit == commit + 2
+
+        assert count not in snapshot
+        with pytest.raises(KeyError):
+            snapshot[count]
+
+    def test_snapshot_is_never_torn(self):
+        """Test that snapshots taken during submissions of another thread are consistent"""
+        source = XValue(0)
+        double = XOneWayFunction({"x": source.hook}, lambda v: {"y": 2 * v["x"]}, {"y"})
+        selection = XSelectionDict({"a": 0, "b": 0}, "a")
+        stop = threading.Event()
+
+        def write() -> None:
+            index = 0
+            while not stop.is_set():
+                index += 1
+                source.value = index
+                selection.change_dict_and_key({"a": index, "b": -index}, "a" if index % 2 else "b")
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(2000):
+                snapshot = DEFAULT_NEXUS_MANAGER.snapshot([source.hook, double.hook("y"), selection])
+                assert snapshot[double.hook("y")] == 2 * snapshot[source.hook]
+                values = snapshot[selection]
+                assert values["dict"][values["key"]] == values["value"]
+        finally:
+            stop.set()
+            writer.join(10)
+
+    def test_lazy_hooks_are_read_without_side_effects(self):
+        """Test that a snapshot computes outdated lazy hooks without storing their value"""
+        from observables.core import ComplexObservableBase
+
+        calls: list[int] = []
+
+        def total(values):
+            calls.append(1)
+            return values["a"] + values["b"]
+
+        obs = ComplexObservableBase(initial_hook_values={"a": 1, "b": 2}, secondary_hook_callbacks={"total": total}, lazy_secondary_hook_keys=["total"])
+        lazy_hook = obs.hook_by_key("total")
+        obs.submit_value_by_key("a", 5)
+        calls.clear()
+
+        assert DEFAULT_NEXUS_MANAGER.snapshot([lazy_hook])[lazy_hook] == 7
+        assert DEFAULT_NEXUS_MANAGER.snapshot([obs]).value(obs, "total") == 7
+        assert lazy_hook._get_nexus().stored_value != 7
+        assert lazy_hook.is_outdated()
+        assert obs.value_by_key("total") == 7
@@ -0,0 +1,190 @@
+"""
+Test cases for XSortedList
+"""
+
+import random
+
+import pytest
+
+from observables import XSortedList, XList, FloatingHook
+from observables.core import PersistentVector
+from observables._xobjects.list_like.x_sorted_list import _inserted_positions
+from observables._xobjects.list_like.list_change import ListChange
+from observables._xobjects.list_like.window_index import WindowIndex
+
+from tests.test_base import ObservableTestCase
+
+
+class TestSortedListEdits(ObservableTestCase):
+    """Test the sorted edits and queries of XSortedList"""
+
+    def test_items_stay_sorted(self):
+        """Test that added items are inserted at their sorted position"""
+        sorted_list = XSortedList([30, 10, 20])
+        sorted_list.add(25)
+        sorted_list.update([5, 40, 25])
+        sorted_list.remove(10)
+        sorted_list.discard(99)
+
+        assert sorted_list.value == [5, 20, 25, 25, 30, 40]
+        assert isinstance(sorted_list.value_hook.value, PersistentVector)
+        assert sorted_list.count(25) == 2
+        assert sorted_list.index(30) == 4
+        with pytest.raises(ValueError):
+            sorted_list.remove(99)
+
+    def test_key_and_unique(self):
+        """Test that a unique keyed list keeps one item per key"""
+        records = XSortedList([("b", 2), ("a", 1), ("a", 3)], key=lambda record: record[0], unique=True)
+        records.add(("a", 5))
+        records.add(("c", 0))
+
+        assert records.value == [("a", 1), ("b", 2), ("c", 0)]
+        assert records.unique
+
+    def test_range_queries(self):
+        """Test bisection and range iteration by key"""
+        sorted_list = XSortedList(range(0, 100, 10))
+
+        assert list(sorted_list.irange(20, 50)) == [20, 30, 40]
+        assert sorted_list.window(None, 15) == [0, 10]
+        assert sorted_list.bisect_left(30) == 3
+        assert sorted_list.bisect_right(30) == 4
+
+    def test_min_max_and_length(self):
+        """Test the secondary hooks and that min is not notified by unrelated edits"""
+        sorted_list = XSortedList([3, 1, 2])
+        calls: list[str] = []
+        sorted_list.min_hook.add_listener(lambda: calls.append("min"))
+
+        sorted_list.add(5)
+        assert calls == []
+        assert sorted_list.max == 5
+        assert sorted_list.length == 4
+
+        sorted_list.add(0)
+        assert calls == ["min"]
+        sorted_list.clear()
+        assert sorted_list.min is None
+        assert sorted_list.max is None
+
+    def test_unsorted_submission_is_rejected(self):
+        """Test that a joined list cannot break the order"""
+        sorted_list = XSortedList([1, 2, 3])
+        joined = XList(sorted_list.value_hook)
+
+        with pytest.raises(ValueError):
+            joined.append(0)
+        joined.append(4)
+        assert sorted_list.value == [1, 2, 3, 4]
+
+    def test_inserted_positions(self):
+        """Test that splice positions are mapped to the final list"""
+        changes = (ListChange(0, 0, ("a",)), ListChange(0, 0, ("b",)), ListChange(3, 1, ()))
+        assert sorted(_inserted_positions(changes)) == [0, 1]
+
+
+class TestSortedListWindowHooks(ObservableTestCase):
+    """Test the window hooks of XSortedList"""
+
+    def test_window_only_notified_for_its_range(self):
+        """Test that a window hook is only notified if a change touches its window"""
+        sorted_list = XSortedList([10, 20, 30])
+        window = sorted_list.window_hook(15, 35)
+        calls: list[int] = []
+        window.add_listener(lambda: calls.append(1))
+
+        sorted_list.add(5)
+        sorted_list.add(40)
+        assert calls == []
+
+        sorted_list.add(25)
+        assert window.value == [20, 25, 30]
+        assert calls == [1]
+        assert sorted_list.window_hook(15, 35) is window
+
+    def test_window_can_be_joined(self):
+        """Test that a window hook can be joined with a floating hook"""
+        sorted_list = XSortedList([1, 5])
+        floating = FloatingHook[object](None)
+        floating.join(sorted_list.window_hook(None, 3), "use_target_value")
+
+        sorted_list.add(2)
+        assert floating.value == [1, 2]
+        with pytest.raises(ValueError):
+            floating.change_value(PersistentVector([9]))
+
+    def test_window_in_large_nexus_stays_read_only(self):
+        """Test that a window hook joined with many hooks still rejects values that do not match the list"""
+        sorted_list = XSortedList([1, 5])
+        floating_hooks = [FloatingHook[object](None) for _ in range(5)]
+        for floating in floating_hooks:
+            floating.join(sorted_list.window_hook(None, 3), "use_target_value")
+
+        success, _ = floating_hooks[0].change_value(PersistentVector([9]), raise_submission_error_flag=False)
+        assert not success
+        assert sorted_list.window_hook(None, 3).value == [1]
+
+    def test_random_edits_match_windows(self):
+        """Test random edits against windows computed from scratch"""
+        rng = random.Random(3)
+        sorted_list = XSortedList([rng.randint(0, 100) for _ in range(50)])
+        for bounds in [(None, 10), (20, 40), (40, None), (50, 51)]:
+            sorted_list.window_hook(*bounds)
+        for _ in range(300):
+            operation = rng.random()
+            if operation < 0.4:
+                sorted_list.add(rng.randint(0, 100))
+            elif operation < 0.6:
+                sorted_list.discard(rng.randint(0, 100))
+            elif operation < 0.8:
+                sorted_list.update([rng.randint(0, 100) for _ in range(rng.randint(0, 5))])
+            else:
+                sorted_list.change_value([rng.randint(0, 100) for _ in range(rng.randint(0, 60))])
+            items = sorted_list.value
+            assert items == sorted(items)
+            for (lower, upper), hook in sorted_list.window_hooks.items():
+                expected = [item for item in items if (lower is None or item >= lower) and (upper is None or item < upper)]
+                assert hook.value == expected
+
+    def test_edit_only_visits_overlapping_windows(self):
+        """Test that an edit only looks at the windows that its items fall into"""
+        sorted_list = XSortedList(range(0, 1000, 2))
+        windows = [sorted_list.window_hook(lower, lower + 10) for lower in range(0, 1000, 10)]
+        visited: list[object] = []
+        updated_window = sorted_list._updated_window # type: ignore
+        def counting_updated_window(hook_key, *args):  # type: ignore
+            visited.append(hook_key)
+            return updated_window(hook_key, *args)
+        sorted_list._updated_window = counting_updated_window # type: ignore
+
+        sorted_list.add(505)
+        sorted_list.update([1, 3])
+        sorted_list.remove(20)
+
+        assert {(hook_key.lower, hook_key.upper) for hook_key in visited} == {(500, 510), (0, 10), (20, 30)} # type: ignore
+        assert windows[50].value == [500, 502, 504, 505, 506, 508]
+        assert windows[0].value == [0, 1, 2, 3, 4, 6, 8]
+        assert windows[2].value == [22, 24, 26, 28]
+
+    def test_window_index(self):
+        """Test that the window index finds exactly the windows overlapping a key range"""
+        rng = random.Random(5)
+        index: WindowIndex[int] = WindowIndex()
+        windows: dict[int, tuple[int | None, int | None]] = {}
+        for window in range(40):
+            lower = rng.choice([None, rng.randint(0, 50)])
+            upper = rng.choice([None, rng.randint(0, 50)])
+            windows[window] = (lower, upper)
+            index.add(window, lower, upper)
+        for window in range(0, 40, 3):
+            del windows[window]
+            index.discard(window)
+        for _ in range(200):
+            first = rng.randint(-5, 55)
+            last = first + rng.randint(0, 10)
+            expected = {
+                window for window, (lower, upper) in windows.items()
+                if any((lower is None or key >= lower) and (upper is None or key < upper) for key in range(first, last + 1))
+            }
+            assert index.overlapping(first, last) == expected
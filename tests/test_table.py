@@ -0,0 +1,139 @@
+"""
+Test cases for XTable and its incrementally maintained indexes
+"""
+
+import random
+
+import pytest
+
+from observables import XTable, XDict, HashIndex, SortedIndex, FloatingHook
+from observables.core import PersistentMap, PersistentSet
+from observables._xobjects.table_like.table_index import IncrementalIndex
+
+from tests.test_base import ObservableTestCase
+
+
+def _tasks() -> XTable[int, dict[str, object]]:
+    return XTable(
+        {1: {"status": "open", "due": 3}, 2: {"status": "done", "due": 1}},
+        indexes={"by_status": HashIndex("status"), "by_due": SortedIndex("due")}
+    )
+
+
+class TestTableIndexes(ObservableTestCase):
+    """Test building and incrementally updating the table indexes"""
+
+    def test_incremental_index_matches_rebuild(self):
+        """Test random row edits against indexes built from scratch"""
+        rng = random.Random(7)
+        hash_index = HashIndex("group")
+        sorted_index = SortedIndex(lambda record: record["rank"])
+        incremental_hash: IncrementalIndex[int, dict[str, int]] = IncrementalIndex(hash_index)
+        incremental_sorted: IncrementalIndex[int, dict[str, int]] = IncrementalIndex(sorted_index)
+        rows: PersistentMap[int, dict[str, int]] = PersistentMap({i: {"group": i % 4, "rank": i} for i in range(50)})
+        for _ in range(200):
+            if rng.random() < 0.7:
+                rows = rows.set(rng.randint(0, 80), {"group": rng.randint(0, 5), "rank": rng.randint(0, 20)})
+            else:
+                rows = rows.remove_keys([rng.randint(0, 80) for _ in range(2)])
+            assert incremental_hash.derive(rows) == hash_index.build(rows)
+            derived = incremental_sorted.derive(rows)
+            assert [value for value, _ in derived] == sorted(record["rank"] for record in rows.values())
+            assert {row_id for _, row_id in derived} == set(rows.keys())
+
+    def test_sorted_index_not_matching_the_rows(self):
+        """Test that updating a sorted index of other rows raises a descriptive error"""
+        index = SortedIndex("due")
+        previous_rows: PersistentMap[int, dict[str, int]] = PersistentMap({1: {"due": 1}, 2: {"due": 2}})
+        current_rows = previous_rows.set(2, {"due": 5})
+        other_index = index.build(PersistentMap({1: {"due": 1}, 3: {"due": 2}}))
+        with pytest.raises(ValueError, match="Row 2"):
+            index.apply(other_index, previous_rows, current_rows, current_rows.changes_from(previous_rows)) # type: ignore
+
+    def test_attribute_fields(self):
+        """Test indexing records by attribute"""
+        class Task:
+            def __init__(self, status: str) -> None:
+                self.status = status
+
+        table = XTable({1: Task("open"), 2: Task("done")}, indexes={"by_status": HashIndex("status")})
+        assert table.lookup("by_status", "open") == {1}
+
+    def test_reserved_and_unknown_index_names(self):
+        """Test that reserved names are rejected and unknown indexes are reported"""
+        with pytest.raises(ValueError):
+            XTable({}, indexes={"rows": HashIndex("status")})
+        table = _tasks()
+        with pytest.raises(ValueError):
+            table.lookup("missing", 1)
+        with pytest.raises(ValueError):
+            table.range("by_status", 1, 2)
+
+
+class TestTableHooks(ObservableTestCase):
+    """Test the index, lookup and range hooks of XTable"""
+
+    def test_lookup_hook_only_notified_for_its_value(self):
+        """Test that a lookup hook is only updated when rows with its value change"""
+        table = _tasks()
+        open_tasks = table.lookup_hook("by_status", "open")
+        calls: list[str] = []
+        open_tasks.add_listener(lambda: calls.append("open"))
+
+        table[3] = {"status": "done", "due": 5}
+        assert calls == []
+
+        table[4] = {"status": "open", "due": 2}
+        table[1] = {"status": "done", "due": 3}
+        assert calls == ["open", "open"]
+        assert open_tasks.value == {4}
+        assert table.lookup_hook("by_status", "open") is open_tasks
+
+    def test_range_hook(self):
+        """Test that a range hook holds the ids ordered by field value"""
+        table = _tasks()
+        due_soon = table.range_hook("by_due", None, 3)
+        calls: list[int] = []
+        due_soon.add_listener(lambda: calls.append(1))
+
+        table[3] = {"status": "open", "due": 2}
+        table[4] = {"status": "open", "due": 10}
+
+        assert due_soon.value == [2, 3]
+        assert calls == [1]
+        assert table.range("by_due") == [2, 3, 1, 4]
+
+    def test_index_hook_and_row_edits(self):
+        """Test the index hooks after adding, updating and removing rows"""
+        table = _tasks()
+        table.update_rows({3: {"status": "open", "due": 0}, 4: {"status": "late", "due": 7}})
+        table.remove_rows([2])
+
+        assert table.index_hook("by_status").value == {"open": PersistentSet({1, 3}), "late": PersistentSet({4})}
+        assert table.length == 3
+        with pytest.raises(KeyError):
+            table.remove_row(2)
+
+    def test_lookup_hook_in_large_nexus_stays_read_only(self):
+        """Test that a lookup hook joined with many hooks still rejects values that do not match the table"""
+        table = _tasks()
+        floating_hooks = [FloatingHook[object](None) for _ in range(5)]
+        for floating in floating_hooks:
+            floating.join(table.lookup_hook("by_status", "open"), "use_target_value")
+
+        success, _ = floating_hooks[0].change_value("bogus", raise_submission_error_flag=False)
+        assert not success
+        assert table.lookup_hook("by_status", "open").value == PersistentSet({1})
+
+    def test_hooks_can_be_joined(self):
+        """Test that lookup hooks can be joined and the rows can be shared with a dict"""
+        table = _tasks()
+        rows = XDict(table.rows_hook)
+        floating = FloatingHook[object](None)
+        floating.join(table.lookup_hook("by_status", "done"), "use_target_value")
+
+        rows[5] = {"status": "done", "due": 4}
+
+        assert floating.value == {2, 5}
+        with pytest.raises(ValueError):
+            floating.change_value(PersistentSet({1}))
@@ -0,0 +1,119 @@
+"""
+Test cases for ValuePublisher generations and equality suppression
+"""
+
+import pytest
+
+from observables import ValuePublisher
+
+from tests.test_base import ObservableTestCase
+
+
+class TestValuePublisherGenerations(ObservableTestCase):
+    """Test generation counters and equality suppression of ValuePublisher"""
+
+    def test_initial_generation_is_zero(self):
+        """Test that a new publisher starts at generation 0"""
+        publisher = ValuePublisher(1, mode="direct")
+        assert publisher.generation == 0
+        assert publisher.changes_since(0) == 0
+        assert not publisher.has_changed_since(0)
+
+    def test_every_assignment_publishes_by_default(self):
+        """Test that equal values still publish without suppression"""
+        publisher = ValuePublisher(1, mode="direct")
+        calls: list[int] = []
+        publisher.add_subscriber(lambda: calls.append(publisher.value))
+
+        publisher.value = 1
+        publisher.value = 1
+
+        assert calls == [1, 1]
+        assert publisher.generation == 2
+
+    def test_change_value_publishes_once(self):
+        """Test that change_value publishes exactly once per call"""
+        publisher = ValuePublisher(1, mode="direct")
+        calls: list[int] = []
+        publisher.add_subscriber(lambda: calls.append(publisher.value))
+
+        publisher.change_value(2)
+
+        assert calls == [2]
+        assert publisher.generation == 1
+
+    def test_equal_values_are_suppressed(self):
+        """Test that equal values neither publish nor bump the generation"""
+        publisher = ValuePublisher(1, mode="direct", suppress_equal_values=True)
+        calls: list[int] = []
+        publisher.add_subscriber(lambda: calls.append(publisher.value))
+
+        publisher.value = 1
+        assert calls == []
+        assert publisher.generation == 0
+
+        publisher.value = 2
+        assert calls == [2]
+        assert publisher.generation == 1
+
+    def test_suppression_uses_nexus_manager_equality(self):
+        """Test that suppression uses the tolerance of NexusManager.is_equal"""
+        publisher = ValuePublisher(1.0, mode="direct", suppress_equal_values=True)
+        publisher.value = 1.0 + 1e-12
+        assert publisher.generation == 0
+        publisher.value = 1
+        assert publisher.generation == 0
+        publisher.value = 1.5
+        assert publisher.generation == 1
+
+    def test_changes_since(self):
+        """Test counting missed changes"""
+        publisher = ValuePublisher("a", mode="direct")
+        seen = publisher.generation
+        publisher.value = "b"
+        publisher.value = "c"
+
+        assert publisher.changes_since(seen) == 2
+        assert publisher.has_changed_since(seen)
+        assert publisher.changes_since(publisher.generation) == 0
+
+    def test_changes_since_out_of_range_raises(self):
+        """Test that invalid generations raise ValueError"""
+        publisher = ValuePublisher("a", mode="direct")
+        with pytest.raises(ValueError):
+            publisher.changes_since(1)
+        with pytest.raises(ValueError):
+            publisher.changes_since(-1)
+
+    def test_values_since(self):
+        """Test replaying missed values from the history"""
+        publisher = ValuePublisher("a", mode="direct", history_size=3)
+        seen = publisher.generation
+        publisher.value = "b"
+        publisher.value = "c"
+
+        assert publisher.values_since(seen) == ((1, "b"), (2, "c"))
+        assert publisher.values_since(1) == ((2, "c"),)
+        assert publisher.values_since(2) == ()
+
+    def test_values_since_beyond_history_raises(self):
+        """Test that changes no longer in the history raise ValueError"""
+        publisher = ValuePublisher(0, mode="direct", history_size=2)
+        for value in range(1, 5):
+            publisher.value = value
+
+        assert publisher.values_since(2) == ((3, 3), (4, 4))
+        with pytest.raises(ValueError):
+            publisher.values_since(1)
+
+    def test_values_since_without_history_raises(self):
+        """Test that values_since requires a history"""
+        publisher = ValuePublisher(0, mode="direct")
+        publisher.value = 1
+        with pytest.raises(ValueError):
+            publisher.values_since(0)
+
+    def test_negative_history_size_raises(self):
+        """Test that a negative history size is rejected"""
+        with pytest.raises(ValueError):
+            ValuePublisher(0, history_size=-1)